@@ -0,0 +1,51 @@
+#!/bin/env python
+
+"""
+Microbenchmark for the module-level interface accessors such as openvr.VRSystem().
+
+Accessors used to re-validate their cached interface against the native VR_GetInitToken()
+on every call. They are now invalidated only by init()/shutdown(), so a call is a plain
+attribute read. The "legacy" timing reproduces the old per-call work with checkClear().
+
+Runs against SteamVR if it is available, otherwise against a placeholder interface object,
+since only the accessor overhead is being measured.
+"""
+
+import timeit
+
+import openvr
+
+
+def setup_context():
+    try:
+        openvr.init(openvr.VRApplication_Background)
+        return True
+    except openvr.OpenVRError:
+        # No runtime: populate the cache directly
+        openvr._internal_module_context.reset()
+        openvr._internal_module_context.m_pVRSystem = object()
+        return False
+
+
+def legacy_accessor():
+    openvr._internal_module_context.checkClear()
+    return openvr._internal_module_context.VRSystem()
+
+
+def main(number=1000000):
+    have_runtime = setup_context()
+    timings = (
+        ('getInitToken() alone', openvr.getInitToken),
+        ('legacy VRSystem() with checkClear()', legacy_accessor),
+        ('VRSystem()', openvr.VRSystem),
+    )
+    print(f"{number} calls each ({'SteamVR' if have_runtime else 'no runtime'})")
+    for label, function in timings:
+        seconds = min(timeit.repeat(function, number=number, repeat=5))
+        print(f"  {label:40s} {1e9 * seconds / number:8.1f} ns per call")
+    if have_runtime:
+        openvr.shutdown()
+
+
+if __name__ == '__main__':
+    main()
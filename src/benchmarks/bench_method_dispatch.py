@@ -0,0 +1,40 @@
+#!/bin/env python
+
+"""
+Microbenchmark for the per-call overhead of generated interface methods, against the in-process fake runtime.
+
+Reading a function pointer field from an IVR*_FnTable structure creates a new ctypes function object
+on every access. The "function table field read" timing isolates that cost; the method timings include
+it once per call, plus the fake runtime's callback. Interface objects now read each field once, when
+they are created, so methods pay only for the "bound function table entry read".
+Run from the src directory with: PYTHONPATH=. python benchmarks/bench_method_dispatch.py
+"""
+
+import timeit
+
+import openvr
+from openvr.fake_runtime import FakeRuntime
+
+
+def main(number=100000):
+    with FakeRuntime() as runtime:
+        runtime.add_device(openvr.TrackedDeviceClass_HMD)
+        vr_system = openvr.init(openvr.VRApplication_Scene)
+        compositor = openvr.VRCompositor()
+        function_table = vr_system.function_table
+        timings = (
+            ('function table field read', lambda: function_table.getTrackedDeviceClass),
+            ('bound function table entry read', lambda: vr_system._fn_getTrackedDeviceClass),
+            ('IVRSystem.getTrackedDeviceClass()', lambda: vr_system.getTrackedDeviceClass(0)),
+            ('IVRSystem.isTrackedDeviceConnected()', lambda: vr_system.isTrackedDeviceConnected(0)),
+            ('IVRCompositor.getFrameTimeRemaining()', compositor.getFrameTimeRemaining),
+        )
+        print(f"{number} calls each (fake runtime)")
+        for label, function in timings:
+            seconds = min(timeit.repeat(function, number=number, repeat=5))
+            print(f"  {label:40s} {1e9 * seconds / number:8.1f} ns per call")
+        openvr.shutdown()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,48 @@
+#!/bin/env python
+
+"""
+Microbenchmark for per-frame wrapper overhead, against the in-process fake runtime.
+
+The fake runtime's callbacks do a fixed, small amount of Python work, so differences
+between the timings below are differences in the wrapper code paths themselves.
+Run from the src directory with: PYTHONPATH=. python benchmarks/bench_pose_pipeline.py
+"""
+
+import timeit
+
+import openvr
+from openvr.fake_runtime import FakeRuntime
+from openvr.pose_buffers import PoseBuffers
+from openvr.property_cache import TrackedDevicePropertyCache
+
+
+def main(number=20000):
+    with FakeRuntime() as runtime:
+        runtime.add_device(openvr.TrackedDeviceClass_HMD)
+        runtime.add_device(openvr.TrackedDeviceClass_Controller, controller_role=openvr.TrackedControllerRole_LeftHand)
+        runtime.add_device(openvr.TrackedDeviceClass_Controller, controller_role=openvr.TrackedControllerRole_RightHand)
+        vr_system = openvr.init(openvr.VRApplication_Scene)
+        compositor = openvr.VRCompositor()
+        poses = (openvr.TrackedDevicePose_t * openvr.k_unMaxTrackedDeviceCount)()
+        buffers = PoseBuffers(game_poses=False)
+        timing = openvr.Compositor_FrameTiming()
+        properties = TrackedDevicePropertyCache()
+        timings = (
+            ('IVRCompositor.waitGetPoses(poses, None)', lambda: compositor.waitGetPoses(poses, None)),
+            ('PoseBuffers.wait_get_poses()', buffers.wait_get_poses),
+            ('IVRSystem.getStringTrackedDeviceProperty()', lambda: vr_system.getStringTrackedDeviceProperty(
+                openvr.k_unTrackedDeviceIndex_Hmd, openvr.Prop_SerialNumber_String)),
+            ('TrackedDevicePropertyCache.get_string()', lambda: properties.get_string(
+                openvr.k_unTrackedDeviceIndex_Hmd, openvr.Prop_SerialNumber_String)),
+            ('IVRCompositor.getFrameTiming()', compositor.getFrameTiming),
+            ('IVRCompositor.getFrameTiming(timing=timing)', lambda: compositor.getFrameTiming(timing=timing)),
+        )
+        print(f"{number} calls each (fake runtime)")
+        for label, function in timings:
+            seconds = min(timeit.repeat(function, number=number, repeat=5))
+            print(f"  {label:45s} {1e6 * seconds / number:8.2f} us per call")
+        openvr.shutdown()
+
+
+if __name__ == '__main__':
+    main()
@@ -2724,6 +2724,87 @@ class SpatialAnchorPose_t(Structure):
     ]
 
 
+# VREvent_Data_t member name, and structure type, holding the payload of each EVREventType
+EVENT_DATA_MEMBERS = {
+    VREvent_IpdChanged: ('ipd', VREvent_Ipd_t),
+    VREvent_PropertyChanged: ('property', VREvent_Property_t),
+    VREvent_ButtonPress: ('controller', VREvent_Controller_t),
+    VREvent_ButtonUnpress: ('controller', VREvent_Controller_t),
+    VREvent_ButtonTouch: ('controller', VREvent_Controller_t),
+    VREvent_ButtonUntouch: ('controller', VREvent_Controller_t),
+    VREvent_MouseMove: ('mouse', VREvent_Mouse_t),
+    VREvent_MouseButtonDown: ('mouse', VREvent_Mouse_t),
+    VREvent_MouseButtonUp: ('mouse', VREvent_Mouse_t),
+    VREvent_FocusEnter: ('overlay', VREvent_Overlay_t),
+    VREvent_FocusLeave: ('overlay', VREvent_Overlay_t),
+    VREvent_ScrollDiscrete: ('scroll', VREvent_Scroll_t),
+    VREvent_TouchPadMove: ('mouse', VREvent_Mouse_t),
+    VREvent_OverlayFocusChanged: ('overlay', VREvent_Overlay_t),
+    VREvent_ScrollSmooth: ('scroll', VREvent_Scroll_t),
+    VREvent_LockMousePosition: ('mouse', VREvent_Mouse_t),
+    VREvent_UnlockMousePosition: ('mouse', VREvent_Mouse_t),
+    VREvent_InputFocusCaptured: ('process', VREvent_Process_t),
+    VREvent_InputFocusReleased: ('process', VREvent_Process_t),
+    VREvent_SceneApplicationChanged: ('process', VREvent_Process_t),
+    VREvent_InputFocusChanged: ('process', VREvent_Process_t),
+    VREvent_SceneApplicationUsingWrongGraphicsAdapter: ('process', VREvent_Process_t),
+    VREvent_ActionBindingReloaded: ('process', VREvent_Process_t),
+    VREvent_SceneAppPipeDisconnected: ('process', VREvent_Process_t),
+    VREvent_OverlayShown: ('overlay', VREvent_Overlay_t),
+    VREvent_OverlayHidden: ('overlay', VREvent_Overlay_t),
+    VREvent_DashboardActivated: ('overlay', VREvent_Overlay_t),
+    VREvent_DashboardDeactivated: ('overlay', VREvent_Overlay_t),
+    VREvent_DashboardRequested: ('overlay', VREvent_Overlay_t),
+    VREvent_ImageLoaded: ('overlay', VREvent_Overlay_t),
+    VREvent_OverlayGamepadFocusGained: ('overlay', VREvent_Overlay_t),
+    VREvent_OverlayGamepadFocusLost: ('overlay', VREvent_Overlay_t),
+    VREvent_ScreenshotTriggered: ('screenshot', VREvent_Screenshot_t),
+    VREvent_ImageFailed: ('overlay', VREvent_Overlay_t),
+    VREvent_RequestScreenshot: ('screenshot', VREvent_Screenshot_t),
+    VREvent_ScreenshotTaken: ('screenshot', VREvent_Screenshot_t),
+    VREvent_ScreenshotFailed: ('screenshot', VREvent_Screenshot_t),
+    VREvent_SubmitScreenshotToDashboard: ('screenshot', VREvent_Screenshot_t),
+    VREvent_ScreenshotProgressToDashboard: ('screenshotProgress', VREvent_ScreenshotProgress_t),
+    VREvent_ShowUI: ('showUi', VREvent_ShowUI_t),
+    VREvent_ShowDevTools: ('showDevTools', VREvent_ShowDevTools_t),
+    VREvent_OverlayCreated: ('overlay', VREvent_Overlay_t),
+    VREvent_OverlayDestroyed: ('overlay', VREvent_Overlay_t),
+    VREvent_Notification_Shown: ('notification', VREvent_Notification_t),
+    VREvent_Notification_Hidden: ('notification', VREvent_Notification_t),
+    VREvent_Notification_BeginInteraction: ('notification', VREvent_Notification_t),
+    VREvent_Notification_Destroyed: ('notification', VREvent_Notification_t),
+    VREvent_Quit: ('process', VREvent_Process_t),
+    VREvent_ProcessQuit: ('process', VREvent_Process_t),
+    VREvent_QuitAcknowledged: ('process', VREvent_Process_t),
+    VREvent_ChaperoneUniverseHasChanged: ('chaperone', VREvent_Chaperone_t),
+    VREvent_StatusUpdate: ('status', VREvent_Status_t),
+    VREvent_KeyboardClosed: ('keyboard', VREvent_Keyboard_t),
+    VREvent_KeyboardCharInput: ('keyboard', VREvent_Keyboard_t),
+    VREvent_KeyboardDone: ('keyboard', VREvent_Keyboard_t),
+    VREvent_KeyboardOpened_Global: ('keyboard', VREvent_Keyboard_t),
+    VREvent_KeyboardClosed_Global: ('keyboard', VREvent_Keyboard_t),
+    VREvent_Compositor_HDCPError: ('hdcpError', VREvent_HDCPError_t),
+    VREvent_TrackedCamera_EditingSurface: ('cameraSurface', VREvent_EditingCameraSurface_t),
+    VREvent_PerformanceTest_FidelityLevel: ('performanceTest', VREvent_PerformanceTest_t),
+    VREvent_MessageOverlay_Closed: ('messageOverlay', VREvent_MessageOverlay_t),
+    VREvent_Input_HapticVibration: ('hapticVibration', VREvent_HapticVibration_t),
+    VREvent_Input_BindingLoadFailed: ('inputBinding', VREvent_InputBindingLoad_t),
+    VREvent_Input_BindingLoadSuccessful: ('inputBinding', VREvent_InputBindingLoad_t),
+    VREvent_Input_ActionManifestLoadFailed: ('actionManifest', VREvent_InputActionManifestLoad_t),
+    VREvent_Input_ProgressUpdate: ('progressUpdate', VREvent_ProgressUpdate_t),
+    VREvent_SpatialAnchors_PoseUpdated: ('spatialAnchor', VREvent_SpatialAnchor_t),
+    VREvent_SpatialAnchors_DescriptorUpdated: ('spatialAnchor', VREvent_SpatialAnchor_t),
+    VREvent_SpatialAnchors_RequestPoseUpdate: ('spatialAnchor', VREvent_SpatialAnchor_t),
+    VREvent_SpatialAnchors_RequestDescriptorUpdate: ('spatialAnchor', VREvent_SpatialAnchor_t),
+    VREvent_Monitor_ShowHeadsetView: ('process', VREvent_Process_t),
+    VREvent_Monitor_HideHeadsetView: ('process', VREvent_Process_t),
+    VREvent_Audio_SetSpeakersVolume: ('audioVolumeControl', VREvent_AudioVolumeControl_t),
+    VREvent_Audio_SetSpeakersMute: ('audioMuteControl', VREvent_AudioMuteControl_t),
+    VREvent_Audio_SetMicrophoneVolume: ('audioVolumeControl', VREvent_AudioVolumeControl_t),
+    VREvent_Audio_SetMicrophoneMute: ('audioMuteControl', VREvent_AudioMuteControl_t),
+}
+
+
 class COpenVRContext(object):
     def __init__(self):
         self.m_pVRSystem = None
@@ -2748,11 +2829,21 @@ class COpenVRContext(object):
         self.m_pVRNotifications = None
 
     def checkClear(self):
+        """
+        Re-validate the cached interfaces against the OpenVR init token.
+        Only needed if OpenVR might have been initialized or shut down outside of this module.
+        """
         global _vr_token
         if _vr_token != getInitToken():
             self.clear()
             _vr_token = getInitToken()
 
+    def reset(self):
+        """Drop the cached interfaces. Called whenever this module initializes or shuts down OpenVR."""
+        global _vr_token
+        self.clear()
+        _vr_token = getInitToken()
+
     def clear(self):  
         self.m_pVRSystem = None
         self.m_pVRChaperone = None
@@ -2776,121 +2867,101 @@ class COpenVRContext(object):
         self.m_pVRNotifications = None
 
     def VRSystem(self):
-        self.checkClear()
         if self.m_pVRSystem is None:
             self.m_pVRSystem = IVRSystem()
         return self.m_pVRSystem
 
     def VRChaperone(self):
-        self.checkClear()
         if self.m_pVRChaperone is None:
             self.m_pVRChaperone = IVRChaperone()
         return self.m_pVRChaperone
 
     def VRChaperoneSetup(self):
-        self.checkClear()
         if self.m_pVRChaperoneSetup is None:
             self.m_pVRChaperoneSetup = IVRChaperoneSetup()
         return self.m_pVRChaperoneSetup
 
     def VRCompositor(self):
-        self.checkClear()
         if self.m_pVRCompositor is None:
             self.m_pVRCompositor = IVRCompositor()
         return self.m_pVRCompositor
 
     def VROverlay(self):
-        self.checkClear()
         if self.m_pVROverlay is None:
             self.m_pVROverlay = IVROverlay()
         return self.m_pVROverlay
 
     def VROverlayView(self):
-        self.checkClear()
         if self.m_pVROverlayView is None:
             self.m_pVROverlayView = IVROverlayView()
         return self.m_pVROverlayView
 
     def VRHeadsetView(self):
-        self.checkClear()
         if self.m_pVRHeadsetView is None:
             self.m_pVRHeadsetView = IVRHeadsetView()
         return self.m_pVRHeadsetView
 
     def VRResources(self):
-        self.checkClear()
         if self.m_pVRResources is None:
             self.m_pVRResources = IVRResources()
         return self.m_pVRResources
 
     def VRScreenshots(self):
-        self.checkClear()
         if self.m_pVRScreenshots is None:
             self.m_pVRScreenshots = IVRScreenshots()
         return self.m_pVRScreenshots
 
     def VRRenderModels(self):
-        self.checkClear()
         if self.m_pVRRenderModels is None:
             self.m_pVRRenderModels = IVRRenderModels()
         return self.m_pVRRenderModels
 
     def VRExtendedDisplay(self):
-        self.checkClear()
         if self.m_pVRExtendedDisplay is None:
             self.m_pVRExtendedDisplay = IVRExtendedDisplay()
         return self.m_pVRExtendedDisplay
 
     def VRSettings(self):
-        self.checkClear()
         if self.m_pVRSettings is None:
             self.m_pVRSettings = IVRSettings()
         return self.m_pVRSettings
 
     def VRApplications(self):
-        self.checkClear()
         if self.m_pVRApplications is None:
             self.m_pVRApplications = IVRApplications()
         return self.m_pVRApplications
 
     def VRTrackedCamera(self):
-        self.checkClear()
         if self.m_pVRTrackedCamera is None:
             self.m_pVRTrackedCamera = IVRTrackedCamera()
         return self.m_pVRTrackedCamera
 
     def VRDriverManager(self):
-        self.checkClear()
         if self.m_pVRDriverManager is None:
             self.m_pVRDriverManager = IVRDriverManager()
         return self.m_pVRDriverManager
 
     def VRInput(self):
-        self.checkClear()
         if self.m_pVRInput is None:
             self.m_pVRInput = IVRInput()
         return self.m_pVRInput
 
     def VRIOBuffer(self):
-        self.checkClear()
         if self.m_pVRIOBuffer is None:
             self.m_pVRIOBuffer = IVRIOBuffer()
         return self.m_pVRIOBuffer
 
     def VRSpatialAnchors(self):
-        self.checkClear()
         if self.m_pVRSpatialAnchors is None:
             self.m_pVRSpatialAnchors = IVRSpatialAnchors()
         return self.m_pVRSpatialAnchors
 
     def VRDebug(self):
-        self.checkClear()
         if self.m_pVRDebug is None:
             self.m_pVRDebug = IVRDebug()
         return self.m_pVRDebug
 
     def VRNotifications(self):
-        self.checkClear()
         if self.m_pVRNotifications is None:
             self.m_pVRNotifications = IVRNotifications()
         return self.m_pVRNotifications
@@ -2901,6 +2972,15 @@ _vr_token = None
 _internal_module_context = COpenVRContext()
 
 
+def checkClear():
+    """
+    Interface objects returned by VRSystem(), VRCompositor() etc. are cached until init(), shutdown(),
+    initInternal2() or shutdownInternal() is called. Call checkClear() to re-validate them, if OpenVR
+    might have been re-initialized by other means, for example by another library in the same process.
+    """
+    _internal_module_context.checkClear()
+
+
 def VRSystem():
     return _internal_module_context.VRSystem()
 
@@ -3033,6 +3113,9 @@ class IVRSystem_FnTable(Structure):
 
 
 class IVRSystem(object):
+    _sizeof_VRControllerState_t = sizeof(VRControllerState_t)
+    _sizeof_VREvent_t = sizeof(VREvent_t)
+
     def __init__(self):
         version_key = IVRSystem_Version
         _checkInterfaceVersion(version_key)
@@ -3042,10 +3125,13 @@ class IVRSystem(object):
         if fn_table_ptr is None:
             raise OpenVRError("Error retrieving VR API for IVRSystem")
         self.function_table = fn_table_ptr.contents
+        # Reading a function table field creates a new function object each time, so read each just once
+        for entry_name, _ in fn_type._fields_:
+            setattr(self, '_fn_' + entry_name, getattr(self.function_table, entry_name))
 
     def getRecommendedRenderTargetSize(self):
         """Suggested size for the intermediate render target that the distortion pulls from."""
-        fn = self.function_table.getRecommendedRenderTargetSize
+        fn = self._fn_getRecommendedRenderTargetSize
         width = c_uint32()
         height = c_uint32()
         fn(byref(width), byref(height))
@@ -3053,7 +3139,7 @@ class IVRSystem(object):
 
     def getProjectionMatrix(self, eye, nearZ: float, farZ: float):
         """The projection matrix for the specified eye"""
-        fn = self.function_table.getProjectionMatrix
+        fn = self._fn_getProjectionMatrix
         result = fn(eye, nearZ, farZ)
         return result
 
@@ -3062,7 +3148,7 @@ class IVRSystem(object):
         The components necessary to build your own projection matrix in case your
         application is doing something fancy like infinite Z
         """
-        fn = self.function_table.getProjectionRaw
+        fn = self._fn_getProjectionRaw
         left = c_float()
         right = c_float()
         top = c_float()
@@ -3070,14 +3156,15 @@ class IVRSystem(object):
         fn(eye, byref(left), byref(right), byref(top), byref(bottom))
         return left.value, right.value, top.value, bottom.value
 
-    def computeDistortion(self, eye, u: float, v: float):
+    def computeDistortion(self, eye, u: float, v: float, distortionCoordinates=None):
         """
         Gets the result of the distortion function for the specified eye and input UVs. UVs go from 0,0 in
         the upper left of that eye's viewport and 1,1 in the lower right of that eye's viewport.
         Returns true for success. Otherwise, returns false, and distortion coordinates are not suitable.
         """
-        fn = self.function_table.computeDistortion
-        distortionCoordinates = DistortionCoordinates_t()
+        fn = self._fn_computeDistortion
+        if distortionCoordinates is None:
+            distortionCoordinates = DistortionCoordinates_t()
         result = fn(eye, u, v, byref(distortionCoordinates))
         return result, distortionCoordinates
 
@@ -3087,7 +3174,7 @@ class IVRSystem(object):
         space that provides stereo disparity. Instead of Model * View * Projection the sequence is Model * View * Eye^-1 * Projection.
         Normally View and Eye^-1 will be multiplied together and treated as View in your application.
         """
-        fn = self.function_table.getEyeToHeadTransform
+        fn = self._fn_getEyeToHeadTransform
         result = fn(eye)
         return result
 
@@ -3098,7 +3185,7 @@ class IVRSystem(object):
         time if that is not available. If no vsync times are available the function will
         return zero for vsync time and frame counter and return false from the method.
         """
-        fn = self.function_table.getTimeSinceLastVsync
+        fn = self._fn_getTimeSinceLastVsync
         secondsSinceLastVsync = c_float()
         frameCounter = c_uint64()
         result = fn(byref(secondsSinceLastVsync), byref(frameCounter))
@@ -3110,7 +3197,7 @@ class IVRSystem(object):
         Returns the adapter index that the user should pass into CreateDevice to set up D3D9 in such
         a way that it can go full screen exclusive on the HMD. Returns -1 if there was an error.
         """
-        fn = self.function_table.getD3D9AdapterIndex
+        fn = self._fn_getD3D9AdapterIndex
         result = fn()
         return result
 
@@ -3120,12 +3207,12 @@ class IVRSystem(object):
         Returns the adapter index that the user should pass into EnumAdapters to create the device
         and swap chain in DX10 and DX11. If an error occurs the index will be set to -1.
         """
-        fn = self.function_table.getDXGIOutputInfo
+        fn = self._fn_getDXGIOutputInfo
         adapterIndex = c_int32()
         fn(byref(adapterIndex))
         return adapterIndex.value
 
-    def getOutputDevice(self, textureType):
+    def getOutputDevice(self, textureType, instance=None):
         """
         Returns platform- and texture-type specific adapter identification so that applications and the
         compositor are creating textures and swap chains on the same GPU. If an error occurs the device
@@ -3148,21 +3235,22 @@ class IVRSystem(object):
          Pre 10.13 for TextureType_OpenGL returns 0, as there is no dependable way to correlate the HMDs MTLDevice
           with a GL Renderer.
         """
-        fn = self.function_table.getOutputDevice
+        fn = self._fn_getOutputDevice
         device = c_uint64()
-        instance = VkInstance_T()
+        if instance is None:
+            instance = VkInstance_T()
         fn(byref(device), textureType, byref(instance))
         return device.value, instance
 
     def isDisplayOnDesktop(self):
         """Use to determine if the headset display is part of the desktop (i.e. extended) or hidden (i.e. direct mode)."""
-        fn = self.function_table.isDisplayOnDesktop
+        fn = self._fn_isDisplayOnDesktop
         result = fn()
         return result
 
     def setDisplayVisibility(self, isVisibleOnDesktop):
         """Set the display visibility (true = extended, false = direct mode).  Return value of true indicates that the change was successful."""
-        fn = self.function_table.setDisplayVisibility
+        fn = self._fn_setDisplayVisibility
         result = fn(isVisibleOnDesktop)
         return result
 
@@ -3185,7 +3273,7 @@ class IVRSystem(object):
         probably not be used unless the application is the Chaperone calibration tool itself, but will provide
         poses relative to the hardware-specific coordinate system in the driver.
         """
-        fn = self.function_table.getDeviceToAbsoluteTrackingPose
+        fn = self._fn_getDeviceToAbsoluteTrackingPose
         if trackedDevicePoseArray is None:
             trackedDevicePoseArrayArg = None
             trackedDevicePoseArrayCount = 0
@@ -3208,7 +3296,7 @@ class IVRSystem(object):
         The seated origin may or may not be inside the Play Area or Collision Bounds returned by IVRChaperone. Its position
         depends on what the user has set from the Dashboard settings and previous calls to ResetSeatedZeroPose.
         """
-        fn = self.function_table.getSeatedZeroPoseToStandingAbsoluteTrackingPose
+        fn = self._fn_getSeatedZeroPoseToStandingAbsoluteTrackingPose
         result = fn()
         return result
 
@@ -3217,7 +3305,7 @@ class IVRSystem(object):
         Returns the transform from the tracking origin to the standing absolute tracking system. This allows
         applications to convert from raw tracking space to the calibrated standing coordinate system.
         """
-        fn = self.function_table.getRawZeroPoseToStandingAbsoluteTrackingPose
+        fn = self._fn_getRawZeroPoseToStandingAbsoluteTrackingPose
         result = fn()
         return result
 
@@ -3227,7 +3315,7 @@ class IVRSystem(object):
         relative to the specified tracked device (default: hmd -- pass in -1 for absolute tracking space).  Returns the number of devices
         in the list, or the size of the array needed if not large enough.
         """
-        fn = self.function_table.getSortedTrackedDeviceIndicesOfClass
+        fn = self._fn_getSortedTrackedDeviceIndicesOfClass
         if trackedDeviceIndexArray is None:
             trackedDeviceIndexArrayArg = None
             trackedDeviceIndexArrayCount = 0
@@ -3243,29 +3331,30 @@ class IVRSystem(object):
 
     def getTrackedDeviceActivityLevel(self, deviceId):
         """Returns the level of activity on the device."""
-        fn = self.function_table.getTrackedDeviceActivityLevel
+        fn = self._fn_getTrackedDeviceActivityLevel
         result = fn(deviceId)
         return result
 
-    def applyTransform(self, trackedDevicePose, transform):
+    def applyTransform(self, trackedDevicePose, transform, outputPose=None):
         """
         Convenience utility to apply the specified transform to the specified pose.
         This properly transforms all pose components, including velocity and angular velocity
         """
-        fn = self.function_table.applyTransform
-        outputPose = TrackedDevicePose_t()
+        fn = self._fn_applyTransform
+        if outputPose is None:
+            outputPose = TrackedDevicePose_t()
         fn(byref(outputPose), byref(trackedDevicePose), byref(transform))
         return outputPose
 
     def getTrackedDeviceIndexForControllerRole(self, deviceType):
         """Returns the device index associated with a specific role, for example the left hand or the right hand. This function is deprecated in favor of the new IVRInput system."""
-        fn = self.function_table.getTrackedDeviceIndexForControllerRole
+        fn = self._fn_getTrackedDeviceIndexForControllerRole
         result = fn(deviceType)
         return result
 
     def getControllerRoleForTrackedDeviceIndex(self, deviceIndex):
         """Returns the controller type associated with a device index. This function is deprecated in favor of the new IVRInput system."""
-        fn = self.function_table.getControllerRoleForTrackedDeviceIndex
+        fn = self._fn_getControllerRoleForTrackedDeviceIndex
         result = fn(deviceIndex)
         return result
 
@@ -3279,75 +3368,117 @@ class IVRSystem(object):
         the device class. Every device with something other than TrackedDevice_Invalid is associated with an
         actual tracked device.
         """
-        fn = self.function_table.getTrackedDeviceClass
+        fn = self._fn_getTrackedDeviceClass
         result = fn(deviceIndex)
         return result
 
     def isTrackedDeviceConnected(self, deviceIndex):
         """Returns true if there is a device connected in this slot."""
-        fn = self.function_table.isTrackedDeviceConnected
+        fn = self._fn_isTrackedDeviceConnected
         result = fn(deviceIndex)
         return result
 
     def getBoolTrackedDeviceProperty(self, deviceIndex, prop):
         """Returns a bool property. If the device index is not valid or the property is not a bool type this function will return false."""
-        fn = self.function_table.getBoolTrackedDeviceProperty
+        fn = self._fn_getBoolTrackedDeviceProperty
         error = ETrackedPropertyError()
         result = fn(deviceIndex, prop, byref(error))
         openvr.error_code.TrackedPropertyError.check_error_value(error.value)
         return result
 
+    def getBoolTrackedDeviceProperty_nothrow(self, deviceIndex, prop):
+        """Like getBoolTrackedDeviceProperty(), but returns the error code last, instead of raising it"""
+        fn = self._fn_getBoolTrackedDeviceProperty
+        error = ETrackedPropertyError()
+        result = fn(deviceIndex, prop, byref(error))
+        return result, error.value
+
     def getFloatTrackedDeviceProperty(self, deviceIndex, prop):
         """Returns a float property. If the device index is not valid or the property is not a float type this function will return 0."""
-        fn = self.function_table.getFloatTrackedDeviceProperty
+        fn = self._fn_getFloatTrackedDeviceProperty
         error = ETrackedPropertyError()
         result = fn(deviceIndex, prop, byref(error))
         openvr.error_code.TrackedPropertyError.check_error_value(error.value)
         return result
 
+    def getFloatTrackedDeviceProperty_nothrow(self, deviceIndex, prop):
+        """Like getFloatTrackedDeviceProperty(), but returns the error code last, instead of raising it"""
+        fn = self._fn_getFloatTrackedDeviceProperty
+        error = ETrackedPropertyError()
+        result = fn(deviceIndex, prop, byref(error))
+        return result, error.value
+
     def getInt32TrackedDeviceProperty(self, deviceIndex, prop):
         """Returns an int property. If the device index is not valid or the property is not a int type this function will return 0."""
-        fn = self.function_table.getInt32TrackedDeviceProperty
+        fn = self._fn_getInt32TrackedDeviceProperty
         error = ETrackedPropertyError()
         result = fn(deviceIndex, prop, byref(error))
         openvr.error_code.TrackedPropertyError.check_error_value(error.value)
         return result
 
+    def getInt32TrackedDeviceProperty_nothrow(self, deviceIndex, prop):
+        """Like getInt32TrackedDeviceProperty(), but returns the error code last, instead of raising it"""
+        fn = self._fn_getInt32TrackedDeviceProperty
+        error = ETrackedPropertyError()
+        result = fn(deviceIndex, prop, byref(error))
+        return result, error.value
+
     def getUint64TrackedDeviceProperty(self, deviceIndex, prop):
         """Returns a uint64 property. If the device index is not valid or the property is not a uint64 type this function will return 0."""
-        fn = self.function_table.getUint64TrackedDeviceProperty
+        fn = self._fn_getUint64TrackedDeviceProperty
         error = ETrackedPropertyError()
         result = fn(deviceIndex, prop, byref(error))
         openvr.error_code.TrackedPropertyError.check_error_value(error.value)
         return result
 
+    def getUint64TrackedDeviceProperty_nothrow(self, deviceIndex, prop):
+        """Like getUint64TrackedDeviceProperty(), but returns the error code last, instead of raising it"""
+        fn = self._fn_getUint64TrackedDeviceProperty
+        error = ETrackedPropertyError()
+        result = fn(deviceIndex, prop, byref(error))
+        return result, error.value
+
     def getMatrix34TrackedDeviceProperty(self, deviceIndex, prop):
         """Returns a matrix property. If the device index is not valid or the property is not a matrix type, this function will return identity."""
-        fn = self.function_table.getMatrix34TrackedDeviceProperty
+        fn = self._fn_getMatrix34TrackedDeviceProperty
         error = ETrackedPropertyError()
         result = fn(deviceIndex, prop, byref(error))
         openvr.error_code.TrackedPropertyError.check_error_value(error.value)
         return result
 
+    def getMatrix34TrackedDeviceProperty_nothrow(self, deviceIndex, prop):
+        """Like getMatrix34TrackedDeviceProperty(), but returns the error code last, instead of raising it"""
+        fn = self._fn_getMatrix34TrackedDeviceProperty
+        error = ETrackedPropertyError()
+        result = fn(deviceIndex, prop, byref(error))
+        return result, error.value
+
     def getArrayTrackedDeviceProperty(self, deviceIndex, prop, type_, buffer, bufferSize):
         """
         Returns an array of one type of property. If the device index is not valid or the property is not a single value or an array of the specified type,
         this function will return 0. Otherwise it returns the number of bytes necessary to hold the array of properties. If unBufferSize is
         greater than the returned size and pBuffer is non-NULL, pBuffer is filled with the contents of array of properties.
         """
-        fn = self.function_table.getArrayTrackedDeviceProperty
+        fn = self._fn_getArrayTrackedDeviceProperty
         error = ETrackedPropertyError()
         result = fn(deviceIndex, prop, type_, byref(buffer), bufferSize, byref(error))
         openvr.error_code.TrackedPropertyError.check_error_value(error.value)
         return result
 
+    def getArrayTrackedDeviceProperty_nothrow(self, deviceIndex, prop, type_, buffer, bufferSize):
+        """Like getArrayTrackedDeviceProperty(), but returns the error code last, instead of raising it"""
+        fn = self._fn_getArrayTrackedDeviceProperty
+        error = ETrackedPropertyError()
+        result = fn(deviceIndex, prop, type_, byref(buffer), bufferSize, byref(error))
+        return result, error.value
+
     def getStringTrackedDeviceProperty(self, deviceIndex, prop):
         """
         Returns a string property. If the device index is not valid or the property is not a string type this function will
         return 0. Otherwise it returns the length of the number of bytes necessary to hold this string including the trailing
         null. Strings will always fit in buffers of k_unMaxPropertyStringSize characters.
         """
-        fn = self.function_table.getStringTrackedDeviceProperty
+        fn = self._fn_getStringTrackedDeviceProperty
         error = ETrackedPropertyError()
         bufferSize = fn(deviceIndex, prop, None, 0, byref(error))
         try:
@@ -3359,12 +3490,21 @@ class IVRSystem(object):
         openvr.error_code.TrackedPropertyError.check_error_value(error.value)
         return bytes(value.value).decode('utf-8')
 
+    def getStringTrackedDeviceProperty_nothrow(self, deviceIndex, prop):
+        """Like getStringTrackedDeviceProperty(), but returns the error code last, instead of raising it"""
+        fn = self._fn_getStringTrackedDeviceProperty
+        error = ETrackedPropertyError()
+        bufferSize = fn(deviceIndex, prop, None, 0, byref(error))
+        value = ctypes.create_string_buffer(bufferSize)
+        fn(deviceIndex, prop, value, bufferSize, byref(error))
+        return bytes(value.value).decode('utf-8'), error.value
+
     def getPropErrorNameFromEnum(self, error):
         """
         returns a string that corresponds with the specified property error. The string will be the name
         of the error enum value for all valid error codes
         """
-        fn = self.function_table.getPropErrorNameFromEnum
+        fn = self._fn_getPropErrorNameFromEnum
         result = fn(error)
         return result.decode('utf-8')
 
@@ -3373,27 +3513,28 @@ class IVRSystem(object):
         Returns true and fills the event with the next event on the queue if there is one. If there are no events
         this method returns false. uncbVREvent should be the size in bytes of the VREvent_t struct
         """
-        fn = self.function_table.pollNextEvent
-        vREvent = sizeof(VREvent_t)
+        fn = self._fn_pollNextEvent
+        vREvent = self._sizeof_VREvent_t
         result = fn(byref(event), vREvent)
         return result != 0
 
-    def pollNextEventWithPose(self, origin, event):
+    def pollNextEventWithPose(self, origin, event, trackedDevicePose=None):
         """
         Returns true and fills the event with the next event on the queue if there is one. If there are no events
           this method returns false. Fills in the pose of the associated tracked device in the provided pose struct.
           This pose will always be older than the call to this function and should not be used to render the device.
         uncbVREvent should be the size in bytes of the VREvent_t struct
         """
-        fn = self.function_table.pollNextEventWithPose
-        vREvent = sizeof(VREvent_t)
-        trackedDevicePose = TrackedDevicePose_t()
+        fn = self._fn_pollNextEventWithPose
+        vREvent = self._sizeof_VREvent_t
+        if trackedDevicePose is None:
+            trackedDevicePose = TrackedDevicePose_t()
         result = fn(origin, byref(event), vREvent, byref(trackedDevicePose))
         return result, event, trackedDevicePose
 
     def getEventTypeNameFromEnum(self, type_):
         """returns the name of an EVREvent enum value"""
-        fn = self.function_table.getEventTypeNameFromEnum
+        fn = self._fn_getEventTypeNameFromEnum
         result = fn(type_)
         return result.decode('utf-8')
 
@@ -3407,31 +3548,34 @@ class IVRSystem(object):
         Setting the bInverse argument to true will produce the visible area mesh that is commonly used in place of full-screen quads. The visible area mesh covers all of the pixels the hidden area mesh does not cover.
         Setting the bLineLoop argument will return a line loop of vertices in HiddenAreaMesh_t->pVertexData with HiddenAreaMesh_t->unTriangleCount set to the number of vertices.
         """
-        fn = self.function_table.getHiddenAreaMesh
+        fn = self._fn_getHiddenAreaMesh
         result = fn(eye, type_)
         return result
 
-    def getControllerState(self, controllerDeviceIndex):
+    def getControllerState(self, controllerDeviceIndex, controllerState=None):
         """
         Fills the supplied struct with the current state of the controller. Returns false if the controller index
         is invalid. This function is deprecated in favor of the new IVRInput system.
         """
-        fn = self.function_table.getControllerState
-        controllerState = VRControllerState_t()
-        controllerStateSize = sizeof(VRControllerState_t)
+        fn = self._fn_getControllerState
+        if controllerState is None:
+            controllerState = VRControllerState_t()
+        controllerStateSize = self._sizeof_VRControllerState_t
         result = fn(controllerDeviceIndex, byref(controllerState), controllerStateSize)
         return result, controllerState
 
-    def getControllerStateWithPose(self, origin, controllerDeviceIndex):
+    def getControllerStateWithPose(self, origin, controllerDeviceIndex, controllerState=None, trackedDevicePose=None):
         """
         fills the supplied struct with the current state of the controller and the provided pose with the pose of
         the controller when the controller state was updated most recently. Use this form if you need a precise controller
         pose as input to your application when the user presses or releases a button. This function is deprecated in favor of the new IVRInput system.
         """
-        fn = self.function_table.getControllerStateWithPose
-        controllerState = VRControllerState_t()
-        controllerStateSize = sizeof(VRControllerState_t)
-        trackedDevicePose = TrackedDevicePose_t()
+        fn = self._fn_getControllerStateWithPose
+        if controllerState is None:
+            controllerState = VRControllerState_t()
+        controllerStateSize = self._sizeof_VRControllerState_t
+        if trackedDevicePose is None:
+            trackedDevicePose = TrackedDevicePose_t()
         result = fn(origin, controllerDeviceIndex, byref(controllerState), controllerStateSize, byref(trackedDevicePose))
         return result, controllerState, trackedDevicePose
 
@@ -3440,18 +3584,18 @@ class IVRSystem(object):
         Trigger a single haptic pulse on a controller. After this call the application may not trigger another haptic pulse on this controller
         and axis combination for 5ms. This function is deprecated in favor of the new IVRInput system.
         """
-        fn = self.function_table.triggerHapticPulse
+        fn = self._fn_triggerHapticPulse
         fn(controllerDeviceIndex, axisId, durationMicroSec)
 
     def getButtonIdNameFromEnum(self, buttonId):
         """returns the name of an EVRButtonId enum value. This function is deprecated in favor of the new IVRInput system."""
-        fn = self.function_table.getButtonIdNameFromEnum
+        fn = self._fn_getButtonIdNameFromEnum
         result = fn(buttonId)
         return result.decode('utf-8')
 
     def getControllerAxisTypeNameFromEnum(self, axisType):
         """returns the name of an EVRControllerAxisType enum value. This function is deprecated in favor of the new IVRInput system."""
-        fn = self.function_table.getControllerAxisTypeNameFromEnum
+        fn = self._fn_getControllerAxisTypeNameFromEnum
         result = fn(axisType)
         return result.decode('utf-8')
 
@@ -3460,7 +3604,7 @@ class IVRSystem(object):
         Returns true if this application is receiving input from the system. This would return false if
         system-related functionality is consuming the input stream.
         """
-        fn = self.function_table.isInputAvailable
+        fn = self._fn_isInputAvailable
         result = fn()
         return result
 
@@ -3469,7 +3613,7 @@ class IVRSystem(object):
         Returns true SteamVR is drawing controllers on top of the application. Applications should consider
         not drawing anything attached to the user's hands in this case.
         """
-        fn = self.function_table.isSteamVRDrawingControllers
+        fn = self._fn_isSteamVRDrawingControllers
         result = fn()
         return result
 
@@ -3478,7 +3622,7 @@ class IVRSystem(object):
         Returns true if the user has put SteamVR into a mode that is distracting them from the application.
         For applications where this is appropriate, the application should pause ongoing activity.
         """
-        fn = self.function_table.shouldApplicationPause
+        fn = self._fn_shouldApplicationPause
         result = fn()
         return result
 
@@ -3487,7 +3631,7 @@ class IVRSystem(object):
         Returns true if SteamVR is doing significant rendering work and the game should do what it can to reduce
         its own workload. One common way to do this is to reduce the size of the render target provided for each eye.
         """
-        fn = self.function_table.shouldApplicationReduceRenderingWork
+        fn = self._fn_shouldApplicationReduceRenderingWork
         result = fn()
         return result
 
@@ -3499,16 +3643,22 @@ class IVRSystem(object):
         to figure our whether a firmware update is available, and to figure out whether its a manual update
         Prop_Firmware_ManualUpdateURL_String should point to an URL describing the manual update process
         """
-        fn = self.function_table.performFirmwareUpdate
+        fn = self._fn_performFirmwareUpdate
         error = fn(deviceIndex)
         openvr.error_code.FirmwareError.check_error_value(error)
 
+    def performFirmwareUpdate_nothrow(self, deviceIndex):
+        """Like performFirmwareUpdate(), but returns the error code last, instead of raising it"""
+        fn = self._fn_performFirmwareUpdate
+        error = fn(deviceIndex)
+        return error
+
     def acknowledgeQuit_Exiting(self) -> None:
         """
         Call this to acknowledge to the system that VREvent_Quit has been received and that the process is exiting.
         This extends the timeout until the process is killed.
         """
-        fn = self.function_table.acknowledgeQuit_Exiting
+        fn = self._fn_acknowledgeQuit_Exiting
         fn()
 
     def getAppContainerFilePaths(self):
@@ -3517,7 +3667,7 @@ class IVRSystem(object):
         must have read access to when running inside of an app container. Returns the number of bytes
         needed to hold the list.
         """
-        fn = self.function_table.getAppContainerFilePaths
+        fn = self._fn_getAppContainerFilePaths
         bufferSize = fn(None, 0)
         buffer = ctypes.create_string_buffer(bufferSize)
         fn(buffer, bufferSize)
@@ -3531,7 +3681,7 @@ class IVRSystem(object):
         number for logging or showing to a user, and not to try to detect anything at runtime. When appropriate, feature-specific
         presence information is provided by other APIs.
         """
-        fn = self.function_table.getRuntimeVersion
+        fn = self._fn_getRuntimeVersion
         result = fn()
         return result.decode('utf-8')
 
@@ -3581,29 +3731,48 @@ class IVRApplications(object):
         if fn_table_ptr is None:
             raise OpenVRError("Error retrieving VR API for IVRApplications")
         self.function_table = fn_table_ptr.contents
+        # Reading a function table field creates a new function object each time, so read each just once
+        for entry_name, _ in fn_type._fields_:
+            setattr(self, '_fn_' + entry_name, getattr(self.function_table, entry_name))
 
     def addApplicationManifest(self, applicationManifestFullPath: str, temporary=False) -> None:
         """
         Adds an application manifest to the list to load when building the list of installed applications.
         Temporary manifests are not automatically loaded
         """
-        fn = self.function_table.addApplicationManifest
+        fn = self._fn_addApplicationManifest
         if applicationManifestFullPath is not None:
             applicationManifestFullPath = bytes(applicationManifestFullPath, encoding='utf-8')
         error = fn(applicationManifestFullPath, temporary)
         openvr.error_code.ApplicationError.check_error_value(error)
 
+    def addApplicationManifest_nothrow(self, applicationManifestFullPath: str, temporary=False):
+        """Like addApplicationManifest(), but returns the error code last, instead of raising it"""
+        fn = self._fn_addApplicationManifest
+        if applicationManifestFullPath is not None:
+            applicationManifestFullPath = bytes(applicationManifestFullPath, encoding='utf-8')
+        error = fn(applicationManifestFullPath, temporary)
+        return error
+
     def removeApplicationManifest(self, applicationManifestFullPath: str) -> None:
         """Removes an application manifest from the list to load when building the list of installed applications."""
-        fn = self.function_table.removeApplicationManifest
+        fn = self._fn_removeApplicationManifest
         if applicationManifestFullPath is not None:
             applicationManifestFullPath = bytes(applicationManifestFullPath, encoding='utf-8')
         error = fn(applicationManifestFullPath)
         openvr.error_code.ApplicationError.check_error_value(error)
 
+    def removeApplicationManifest_nothrow(self, applicationManifestFullPath: str):
+        """Like removeApplicationManifest(), but returns the error code last, instead of raising it"""
+        fn = self._fn_removeApplicationManifest
+        if applicationManifestFullPath is not None:
+            applicationManifestFullPath = bytes(applicationManifestFullPath, encoding='utf-8')
+        error = fn(applicationManifestFullPath)
+        return error
+
     def isApplicationInstalled(self, appKey: str):
         """Returns true if an application is installed"""
-        fn = self.function_table.isApplicationInstalled
+        fn = self._fn_isApplicationInstalled
         if appKey is not None:
             appKey = bytes(appKey, encoding='utf-8')
         result = fn(appKey)
@@ -3611,7 +3780,7 @@ class IVRApplications(object):
 
     def getApplicationCount(self):
         """Returns the number of applications available in the list"""
-        fn = self.function_table.getApplicationCount
+        fn = self._fn_getApplicationCount
         result = fn()
         return result
 
@@ -3621,42 +3790,66 @@ class IVRApplications(object):
         value of GetApplicationCount(). The buffer should be at least k_unMaxApplicationKeyLength in order to
         fit the key.
         """
-        fn = self.function_table.getApplicationKeyByIndex
+        fn = self._fn_getApplicationKeyByIndex
         appKeyBufferLen = fn(applicationIndex, None, 0)
         appKeyBuffer = ctypes.create_string_buffer(appKeyBufferLen)
         error = fn(applicationIndex, appKeyBuffer, appKeyBufferLen)
         openvr.error_code.ApplicationError.check_error_value(error)
         return bytes(appKeyBuffer.value).decode('utf-8')
 
+    def getApplicationKeyByIndex_nothrow(self, applicationIndex):
+        """Like getApplicationKeyByIndex(), but returns the error code last, instead of raising it"""
+        fn = self._fn_getApplicationKeyByIndex
+        appKeyBufferLen = fn(applicationIndex, None, 0)
+        appKeyBuffer = ctypes.create_string_buffer(appKeyBufferLen)
+        error = fn(applicationIndex, appKeyBuffer, appKeyBufferLen)
+        return bytes(appKeyBuffer.value).decode('utf-8'), error
+
     def getApplicationKeyByProcessId(self, processId):
         """
         Returns the key of the application for the specified Process Id. The buffer should be at least
         k_unMaxApplicationKeyLength in order to fit the key.
         """
-        fn = self.function_table.getApplicationKeyByProcessId
+        fn = self._fn_getApplicationKeyByProcessId
         appKeyBufferLen = fn(processId, None, 0)
         appKeyBuffer = ctypes.create_string_buffer(appKeyBufferLen)
         error = fn(processId, appKeyBuffer, appKeyBufferLen)
         openvr.error_code.ApplicationError.check_error_value(error)
         return bytes(appKeyBuffer.value).decode('utf-8')
 
+    def getApplicationKeyByProcessId_nothrow(self, processId):
+        """Like getApplicationKeyByProcessId(), but returns the error code last, instead of raising it"""
+        fn = self._fn_getApplicationKeyByProcessId
+        appKeyBufferLen = fn(processId, None, 0)
+        appKeyBuffer = ctypes.create_string_buffer(appKeyBufferLen)
+        error = fn(processId, appKeyBuffer, appKeyBufferLen)
+        return bytes(appKeyBuffer.value).decode('utf-8'), error
+
     def launchApplication(self, appKey: str) -> None:
         """
         Launches the application. The existing scene application will exit and then the new application will start.
         This call is not valid for dashboard overlay applications.
         """
-        fn = self.function_table.launchApplication
+        fn = self._fn_launchApplication
         if appKey is not None:
             appKey = bytes(appKey, encoding='utf-8')
         error = fn(appKey)
         openvr.error_code.ApplicationError.check_error_value(error)
 
+    def launchApplication_nothrow(self, appKey: str):
+        """Like launchApplication(), but returns the error code last, instead of raising it"""
+        fn = self._fn_launchApplication
+        if appKey is not None:
+            appKey = bytes(appKey, encoding='utf-8')
+        error = fn(appKey)
+        return error
+
     def launchTemplateApplication(self, templateAppKey: str, newAppKey: str, keys) -> None:
         """
         Launches an instance of an application of type template, with its app key being pchNewAppKey (which must be unique) and optionally override sections
         from the manifest file via AppOverrideKeys_t
         """
-        fn = self.function_table.launchTemplateApplication
+        fn = self._fn_launchTemplateApplication
         if templateAppKey is not None:
             templateAppKey = bytes(templateAppKey, encoding='utf-8')
         if newAppKey is not None:
@@ -3674,9 +3867,29 @@ class IVRApplications(object):
         error = fn(templateAppKey, newAppKey, keysArg, keys)
         openvr.error_code.ApplicationError.check_error_value(error)
 
+    def launchTemplateApplication_nothrow(self, templateAppKey: str, newAppKey: str, keys):
+        """Like launchTemplateApplication(), but returns the error code last, instead of raising it"""
+        fn = self._fn_launchTemplateApplication
+        if templateAppKey is not None:
+            templateAppKey = bytes(templateAppKey, encoding='utf-8')
+        if newAppKey is not None:
+            newAppKey = bytes(newAppKey, encoding='utf-8')
+        if keys is None:
+            keysArg = None
+            keys = 0
+        elif isinstance(keys, ctypes.Array):
+            keysArg = byref(keys[0])
+            keys = len(keys)
+        else:
+            keys = (AppOverrideKeys_t * 1)()
+            keysArg = byref(keys[0])
+            keys = 1
+        error = fn(templateAppKey, newAppKey, keysArg, keys)
+        return error
+
     def launchApplicationFromMimeType(self, mimeType: str, args: str) -> None:
         """launches the application currently associated with this mime type and passes it the option args, typically the filename or object name of the item being launched"""
-        fn = self.function_table.launchApplicationFromMimeType
+        fn = self._fn_launchApplicationFromMimeType
         if mimeType is not None:
             mimeType = bytes(mimeType, encoding='utf-8')
         if args is not None:
@@ -3684,20 +3897,38 @@ class IVRApplications(object):
         error = fn(mimeType, args)
         openvr.error_code.ApplicationError.check_error_value(error)
 
+    def launchApplicationFromMimeType_nothrow(self, mimeType: str, args: str):
+        """Like launchApplicationFromMimeType(), but returns the error code last, instead of raising it"""
+        fn = self._fn_launchApplicationFromMimeType
+        if mimeType is not None:
+            mimeType = bytes(mimeType, encoding='utf-8')
+        if args is not None:
+            args = bytes(args, encoding='utf-8')
+        error = fn(mimeType, args)
+        return error
+
     def launchDashboardOverlay(self, appKey: str) -> None:
         """
         Launches the dashboard overlay application if it is not already running. This call is only valid for
         dashboard overlay applications.
         """
-        fn = self.function_table.launchDashboardOverlay
+        fn = self._fn_launchDashboardOverlay
         if appKey is not None:
             appKey = bytes(appKey, encoding='utf-8')
         error = fn(appKey)
         openvr.error_code.ApplicationError.check_error_value(error)
 
+    def launchDashboardOverlay_nothrow(self, appKey: str):
+        """Like launchDashboardOverlay(), but returns the error code last, instead of raising it"""
+        fn = self._fn_launchDashboardOverlay
+        if appKey is not None:
+            appKey = bytes(appKey, encoding='utf-8')
+        error = fn(appKey)
+        return error
+
     def cancelApplicationLaunch(self, appKey: str):
         """Cancel a pending launch for an application"""
-        fn = self.function_table.cancelApplicationLaunch
+        fn = self._fn_cancelApplicationLaunch
         if appKey is not None:
             appKey = bytes(appKey, encoding='utf-8')
         result = fn(appKey)
@@ -3710,15 +3941,23 @@ class IVRApplications(object):
         for the now running application. Passing a process ID of 0 identifies the calling process.
         The application must be one that's known to the system via a call to AddApplicationManifest.
         """
-        fn = self.function_table.identifyApplication
+        fn = self._fn_identifyApplication
         if appKey is not None:
             appKey = bytes(appKey, encoding='utf-8')
         error = fn(processId, appKey)
         openvr.error_code.ApplicationError.check_error_value(error)
 
+    def identifyApplication_nothrow(self, processId, appKey: str):
+        """Like identifyApplication(), but returns the error code last, instead of raising it"""
+        fn = self._fn_identifyApplication
+        if appKey is not None:
+            appKey = bytes(appKey, encoding='utf-8')
+        error = fn(processId, appKey)
+        return error
+
     def getApplicationProcessId(self, appKey: str):
         """Returns the process ID for an application. Return 0 if the application was not found or is not running."""
-        fn = self.function_table.getApplicationProcessId
+        fn = self._fn_getApplicationProcessId
         if appKey is not None:
             appKey = bytes(appKey, encoding='utf-8')
         result = fn(appKey)
@@ -3726,13 +3965,13 @@ class IVRApplications(object):
 
     def getApplicationsErrorNameFromEnum(self, error):
         """Returns a string for an applications error"""
-        fn = self.function_table.getApplicationsErrorNameFromEnum
+        fn = self._fn_getApplicationsErrorNameFromEnum
         result = fn(error)
         return result.decode('utf-8')
 
     def getApplicationPropertyString(self, appKey: str, property_):
         """Returns a value for an application property. The required buffer size to fit this value will be returned."""
-        fn = self.function_table.getApplicationPropertyString
+        fn = self._fn_getApplicationPropertyString
         if appKey is not None:
             appKey = bytes(appKey, encoding='utf-8')
         error = EVRApplicationError()
@@ -3746,9 +3985,20 @@ class IVRApplications(object):
         openvr.error_code.ApplicationError.check_error_value(error.value)
         return bytes(propertyValueBuffer.value).decode('utf-8')
 
+    def getApplicationPropertyString_nothrow(self, appKey: str, property_):
+        """Like getApplicationPropertyString(), but returns the error code last, instead of raising it"""
+        fn = self._fn_getApplicationPropertyString
+        if appKey is not None:
+            appKey = bytes(appKey, encoding='utf-8')
+        error = EVRApplicationError()
+        propertyValueBufferLen = fn(appKey, property_, None, 0, byref(error))
+        propertyValueBuffer = ctypes.create_string_buffer(propertyValueBufferLen)
+        fn(appKey, property_, propertyValueBuffer, propertyValueBufferLen, byref(error))
+        return bytes(propertyValueBuffer.value).decode('utf-8'), error.value
+
     def getApplicationPropertyBool(self, appKey: str, property_):
         """Returns a bool value for an application property. Returns false in all error cases."""
-        fn = self.function_table.getApplicationPropertyBool
+        fn = self._fn_getApplicationPropertyBool
         if appKey is not None:
             appKey = bytes(appKey, encoding='utf-8')
         error = EVRApplicationError()
@@ -3756,9 +4006,18 @@ class IVRApplications(object):
         openvr.error_code.ApplicationError.check_error_value(error.value)
         return result
 
+    def getApplicationPropertyBool_nothrow(self, appKey: str, property_):
+        """Like getApplicationPropertyBool(), but returns the error code last, instead of raising it"""
+        fn = self._fn_getApplicationPropertyBool
+        if appKey is not None:
+            appKey = bytes(appKey, encoding='utf-8')
+        error = EVRApplicationError()
+        result = fn(appKey, property_, byref(error))
+        return result, error.value
+
     def getApplicationPropertyUint64(self, appKey: str, property_):
         """Returns a uint64 value for an application property. Returns 0 in all error cases."""
-        fn = self.function_table.getApplicationPropertyUint64
+        fn = self._fn_getApplicationPropertyUint64
         if appKey is not None:
             appKey = bytes(appKey, encoding='utf-8')
         error = EVRApplicationError()
@@ -3766,17 +4025,34 @@ class IVRApplications(object):
         openvr.error_code.ApplicationError.check_error_value(error.value)
         return result
 
+    def getApplicationPropertyUint64_nothrow(self, appKey: str, property_):
+        """Like getApplicationPropertyUint64(), but returns the error code last, instead of raising it"""
+        fn = self._fn_getApplicationPropertyUint64
+        if appKey is not None:
+            appKey = bytes(appKey, encoding='utf-8')
+        error = EVRApplicationError()
+        result = fn(appKey, property_, byref(error))
+        return result, error.value
+
     def setApplicationAutoLaunch(self, appKey: str, autoLaunch) -> None:
         """Sets the application auto-launch flag. This is only valid for applications which return true for VRApplicationProperty_IsDashboardOverlay_Bool."""
-        fn = self.function_table.setApplicationAutoLaunch
+        fn = self._fn_setApplicationAutoLaunch
         if appKey is not None:
             appKey = bytes(appKey, encoding='utf-8')
         error = fn(appKey, autoLaunch)
         openvr.error_code.ApplicationError.check_error_value(error)
 
+    def setApplicationAutoLaunch_nothrow(self, appKey: str, autoLaunch):
+        """Like setApplicationAutoLaunch(), but returns the error code last, instead of raising it"""
+        fn = self._fn_setApplicationAutoLaunch
+        if appKey is not None:
+            appKey = bytes(appKey, encoding='utf-8')
+        error = fn(appKey, autoLaunch)
+        return error
+
     def getApplicationAutoLaunch(self, appKey: str):
         """Gets the application auto-launch flag. This is only valid for applications which return true for VRApplicationProperty_IsDashboardOverlay_Bool."""
-        fn = self.function_table.getApplicationAutoLaunch
+        fn = self._fn_getApplicationAutoLaunch
         if appKey is not None:
             appKey = bytes(appKey, encoding='utf-8')
         result = fn(appKey)
@@ -3784,7 +4060,7 @@ class IVRApplications(object):
 
     def setDefaultApplicationForMimeType(self, appKey: str, mimeType: str) -> None:
         """Adds this mime-type to the list of supported mime types for this application"""
-        fn = self.function_table.setDefaultApplicationForMimeType
+        fn = self._fn_setDefaultApplicationForMimeType
         if appKey is not None:
             appKey = bytes(appKey, encoding='utf-8')
         if mimeType is not None:
@@ -3792,9 +4068,19 @@ class IVRApplications(object):
         error = fn(appKey, mimeType)
         openvr.error_code.ApplicationError.check_error_value(error)
 
+    def setDefaultApplicationForMimeType_nothrow(self, appKey: str, mimeType: str):
+        """Like setDefaultApplicationForMimeType(), but returns the error code last, instead of raising it"""
+        fn = self._fn_setDefaultApplicationForMimeType
+        if appKey is not None:
+            appKey = bytes(appKey, encoding='utf-8')
+        if mimeType is not None:
+            mimeType = bytes(mimeType, encoding='utf-8')
+        error = fn(appKey, mimeType)
+        return error
+
     def getDefaultApplicationForMimeType(self, mimeType: str):
         """return the app key that will open this mime type"""
-        fn = self.function_table.getDefaultApplicationForMimeType
+        fn = self._fn_getDefaultApplicationForMimeType
         if mimeType is not None:
             mimeType = bytes(mimeType, encoding='utf-8')
         appKeyBufferLen = fn(mimeType, None, 0)
@@ -3804,7 +4090,7 @@ class IVRApplications(object):
 
     def getApplicationSupportedMimeTypes(self, appKey: str):
         """Get the list of supported mime types for this application, comma-delimited"""
-        fn = self.function_table.getApplicationSupportedMimeTypes
+        fn = self._fn_getApplicationSupportedMimeTypes
         if appKey is not None:
             appKey = bytes(appKey, encoding='utf-8')
         mimeTypesBuffer = fn(appKey, None, 0)
@@ -3814,7 +4100,7 @@ class IVRApplications(object):
 
     def getApplicationsThatSupportMimeType(self, mimeType: str):
         """Get the list of app-keys that support this mime type, comma-delimited, the return value is number of bytes you need to return the full string"""
-        fn = self.function_table.getApplicationsThatSupportMimeType
+        fn = self._fn_getApplicationsThatSupportMimeType
         if mimeType is not None:
             mimeType = bytes(mimeType, encoding='utf-8')
         appKeysThatSupportBuffer = fn(mimeType, None, 0)
@@ -3824,7 +4110,7 @@ class IVRApplications(object):
 
     def getApplicationLaunchArguments(self, handle):
         """Get the args list from an app launch that had the process already running, you call this when you get a VREvent_ApplicationMimeTypeLoad"""
-        fn = self.function_table.getApplicationLaunchArguments
+        fn = self._fn_getApplicationLaunchArguments
         args = fn(handle, None, 0)
         args = ctypes.create_string_buffer(args)
         fn(handle, args, args)
@@ -3832,16 +4118,24 @@ class IVRApplications(object):
 
     def getStartingApplication(self):
         """Returns the app key for the application that is starting up"""
-        fn = self.function_table.getStartingApplication
+        fn = self._fn_getStartingApplication
         appKeyBufferLen = fn(None, 0)
         appKeyBuffer = ctypes.create_string_buffer(appKeyBufferLen)
         error = fn(appKeyBuffer, appKeyBufferLen)
         openvr.error_code.ApplicationError.check_error_value(error)
         return bytes(appKeyBuffer.value).decode('utf-8')
 
+    def getStartingApplication_nothrow(self):
+        """Like getStartingApplication(), but returns the error code last, instead of raising it"""
+        fn = self._fn_getStartingApplication
+        appKeyBufferLen = fn(None, 0)
+        appKeyBuffer = ctypes.create_string_buffer(appKeyBufferLen)
+        error = fn(appKeyBuffer, appKeyBufferLen)
+        return bytes(appKeyBuffer.value).decode('utf-8'), error
+
     def getSceneApplicationState(self):
         """Returns the application transition state"""
-        fn = self.function_table.getSceneApplicationState
+        fn = self._fn_getSceneApplicationState
         result = fn()
         return result
 
@@ -3856,15 +4150,23 @@ class IVRApplications(object):
           VRApplicationError_LaunchInProgress         - A different application is already starting. This is a permanent failure.
           VRApplicationError_None                   - Go ahead and launch. Everything is clear.
         """
-        fn = self.function_table.performApplicationPrelaunchCheck
+        fn = self._fn_performApplicationPrelaunchCheck
         if appKey is not None:
             appKey = bytes(appKey, encoding='utf-8')
         error = fn(appKey)
         openvr.error_code.ApplicationError.check_error_value(error)
 
+    def performApplicationPrelaunchCheck_nothrow(self, appKey: str):
+        """Like performApplicationPrelaunchCheck(), but returns the error code last, instead of raising it"""
+        fn = self._fn_performApplicationPrelaunchCheck
+        if appKey is not None:
+            appKey = bytes(appKey, encoding='utf-8')
+        error = fn(appKey)
+        return error
+
     def getSceneApplicationStateNameFromEnum(self, state):
         """Returns a string for an application transition state"""
-        fn = self.function_table.getSceneApplicationStateNameFromEnum
+        fn = self._fn_getSceneApplicationStateNameFromEnum
         result = fn(state)
         return result.decode('utf-8')
 
@@ -3876,7 +4178,7 @@ class IVRApplications(object):
         If working directory is NULL or "" the directory portion of the binary path will be
         the working directory.
         """
-        fn = self.function_table.launchInternalProcess
+        fn = self._fn_launchInternalProcess
         if binaryPath is not None:
             binaryPath = bytes(binaryPath, encoding='utf-8')
         if arguments is not None:
@@ -3886,13 +4188,25 @@ class IVRApplications(object):
         error = fn(binaryPath, arguments, workingDirectory)
         openvr.error_code.ApplicationError.check_error_value(error)
 
+    def launchInternalProcess_nothrow(self, binaryPath: str, arguments: str, workingDirectory: str):
+        """Like launchInternalProcess(), but returns the error code last, instead of raising it"""
+        fn = self._fn_launchInternalProcess
+        if binaryPath is not None:
+            binaryPath = bytes(binaryPath, encoding='utf-8')
+        if arguments is not None:
+            arguments = bytes(arguments, encoding='utf-8')
+        if workingDirectory is not None:
+            workingDirectory = bytes(workingDirectory, encoding='utf-8')
+        error = fn(binaryPath, arguments, workingDirectory)
+        return error
+
     def getCurrentSceneProcessId(self):
         """
         Returns the current scene process ID according to the application system. A scene process will get scene
         focus once it starts rendering, but it will appear here once it calls VR_Init with the Scene application
         type.
         """
-        fn = self.function_table.getCurrentSceneProcessId
+        fn = self._fn_getCurrentSceneProcessId
         result = fn()
         return result
 
@@ -3923,14 +4237,17 @@ class IVRSettings(object):
         if fn_table_ptr is None:
             raise OpenVRError("Error retrieving VR API for IVRSettings")
         self.function_table = fn_table_ptr.contents
+        # Reading a function table field creates a new function object each time, so read each just once
+        for entry_name, _ in fn_type._fields_:
+            setattr(self, '_fn_' + entry_name, getattr(self.function_table, entry_name))
 
     def getSettingsErrorNameFromEnum(self, error):
-        fn = self.function_table.getSettingsErrorNameFromEnum
+        fn = self._fn_getSettingsErrorNameFromEnum
         result = fn(error)
         return result.decode('utf-8')
 
     def setBool(self, section: str, settingsKey: str, value) -> None:
-        fn = self.function_table.setBool
+        fn = self._fn_setBool
         if section is not None:
             section = bytes(section, encoding='utf-8')
         if settingsKey is not None:
@@ -3939,8 +4256,19 @@ class IVRSettings(object):
         fn(section, settingsKey, value, byref(error))
         openvr.error_code.SettingsError.check_error_value(error.value)
 
+    def setBool_nothrow(self, section: str, settingsKey: str, value):
+        """Like setBool(), but returns the error code last, instead of raising it"""
+        fn = self._fn_setBool
+        if section is not None:
+            section = bytes(section, encoding='utf-8')
+        if settingsKey is not None:
+            settingsKey = bytes(settingsKey, encoding='utf-8')
+        error = EVRSettingsError()
+        fn(section, settingsKey, value, byref(error))
+        return error.value
+
     def setInt32(self, section: str, settingsKey: str, value) -> None:
-        fn = self.function_table.setInt32
+        fn = self._fn_setInt32
         if section is not None:
             section = bytes(section, encoding='utf-8')
         if settingsKey is not None:
@@ -3949,8 +4277,19 @@ class IVRSettings(object):
         fn(section, settingsKey, value, byref(error))
         openvr.error_code.SettingsError.check_error_value(error.value)
 
+    def setInt32_nothrow(self, section: str, settingsKey: str, value):
+        """Like setInt32(), but returns the error code last, instead of raising it"""
+        fn = self._fn_setInt32
+        if section is not None:
+            section = bytes(section, encoding='utf-8')
+        if settingsKey is not None:
+            settingsKey = bytes(settingsKey, encoding='utf-8')
+        error = EVRSettingsError()
+        fn(section, settingsKey, value, byref(error))
+        return error.value
+
     def setFloat(self, section: str, settingsKey: str, value: float) -> None:
-        fn = self.function_table.setFloat
+        fn = self._fn_setFloat
         if section is not None:
             section = bytes(section, encoding='utf-8')
         if settingsKey is not None:
@@ -3959,8 +4298,19 @@ class IVRSettings(object):
         fn(section, settingsKey, value, byref(error))
         openvr.error_code.SettingsError.check_error_value(error.value)
 
+    def setFloat_nothrow(self, section: str, settingsKey: str, value: float):
+        """Like setFloat(), but returns the error code last, instead of raising it"""
+        fn = self._fn_setFloat
+        if section is not None:
+            section = bytes(section, encoding='utf-8')
+        if settingsKey is not None:
+            settingsKey = bytes(settingsKey, encoding='utf-8')
+        error = EVRSettingsError()
+        fn(section, settingsKey, value, byref(error))
+        return error.value
+
     def setString(self, section: str, settingsKey: str, value: str) -> None:
-        fn = self.function_table.setString
+        fn = self._fn_setString
         if section is not None:
             section = bytes(section, encoding='utf-8')
         if settingsKey is not None:
@@ -3971,12 +4321,25 @@ class IVRSettings(object):
         fn(section, settingsKey, value, byref(error))
         openvr.error_code.SettingsError.check_error_value(error.value)
 
+    def setString_nothrow(self, section: str, settingsKey: str, value: str):
+        """Like setString(), but returns the error code last, instead of raising it"""
+        fn = self._fn_setString
+        if section is not None:
+            section = bytes(section, encoding='utf-8')
+        if settingsKey is not None:
+            settingsKey = bytes(settingsKey, encoding='utf-8')
+        if value is not None:
+            value = bytes(value, encoding='utf-8')
+        error = EVRSettingsError()
+        fn(section, settingsKey, value, byref(error))
+        return error.value
+
     def getBool(self, section: str, settingsKey: str):
         """
         Users of the system need to provide a proper default in default.vrsettings in the resources/settings/ directory
         of either the runtime or the driver_xxx directory. Otherwise the default will be false, 0, 0.0 or ""
         """
-        fn = self.function_table.getBool
+        fn = self._fn_getBool
         if section is not None:
             section = bytes(section, encoding='utf-8')
         if settingsKey is not None:
@@ -3986,8 +4349,19 @@ class IVRSettings(object):
         openvr.error_code.SettingsError.check_error_value(error.value)
         return result
 
+    def getBool_nothrow(self, section: str, settingsKey: str):
+        """Like getBool(), but returns the error code last, instead of raising it"""
+        fn = self._fn_getBool
+        if section is not None:
+            section = bytes(section, encoding='utf-8')
+        if settingsKey is not None:
+            settingsKey = bytes(settingsKey, encoding='utf-8')
+        error = EVRSettingsError()
+        result = fn(section, settingsKey, byref(error))
+        return result, error.value
+
     def getInt32(self, section: str, settingsKey: str):
-        fn = self.function_table.getInt32
+        fn = self._fn_getInt32
         if section is not None:
             section = bytes(section, encoding='utf-8')
         if settingsKey is not None:
@@ -3997,8 +4371,19 @@ class IVRSettings(object):
         openvr.error_code.SettingsError.check_error_value(error.value)
         return result
 
+    def getInt32_nothrow(self, section: str, settingsKey: str):
+        """Like getInt32(), but returns the error code last, instead of raising it"""
+        fn = self._fn_getInt32
+        if section is not None:
+            section = bytes(section, encoding='utf-8')
+        if settingsKey is not None:
+            settingsKey = bytes(settingsKey, encoding='utf-8')
+        error = EVRSettingsError()
+        result = fn(section, settingsKey, byref(error))
+        return result, error.value
+
     def getFloat(self, section: str, settingsKey: str):
-        fn = self.function_table.getFloat
+        fn = self._fn_getFloat
         if section is not None:
             section = bytes(section, encoding='utf-8')
         if settingsKey is not None:
@@ -4008,8 +4393,19 @@ class IVRSettings(object):
         openvr.error_code.SettingsError.check_error_value(error.value)
         return result
 
+    def getFloat_nothrow(self, section: str, settingsKey: str):
+        """Like getFloat(), but returns the error code last, instead of raising it"""
+        fn = self._fn_getFloat
+        if section is not None:
+            section = bytes(section, encoding='utf-8')
+        if settingsKey is not None:
+            settingsKey = bytes(settingsKey, encoding='utf-8')
+        error = EVRSettingsError()
+        result = fn(section, settingsKey, byref(error))
+        return result, error.value
+
     def getString(self, section: str, settingsKey: str):
-        fn = self.function_table.getString
+        fn = self._fn_getString
         if section is not None:
             section = bytes(section, encoding='utf-8')
         if settingsKey is not None:
@@ -4025,16 +4421,38 @@ class IVRSettings(object):
         openvr.error_code.SettingsError.check_error_value(error.value)
         return bytes(value.value).decode('utf-8')
 
+    def getString_nothrow(self, section: str, settingsKey: str):
+        """Like getString(), but returns the error code last, instead of raising it"""
+        fn = self._fn_getString
+        if section is not None:
+            section = bytes(section, encoding='utf-8')
+        if settingsKey is not None:
+            settingsKey = bytes(settingsKey, encoding='utf-8')
+        error = EVRSettingsError()
+        valueLen = fn(section, settingsKey, None, 0, byref(error))
+        value = ctypes.create_string_buffer(valueLen)
+        fn(section, settingsKey, value, valueLen, byref(error))
+        return bytes(value.value).decode('utf-8'), error.value
+
     def removeSection(self, section: str) -> None:
-        fn = self.function_table.removeSection
+        fn = self._fn_removeSection
         if section is not None:
             section = bytes(section, encoding='utf-8')
         error = EVRSettingsError()
         fn(section, byref(error))
         openvr.error_code.SettingsError.check_error_value(error.value)
 
+    def removeSection_nothrow(self, section: str):
+        """Like removeSection(), but returns the error code last, instead of raising it"""
+        fn = self._fn_removeSection
+        if section is not None:
+            section = bytes(section, encoding='utf-8')
+        error = EVRSettingsError()
+        fn(section, byref(error))
+        return error.value
+
     def removeKeyInSection(self, section: str, settingsKey: str) -> None:
-        fn = self.function_table.removeKeyInSection
+        fn = self._fn_removeKeyInSection
         if section is not None:
             section = bytes(section, encoding='utf-8')
         if settingsKey is not None:
@@ -4043,6 +4461,17 @@ class IVRSettings(object):
         fn(section, settingsKey, byref(error))
         openvr.error_code.SettingsError.check_error_value(error.value)
 
+    def removeKeyInSection_nothrow(self, section: str, settingsKey: str):
+        """Like removeKeyInSection(), but returns the error code last, instead of raising it"""
+        fn = self._fn_removeKeyInSection
+        if section is not None:
+            section = bytes(section, encoding='utf-8')
+        if settingsKey is not None:
+            settingsKey = bytes(settingsKey, encoding='utf-8')
+        error = EVRSettingsError()
+        fn(section, settingsKey, byref(error))
+        return error.value
+
 
 class IVRChaperone_FnTable(Structure):
     _fields_ = [
@@ -4075,10 +4504,13 @@ class IVRChaperone(object):
         if fn_table_ptr is None:
             raise OpenVRError("Error retrieving VR API for IVRChaperone")
         self.function_table = fn_table_ptr.contents
+        # Reading a function table field creates a new function object each time, so read each just once
+        for entry_name, _ in fn_type._fields_:
+            setattr(self, '_fn_' + entry_name, getattr(self.function_table, entry_name))
 
     def getCalibrationState(self):
         """Get the current state of Chaperone calibration. This state can change at any time during a session due to physical base station changes."""
-        fn = self.function_table.getCalibrationState
+        fn = self._fn_getCalibrationState
         result = fn()
         return result
 
@@ -4087,13 +4519,13 @@ class IVRChaperone(object):
         Returns the width and depth of the Play Area (formerly named Soft Bounds) in X and Z.
         Tracking space center (0,0,0) is the center of the Play Area.
         """
-        fn = self.function_table.getPlayAreaSize
+        fn = self._fn_getPlayAreaSize
         sizeX = c_float()
         sizeZ = c_float()
         result = fn(byref(sizeX), byref(sizeZ))
         return result, sizeX.value, sizeZ.value
 
-    def getPlayAreaRect(self):
+    def getPlayAreaRect(self, rect=None):
         """
         Returns a quad describing the Play Area (formerly named Soft Bounds).
         The corners form a rectangle.
@@ -4106,38 +4538,41 @@ class IVRChaperone(object):
         The quad lies on the XZ plane (height = 0y), with 2 sides parallel to the X-axis and two sides parallel
         to the Z-axis of the user's calibrated Play Area.
         """
-        fn = self.function_table.getPlayAreaRect
-        rect = HmdQuad_t()
+        fn = self._fn_getPlayAreaRect
+        if rect is None:
+            rect = HmdQuad_t()
         result = fn(byref(rect))
         return result, rect
 
     def reloadInfo(self) -> None:
         """Reload Chaperone data from the .vrchap file on disk."""
-        fn = self.function_table.reloadInfo
+        fn = self._fn_reloadInfo
         fn()
 
     def setSceneColor(self, color) -> None:
         """Optionally give the chaperone system a hit about the color and brightness in the scene"""
-        fn = self.function_table.setSceneColor
+        fn = self._fn_setSceneColor
         fn(color)
 
-    def getBoundsColor(self, numOutputColors: int, collisionBoundsFadeDistance: float):
+    def getBoundsColor(self, numOutputColors: int, collisionBoundsFadeDistance: float, outputColorArray=None, outputCameraColor=None):
         """Get the current chaperone bounds draw color and brightness"""
-        fn = self.function_table.getBoundsColor
-        outputColorArray = HmdColor_t()
-        outputCameraColor = HmdColor_t()
+        fn = self._fn_getBoundsColor
+        if outputColorArray is None:
+            outputColorArray = HmdColor_t()
+        if outputCameraColor is None:
+            outputCameraColor = HmdColor_t()
         fn(byref(outputColorArray), numOutputColors, collisionBoundsFadeDistance, byref(outputCameraColor))
         return outputColorArray, outputCameraColor
 
     def areBoundsVisible(self):
         """Determine whether the bounds are showing right now"""
-        fn = self.function_table.areBoundsVisible
+        fn = self._fn_areBoundsVisible
         result = fn()
         return result
 
     def forceBoundsVisible(self, force) -> None:
         """Force the bounds to show, mostly for utilities"""
-        fn = self.function_table.forceBoundsVisible
+        fn = self._fn_forceBoundsVisible
         fn(force)
 
     def resetZeroPose(self, trackingUniverseOrigin) -> None:
@@ -4151,7 +4586,7 @@ class IVRChaperone(object):
         NOTE: This function overrides the user's previously saved zero pose and should only be called as the result of a user action.
         Users are also able to set their zero pose via the OpenVR Dashboard.
         """
-        fn = self.function_table.resetZeroPose
+        fn = self._fn_resetZeroPose
         fn(trackingUniverseOrigin)
 
 
@@ -4197,10 +4632,13 @@ class IVRChaperoneSetup(object):
         if fn_table_ptr is None:
             raise OpenVRError("Error retrieving VR API for IVRChaperoneSetup")
         self.function_table = fn_table_ptr.contents
+        # Reading a function table field creates a new function object each time, so read each just once
+        for entry_name, _ in fn_type._fields_:
+            setattr(self, '_fn_' + entry_name, getattr(self.function_table, entry_name))
 
     def commitWorkingCopy(self, configFile):
         """Saves the current working copy to disk"""
-        fn = self.function_table.commitWorkingCopy
+        fn = self._fn_commitWorkingCopy
         result = fn(configFile)
         return result
 
@@ -4210,7 +4648,7 @@ class IVRChaperoneSetup(object):
         To modify existing data this MUST be do WHILE getting a non-error ChaperoneCalibrationStatus.
         Only after this should you do gets and sets on the existing data.
         """
-        fn = self.function_table.revertWorkingCopy
+        fn = self._fn_revertWorkingCopy
         fn()
 
     def getWorkingPlayAreaSize(self):
@@ -4218,13 +4656,13 @@ class IVRChaperoneSetup(object):
         Returns the width and depth of the Play Area (formerly named Soft Bounds) in X and Z from the working copy.
         Tracking space center (0,0,0) is the center of the Play Area.
         """
-        fn = self.function_table.getWorkingPlayAreaSize
+        fn = self._fn_getWorkingPlayAreaSize
         sizeX = c_float()
         sizeZ = c_float()
         result = fn(byref(sizeX), byref(sizeZ))
         return result, sizeX.value, sizeZ.value
 
-    def getWorkingPlayAreaRect(self):
+    def getWorkingPlayAreaRect(self, rect=None):
         """
         Returns the 4 corner positions of the Play Area (formerly named Soft Bounds) from the working copy.
         Corners are in clockwise order.
@@ -4233,55 +4671,60 @@ class IVRChaperoneSetup(object):
         2 sides are parallel to the X axis and 2 sides are parallel to the Z axis.
         Height of every corner is 0Y (on the floor).
         """
-        fn = self.function_table.getWorkingPlayAreaRect
-        rect = HmdQuad_t()
+        fn = self._fn_getWorkingPlayAreaRect
+        if rect is None:
+            rect = HmdQuad_t()
         result = fn(byref(rect))
         return result, rect
 
-    def getWorkingCollisionBoundsInfo(self):
+    def getWorkingCollisionBoundsInfo(self, quadsBuffer=None):
         """
         Returns the number of Quads if the buffer points to null. Otherwise it returns Quads
         into the buffer up to the max specified from the working copy.
         """
-        fn = self.function_table.getWorkingCollisionBoundsInfo
-        quadsBuffer = HmdQuad_t()
+        fn = self._fn_getWorkingCollisionBoundsInfo
+        if quadsBuffer is None:
+            quadsBuffer = HmdQuad_t()
         quadsCount = c_uint32()
         result = fn(byref(quadsBuffer), byref(quadsCount))
         return result, quadsBuffer, quadsCount.value
 
-    def getLiveCollisionBoundsInfo(self):
+    def getLiveCollisionBoundsInfo(self, quadsBuffer=None):
         """
         Returns the number of Quads if the buffer points to null. Otherwise it returns Quads
         into the buffer up to the max specified.
         """
-        fn = self.function_table.getLiveCollisionBoundsInfo
-        quadsBuffer = HmdQuad_t()
+        fn = self._fn_getLiveCollisionBoundsInfo
+        if quadsBuffer is None:
+            quadsBuffer = HmdQuad_t()
         quadsCount = c_uint32()
         result = fn(byref(quadsBuffer), byref(quadsCount))
         return result, quadsBuffer, quadsCount.value
 
-    def getWorkingSeatedZeroPoseToRawTrackingPose(self):
+    def getWorkingSeatedZeroPoseToRawTrackingPose(self, seatedZeroPoseToRawTrackingPose=None):
         """Returns the preferred seated position from the working copy."""
-        fn = self.function_table.getWorkingSeatedZeroPoseToRawTrackingPose
-        seatedZeroPoseToRawTrackingPose = HmdMatrix34_t()
+        fn = self._fn_getWorkingSeatedZeroPoseToRawTrackingPose
+        if seatedZeroPoseToRawTrackingPose is None:
+            seatedZeroPoseToRawTrackingPose = HmdMatrix34_t()
         result = fn(byref(seatedZeroPoseToRawTrackingPose))
         return result, seatedZeroPoseToRawTrackingPose
 
-    def getWorkingStandingZeroPoseToRawTrackingPose(self):
+    def getWorkingStandingZeroPoseToRawTrackingPose(self, standingZeroPoseToRawTrackingPose=None):
         """Returns the standing origin from the working copy."""
-        fn = self.function_table.getWorkingStandingZeroPoseToRawTrackingPose
-        standingZeroPoseToRawTrackingPose = HmdMatrix34_t()
+        fn = self._fn_getWorkingStandingZeroPoseToRawTrackingPose
+        if standingZeroPoseToRawTrackingPose is None:
+            standingZeroPoseToRawTrackingPose = HmdMatrix34_t()
         result = fn(byref(standingZeroPoseToRawTrackingPose))
         return result, standingZeroPoseToRawTrackingPose
 
     def setWorkingPlayAreaSize(self, x: float, z: float) -> None:
         """Sets the Play Area in the working copy."""
-        fn = self.function_table.setWorkingPlayAreaSize
+        fn = self._fn_setWorkingPlayAreaSize
         fn(x, z)
 
     def setWorkingCollisionBoundsInfo(self, quadsBuffer):
         """Sets the Collision Bounds in the working copy. Note: ceiling height is ignored."""
-        fn = self.function_table.setWorkingCollisionBoundsInfo
+        fn = self._fn_setWorkingCollisionBoundsInfo
         if quadsBuffer is None:
             quadsBufferArg = None
             quadsCount = 0
@@ -4297,7 +4740,7 @@ class IVRChaperoneSetup(object):
 
     def setWorkingPerimeter(self, pointBuffer):
         """Sets the Collision Bounds in the working copy."""
-        fn = self.function_table.setWorkingPerimeter
+        fn = self._fn_setWorkingPerimeter
         if pointBuffer is None:
             pointBufferArg = None
             pointCount = 0
@@ -4313,35 +4756,36 @@ class IVRChaperoneSetup(object):
 
     def setWorkingSeatedZeroPoseToRawTrackingPose(self, matSeatedZeroPoseToRawTrackingPose) -> None:
         """Sets the preferred seated position in the working copy."""
-        fn = self.function_table.setWorkingSeatedZeroPoseToRawTrackingPose
+        fn = self._fn_setWorkingSeatedZeroPoseToRawTrackingPose
         fn(byref(matSeatedZeroPoseToRawTrackingPose))
 
     def setWorkingStandingZeroPoseToRawTrackingPose(self, matStandingZeroPoseToRawTrackingPose) -> None:
         """Sets the preferred standing position in the working copy."""
-        fn = self.function_table.setWorkingStandingZeroPoseToRawTrackingPose
+        fn = self._fn_setWorkingStandingZeroPoseToRawTrackingPose
         fn(byref(matStandingZeroPoseToRawTrackingPose))
 
     def reloadFromDisk(self, configFile) -> None:
         """Tear everything down and reload it from the file on disk"""
-        fn = self.function_table.reloadFromDisk
+        fn = self._fn_reloadFromDisk
         fn(configFile)
 
-    def getLiveSeatedZeroPoseToRawTrackingPose(self):
+    def getLiveSeatedZeroPoseToRawTrackingPose(self, seatedZeroPoseToRawTrackingPose=None):
         """Returns the preferred seated position."""
-        fn = self.function_table.getLiveSeatedZeroPoseToRawTrackingPose
-        seatedZeroPoseToRawTrackingPose = HmdMatrix34_t()
+        fn = self._fn_getLiveSeatedZeroPoseToRawTrackingPose
+        if seatedZeroPoseToRawTrackingPose is None:
+            seatedZeroPoseToRawTrackingPose = HmdMatrix34_t()
         result = fn(byref(seatedZeroPoseToRawTrackingPose))
         return result, seatedZeroPoseToRawTrackingPose
 
     def exportLiveToBuffer(self):
-        fn = self.function_table.exportLiveToBuffer
+        fn = self._fn_exportLiveToBuffer
         bufferLength = fn(None, 0)
         buffer = ctypes.create_string_buffer(bufferLength)
         fn(buffer, bufferLength)
         return bytes(buffer.value).decode('utf-8')
 
     def importFromBufferToWorking(self, buffer: str, importFlags):
-        fn = self.function_table.importFromBufferToWorking
+        fn = self._fn_importFromBufferToWorking
         if buffer is not None:
             buffer = bytes(buffer, encoding='utf-8')
         result = fn(buffer, importFlags)
@@ -4349,12 +4793,12 @@ class IVRChaperoneSetup(object):
 
     def showWorkingSetPreview(self) -> None:
         """Shows the chaperone data in the working set to preview in the compositor."""
-        fn = self.function_table.showWorkingSetPreview
+        fn = self._fn_showWorkingSetPreview
         fn()
 
     def hideWorkingSetPreview(self) -> None:
         """Hides the chaperone data in the working set to preview in the compositor (if it was visible)."""
-        fn = self.function_table.hideWorkingSetPreview
+        fn = self._fn_hideWorkingSetPreview
         fn()
 
     def roomSetupStarting(self) -> None:
@@ -4363,7 +4807,7 @@ class IVRChaperoneSetup(object):
         system make any last minute adjustments that should be incorporated into the new setup.  If the user is adjusting
         live in HMD using a tweak tool, keep in mind that calling this might cause the user to see the room jump.
         """
-        fn = self.function_table.roomSetupStarting
+        fn = self._fn_roomSetupStarting
         fn()
 
 
@@ -4436,15 +4880,18 @@ class IVRCompositor(object):
         if fn_table_ptr is None:
             raise OpenVRError("Error retrieving VR API for IVRCompositor")
         self.function_table = fn_table_ptr.contents
+        # Reading a function table field creates a new function object each time, so read each just once
+        for entry_name, _ in fn_type._fields_:
+            setattr(self, '_fn_' + entry_name, getattr(self.function_table, entry_name))
 
     def setTrackingSpace(self, origin) -> None:
         """Sets tracking space returned by WaitGetPoses"""
-        fn = self.function_table.setTrackingSpace
+        fn = self._fn_setTrackingSpace
         fn(origin)
 
     def getTrackingSpace(self):
         """Gets current tracking space returned by WaitGetPoses"""
-        fn = self.function_table.getTrackingSpace
+        fn = self._fn_getTrackingSpace
         result = fn()
         return result
 
@@ -4458,7 +4905,7 @@ class IVRCompositor(object):
           - IsNotSceneApplication (make sure to call VR_Init with VRApplicaiton_Scene)
           - DoNotHaveFocus (some other app has taken focus - this will throttle the call to 10hz to reduce the impact on that app)
         """
-        fn = self.function_table.waitGetPoses
+        fn = self._fn_waitGetPoses
         if renderPoseArray is None:
             renderPoseArrayArg = None
             renderPoseArrayCount = 0
@@ -4483,9 +4930,35 @@ class IVRCompositor(object):
         openvr.error_code.CompositorError.check_error_value(error)
         return renderPoseArray, gamePoseArray
 
+    def waitGetPoses_nothrow(self, renderPoseArray, gamePoseArray):
+        """Like waitGetPoses(), but returns the error code last, instead of raising it"""
+        fn = self._fn_waitGetPoses
+        if renderPoseArray is None:
+            renderPoseArrayArg = None
+            renderPoseArrayCount = 0
+        elif isinstance(renderPoseArray, ctypes.Array):
+            renderPoseArrayArg = byref(renderPoseArray[0])
+            renderPoseArrayCount = len(renderPoseArray)
+        else:
+            renderPoseArray = (TrackedDevicePose_t * k_unMaxTrackedDeviceCount)()
+            renderPoseArrayArg = byref(renderPoseArray[0])
+            renderPoseArrayCount = k_unMaxTrackedDeviceCount
+        if gamePoseArray is None:
+            gamePoseArrayArg = None
+            gamePoseArrayCount = 0
+        elif isinstance(gamePoseArray, ctypes.Array):
+            gamePoseArrayArg = byref(gamePoseArray[0])
+            gamePoseArrayCount = len(gamePoseArray)
+        else:
+            gamePoseArray = (TrackedDevicePose_t * k_unMaxTrackedDeviceCount)()
+            gamePoseArrayArg = byref(gamePoseArray[0])
+            gamePoseArrayCount = k_unMaxTrackedDeviceCount
+        error = fn(renderPoseArrayArg, renderPoseArrayCount, gamePoseArrayArg, gamePoseArrayCount)
+        return renderPoseArray, gamePoseArray, error
+
     def getLastPoses(self, renderPoseArray, gamePoseArray):
         """Get the last set of poses returned by WaitGetPoses."""
-        fn = self.function_table.getLastPoses
+        fn = self._fn_getLastPoses
         if renderPoseArray is None:
             renderPoseArrayArg = None
             renderPoseArrayCount = 0
@@ -4510,19 +4983,57 @@ class IVRCompositor(object):
         openvr.error_code.CompositorError.check_error_value(error)
         return renderPoseArray, gamePoseArray
 
-    def getLastPoseForTrackedDeviceIndex(self, deviceIndex):
+    def getLastPoses_nothrow(self, renderPoseArray, gamePoseArray):
+        """Like getLastPoses(), but returns the error code last, instead of raising it"""
+        fn = self._fn_getLastPoses
+        if renderPoseArray is None:
+            renderPoseArrayArg = None
+            renderPoseArrayCount = 0
+        elif isinstance(renderPoseArray, ctypes.Array):
+            renderPoseArrayArg = byref(renderPoseArray[0])
+            renderPoseArrayCount = len(renderPoseArray)
+        else:
+            renderPoseArray = (TrackedDevicePose_t * k_unMaxTrackedDeviceCount)()
+            renderPoseArrayArg = byref(renderPoseArray[0])
+            renderPoseArrayCount = k_unMaxTrackedDeviceCount
+        if gamePoseArray is None:
+            gamePoseArrayArg = None
+            gamePoseArrayCount = 0
+        elif isinstance(gamePoseArray, ctypes.Array):
+            gamePoseArrayArg = byref(gamePoseArray[0])
+            gamePoseArrayCount = len(gamePoseArray)
+        else:
+            gamePoseArray = (TrackedDevicePose_t * k_unMaxTrackedDeviceCount)()
+            gamePoseArrayArg = byref(gamePoseArray[0])
+            gamePoseArrayCount = k_unMaxTrackedDeviceCount
+        error = fn(renderPoseArrayArg, renderPoseArrayCount, gamePoseArrayArg, gamePoseArrayCount)
+        return renderPoseArray, gamePoseArray, error
+
+    def getLastPoseForTrackedDeviceIndex(self, deviceIndex, outputPose=None, outputGamePose=None):
         """
         Interface for accessing last set of poses returned by WaitGetPoses one at a time.
         Returns VRCompositorError_IndexOutOfRange if unDeviceIndex not less than k_unMaxTrackedDeviceCount otherwise VRCompositorError_None.
         It is okay to pass NULL for either pose if you only want one of the values.
         """
-        fn = self.function_table.getLastPoseForTrackedDeviceIndex
-        outputPose = TrackedDevicePose_t()
-        outputGamePose = TrackedDevicePose_t()
+        fn = self._fn_getLastPoseForTrackedDeviceIndex
+        if outputPose is None:
+            outputPose = TrackedDevicePose_t()
+        if outputGamePose is None:
+            outputGamePose = TrackedDevicePose_t()
         error = fn(deviceIndex, byref(outputPose), byref(outputGamePose))
         openvr.error_code.CompositorError.check_error_value(error)
         return outputPose, outputGamePose
 
+    def getLastPoseForTrackedDeviceIndex_nothrow(self, deviceIndex, outputPose=None, outputGamePose=None):
+        """Like getLastPoseForTrackedDeviceIndex(), but returns the error code last, instead of raising it"""
+        fn = self._fn_getLastPoseForTrackedDeviceIndex
+        if outputPose is None:
+            outputPose = TrackedDevicePose_t()
+        if outputGamePose is None:
+            outputGamePose = TrackedDevicePose_t()
+        error = fn(deviceIndex, byref(outputPose), byref(outputGamePose))
+        return outputPose, outputGamePose, error
+
     def submit(self, eye, texture, bounds=None, submitFlags=Submit_Default) -> None:
         """
         Updated scene texture to display. If pBounds is NULL the entire texture will be used.  If called from an OpenGL app, consider adding a glFlush after
@@ -4540,21 +5051,33 @@ class IVRCompositor(object):
           - InvalidTexture (usually means bad arguments passed in)
           - AlreadySubmitted (app has submitted two left textures or two right textures in a single frame - i.e. before calling WaitGetPoses again)
         """
-        fn = self.function_table.submit
+        fn = self._fn_submit
         error = fn(eye, byref(texture), byref(bounds), submitFlags)
         openvr.error_code.CompositorError.check_error_value(error)
 
+    def submit_nothrow(self, eye, texture, bounds=None, submitFlags=Submit_Default):
+        """Like submit(), but returns the error code last, instead of raising it"""
+        fn = self._fn_submit
+        error = fn(eye, byref(texture), byref(bounds), submitFlags)
+        return error
+
     def submitWithArrayIndex(self, eye, texture, textureArrayIndex, bounds=None, submitFlags=Submit_Default) -> None:
-        fn = self.function_table.submitWithArrayIndex
+        fn = self._fn_submitWithArrayIndex
         error = fn(eye, byref(texture), textureArrayIndex, byref(bounds), submitFlags)
         openvr.error_code.CompositorError.check_error_value(error)
 
+    def submitWithArrayIndex_nothrow(self, eye, texture, textureArrayIndex, bounds=None, submitFlags=Submit_Default):
+        """Like submitWithArrayIndex(), but returns the error code last, instead of raising it"""
+        fn = self._fn_submitWithArrayIndex
+        error = fn(eye, byref(texture), textureArrayIndex, byref(bounds), submitFlags)
+        return error
+
     def clearLastSubmittedFrame(self) -> None:
         """
         Clears the frame that was sent with the last call to Submit. This will cause the
         compositor to show the grid until Submit is called again.
         """
-        fn = self.function_table.clearLastSubmittedFrame
+        fn = self._fn_clearLastSubmittedFrame
         fn()
 
     def postPresentHandoff(self) -> None:
@@ -4565,16 +5088,17 @@ class IVRCompositor(object):
         introduce a deadlock of some sort.  This function tells the compositor that you have finished all rendering after having Submitted buffers for both
         eyes, and it is free to start its rendering work.  This should only be called from the same thread you are rendering on.
         """
-        fn = self.function_table.postPresentHandoff
+        fn = self._fn_postPresentHandoff
         fn()
 
-    def getFrameTiming(self, framesAgo=0):
+    def getFrameTiming(self, framesAgo=0, timing=None):
         """
         Returns true if timing data is filled it.  Sets oldest timing info if nFramesAgo is larger than the stored history.
         Be sure to set timing.size = sizeof(Compositor_FrameTiming) on struct passed in before calling this function.
         """
-        fn = self.function_table.getFrameTiming
-        timing = Compositor_FrameTiming()
+        fn = self._fn_getFrameTiming
+        if timing is None:
+            timing = Compositor_FrameTiming()
         result = fn(byref(timing), framesAgo)
         return result, timing
 
@@ -4583,7 +5107,7 @@ class IVRCompositor(object):
         Interface for copying a range of timing data.  Frames are returned in ascending order (oldest to newest) with the last being the most recent frame.
         Only the first entry's m_nSize needs to be set, as the rest will be inferred from that.  Returns total number of entries filled out.
         """
-        fn = self.function_table.getFrameTimings
+        fn = self._fn_getFrameTimings
         if timing is None:
             timingArg = None
             frames = 0
@@ -4602,14 +5126,15 @@ class IVRCompositor(object):
         Returns the time in seconds left in the current (as identified by FrameTiming's frameIndex) frame.
         Due to "running start", this value may roll over to the next frame before ever reaching 0.0.
         """
-        fn = self.function_table.getFrameTimeRemaining
+        fn = self._fn_getFrameTimeRemaining
         result = fn()
         return result
 
-    def getCumulativeStats(self, statsSizeInBytes):
+    def getCumulativeStats(self, statsSizeInBytes, stats=None):
         """Fills out stats accumulated for the last connected application.  Pass in sizeof( Compositor_CumulativeStats ) as second parameter."""
-        fn = self.function_table.getCumulativeStats
-        stats = Compositor_CumulativeStats()
+        fn = self._fn_getCumulativeStats
+        if stats is None:
+            stats = Compositor_CumulativeStats()
         fn(byref(stats), statsSizeInBytes)
         return stats
 
@@ -4619,23 +5144,23 @@ class IVRCompositor(object):
         0.0 and 1.0. This color is faded on top of the scene based on the alpha parameter. Removing the fade color instantly
         would be FadeToColor( 0.0, 0.0, 0.0, 0.0, 0.0 ).  Values are in un-premultiplied alpha space.
         """
-        fn = self.function_table.fadeToColor
+        fn = self._fn_fadeToColor
         fn(seconds, red, green, blue, alpha, background)
 
     def getCurrentFadeColor(self, background=False):
         """Get current fade color value."""
-        fn = self.function_table.getCurrentFadeColor
+        fn = self._fn_getCurrentFadeColor
         result = fn(background)
         return result
 
     def fadeGrid(self, seconds: float, fadeGridIn) -> None:
         """Fading the Grid in or out in fSeconds"""
-        fn = self.function_table.fadeGrid
+        fn = self._fn_fadeGrid
         fn(seconds, fadeGridIn)
 
     def getCurrentGridAlpha(self):
         """Get current alpha value of grid."""
-        fn = self.function_table.getCurrentGridAlpha
+        fn = self._fn_getCurrentGridAlpha
         result = fn()
         return result
 
@@ -4645,7 +5170,7 @@ class IVRCompositor(object):
         Order is Front, Back, Left, Right, Top, Bottom.  If only a single texture is passed, it is assumed in lat-long format.
         If two are passed, it is assumed a lat-long stereo pair.
         """
-        fn = self.function_table.setSkyboxOverride
+        fn = self._fn_setSkyboxOverride
         if textures is None:
             texturesArg = None
             textureCount = 0
@@ -4659,9 +5184,25 @@ class IVRCompositor(object):
         error = fn(texturesArg, textureCount)
         openvr.error_code.CompositorError.check_error_value(error)
 
-    def clearSkyboxOverride(self) -> None:
-        """Resets compositor skybox back to defaults."""
-        fn = self.function_table.clearSkyboxOverride
+    def setSkyboxOverride_nothrow(self, textures):
+        """Like setSkyboxOverride(), but returns the error code last, instead of raising it"""
+        fn = self._fn_setSkyboxOverride
+        if textures is None:
+            texturesArg = None
+            textureCount = 0
+        elif isinstance(textures, ctypes.Array):
+            texturesArg = byref(textures[0])
+            textureCount = len(textures)
+        else:
+            textures = (Texture_t * 1)()
+            texturesArg = byref(textures[0])
+            textureCount = 1
+        error = fn(texturesArg, textureCount)
+        return error
+
+    def clearSkyboxOverride(self) -> None:
+        """Resets compositor skybox back to defaults."""
+        fn = self._fn_clearSkyboxOverride
         fn()
 
     def compositorBringToFront(self) -> None:
@@ -4669,12 +5210,12 @@ class IVRCompositor(object):
         Brings the compositor window to the front. This is useful for covering any other window that may be on the HMD
         and is obscuring the compositor window.
         """
-        fn = self.function_table.compositorBringToFront
+        fn = self._fn_compositorBringToFront
         fn()
 
     def compositorGoToBack(self) -> None:
         """Pushes the compositor window to the back. This is useful for allowing other applications to draw directly to the HMD."""
-        fn = self.function_table.compositorGoToBack
+        fn = self._fn_compositorGoToBack
         fn()
 
     def compositorQuit(self) -> None:
@@ -4682,18 +5223,18 @@ class IVRCompositor(object):
         DEPRECATED: Tells the compositor process to clean up and exit. You do not need to call this function at shutdown.
         Under normal circumstances the compositor will manage its own life cycle based on what applications are running.
         """
-        fn = self.function_table.compositorQuit
+        fn = self._fn_compositorQuit
         fn()
 
     def isFullscreen(self):
         """Return whether the compositor is fullscreen"""
-        fn = self.function_table.isFullscreen
+        fn = self._fn_isFullscreen
         result = fn()
         return result
 
     def getCurrentSceneFocusProcess(self):
         """Returns the process ID of the process that is currently rendering the scene"""
-        fn = self.function_table.getCurrentSceneFocusProcess
+        fn = self._fn_getCurrentSceneFocusProcess
         result = fn()
         return result
 
@@ -4702,13 +5243,13 @@ class IVRCompositor(object):
         Returns the process ID of the process that rendered the last frame (or 0 if the compositor itself rendered the frame.)
         Returns 0 when fading out from an app and the app's process Id when fading into an app.
         """
-        fn = self.function_table.getLastFrameRenderer
+        fn = self._fn_getLastFrameRenderer
         result = fn()
         return result
 
     def canRenderScene(self):
         """Returns true if the current process has the scene focus"""
-        fn = self.function_table.canRenderScene
+        fn = self._fn_canRenderScene
         result = fn()
         return result
 
@@ -4717,44 +5258,44 @@ class IVRCompositor(object):
         DEPRECATED: Opens the headset view (as either a window or docked widget depending on user's preferences) that displays what the user
         sees in the headset.
         """
-        fn = self.function_table.showMirrorWindow
+        fn = self._fn_showMirrorWindow
         fn()
 
     def hideMirrorWindow(self) -> None:
         """DEPRECATED: Closes the headset view, either as a window or docked widget."""
-        fn = self.function_table.hideMirrorWindow
+        fn = self._fn_hideMirrorWindow
         fn()
 
     def isMirrorWindowVisible(self):
         """DEPRECATED: Returns true if the headset view (either as a window or docked widget) is shown."""
-        fn = self.function_table.isMirrorWindowVisible
+        fn = self._fn_isMirrorWindowVisible
         result = fn()
         return result
 
     def compositorDumpImages(self) -> None:
         """Writes back buffer and stereo left/right pair from the application to a 'screenshots' folder in the SteamVR runtime root."""
-        fn = self.function_table.compositorDumpImages
+        fn = self._fn_compositorDumpImages
         fn()
 
     def shouldAppRenderWithLowResources(self):
         """Let an app know it should be rendering with low resources."""
-        fn = self.function_table.shouldAppRenderWithLowResources
+        fn = self._fn_shouldAppRenderWithLowResources
         result = fn()
         return result
 
     def forceInterleavedReprojectionOn(self, override) -> None:
         """Override interleaved reprojection logic to force on."""
-        fn = self.function_table.forceInterleavedReprojectionOn
+        fn = self._fn_forceInterleavedReprojectionOn
         fn(override)
 
     def forceReconnectProcess(self) -> None:
         """Force reconnecting to the compositor process."""
-        fn = self.function_table.forceReconnectProcess
+        fn = self._fn_forceReconnectProcess
         fn()
 
     def suspendRendering(self, suspend) -> None:
         """Temporarily suspends rendering (useful for finer control over scene transitions)."""
-        fn = self.function_table.suspendRendering
+        fn = self._fn_suspendRendering
         fn(suspend)
 
     def getMirrorTextureD3D11(self, eye, d3D11DeviceOrResource):
@@ -4762,36 +5303,51 @@ class IVRCompositor(object):
         Opens a shared D3D11 texture with the undistorted composited image for each eye.  Use ReleaseMirrorTextureD3D11 when finished
         instead of calling Release on the resource itself.
         """
-        fn = self.function_table.getMirrorTextureD3D11
+        fn = self._fn_getMirrorTextureD3D11
         d3D11ShaderResourceView = c_void_p()
         error = fn(eye, byref(d3D11DeviceOrResource), byref(d3D11ShaderResourceView))
         openvr.error_code.CompositorError.check_error_value(error)
         return d3D11ShaderResourceView.value
 
+    def getMirrorTextureD3D11_nothrow(self, eye, d3D11DeviceOrResource):
+        """Like getMirrorTextureD3D11(), but returns the error code last, instead of raising it"""
+        fn = self._fn_getMirrorTextureD3D11
+        d3D11ShaderResourceView = c_void_p()
+        error = fn(eye, byref(d3D11DeviceOrResource), byref(d3D11ShaderResourceView))
+        return d3D11ShaderResourceView.value, error
+
     def releaseMirrorTextureD3D11(self, d3D11ShaderResourceView) -> None:
-        fn = self.function_table.releaseMirrorTextureD3D11
+        fn = self._fn_releaseMirrorTextureD3D11
         fn(byref(d3D11ShaderResourceView))
 
     def getMirrorTextureGL(self, eye):
         """Access to mirror textures from OpenGL."""
-        fn = self.function_table.getMirrorTextureGL
+        fn = self._fn_getMirrorTextureGL
         textureId = glUInt_t()
         sharedTextureHandle = glSharedTextureHandle_t()
         error = fn(eye, byref(textureId), byref(sharedTextureHandle))
         openvr.error_code.CompositorError.check_error_value(error)
         return textureId, sharedTextureHandle
 
+    def getMirrorTextureGL_nothrow(self, eye):
+        """Like getMirrorTextureGL(), but returns the error code last, instead of raising it"""
+        fn = self._fn_getMirrorTextureGL
+        textureId = glUInt_t()
+        sharedTextureHandle = glSharedTextureHandle_t()
+        error = fn(eye, byref(textureId), byref(sharedTextureHandle))
+        return textureId, sharedTextureHandle, error
+
     def releaseSharedGLTexture(self, textureId, sharedTextureHandle):
-        fn = self.function_table.releaseSharedGLTexture
+        fn = self._fn_releaseSharedGLTexture
         result = fn(textureId, sharedTextureHandle)
         return result
 
     def lockGLSharedTextureForAccess(self, sharedTextureHandle) -> None:
-        fn = self.function_table.lockGLSharedTextureForAccess
+        fn = self._fn_lockGLSharedTextureForAccess
         fn(sharedTextureHandle)
 
     def unlockGLSharedTextureForAccess(self, sharedTextureHandle) -> None:
-        fn = self.function_table.unlockGLSharedTextureForAccess
+        fn = self._fn_unlockGLSharedTextureForAccess
         fn(sharedTextureHandle)
 
     def getVulkanInstanceExtensionsRequired(self):
@@ -4800,20 +5356,21 @@ class IVRCompositor(object):
         return 0. Otherwise it returns the length of the number of bytes necessary to hold this string including the trailing
         null.  The string will be a space separated list of-required instance extensions to enable in VkCreateInstance
         """
-        fn = self.function_table.getVulkanInstanceExtensionsRequired
+        fn = self._fn_getVulkanInstanceExtensionsRequired
         bufferSize = fn(None, 0)
         value = ctypes.create_string_buffer(bufferSize)
         fn(value, bufferSize)
         return bytes(value.value).decode('utf-8')
 
-    def getVulkanDeviceExtensionsRequired(self):
+    def getVulkanDeviceExtensionsRequired(self, physicalDevice=None):
         """
         [Vulkan only]
         return 0. Otherwise it returns the length of the number of bytes necessary to hold this string including the trailing
         null.  The string will be a space separated list of required device extensions to enable in VkCreateDevice
         """
-        fn = self.function_table.getVulkanDeviceExtensionsRequired
-        physicalDevice = VkPhysicalDevice_T()
+        fn = self._fn_getVulkanDeviceExtensionsRequired
+        if physicalDevice is None:
+            physicalDevice = VkPhysicalDevice_T()
         bufferSize = fn(byref(physicalDevice), None, 0)
         value = ctypes.create_string_buffer(bufferSize)
         fn(byref(physicalDevice), value, bufferSize)
@@ -4840,7 +5397,7 @@ class IVRCompositor(object):
         and SubmitExplicitTimingData will access the queue, so only WaitGetPoses becomes safe for accessing the queue from another
         thread.
         """
-        fn = self.function_table.setExplicitTimingMode
+        fn = self._fn_setExplicitTimingMode
         fn(timingMode)
 
     def submitExplicitTimingData(self) -> None:
@@ -4852,23 +5409,29 @@ class IVRCompositor(object):
         will perform a vkQueueSubmit on Vulkan so must not be done simultaneously with VkQueue operations on another thread.
         Returns VRCompositorError_RequestFailed if SetExplicitTimingMode is not enabled.
         """
-        fn = self.function_table.submitExplicitTimingData
+        fn = self._fn_submitExplicitTimingData
         error = fn()
         openvr.error_code.CompositorError.check_error_value(error)
 
+    def submitExplicitTimingData_nothrow(self):
+        """Like submitExplicitTimingData(), but returns the error code last, instead of raising it"""
+        fn = self._fn_submitExplicitTimingData
+        error = fn()
+        return error
+
     def isMotionSmoothingEnabled(self):
         """
         Indicates whether or not motion smoothing is enabled by the user settings.
         If you want to know if motion smoothing actually triggered due to a late frame, check Compositor_FrameTiming
         m_nReprojectionFlags & VRCompositor_ReprojectionMotion instead.
         """
-        fn = self.function_table.isMotionSmoothingEnabled
+        fn = self._fn_isMotionSmoothingEnabled
         result = fn()
         return result
 
     def isMotionSmoothingSupported(self):
         """Indicates whether or not motion smoothing is supported by the current hardware."""
-        fn = self.function_table.isMotionSmoothingSupported
+        fn = self._fn_isMotionSmoothingSupported
         result = fn()
         return result
 
@@ -4877,7 +5440,7 @@ class IVRCompositor(object):
         Indicates whether or not the current scene focus app is currently loading.  This is inferred from its use of FadeGrid to
         explicitly fade to the compositor to cover up the fact that it cannot render at a sustained full framerate during this time.
         """
-        fn = self.function_table.isCurrentSceneFocusAppLoading
+        fn = self._fn_isCurrentSceneFocusAppLoading
         result = fn()
         return result
 
@@ -4887,39 +5450,56 @@ class IVRCompositor(object):
         This file will be loaded asynchronously from disk and uploaded to the gpu by the runtime.  Once ready for rendering, the
         VREvent StageOverrideReady will be sent.  Use FadeToGrid to reveal.  Call ClearStageOverride to free the associated resources when finished.
         """
-        fn = self.function_table.setStageOverride_Async
+        fn = self._fn_setStageOverride_Async
         if renderModelPath is not None:
             renderModelPath = bytes(renderModelPath, encoding='utf-8')
         error = fn(renderModelPath, byref(transform), byref(renderSettings), sizeOfRenderSettings)
         openvr.error_code.CompositorError.check_error_value(error)
 
+    def setStageOverride_Async_nothrow(self, renderModelPath: str, transform=None, renderSettings=None, sizeOfRenderSettings=0):
+        """Like setStageOverride_Async(), but returns the error code last, instead of raising it"""
+        fn = self._fn_setStageOverride_Async
+        if renderModelPath is not None:
+            renderModelPath = bytes(renderModelPath, encoding='utf-8')
+        error = fn(renderModelPath, byref(transform), byref(renderSettings), sizeOfRenderSettings)
+        return error
+
     def clearStageOverride(self) -> None:
         """Resets the stage to its default user specified setting."""
-        fn = self.function_table.clearStageOverride
+        fn = self._fn_clearStageOverride
         fn()
 
-    def getCompositorBenchmarkResults(self, sizeOfBenchmarkResults):
+    def getCompositorBenchmarkResults(self, sizeOfBenchmarkResults, benchmarkResults=None):
         """
         Returns true if pBenchmarkResults is filled it.  Sets pBenchmarkResults with the result of the compositor benchmark.
         nSizeOfBenchmarkResults should be set to sizeof(Compositor_BenchmarkResults)
         """
-        fn = self.function_table.getCompositorBenchmarkResults
-        benchmarkResults = Compositor_BenchmarkResults()
+        fn = self._fn_getCompositorBenchmarkResults
+        if benchmarkResults is None:
+            benchmarkResults = Compositor_BenchmarkResults()
         result = fn(byref(benchmarkResults), sizeOfBenchmarkResults)
         return result, benchmarkResults
 
     def getLastPosePredictionIDs(self):
         """Returns the frame id associated with the poses last returned by WaitGetPoses.  Deltas between IDs correspond to number of headset vsync intervals."""
-        fn = self.function_table.getLastPosePredictionIDs
+        fn = self._fn_getLastPosePredictionIDs
         renderPosePredictionID = c_uint32()
         gamePosePredictionID = c_uint32()
         error = fn(byref(renderPosePredictionID), byref(gamePosePredictionID))
         openvr.error_code.CompositorError.check_error_value(error)
         return renderPosePredictionID.value, gamePosePredictionID.value
 
+    def getLastPosePredictionIDs_nothrow(self):
+        """Like getLastPosePredictionIDs(), but returns the error code last, instead of raising it"""
+        fn = self._fn_getLastPosePredictionIDs
+        renderPosePredictionID = c_uint32()
+        gamePosePredictionID = c_uint32()
+        error = fn(byref(renderPosePredictionID), byref(gamePosePredictionID))
+        return renderPosePredictionID.value, gamePosePredictionID.value, error
+
     def getPosesForFrame(self, posePredictionID, poseArray):
         """Get the most up-to-date predicted (or recorded - up to 100ms old) set of poses for a given frame id."""
-        fn = self.function_table.getPosesForFrame
+        fn = self._fn_getPosesForFrame
         if poseArray is None:
             poseArrayArg = None
             poseArrayCount = 0
@@ -4934,6 +5514,22 @@ class IVRCompositor(object):
         openvr.error_code.CompositorError.check_error_value(error)
         return poseArray
 
+    def getPosesForFrame_nothrow(self, posePredictionID, poseArray):
+        """Like getPosesForFrame(), but returns the error code last, instead of raising it"""
+        fn = self._fn_getPosesForFrame
+        if poseArray is None:
+            poseArrayArg = None
+            poseArrayCount = 0
+        elif isinstance(poseArray, ctypes.Array):
+            poseArrayArg = byref(poseArray[0])
+            poseArrayCount = len(poseArray)
+        else:
+            poseArray = (TrackedDevicePose_t * 1)()
+            poseArrayArg = byref(poseArray[0])
+            poseArrayCount = 1
+        error = fn(posePredictionID, poseArrayArg, poseArrayCount)
+        return poseArray, error
+
 
 class IVRHeadsetView_FnTable(Structure):
     _fields_ = [
@@ -4959,6 +5555,9 @@ class IVRHeadsetView(object):
         if fn_table_ptr is None:
             raise OpenVRError("Error retrieving VR API for IVRHeadsetView")
         self.function_table = fn_table_ptr.contents
+        # Reading a function table field creates a new function object each time, so read each just once
+        for entry_name, _ in fn_type._fields_:
+            setattr(self, '_fn_' + entry_name, getattr(self.function_table, entry_name))
 
     def setHeadsetViewSize(self, width, height) -> None:
         """
@@ -4968,12 +5567,12 @@ class IVRHeadsetView(object):
         to adjust the requested render size to avoid squashing or stretching, and then apply letterboxing to compensate
         when displaying the results.
         """
-        fn = self.function_table.setHeadsetViewSize
+        fn = self._fn_setHeadsetViewSize
         fn(width, height)
 
     def getHeadsetViewSize(self):
         """Gets the current resolution used to render the headset view."""
-        fn = self.function_table.getHeadsetViewSize
+        fn = self._fn_getHeadsetViewSize
         width = c_uint32()
         height = c_uint32()
         fn(byref(width), byref(height))
@@ -4981,40 +5580,40 @@ class IVRHeadsetView(object):
 
     def setHeadsetViewMode(self, headsetViewMode) -> None:
         """Set the mode used to render the headset view."""
-        fn = self.function_table.setHeadsetViewMode
+        fn = self._fn_setHeadsetViewMode
         fn(headsetViewMode)
 
     def getHeadsetViewMode(self):
         """Get the current mode used to render the headset view."""
-        fn = self.function_table.getHeadsetViewMode
+        fn = self._fn_getHeadsetViewMode
         result = fn()
         return result
 
     def setHeadsetViewCropped(self, cropped) -> None:
         """Set whether or not the headset view should be rendered cropped to hide the hidden area mesh or not."""
-        fn = self.function_table.setHeadsetViewCropped
+        fn = self._fn_setHeadsetViewCropped
         fn(cropped)
 
     def getHeadsetViewCropped(self):
         """Get the current cropping status of the headset view."""
-        fn = self.function_table.getHeadsetViewCropped
+        fn = self._fn_getHeadsetViewCropped
         result = fn()
         return result
 
     def getHeadsetViewAspectRatio(self):
         """Get the aspect ratio (width:height) of the uncropped headset view (accounting for the current set mode)."""
-        fn = self.function_table.getHeadsetViewAspectRatio
+        fn = self._fn_getHeadsetViewAspectRatio
         result = fn()
         return result
 
     def setHeadsetViewBlendRange(self, startPct: float, endPct: float) -> None:
         """Set the range [0..1] that the headset view blends across the stereo overlapped area in cropped both mode."""
-        fn = self.function_table.setHeadsetViewBlendRange
+        fn = self._fn_setHeadsetViewBlendRange
         fn(startPct, endPct)
 
     def getHeadsetViewBlendRange(self):
         """Get the current range [0..1] that the headset view blends across the stereo overlapped area in cropped both mode."""
-        fn = self.function_table.getHeadsetViewBlendRange
+        fn = self._fn_getHeadsetViewBlendRange
         startPct = c_float()
         endPct = c_float()
         fn(byref(startPct), byref(endPct))
@@ -5040,6 +5639,9 @@ class IVRNotifications(object):
         if fn_table_ptr is None:
             raise OpenVRError("Error retrieving VR API for IVRNotifications")
         self.function_table = fn_table_ptr.contents
+        # Reading a function table field creates a new function object each time, so read each just once
+        for entry_name, _ in fn_type._fields_:
+            setattr(self, '_fn_' + entry_name, getattr(self.function_table, entry_name))
 
     def createNotification(self, overlayHandle, userValue, type_, text: str, style, image):
         """
@@ -5048,7 +5650,7 @@ class IVRNotifications(object):
         To create a two-line notification, use a line break ('\\n') to split the text into two lines.
         The pImage argument may be NULL, in which case the specified overlay's icon will be used instead.
         """
-        fn = self.function_table.createNotification
+        fn = self._fn_createNotification
         if text is not None:
             text = bytes(text, encoding='utf-8')
         notificationId = VRNotificationId()
@@ -5056,12 +5658,27 @@ class IVRNotifications(object):
         openvr.error_code.NotificationError.check_error_value(error)
         return notificationId
 
+    def createNotification_nothrow(self, overlayHandle, userValue, type_, text: str, style, image):
+        """Like createNotification(), but returns the error code last, instead of raising it"""
+        fn = self._fn_createNotification
+        if text is not None:
+            text = bytes(text, encoding='utf-8')
+        notificationId = VRNotificationId()
+        error = fn(overlayHandle, userValue, type_, text, style, byref(image), byref(notificationId))
+        return notificationId, error
+
     def removeNotification(self, notificationId) -> None:
         """Destroy a notification, hiding it first if it currently shown to the user."""
-        fn = self.function_table.removeNotification
+        fn = self._fn_removeNotification
         error = fn(notificationId)
         openvr.error_code.NotificationError.check_error_value(error)
 
+    def removeNotification_nothrow(self, notificationId):
+        """Like removeNotification(), but returns the error code last, instead of raising it"""
+        fn = self._fn_removeNotification
+        error = fn(notificationId)
+        return error
+
 
 class IVROverlay_FnTable(Structure):
     _fields_ = [
@@ -5149,6 +5766,8 @@ class IVROverlay_FnTable(Structure):
 
 
 class IVROverlay(object):
+    _sizeof_VREvent_t = sizeof(VREvent_t)
+
     def __init__(self):
         version_key = IVROverlay_Version
         _checkInterfaceVersion(version_key)
@@ -5158,10 +5777,13 @@ class IVROverlay(object):
         if fn_table_ptr is None:
             raise OpenVRError("Error retrieving VR API for IVROverlay")
         self.function_table = fn_table_ptr.contents
+        # Reading a function table field creates a new function object each time, so read each just once
+        for entry_name, _ in fn_type._fields_:
+            setattr(self, '_fn_' + entry_name, getattr(self.function_table, entry_name))
 
     def findOverlay(self, overlayKey: str):
         """Finds an existing overlay with the specified key."""
-        fn = self.function_table.findOverlay
+        fn = self._fn_findOverlay
         if overlayKey is not None:
             overlayKey = bytes(overlayKey, encoding='utf-8')
         overlayHandle = VROverlayHandle_t()
@@ -5169,9 +5791,18 @@ class IVROverlay(object):
         openvr.error_code.OverlayError.check_error_value(error)
         return overlayHandle.value
 
+    def findOverlay_nothrow(self, overlayKey: str):
+        """Like findOverlay(), but returns the error code last, instead of raising it"""
+        fn = self._fn_findOverlay
+        if overlayKey is not None:
+            overlayKey = bytes(overlayKey, encoding='utf-8')
+        overlayHandle = VROverlayHandle_t()
+        error = fn(overlayKey, byref(overlayHandle))
+        return overlayHandle.value, error
+
     def createOverlay(self, overlayKey: str, overlayName: str):
         """Creates a new named overlay. All overlays start hidden and with default settings."""
-        fn = self.function_table.createOverlay
+        fn = self._fn_createOverlay
         if overlayKey is not None:
             overlayKey = bytes(overlayKey, encoding='utf-8')
         if overlayName is not None:
@@ -5181,21 +5812,38 @@ class IVROverlay(object):
         openvr.error_code.OverlayError.check_error_value(error)
         return overlayHandle.value
 
+    def createOverlay_nothrow(self, overlayKey: str, overlayName: str):
+        """Like createOverlay(), but returns the error code last, instead of raising it"""
+        fn = self._fn_createOverlay
+        if overlayKey is not None:
+            overlayKey = bytes(overlayKey, encoding='utf-8')
+        if overlayName is not None:
+            overlayName = bytes(overlayName, encoding='utf-8')
+        overlayHandle = VROverlayHandle_t()
+        error = fn(overlayKey, overlayName, byref(overlayHandle))
+        return overlayHandle.value, error
+
     def destroyOverlay(self, overlayHandle) -> None:
         """
         Destroys the specified overlay. When an application calls VR_Shutdown all overlays created by that app are
         automatically destroyed.
         """
-        fn = self.function_table.destroyOverlay
+        fn = self._fn_destroyOverlay
         error = fn(overlayHandle)
         openvr.error_code.OverlayError.check_error_value(error)
 
+    def destroyOverlay_nothrow(self, overlayHandle):
+        """Like destroyOverlay(), but returns the error code last, instead of raising it"""
+        fn = self._fn_destroyOverlay
+        error = fn(overlayHandle)
+        return error
+
     def getOverlayKey(self, overlayHandle):
         """
         Fills the provided buffer with the string key of the overlay. Returns the size of buffer required to store the key, including
         the terminating null character. k_unVROverlayMaxKeyLength will be enough bytes to fit the string.
         """
-        fn = self.function_table.getOverlayKey
+        fn = self._fn_getOverlayKey
         error = EVROverlayError()
         bufferSize = fn(overlayHandle, None, 0, byref(error))
         try:
@@ -5207,12 +5855,21 @@ class IVROverlay(object):
         openvr.error_code.OverlayError.check_error_value(error.value)
         return bytes(value.value).decode('utf-8')
 
+    def getOverlayKey_nothrow(self, overlayHandle):
+        """Like getOverlayKey(), but returns the error code last, instead of raising it"""
+        fn = self._fn_getOverlayKey
+        error = EVROverlayError()
+        bufferSize = fn(overlayHandle, None, 0, byref(error))
+        value = ctypes.create_string_buffer(bufferSize)
+        fn(overlayHandle, value, bufferSize, byref(error))
+        return bytes(value.value).decode('utf-8'), error.value
+
     def getOverlayName(self, overlayHandle):
         """
         Fills the provided buffer with the friendly name of the overlay. Returns the size of buffer required to store the key, including
         the terminating null character. k_unVROverlayMaxNameLength will be enough bytes to fit the string.
         """
-        fn = self.function_table.getOverlayName
+        fn = self._fn_getOverlayName
         error = EVROverlayError()
         bufferSize = fn(overlayHandle, None, 0, byref(error))
         try:
@@ -5224,32 +5881,57 @@ class IVROverlay(object):
         openvr.error_code.OverlayError.check_error_value(error.value)
         return bytes(value.value).decode('utf-8')
 
+    def getOverlayName_nothrow(self, overlayHandle):
+        """Like getOverlayName(), but returns the error code last, instead of raising it"""
+        fn = self._fn_getOverlayName
+        error = EVROverlayError()
+        bufferSize = fn(overlayHandle, None, 0, byref(error))
+        value = ctypes.create_string_buffer(bufferSize)
+        fn(overlayHandle, value, bufferSize, byref(error))
+        return bytes(value.value).decode('utf-8'), error.value
+
     def setOverlayName(self, overlayHandle, name: str) -> None:
         """set the name to use for this overlay"""
-        fn = self.function_table.setOverlayName
+        fn = self._fn_setOverlayName
         if name is not None:
             name = bytes(name, encoding='utf-8')
         error = fn(overlayHandle, name)
         openvr.error_code.OverlayError.check_error_value(error)
 
+    def setOverlayName_nothrow(self, overlayHandle, name: str):
+        """Like setOverlayName(), but returns the error code last, instead of raising it"""
+        fn = self._fn_setOverlayName
+        if name is not None:
+            name = bytes(name, encoding='utf-8')
+        error = fn(overlayHandle, name)
+        return error
+
     def getOverlayImageData(self, overlayHandle, buffer, bufferSize):
         """
         Gets the raw image data from an overlay. Overlay image data is always returned as RGBA data, 4 bytes per pixel. If the buffer is not large enough, width and height
         will be set and VROverlayError_ArrayTooSmall is returned.
         """
-        fn = self.function_table.getOverlayImageData
+        fn = self._fn_getOverlayImageData
         width = c_uint32()
         height = c_uint32()
         error = fn(overlayHandle, byref(buffer), bufferSize, byref(width), byref(height))
         openvr.error_code.OverlayError.check_error_value(error)
         return width.value, height.value
 
+    def getOverlayImageData_nothrow(self, overlayHandle, buffer, bufferSize):
+        """Like getOverlayImageData(), but returns the error code last, instead of raising it"""
+        fn = self._fn_getOverlayImageData
+        width = c_uint32()
+        height = c_uint32()
+        error = fn(overlayHandle, byref(buffer), bufferSize, byref(width), byref(height))
+        return width.value, height.value, error
+
     def getOverlayErrorNameFromEnum(self, error):
         """
         returns a string that corresponds with the specified overlay error. The string will be the name
         of the error enum value for all valid error codes
         """
-        fn = self.function_table.getOverlayErrorNameFromEnum
+        fn = self._fn_getOverlayErrorNameFromEnum
         result = fn(error)
         return result.decode('utf-8')
 
@@ -5258,47 +5940,79 @@ class IVROverlay(object):
         Sets the pid that is allowed to render to this overlay (the creator pid is always allow to render),
         by default this is the pid of the process that made the overlay
         """
-        fn = self.function_table.setOverlayRenderingPid
+        fn = self._fn_setOverlayRenderingPid
         error = fn(overlayHandle, pID)
         openvr.error_code.OverlayError.check_error_value(error)
 
+    def setOverlayRenderingPid_nothrow(self, overlayHandle, pID):
+        """Like setOverlayRenderingPid(), but returns the error code last, instead of raising it"""
+        fn = self._fn_setOverlayRenderingPid
+        error = fn(overlayHandle, pID)
+        return error
+
     def getOverlayRenderingPid(self, overlayHandle):
         """Gets the pid that is allowed to render to this overlay"""
-        fn = self.function_table.getOverlayRenderingPid
+        fn = self._fn_getOverlayRenderingPid
         result = fn(overlayHandle)
         return result
 
     def setOverlayFlag(self, overlayHandle, overlayFlag, enabled) -> None:
         """Specify flag setting for a given overlay"""
-        fn = self.function_table.setOverlayFlag
+        fn = self._fn_setOverlayFlag
         error = fn(overlayHandle, overlayFlag, enabled)
         openvr.error_code.OverlayError.check_error_value(error)
 
+    def setOverlayFlag_nothrow(self, overlayHandle, overlayFlag, enabled):
+        """Like setOverlayFlag(), but returns the error code last, instead of raising it"""
+        fn = self._fn_setOverlayFlag
+        error = fn(overlayHandle, overlayFlag, enabled)
+        return error
+
     def getOverlayFlag(self, overlayHandle, overlayFlag):
         """Sets flag setting for a given overlay"""
-        fn = self.function_table.getOverlayFlag
+        fn = self._fn_getOverlayFlag
         enabled = openvr_bool()
         error = fn(overlayHandle, overlayFlag, byref(enabled))
         openvr.error_code.OverlayError.check_error_value(error)
         return enabled
 
+    def getOverlayFlag_nothrow(self, overlayHandle, overlayFlag):
+        """Like getOverlayFlag(), but returns the error code last, instead of raising it"""
+        fn = self._fn_getOverlayFlag
+        enabled = openvr_bool()
+        error = fn(overlayHandle, overlayFlag, byref(enabled))
+        return enabled, error
+
     def getOverlayFlags(self, overlayHandle):
         """Gets all the flags for a given overlay"""
-        fn = self.function_table.getOverlayFlags
+        fn = self._fn_getOverlayFlags
         flags = c_uint32()
         error = fn(overlayHandle, byref(flags))
         openvr.error_code.OverlayError.check_error_value(error)
         return flags.value
 
+    def getOverlayFlags_nothrow(self, overlayHandle):
+        """Like getOverlayFlags(), but returns the error code last, instead of raising it"""
+        fn = self._fn_getOverlayFlags
+        flags = c_uint32()
+        error = fn(overlayHandle, byref(flags))
+        return flags.value, error
+
     def setOverlayColor(self, overlayHandle, red: float, green: float, blue: float) -> None:
         """Sets the color tint of the overlay quad. Use 0.0 to 1.0 per channel."""
-        fn = self.function_table.setOverlayColor
+        fn = self._fn_setOverlayColor
         error = fn(overlayHandle, red, green, blue)
         openvr.error_code.OverlayError.check_error_value(error)
 
+    def setOverlayColor_nothrow(self, overlayHandle, red: float, green: float, blue: float):
+        """Like setOverlayColor(), but returns the error code last, instead of raising it"""
+        fn = self._fn_setOverlayColor
+        error = fn(overlayHandle, red, green, blue)
+        return error
+
     def getOverlayColor(self, overlayHandle):
         """Gets the color tint of the overlay quad."""
-        fn = self.function_table.getOverlayColor
+        fn = self._fn_getOverlayColor
         red = c_float()
         green = c_float()
         blue = c_float()
@@ -5306,37 +6020,72 @@ class IVROverlay(object):
         openvr.error_code.OverlayError.check_error_value(error)
         return red.value, green.value, blue.value
 
+    def getOverlayColor_nothrow(self, overlayHandle):
+        """Like getOverlayColor(), but returns the error code last, instead of raising it"""
+        fn = self._fn_getOverlayColor
+        red = c_float()
+        green = c_float()
+        blue = c_float()
+        error = fn(overlayHandle, byref(red), byref(green), byref(blue))
+        return red.value, green.value, blue.value, error
+
     def setOverlayAlpha(self, overlayHandle, alpha: float) -> None:
         """Sets the alpha of the overlay quad. Use 1.0 for 100 percent opacity to 0.0 for 0 percent opacity."""
-        fn = self.function_table.setOverlayAlpha
+        fn = self._fn_setOverlayAlpha
         error = fn(overlayHandle, alpha)
         openvr.error_code.OverlayError.check_error_value(error)
 
+    def setOverlayAlpha_nothrow(self, overlayHandle, alpha: float):
+        """Like setOverlayAlpha(), but returns the error code last, instead of raising it"""
+        fn = self._fn_setOverlayAlpha
+        error = fn(overlayHandle, alpha)
+        return error
+
     def getOverlayAlpha(self, overlayHandle):
         """Gets the alpha of the overlay quad. By default overlays are rendering at 100 percent alpha (1.0)."""
-        fn = self.function_table.getOverlayAlpha
+        fn = self._fn_getOverlayAlpha
         alpha = c_float()
         error = fn(overlayHandle, byref(alpha))
         openvr.error_code.OverlayError.check_error_value(error)
         return alpha.value
 
+    def getOverlayAlpha_nothrow(self, overlayHandle):
+        """Like getOverlayAlpha(), but returns the error code last, instead of raising it"""
+        fn = self._fn_getOverlayAlpha
+        alpha = c_float()
+        error = fn(overlayHandle, byref(alpha))
+        return alpha.value, error
+
     def setOverlayTexelAspect(self, overlayHandle, texelAspect: float) -> None:
         """
         Sets the aspect ratio of the texels in the overlay. 1.0 means the texels are square. 2.0 means the texels
         are twice as wide as they are tall. Defaults to 1.0.
         """
-        fn = self.function_table.setOverlayTexelAspect
+        fn = self._fn_setOverlayTexelAspect
         error = fn(overlayHandle, texelAspect)
         openvr.error_code.OverlayError.check_error_value(error)
 
+    def setOverlayTexelAspect_nothrow(self, overlayHandle, texelAspect: float):
+        """Like setOverlayTexelAspect(), but returns the error code last, instead of raising it"""
+        fn = self._fn_setOverlayTexelAspect
+        error = fn(overlayHandle, texelAspect)
+        return error
+
     def getOverlayTexelAspect(self, overlayHandle):
         """Gets the aspect ratio of the texels in the overlay. Defaults to 1.0"""
-        fn = self.function_table.getOverlayTexelAspect
+        fn = self._fn_getOverlayTexelAspect
         texelAspect = c_float()
         error = fn(overlayHandle, byref(texelAspect))
         openvr.error_code.OverlayError.check_error_value(error)
         return texelAspect.value
 
+    def getOverlayTexelAspect_nothrow(self, overlayHandle):
+        """Like getOverlayTexelAspect(), but returns the error code last, instead of raising it"""
+        fn = self._fn_getOverlayTexelAspect
+        texelAspect = c_float()
+        error = fn(overlayHandle, byref(texelAspect))
+        return texelAspect.value, error
+
     def setOverlaySortOrder(self, overlayHandle, sortOrder) -> None:
         """
         Sets the rendering sort order for the overlay. Overlays are rendered this order:
@@ -5351,146 +6100,273 @@ class IVROverlay(object):
 
         Sort order defaults to 0.
         """
-        fn = self.function_table.setOverlaySortOrder
+        fn = self._fn_setOverlaySortOrder
         error = fn(overlayHandle, sortOrder)
         openvr.error_code.OverlayError.check_error_value(error)
 
+    def setOverlaySortOrder_nothrow(self, overlayHandle, sortOrder):
+        """Like setOverlaySortOrder(), but returns the error code last, instead of raising it"""
+        fn = self._fn_setOverlaySortOrder
+        error = fn(overlayHandle, sortOrder)
+        return error
+
     def getOverlaySortOrder(self, overlayHandle):
         """Gets the sort order of the overlay. See SetOverlaySortOrder for how this works."""
-        fn = self.function_table.getOverlaySortOrder
+        fn = self._fn_getOverlaySortOrder
         sortOrder = c_uint32()
         error = fn(overlayHandle, byref(sortOrder))
         openvr.error_code.OverlayError.check_error_value(error)
         return sortOrder.value
 
+    def getOverlaySortOrder_nothrow(self, overlayHandle):
+        """Like getOverlaySortOrder(), but returns the error code last, instead of raising it"""
+        fn = self._fn_getOverlaySortOrder
+        sortOrder = c_uint32()
+        error = fn(overlayHandle, byref(sortOrder))
+        return sortOrder.value, error
+
     def setOverlayWidthInMeters(self, overlayHandle, widthInMeters: float) -> None:
         """Sets the width of the overlay quad in meters. By default overlays are rendered on a quad that is 1 meter across"""
-        fn = self.function_table.setOverlayWidthInMeters
+        fn = self._fn_setOverlayWidthInMeters
         error = fn(overlayHandle, widthInMeters)
         openvr.error_code.OverlayError.check_error_value(error)
 
+    def setOverlayWidthInMeters_nothrow(self, overlayHandle, widthInMeters: float):
+        """Like setOverlayWidthInMeters(), but returns the error code last, instead of raising it"""
+        fn = self._fn_setOverlayWidthInMeters
+        error = fn(overlayHandle, widthInMeters)
+        return error
+
     def getOverlayWidthInMeters(self, overlayHandle):
         """Returns the width of the overlay quad in meters. By default overlays are rendered on a quad that is 1 meter across"""
-        fn = self.function_table.getOverlayWidthInMeters
+        fn = self._fn_getOverlayWidthInMeters
         widthInMeters = c_float()
         error = fn(overlayHandle, byref(widthInMeters))
         openvr.error_code.OverlayError.check_error_value(error)
         return widthInMeters.value
 
+    def getOverlayWidthInMeters_nothrow(self, overlayHandle):
+        """Like getOverlayWidthInMeters(), but returns the error code last, instead of raising it"""
+        fn = self._fn_getOverlayWidthInMeters
+        widthInMeters = c_float()
+        error = fn(overlayHandle, byref(widthInMeters))
+        return widthInMeters.value, error
+
     def setOverlayCurvature(self, overlayHandle, curvature: float) -> None:
         """
         Use to draw overlay as a curved surface. Curvature is a percentage from (0..1] where 1 is a fully closed cylinder.
         For a specific radius, curvature can be computed as: overlay.width / (2 PI r).
         """
-        fn = self.function_table.setOverlayCurvature
+        fn = self._fn_setOverlayCurvature
         error = fn(overlayHandle, curvature)
         openvr.error_code.OverlayError.check_error_value(error)
 
+    def setOverlayCurvature_nothrow(self, overlayHandle, curvature: float):
+        """Like setOverlayCurvature(), but returns the error code last, instead of raising it"""
+        fn = self._fn_setOverlayCurvature
+        error = fn(overlayHandle, curvature)
+        return error
+
     def getOverlayCurvature(self, overlayHandle):
         """Returns the curvature of the overlay as a percentage from (0..1] where 1 is a fully closed cylinder."""
-        fn = self.function_table.getOverlayCurvature
+        fn = self._fn_getOverlayCurvature
         curvature = c_float()
         error = fn(overlayHandle, byref(curvature))
         openvr.error_code.OverlayError.check_error_value(error)
         return curvature.value
 
+    def getOverlayCurvature_nothrow(self, overlayHandle):
+        """Like getOverlayCurvature(), but returns the error code last, instead of raising it"""
+        fn = self._fn_getOverlayCurvature
+        curvature = c_float()
+        error = fn(overlayHandle, byref(curvature))
+        return curvature.value, error
+
     def setOverlayPreCurvePitch(self, overlayHandle, radians: float) -> None:
         """Sets the pitch angle (in radians) of the overlay before curvature is applied -- to form a fan or disk."""
-        fn = self.function_table.setOverlayPreCurvePitch
+        fn = self._fn_setOverlayPreCurvePitch
         error = fn(overlayHandle, radians)
         openvr.error_code.OverlayError.check_error_value(error)
 
+    def setOverlayPreCurvePitch_nothrow(self, overlayHandle, radians: float):
+        """Like setOverlayPreCurvePitch(), but returns the error code last, instead of raising it"""
+        fn = self._fn_setOverlayPreCurvePitch
+        error = fn(overlayHandle, radians)
+        return error
+
     def getOverlayPreCurvePitch(self, overlayHandle):
         """Returns the overlay's set pre-curve pitch angle (in radians)."""
-        fn = self.function_table.getOverlayPreCurvePitch
+        fn = self._fn_getOverlayPreCurvePitch
         radians = c_float()
         error = fn(overlayHandle, byref(radians))
         openvr.error_code.OverlayError.check_error_value(error)
         return radians.value
 
+    def getOverlayPreCurvePitch_nothrow(self, overlayHandle):
+        """Like getOverlayPreCurvePitch(), but returns the error code last, instead of raising it"""
+        fn = self._fn_getOverlayPreCurvePitch
+        radians = c_float()
+        error = fn(overlayHandle, byref(radians))
+        return radians.value, error
+
     def setOverlayTextureColorSpace(self, overlayHandle, textureColorSpace) -> None:
         """
         Sets the colorspace the overlay texture's data is in.  Defaults to 'auto'.
         If the texture needs to be resolved, you should call SetOverlayTexture with the appropriate colorspace instead.
         """
-        fn = self.function_table.setOverlayTextureColorSpace
+        fn = self._fn_setOverlayTextureColorSpace
         error = fn(overlayHandle, textureColorSpace)
         openvr.error_code.OverlayError.check_error_value(error)
 
+    def setOverlayTextureColorSpace_nothrow(self, overlayHandle, textureColorSpace):
+        """Like setOverlayTextureColorSpace(), but returns the error code last, instead of raising it"""
+        fn = self._fn_setOverlayTextureColorSpace
+        error = fn(overlayHandle, textureColorSpace)
+        return error
+
     def getOverlayTextureColorSpace(self, overlayHandle):
         """Gets the overlay's current colorspace setting."""
-        fn = self.function_table.getOverlayTextureColorSpace
+        fn = self._fn_getOverlayTextureColorSpace
         textureColorSpace = EColorSpace()
         error = fn(overlayHandle, byref(textureColorSpace))
         openvr.error_code.OverlayError.check_error_value(error)
         return textureColorSpace
 
+    def getOverlayTextureColorSpace_nothrow(self, overlayHandle):
+        """Like getOverlayTextureColorSpace(), but returns the error code last, instead of raising it"""
+        fn = self._fn_getOverlayTextureColorSpace
+        textureColorSpace = EColorSpace()
+        error = fn(overlayHandle, byref(textureColorSpace))
+        return textureColorSpace, error
+
     def setOverlayTextureBounds(self, overlayHandle, overlayTextureBounds) -> None:
         """Sets the part of the texture to use for the overlay. UV Min is the upper left corner and UV Max is the lower right corner."""
-        fn = self.function_table.setOverlayTextureBounds
+        fn = self._fn_setOverlayTextureBounds
         error = fn(overlayHandle, byref(overlayTextureBounds))
         openvr.error_code.OverlayError.check_error_value(error)
 
-    def getOverlayTextureBounds(self, overlayHandle):
+    def setOverlayTextureBounds_nothrow(self, overlayHandle, overlayTextureBounds):
+        """Like setOverlayTextureBounds(), but returns the error code last, instead of raising it"""
+        fn = self._fn_setOverlayTextureBounds
+        error = fn(overlayHandle, byref(overlayTextureBounds))
+        return error
+
+    def getOverlayTextureBounds(self, overlayHandle, overlayTextureBounds=None):
         """Gets the part of the texture to use for the overlay. UV Min is the upper left corner and UV Max is the lower right corner."""
-        fn = self.function_table.getOverlayTextureBounds
-        overlayTextureBounds = VRTextureBounds_t()
+        fn = self._fn_getOverlayTextureBounds
+        if overlayTextureBounds is None:
+            overlayTextureBounds = VRTextureBounds_t()
         error = fn(overlayHandle, byref(overlayTextureBounds))
         openvr.error_code.OverlayError.check_error_value(error)
         return overlayTextureBounds
 
+    def getOverlayTextureBounds_nothrow(self, overlayHandle, overlayTextureBounds=None):
+        """Like getOverlayTextureBounds(), but returns the error code last, instead of raising it"""
+        fn = self._fn_getOverlayTextureBounds
+        if overlayTextureBounds is None:
+            overlayTextureBounds = VRTextureBounds_t()
+        error = fn(overlayHandle, byref(overlayTextureBounds))
+        return overlayTextureBounds, error
+
     def getOverlayTransformType(self, overlayHandle):
         """Returns the transform type of this overlay."""
-        fn = self.function_table.getOverlayTransformType
+        fn = self._fn_getOverlayTransformType
         transformType = VROverlayTransformType()
         error = fn(overlayHandle, byref(transformType))
         openvr.error_code.OverlayError.check_error_value(error)
         return transformType
 
+    def getOverlayTransformType_nothrow(self, overlayHandle):
+        """Like getOverlayTransformType(), but returns the error code last, instead of raising it"""
+        fn = self._fn_getOverlayTransformType
+        transformType = VROverlayTransformType()
+        error = fn(overlayHandle, byref(transformType))
+        return transformType, error
+
     def setOverlayTransformAbsolute(self, overlayHandle, trackingOrigin, trackingOriginToOverlayTransform) -> None:
         """Sets the transform to absolute tracking origin."""
-        fn = self.function_table.setOverlayTransformAbsolute
+        fn = self._fn_setOverlayTransformAbsolute
         error = fn(overlayHandle, trackingOrigin, byref(trackingOriginToOverlayTransform))
         openvr.error_code.OverlayError.check_error_value(error)
 
-    def getOverlayTransformAbsolute(self, overlayHandle):
+    def setOverlayTransformAbsolute_nothrow(self, overlayHandle, trackingOrigin, trackingOriginToOverlayTransform):
+        """Like setOverlayTransformAbsolute(), but returns the error code last, instead of raising it"""
+        fn = self._fn_setOverlayTransformAbsolute
+        error = fn(overlayHandle, trackingOrigin, byref(trackingOriginToOverlayTransform))
+        return error
+
+    def getOverlayTransformAbsolute(self, overlayHandle, trackingOriginToOverlayTransform=None):
         """Gets the transform if it is absolute. Returns an error if the transform is some other type."""
-        fn = self.function_table.getOverlayTransformAbsolute
+        fn = self._fn_getOverlayTransformAbsolute
         trackingOrigin = ETrackingUniverseOrigin()
-        trackingOriginToOverlayTransform = HmdMatrix34_t()
+        if trackingOriginToOverlayTransform is None:
+            trackingOriginToOverlayTransform = HmdMatrix34_t()
         error = fn(overlayHandle, byref(trackingOrigin), byref(trackingOriginToOverlayTransform))
         openvr.error_code.OverlayError.check_error_value(error)
         return trackingOrigin, trackingOriginToOverlayTransform
 
+    def getOverlayTransformAbsolute_nothrow(self, overlayHandle, trackingOriginToOverlayTransform=None):
+        """Like getOverlayTransformAbsolute(), but returns the error code last, instead of raising it"""
+        fn = self._fn_getOverlayTransformAbsolute
+        trackingOrigin = ETrackingUniverseOrigin()
+        if trackingOriginToOverlayTransform is None:
+            trackingOriginToOverlayTransform = HmdMatrix34_t()
+        error = fn(overlayHandle, byref(trackingOrigin), byref(trackingOriginToOverlayTransform))
+        return trackingOrigin, trackingOriginToOverlayTransform, error
+
     def setOverlayTransformTrackedDeviceRelative(self, overlayHandle, trackedDevice, trackedDeviceToOverlayTransform) -> None:
         """Sets the transform to relative to the transform of the specified tracked device."""
-        fn = self.function_table.setOverlayTransformTrackedDeviceRelative
+        fn = self._fn_setOverlayTransformTrackedDeviceRelative
         error = fn(overlayHandle, trackedDevice, byref(trackedDeviceToOverlayTransform))
         openvr.error_code.OverlayError.check_error_value(error)
 
-    def getOverlayTransformTrackedDeviceRelative(self, overlayHandle):
+    def setOverlayTransformTrackedDeviceRelative_nothrow(self, overlayHandle, trackedDevice, trackedDeviceToOverlayTransform):
+        """Like setOverlayTransformTrackedDeviceRelative(), but returns the error code last, instead of raising it"""
+        fn = self._fn_setOverlayTransformTrackedDeviceRelative
+        error = fn(overlayHandle, trackedDevice, byref(trackedDeviceToOverlayTransform))
+        return error
+
+    def getOverlayTransformTrackedDeviceRelative(self, overlayHandle, trackedDeviceToOverlayTransform=None):
         """Gets the transform if it is relative to a tracked device. Returns an error if the transform is some other type."""
-        fn = self.function_table.getOverlayTransformTrackedDeviceRelative
+        fn = self._fn_getOverlayTransformTrackedDeviceRelative
         trackedDevice = TrackedDeviceIndex_t()
-        trackedDeviceToOverlayTransform = HmdMatrix34_t()
+        if trackedDeviceToOverlayTransform is None:
+            trackedDeviceToOverlayTransform = HmdMatrix34_t()
         error = fn(overlayHandle, byref(trackedDevice), byref(trackedDeviceToOverlayTransform))
         openvr.error_code.OverlayError.check_error_value(error)
         return trackedDevice, trackedDeviceToOverlayTransform
 
+    def getOverlayTransformTrackedDeviceRelative_nothrow(self, overlayHandle, trackedDeviceToOverlayTransform=None):
+        """Like getOverlayTransformTrackedDeviceRelative(), but returns the error code last, instead of raising it"""
+        fn = self._fn_getOverlayTransformTrackedDeviceRelative
+        trackedDevice = TrackedDeviceIndex_t()
+        if trackedDeviceToOverlayTransform is None:
+            trackedDeviceToOverlayTransform = HmdMatrix34_t()
+        error = fn(overlayHandle, byref(trackedDevice), byref(trackedDeviceToOverlayTransform))
+        return trackedDevice, trackedDeviceToOverlayTransform, error
+
     def setOverlayTransformTrackedDeviceComponent(self, overlayHandle, deviceIndex, componentName: str) -> None:
         """
         Sets the transform to draw the overlay on a rendermodel component mesh instead of a quad. This will only draw when the system is
         drawing the device. Overlays with this transform type cannot receive mouse events.
         """
-        fn = self.function_table.setOverlayTransformTrackedDeviceComponent
+        fn = self._fn_setOverlayTransformTrackedDeviceComponent
         if componentName is not None:
             componentName = bytes(componentName, encoding='utf-8')
         error = fn(overlayHandle, deviceIndex, componentName)
         openvr.error_code.OverlayError.check_error_value(error)
 
+    def setOverlayTransformTrackedDeviceComponent_nothrow(self, overlayHandle, deviceIndex, componentName: str):
+        """Like setOverlayTransformTrackedDeviceComponent(), but returns the error code last, instead of raising it"""
+        fn = self._fn_setOverlayTransformTrackedDeviceComponent
+        if componentName is not None:
+            componentName = bytes(componentName, encoding='utf-8')
+        error = fn(overlayHandle, deviceIndex, componentName)
+        return error
+
     def getOverlayTransformTrackedDeviceComponent(self, overlayHandle):
         """Gets the transform information when the overlay is rendering on a component."""
-        fn = self.function_table.getOverlayTransformTrackedDeviceComponent
+        fn = self._fn_getOverlayTransformTrackedDeviceComponent
         deviceIndex = TrackedDeviceIndex_t()
         componentNameSize = fn(overlayHandle, byref(deviceIndex), None, 0)
         componentName = ctypes.create_string_buffer(componentNameSize)
@@ -5498,116 +6374,202 @@ class IVROverlay(object):
         openvr.error_code.OverlayError.check_error_value(error)
         return deviceIndex, bytes(componentName.value).decode('utf-8')
 
+    def getOverlayTransformTrackedDeviceComponent_nothrow(self, overlayHandle):
+        """Like getOverlayTransformTrackedDeviceComponent(), but returns the error code last, instead of raising it"""
+        fn = self._fn_getOverlayTransformTrackedDeviceComponent
+        deviceIndex = TrackedDeviceIndex_t()
+        componentNameSize = fn(overlayHandle, byref(deviceIndex), None, 0)
+        componentName = ctypes.create_string_buffer(componentNameSize)
+        error = fn(overlayHandle, byref(deviceIndex), componentName, componentNameSize)
+        return deviceIndex, bytes(componentName.value).decode('utf-8'), error
+
     def setOverlayTransformCursor(self, cursorOverlayHandle, hotspot) -> None:
         """
         Sets the hotspot for the specified overlay when that overlay is used as a cursor. These are in texture space with 0,0 in the upper left corner of
         the texture and 1,1 in the lower right corner of the texture.
         """
-        fn = self.function_table.setOverlayTransformCursor
+        fn = self._fn_setOverlayTransformCursor
         error = fn(cursorOverlayHandle, byref(hotspot))
         openvr.error_code.OverlayError.check_error_value(error)
 
-    def getOverlayTransformCursor(self, overlayHandle):
+    def setOverlayTransformCursor_nothrow(self, cursorOverlayHandle, hotspot):
+        """Like setOverlayTransformCursor(), but returns the error code last, instead of raising it"""
+        fn = self._fn_setOverlayTransformCursor
+        error = fn(cursorOverlayHandle, byref(hotspot))
+        return error
+
+    def getOverlayTransformCursor(self, overlayHandle, hotspot=None):
         """Gets cursor hotspot/transform for the specified overlay"""
-        fn = self.function_table.getOverlayTransformCursor
-        hotspot = HmdVector2_t()
+        fn = self._fn_getOverlayTransformCursor
+        if hotspot is None:
+            hotspot = HmdVector2_t()
         error = fn(overlayHandle, byref(hotspot))
         openvr.error_code.OverlayError.check_error_value(error)
         return hotspot
 
+    def getOverlayTransformCursor_nothrow(self, overlayHandle, hotspot=None):
+        """Like getOverlayTransformCursor(), but returns the error code last, instead of raising it"""
+        fn = self._fn_getOverlayTransformCursor
+        if hotspot is None:
+            hotspot = HmdVector2_t()
+        error = fn(overlayHandle, byref(hotspot))
+        return hotspot, error
+
     def setOverlayTransformProjection(self, overlayHandle, trackingOrigin, trackingOriginToOverlayTransform, projection, eye) -> None:
         """Sets the overlay as a projection overlay"""
-        fn = self.function_table.setOverlayTransformProjection
+        fn = self._fn_setOverlayTransformProjection
         error = fn(overlayHandle, trackingOrigin, byref(trackingOriginToOverlayTransform), byref(projection), eye)
         openvr.error_code.OverlayError.check_error_value(error)
 
+    def setOverlayTransformProjection_nothrow(self, overlayHandle, trackingOrigin, trackingOriginToOverlayTransform, projection, eye):
+        """Like setOverlayTransformProjection(), but returns the error code last, instead of raising it"""
+        fn = self._fn_setOverlayTransformProjection
+        error = fn(overlayHandle, trackingOrigin, byref(trackingOriginToOverlayTransform), byref(projection), eye)
+        return error
+
     def showOverlay(self, overlayHandle) -> None:
         """Shows the VR overlay. Not applicable for Dashboard Overlays."""
-        fn = self.function_table.showOverlay
+        fn = self._fn_showOverlay
         error = fn(overlayHandle)
         openvr.error_code.OverlayError.check_error_value(error)
 
+    def showOverlay_nothrow(self, overlayHandle):
+        """Like showOverlay(), but returns the error code last, instead of raising it"""
+        fn = self._fn_showOverlay
+        error = fn(overlayHandle)
+        return error
+
     def hideOverlay(self, overlayHandle) -> None:
         """Hides the VR overlay. Not applicable for Dashboard Overlays."""
-        fn = self.function_table.hideOverlay
+        fn = self._fn_hideOverlay
         error = fn(overlayHandle)
         openvr.error_code.OverlayError.check_error_value(error)
 
+    def hideOverlay_nothrow(self, overlayHandle):
+        """Like hideOverlay(), but returns the error code last, instead of raising it"""
+        fn = self._fn_hideOverlay
+        error = fn(overlayHandle)
+        return error
+
     def isOverlayVisible(self, overlayHandle):
         """Returns true if the overlay is currently visible, applicable for all overlay types except Dashboard Thumbnail overlays. VREvent_OverlayShown and VREvent_OverlayHidden reflect changes to this value."""
-        fn = self.function_table.isOverlayVisible
+        fn = self._fn_isOverlayVisible
         result = fn(overlayHandle)
         return result
 
-    def getTransformForOverlayCoordinates(self, overlayHandle, trackingOrigin, coordinatesInOverlay):
+    def getTransformForOverlayCoordinates(self, overlayHandle, trackingOrigin, coordinatesInOverlay, transform=None):
         """Get the transform in 3d space associated with a specific 2d point in the overlay's coordinate space (where 0,0 is the lower left). -Z points out of the overlay"""
-        fn = self.function_table.getTransformForOverlayCoordinates
-        transform = HmdMatrix34_t()
+        fn = self._fn_getTransformForOverlayCoordinates
+        if transform is None:
+            transform = HmdMatrix34_t()
         error = fn(overlayHandle, trackingOrigin, coordinatesInOverlay, byref(transform))
         openvr.error_code.OverlayError.check_error_value(error)
         return transform
 
+    def getTransformForOverlayCoordinates_nothrow(self, overlayHandle, trackingOrigin, coordinatesInOverlay, transform=None):
+        """Like getTransformForOverlayCoordinates(), but returns the error code last, instead of raising it"""
+        fn = self._fn_getTransformForOverlayCoordinates
+        if transform is None:
+            transform = HmdMatrix34_t()
+        error = fn(overlayHandle, trackingOrigin, coordinatesInOverlay, byref(transform))
+        return transform, error
+
     def waitFrameSync(self, timeoutMs) -> None:
         """
         This function will block until the top of each frame, and can therefore be used to synchronize with the runtime's update rate.
         Note: In non-async mode, some signals may be dropped due to scene app performance, so passing a timeout of 1000/refresh rate
         may be useful depending on the overlay app's desired behavior.
         """
-        fn = self.function_table.waitFrameSync
+        fn = self._fn_waitFrameSync
         error = fn(timeoutMs)
         openvr.error_code.OverlayError.check_error_value(error)
 
+    def waitFrameSync_nothrow(self, timeoutMs):
+        """Like waitFrameSync(), but returns the error code last, instead of raising it"""
+        fn = self._fn_waitFrameSync
+        error = fn(timeoutMs)
+        return error
+
     def pollNextOverlayEvent(self, overlayHandle, event):
         """
         Returns true and fills the event with the next event on the overlay's event queue, if there is one.
         If there are no events this method returns false. uncbVREvent should be the size in bytes of the VREvent_t struct
         """
-        fn = self.function_table.pollNextOverlayEvent
-        vREvent = sizeof(VREvent_t)
+        fn = self._fn_pollNextOverlayEvent
+        vREvent = self._sizeof_VREvent_t
         result = fn(overlayHandle, byref(event), vREvent)
         return result, event
 
     def getOverlayInputMethod(self, overlayHandle):
         """Returns the current input settings for the specified overlay."""
-        fn = self.function_table.getOverlayInputMethod
+        fn = self._fn_getOverlayInputMethod
         inputMethod = VROverlayInputMethod()
         error = fn(overlayHandle, byref(inputMethod))
         openvr.error_code.OverlayError.check_error_value(error)
         return inputMethod
 
+    def getOverlayInputMethod_nothrow(self, overlayHandle):
+        """Like getOverlayInputMethod(), but returns the error code last, instead of raising it"""
+        fn = self._fn_getOverlayInputMethod
+        inputMethod = VROverlayInputMethod()
+        error = fn(overlayHandle, byref(inputMethod))
+        return inputMethod, error
+
     def setOverlayInputMethod(self, overlayHandle, inputMethod) -> None:
         """Sets the input settings for the specified overlay."""
-        fn = self.function_table.setOverlayInputMethod
+        fn = self._fn_setOverlayInputMethod
         error = fn(overlayHandle, inputMethod)
         openvr.error_code.OverlayError.check_error_value(error)
 
-    def getOverlayMouseScale(self, overlayHandle):
+    def setOverlayInputMethod_nothrow(self, overlayHandle, inputMethod):
+        """Like setOverlayInputMethod(), but returns the error code last, instead of raising it"""
+        fn = self._fn_setOverlayInputMethod
+        error = fn(overlayHandle, inputMethod)
+        return error
+
+    def getOverlayMouseScale(self, overlayHandle, mouseScale=None):
         """
         Gets the mouse scaling factor that is used for mouse events. The actual texture may be a different size, but this is
         typically the size of the underlying UI in pixels.
         """
-        fn = self.function_table.getOverlayMouseScale
-        mouseScale = HmdVector2_t()
+        fn = self._fn_getOverlayMouseScale
+        if mouseScale is None:
+            mouseScale = HmdVector2_t()
         error = fn(overlayHandle, byref(mouseScale))
         openvr.error_code.OverlayError.check_error_value(error)
         return mouseScale
 
+    def getOverlayMouseScale_nothrow(self, overlayHandle, mouseScale=None):
+        """Like getOverlayMouseScale(), but returns the error code last, instead of raising it"""
+        fn = self._fn_getOverlayMouseScale
+        if mouseScale is None:
+            mouseScale = HmdVector2_t()
+        error = fn(overlayHandle, byref(mouseScale))
+        return mouseScale, error
+
     def setOverlayMouseScale(self, overlayHandle, mouseScale) -> None:
         """
         Sets the mouse scaling factor that is used for mouse events. The actual texture may be a different size, but this is
         typically the size of the underlying UI in pixels (not in world space).
         """
-        fn = self.function_table.setOverlayMouseScale
+        fn = self._fn_setOverlayMouseScale
         error = fn(overlayHandle, byref(mouseScale))
         openvr.error_code.OverlayError.check_error_value(error)
 
-    def computeOverlayIntersection(self, overlayHandle, params):
+    def setOverlayMouseScale_nothrow(self, overlayHandle, mouseScale):
+        """Like setOverlayMouseScale(), but returns the error code last, instead of raising it"""
+        fn = self._fn_setOverlayMouseScale
+        error = fn(overlayHandle, byref(mouseScale))
+        return error
+
+    def computeOverlayIntersection(self, overlayHandle, params, results=None):
         """
         Computes the overlay-space pixel coordinates of where the ray intersects the overlay with the
         specified settings. Returns false if there is no intersection.
         """
-        fn = self.function_table.computeOverlayIntersection
-        results = VROverlayIntersectionResults_t()
+        fn = self._fn_computeOverlayIntersection
+        if results is None:
+            results = VROverlayIntersectionResults_t()
         result = fn(overlayHandle, byref(params), byref(results))
         return result, results
 
@@ -5616,48 +6578,81 @@ class IVROverlay(object):
         Returns true if the specified overlay is the hover target. An overlay is the hover target when it is the last overlay "moused over"
         by the virtual mouse pointer
         """
-        fn = self.function_table.isHoverTargetOverlay
+        fn = self._fn_isHoverTargetOverlay
         result = fn(overlayHandle)
         return result
 
-    def setOverlayIntersectionMask(self, overlayHandle, numMaskPrimitives, primitiveSize=sizeof(VROverlayIntersectionMaskPrimitive_t)):
+    def setOverlayIntersectionMask(self, overlayHandle, numMaskPrimitives, primitiveSize=sizeof(VROverlayIntersectionMaskPrimitive_t), maskPrimitives=None):
         """
         Sets a list of primitives to be used for controller ray intersection
         typically the size of the underlying UI in pixels (not in world space).
         """
-        fn = self.function_table.setOverlayIntersectionMask
-        maskPrimitives = VROverlayIntersectionMaskPrimitive_t()
+        fn = self._fn_setOverlayIntersectionMask
+        if maskPrimitives is None:
+            maskPrimitives = VROverlayIntersectionMaskPrimitive_t()
         error = fn(overlayHandle, byref(maskPrimitives), numMaskPrimitives, primitiveSize)
         openvr.error_code.OverlayError.check_error_value(error)
         return maskPrimitives
 
+    def setOverlayIntersectionMask_nothrow(self, overlayHandle, numMaskPrimitives, primitiveSize=sizeof(VROverlayIntersectionMaskPrimitive_t), maskPrimitives=None):
+        """Like setOverlayIntersectionMask(), but returns the error code last, instead of raising it"""
+        fn = self._fn_setOverlayIntersectionMask
+        if maskPrimitives is None:
+            maskPrimitives = VROverlayIntersectionMaskPrimitive_t()
+        error = fn(overlayHandle, byref(maskPrimitives), numMaskPrimitives, primitiveSize)
+        return maskPrimitives, error
+
     def triggerLaserMouseHapticVibration(self, overlayHandle, durationSeconds: float, frequency: float, amplitude: float) -> None:
         """Triggers a haptic event on the laser mouse controller for the specified overlay"""
-        fn = self.function_table.triggerLaserMouseHapticVibration
+        fn = self._fn_triggerLaserMouseHapticVibration
         error = fn(overlayHandle, durationSeconds, frequency, amplitude)
         openvr.error_code.OverlayError.check_error_value(error)
 
+    def triggerLaserMouseHapticVibration_nothrow(self, overlayHandle, durationSeconds: float, frequency: float, amplitude: float):
+        """Like triggerLaserMouseHapticVibration(), but returns the error code last, instead of raising it"""
+        fn = self._fn_triggerLaserMouseHapticVibration
+        error = fn(overlayHandle, durationSeconds, frequency, amplitude)
+        return error
+
     def setOverlayCursor(self, overlayHandle, cursorHandle) -> None:
         """Sets the cursor to use for the specified overlay. This will be drawn instead of the generic blob when the laser mouse is pointed at the specified overlay"""
-        fn = self.function_table.setOverlayCursor
+        fn = self._fn_setOverlayCursor
         error = fn(overlayHandle, cursorHandle)
         openvr.error_code.OverlayError.check_error_value(error)
 
+    def setOverlayCursor_nothrow(self, overlayHandle, cursorHandle):
+        """Like setOverlayCursor(), but returns the error code last, instead of raising it"""
+        fn = self._fn_setOverlayCursor
+        error = fn(overlayHandle, cursorHandle)
+        return error
+
     def setOverlayCursorPositionOverride(self, overlayHandle, cursor) -> None:
         """
         Sets the override cursor position to use for this overlay in overlay mouse coordinates. This position will be used to draw the cursor
         instead of whatever the laser mouse cursor position is.
         """
-        fn = self.function_table.setOverlayCursorPositionOverride
+        fn = self._fn_setOverlayCursorPositionOverride
         error = fn(overlayHandle, byref(cursor))
         openvr.error_code.OverlayError.check_error_value(error)
 
+    def setOverlayCursorPositionOverride_nothrow(self, overlayHandle, cursor):
+        """Like setOverlayCursorPositionOverride(), but returns the error code last, instead of raising it"""
+        fn = self._fn_setOverlayCursorPositionOverride
+        error = fn(overlayHandle, byref(cursor))
+        return error
+
     def clearOverlayCursorPositionOverride(self, overlayHandle) -> None:
         """Clears the override cursor position for this overlay"""
-        fn = self.function_table.clearOverlayCursorPositionOverride
+        fn = self._fn_clearOverlayCursorPositionOverride
         error = fn(overlayHandle)
         openvr.error_code.OverlayError.check_error_value(error)
 
+    def clearOverlayCursorPositionOverride_nothrow(self, overlayHandle):
+        """Like clearOverlayCursorPositionOverride(), but returns the error code last, instead of raising it"""
+        fn = self._fn_clearOverlayCursorPositionOverride
+        error = fn(overlayHandle)
+        return error
+
     def setOverlayTexture(self, overlayHandle, texture) -> None:
         """
         Texture to draw for the overlay. This function can only be called by the overlay's creator or renderer process (see SetOverlayRenderingPid) .
@@ -5665,37 +6660,63 @@ class IVROverlay(object):
         OpenGL dirty state:
           glBindTexture
         """
-        fn = self.function_table.setOverlayTexture
+        fn = self._fn_setOverlayTexture
         error = fn(overlayHandle, byref(texture))
         openvr.error_code.OverlayError.check_error_value(error)
 
+    def setOverlayTexture_nothrow(self, overlayHandle, texture):
+        """Like setOverlayTexture(), but returns the error code last, instead of raising it"""
+        fn = self._fn_setOverlayTexture
+        error = fn(overlayHandle, byref(texture))
+        return error
+
     def clearOverlayTexture(self, overlayHandle) -> None:
         """Use this to tell the overlay system to release the texture set for this overlay."""
-        fn = self.function_table.clearOverlayTexture
+        fn = self._fn_clearOverlayTexture
         error = fn(overlayHandle)
         openvr.error_code.OverlayError.check_error_value(error)
 
+    def clearOverlayTexture_nothrow(self, overlayHandle):
+        """Like clearOverlayTexture(), but returns the error code last, instead of raising it"""
+        fn = self._fn_clearOverlayTexture
+        error = fn(overlayHandle)
+        return error
+
     def setOverlayRaw(self, overlayHandle, buffer, width, height, bytesPerPixel) -> None:
         """
         Separate interface for providing the data as a stream of bytes, but there is an upper bound on data
         that can be sent. This function can only be called by the overlay's renderer process.
         """
-        fn = self.function_table.setOverlayRaw
+        fn = self._fn_setOverlayRaw
         error = fn(overlayHandle, byref(buffer), width, height, bytesPerPixel)
         openvr.error_code.OverlayError.check_error_value(error)
 
+    def setOverlayRaw_nothrow(self, overlayHandle, buffer, width, height, bytesPerPixel):
+        """Like setOverlayRaw(), but returns the error code last, instead of raising it"""
+        fn = self._fn_setOverlayRaw
+        error = fn(overlayHandle, byref(buffer), width, height, bytesPerPixel)
+        return error
+
     def setOverlayFromFile(self, overlayHandle, filePath: str) -> None:
         """
         Separate interface for providing the image through a filename: can be png or jpg, and should not be bigger than 1920x1080.
         This function can only be called by the overlay's renderer process
         """
-        fn = self.function_table.setOverlayFromFile
+        fn = self._fn_setOverlayFromFile
         if filePath is not None:
             filePath = bytes(filePath, encoding='utf-8')
         error = fn(overlayHandle, filePath)
         openvr.error_code.OverlayError.check_error_value(error)
 
-    def getOverlayTexture(self, overlayHandle, nativeTextureRef):
+    def setOverlayFromFile_nothrow(self, overlayHandle, filePath: str):
+        """Like setOverlayFromFile(), but returns the error code last, instead of raising it"""
+        fn = self._fn_setOverlayFromFile
+        if filePath is not None:
+            filePath = bytes(filePath, encoding='utf-8')
+        error = fn(overlayHandle, filePath)
+        return error
+
+    def getOverlayTexture(self, overlayHandle, nativeTextureRef, textureBounds=None):
         """
         Get the native texture handle/device for an overlay you have created.
         On windows this handle will be a ID3D11ShaderResourceView with a ID3D11Texture2D bound.
@@ -5707,39 +6728,68 @@ class IVROverlay(object):
         pNativeTextureHandle is an OUTPUT, it will be a pointer to a ID3D11ShaderResourceView *.
         pNativeTextureRef is an INPUT and should be a ID3D11Resource *. The device used by pNativeTextureRef will be used to bind pNativeTextureHandle.
         """
-        fn = self.function_table.getOverlayTexture
+        fn = self._fn_getOverlayTexture
         nativeTextureHandle = c_void_p()
         width = c_uint32()
         height = c_uint32()
         nativeFormat = c_uint32()
         aPIType = ETextureType()
         colorSpace = EColorSpace()
-        textureBounds = VRTextureBounds_t()
+        if textureBounds is None:
+            textureBounds = VRTextureBounds_t()
         error = fn(overlayHandle, byref(nativeTextureHandle), byref(nativeTextureRef), byref(width), byref(height), byref(nativeFormat), byref(aPIType), byref(colorSpace), byref(textureBounds))
         openvr.error_code.OverlayError.check_error_value(error)
         return nativeTextureHandle.value, width.value, height.value, nativeFormat.value, aPIType, colorSpace, textureBounds
 
+    def getOverlayTexture_nothrow(self, overlayHandle, nativeTextureRef, textureBounds=None):
+        """Like getOverlayTexture(), but returns the error code last, instead of raising it"""
+        fn = self._fn_getOverlayTexture
+        nativeTextureHandle = c_void_p()
+        width = c_uint32()
+        height = c_uint32()
+        nativeFormat = c_uint32()
+        aPIType = ETextureType()
+        colorSpace = EColorSpace()
+        if textureBounds is None:
+            textureBounds = VRTextureBounds_t()
+        error = fn(overlayHandle, byref(nativeTextureHandle), byref(nativeTextureRef), byref(width), byref(height), byref(nativeFormat), byref(aPIType), byref(colorSpace), byref(textureBounds))
+        return nativeTextureHandle.value, width.value, height.value, nativeFormat.value, aPIType, colorSpace, textureBounds, error
+
     def releaseNativeOverlayHandle(self, overlayHandle, nativeTextureHandle) -> None:
         """
         Release the pNativeTextureHandle provided from the GetOverlayTexture call, this allows the system to free the underlying GPU resources for this object,
         so only do it once you stop rendering this texture.
         """
-        fn = self.function_table.releaseNativeOverlayHandle
+        fn = self._fn_releaseNativeOverlayHandle
         error = fn(overlayHandle, byref(nativeTextureHandle))
         openvr.error_code.OverlayError.check_error_value(error)
 
+    def releaseNativeOverlayHandle_nothrow(self, overlayHandle, nativeTextureHandle):
+        """Like releaseNativeOverlayHandle(), but returns the error code last, instead of raising it"""
+        fn = self._fn_releaseNativeOverlayHandle
+        error = fn(overlayHandle, byref(nativeTextureHandle))
+        return error
+
     def getOverlayTextureSize(self, overlayHandle):
         """Get the size of the overlay texture"""
-        fn = self.function_table.getOverlayTextureSize
+        fn = self._fn_getOverlayTextureSize
         width = c_uint32()
         height = c_uint32()
         error = fn(overlayHandle, byref(width), byref(height))
         openvr.error_code.OverlayError.check_error_value(error)
         return width.value, height.value
 
+    def getOverlayTextureSize_nothrow(self, overlayHandle):
+        """Like getOverlayTextureSize(), but returns the error code last, instead of raising it"""
+        fn = self._fn_getOverlayTextureSize
+        width = c_uint32()
+        height = c_uint32()
+        error = fn(overlayHandle, byref(width), byref(height))
+        return width.value, height.value, error
+
     def createDashboardOverlay(self, overlayKey: str, overlayFriendlyName: str):
         """Creates a dashboard overlay and returns its handle"""
-        fn = self.function_table.createDashboardOverlay
+        fn = self._fn_createDashboardOverlay
         if overlayKey is not None:
             overlayKey = bytes(overlayKey, encoding='utf-8')
         if overlayFriendlyName is not None:
@@ -5750,42 +6800,67 @@ class IVROverlay(object):
         openvr.error_code.OverlayError.check_error_value(error)
         return mainHandle.value, thumbnailHandle.value
 
+    def createDashboardOverlay_nothrow(self, overlayKey: str, overlayFriendlyName: str):
+        """Like createDashboardOverlay(), but returns the error code last, instead of raising it"""
+        fn = self._fn_createDashboardOverlay
+        if overlayKey is not None:
+            overlayKey = bytes(overlayKey, encoding='utf-8')
+        if overlayFriendlyName is not None:
+            overlayFriendlyName = bytes(overlayFriendlyName, encoding='utf-8')
+        mainHandle = VROverlayHandle_t()
+        thumbnailHandle = VROverlayHandle_t()
+        error = fn(overlayKey, overlayFriendlyName, byref(mainHandle), byref(thumbnailHandle))
+        return mainHandle.value, thumbnailHandle.value, error
+
     def isDashboardVisible(self):
         """Returns true if the dashboard is visible"""
-        fn = self.function_table.isDashboardVisible
+        fn = self._fn_isDashboardVisible
         result = fn()
         return result
 
     def isActiveDashboardOverlay(self, overlayHandle):
         """returns true if the dashboard is visible and the specified overlay is the active system Overlay"""
-        fn = self.function_table.isActiveDashboardOverlay
+        fn = self._fn_isActiveDashboardOverlay
         result = fn(overlayHandle)
         return result
 
     def setDashboardOverlaySceneProcess(self, overlayHandle, processId) -> None:
         """Sets the dashboard overlay to only appear when the specified process ID has scene focus"""
-        fn = self.function_table.setDashboardOverlaySceneProcess
+        fn = self._fn_setDashboardOverlaySceneProcess
         error = fn(overlayHandle, processId)
         openvr.error_code.OverlayError.check_error_value(error)
 
+    def setDashboardOverlaySceneProcess_nothrow(self, overlayHandle, processId):
+        """Like setDashboardOverlaySceneProcess(), but returns the error code last, instead of raising it"""
+        fn = self._fn_setDashboardOverlaySceneProcess
+        error = fn(overlayHandle, processId)
+        return error
+
     def getDashboardOverlaySceneProcess(self, overlayHandle):
         """Gets the process ID that this dashboard overlay requires to have scene focus"""
-        fn = self.function_table.getDashboardOverlaySceneProcess
+        fn = self._fn_getDashboardOverlaySceneProcess
         processId = c_uint32()
         error = fn(overlayHandle, byref(processId))
         openvr.error_code.OverlayError.check_error_value(error)
         return processId.value
 
+    def getDashboardOverlaySceneProcess_nothrow(self, overlayHandle):
+        """Like getDashboardOverlaySceneProcess(), but returns the error code last, instead of raising it"""
+        fn = self._fn_getDashboardOverlaySceneProcess
+        processId = c_uint32()
+        error = fn(overlayHandle, byref(processId))
+        return processId.value, error
+
     def showDashboard(self, overlayToShow: str) -> None:
         """Shows the dashboard."""
-        fn = self.function_table.showDashboard
+        fn = self._fn_showDashboard
         if overlayToShow is not None:
             overlayToShow = bytes(overlayToShow, encoding='utf-8')
         fn(overlayToShow)
 
     def getPrimaryDashboardDevice(self):
         """Returns the tracked device index that has the laser pointer in the dashboard, or the last one that was used."""
-        fn = self.function_table.getPrimaryDashboardDevice
+        fn = self._fn_getPrimaryDashboardDevice
         result = fn()
         return result
 
@@ -5794,7 +6869,7 @@ class IVROverlay(object):
         Show the virtual keyboard to accept input. In most cases, you should pass KeyboardFlag_Modal to enable modal overlay
         behavior on the keyboard itself. See EKeyboardFlags for more.
         """
-        fn = self.function_table.showKeyboard
+        fn = self._fn_showKeyboard
         if description is not None:
             description = bytes(description, encoding='utf-8')
         if existingText is not None:
@@ -5802,12 +6877,22 @@ class IVROverlay(object):
         error = fn(inputMode, lineInputMode, flags, description, charMax, existingText, userValue)
         openvr.error_code.OverlayError.check_error_value(error)
 
+    def showKeyboard_nothrow(self, inputMode, lineInputMode, flags, description: str, charMax, existingText: str, userValue):
+        """Like showKeyboard(), but returns the error code last, instead of raising it"""
+        fn = self._fn_showKeyboard
+        if description is not None:
+            description = bytes(description, encoding='utf-8')
+        if existingText is not None:
+            existingText = bytes(existingText, encoding='utf-8')
+        error = fn(inputMode, lineInputMode, flags, description, charMax, existingText, userValue)
+        return error
+
     def showKeyboardForOverlay(self, overlayHandle, inputMode, lineInputMode, flags, description: str, charMax, existingText: str, userValue) -> None:
         """
         Show the virtual keyboard to accept input for an overlay. In most cases, you should pass KeyboardFlag_Modal to enable modal
         overlay behavior on the keyboard itself. See EKeyboardFlags for more.
         """
-        fn = self.function_table.showKeyboardForOverlay
+        fn = self._fn_showKeyboardForOverlay
         if description is not None:
             description = bytes(description, encoding='utf-8')
         if existingText is not None:
@@ -5815,9 +6900,19 @@ class IVROverlay(object):
         error = fn(overlayHandle, inputMode, lineInputMode, flags, description, charMax, existingText, userValue)
         openvr.error_code.OverlayError.check_error_value(error)
 
+    def showKeyboardForOverlay_nothrow(self, overlayHandle, inputMode, lineInputMode, flags, description: str, charMax, existingText: str, userValue):
+        """Like showKeyboardForOverlay(), but returns the error code last, instead of raising it"""
+        fn = self._fn_showKeyboardForOverlay
+        if description is not None:
+            description = bytes(description, encoding='utf-8')
+        if existingText is not None:
+            existingText = bytes(existingText, encoding='utf-8')
+        error = fn(overlayHandle, inputMode, lineInputMode, flags, description, charMax, existingText, userValue)
+        return error
+
     def getKeyboardText(self):
         """Get the text that was entered into the text input"""
-        fn = self.function_table.getKeyboardText
+        fn = self._fn_getKeyboardText
         text = fn(None, 0)
         text = ctypes.create_string_buffer(text)
         fn(text, text)
@@ -5825,22 +6920,22 @@ class IVROverlay(object):
 
     def hideKeyboard(self) -> None:
         """Hide the virtual keyboard"""
-        fn = self.function_table.hideKeyboard
+        fn = self._fn_hideKeyboard
         fn()
 
     def setKeyboardTransformAbsolute(self, trackingOrigin, trackingOriginToKeyboardTransform) -> None:
         """Set the position of the keyboard in world space"""
-        fn = self.function_table.setKeyboardTransformAbsolute
+        fn = self._fn_setKeyboardTransformAbsolute
         fn(trackingOrigin, byref(trackingOriginToKeyboardTransform))
 
     def setKeyboardPositionForOverlay(self, overlayHandle, rect) -> None:
         """Set the position of the keyboard in overlay space by telling it to avoid a rectangle in the overlay. Rectangle coords have (0,0) in the bottom left"""
-        fn = self.function_table.setKeyboardPositionForOverlay
+        fn = self._fn_setKeyboardPositionForOverlay
         fn(overlayHandle, rect)
 
     def showMessageOverlay(self, text: str, caption: str, button0Text: str, button1Text: str = None, button2Text: str = None, button3Text: str = None):
         """Show the message overlay. This will block and return you a result."""
-        fn = self.function_table.showMessageOverlay
+        fn = self._fn_showMessageOverlay
         if text is not None:
             text = bytes(text, encoding='utf-8')
         if caption is not None:
@@ -5858,7 +6953,7 @@ class IVROverlay(object):
 
     def closeMessageOverlay(self) -> None:
         """If the calling process owns the overlay and it's open, this will close it."""
-        fn = self.function_table.closeMessageOverlay
+        fn = self._fn_closeMessageOverlay
         fn()
 
 
@@ -5872,6 +6967,8 @@ class IVROverlayView_FnTable(Structure):
 
 
 class IVROverlayView(object):
+    _sizeof_VROverlayView_t = sizeof(VROverlayView_t)
+
     def __init__(self):
         version_key = IVROverlayView_Version
         _checkInterfaceVersion(version_key)
@@ -5881,8 +6978,11 @@ class IVROverlayView(object):
         if fn_table_ptr is None:
             raise OpenVRError("Error retrieving VR API for IVROverlayView")
         self.function_table = fn_table_ptr.contents
+        # Reading a function table field creates a new function object each time, so read each just once
+        for entry_name, _ in fn_type._fields_:
+            setattr(self, '_fn_' + entry_name, getattr(self.function_table, entry_name))
 
-    def acquireOverlayView(self, overlayHandle):
+    def acquireOverlayView(self, overlayHandle, nativeDevice=None, overlayView=None):
         """
         Acquire an OverlayView_t from an overlay handle
 
@@ -5902,15 +7002,28 @@ class IVROverlayView(object):
         will be nullptr. Once the producer generates the first overlay frame, Texture_t->handle
         will become a valid handle.
         """
-        fn = self.function_table.acquireOverlayView
-        nativeDevice = VRNativeDevice_t()
-        overlayView = VROverlayView_t()
-        overlayViewSize = sizeof(VROverlayView_t)
+        fn = self._fn_acquireOverlayView
+        if nativeDevice is None:
+            nativeDevice = VRNativeDevice_t()
+        if overlayView is None:
+            overlayView = VROverlayView_t()
+        overlayViewSize = self._sizeof_VROverlayView_t
         error = fn(overlayHandle, byref(nativeDevice), byref(overlayView), overlayViewSize)
         openvr.error_code.OverlayError.check_error_value(error)
         return nativeDevice, overlayView
 
-    def releaseOverlayView(self):
+    def acquireOverlayView_nothrow(self, overlayHandle, nativeDevice=None, overlayView=None):
+        """Like acquireOverlayView(), but returns the error code last, instead of raising it"""
+        fn = self._fn_acquireOverlayView
+        if nativeDevice is None:
+            nativeDevice = VRNativeDevice_t()
+        if overlayView is None:
+            overlayView = VROverlayView_t()
+        overlayViewSize = self._sizeof_VROverlayView_t
+        error = fn(overlayHandle, byref(nativeDevice), byref(overlayView), overlayViewSize)
+        return nativeDevice, overlayView, error
+
+    def releaseOverlayView(self, overlayView=None):
         """
         Release an acquired OverlayView_t
 
@@ -5920,20 +7033,29 @@ class IVROverlayView(object):
         All OverlayView_t*'s provided to AcquireOverlayView() as pOverlayViews must be
         passed into ReleaseOverlayView() in order for the underlying GPU resources to be freed.
         """
-        fn = self.function_table.releaseOverlayView
-        overlayView = VROverlayView_t()
+        fn = self._fn_releaseOverlayView
+        if overlayView is None:
+            overlayView = VROverlayView_t()
         error = fn(byref(overlayView))
         openvr.error_code.OverlayError.check_error_value(error)
         return overlayView
 
+    def releaseOverlayView_nothrow(self, overlayView=None):
+        """Like releaseOverlayView(), but returns the error code last, instead of raising it"""
+        fn = self._fn_releaseOverlayView
+        if overlayView is None:
+            overlayView = VROverlayView_t()
+        error = fn(byref(overlayView))
+        return overlayView, error
+
     def postOverlayEvent(self, overlayHandle, event) -> None:
         """Posts an overlay event"""
-        fn = self.function_table.postOverlayEvent
+        fn = self._fn_postOverlayEvent
         fn(overlayHandle, byref(event))
 
     def isViewingPermitted(self, overlayHandle):
         """Determines whether this process is permitted to view an overlay's content."""
-        fn = self.function_table.isViewingPermitted
+        fn = self._fn_isViewingPermitted
         result = fn(overlayHandle)
         return result
 
@@ -5972,6 +7094,9 @@ class IVRRenderModels(object):
         if fn_table_ptr is None:
             raise OpenVRError("Error retrieving VR API for IVRRenderModels")
         self.function_table = fn_table_ptr.contents
+        # Reading a function table field creates a new function object each time, so read each just once
+        for entry_name, _ in fn_type._fields_:
+            setattr(self, '_fn_' + entry_name, getattr(self.function_table, entry_name))
 
     def loadRenderModel_Async(self, renderModelName: str):
         """
@@ -5985,7 +7110,7 @@ class IVRRenderModels(object):
         The method returns VRRenderModelError_Loading while the render model is still being loaded.
         The method returns VRRenderModelError_None once loaded successfully, otherwise will return an error.
         """
-        fn = self.function_table.loadRenderModel_Async
+        fn = self._fn_loadRenderModel_Async
         if renderModelName is not None:
             renderModelName = bytes(renderModelName, encoding='utf-8')
         renderModel = POINTER(RenderModel_t)()
@@ -5997,17 +7122,30 @@ class IVRRenderModels(object):
         openvr.error_code.RenderModelError.check_error_value(error)
         return renderModel
 
-    def freeRenderModel(self, renderModel) -> None:
-        """
-        Frees a previously returned render model
-        It is safe to call this on a null ptr.
-        """
-        fn = self.function_table.freeRenderModel
-        fn(byref(renderModel))
-
-    def loadTexture_Async(self, textureId):
+    def loadRenderModel_Async_nothrow(self, renderModelName: str):
+        """Like loadRenderModel_Async(), but returns the error code last, instead of raising it"""
+        fn = self._fn_loadRenderModel_Async
+        if renderModelName is not None:
+            renderModelName = bytes(renderModelName, encoding='utf-8')
+        renderModel = POINTER(RenderModel_t)()
+        error = fn(renderModelName, byref(renderModel))
+        if renderModel:
+            renderModel = renderModel.contents
+        else:
+            renderModel = None
+        return renderModel, error
+
+    def freeRenderModel(self, renderModel) -> None:
+        """
+        Frees a previously returned render model
+        It is safe to call this on a null ptr.
+        """
+        fn = self._fn_freeRenderModel
+        fn(byref(renderModel))
+
+    def loadTexture_Async(self, textureId):
         """Loads and returns a texture for use in the application."""
-        fn = self.function_table.loadTexture_Async
+        fn = self._fn_loadTexture_Async
         texture = POINTER(RenderModel_TextureMap_t)()
         error = fn(textureId, byref(texture))
         if texture:
@@ -6017,31 +7155,55 @@ class IVRRenderModels(object):
         openvr.error_code.RenderModelError.check_error_value(error)
         return texture
 
+    def loadTexture_Async_nothrow(self, textureId):
+        """Like loadTexture_Async(), but returns the error code last, instead of raising it"""
+        fn = self._fn_loadTexture_Async
+        texture = POINTER(RenderModel_TextureMap_t)()
+        error = fn(textureId, byref(texture))
+        if texture:
+            texture = texture.contents
+        else:
+            texture = None
+        return texture, error
+
     def freeTexture(self, texture) -> None:
         """
         Frees a previously returned texture
         It is safe to call this on a null ptr.
         """
-        fn = self.function_table.freeTexture
+        fn = self._fn_freeTexture
         fn(byref(texture))
 
     def loadTextureD3D11_Async(self, textureId, d3D11Device):
         """Creates a D3D11 texture and loads data into it."""
-        fn = self.function_table.loadTextureD3D11_Async
+        fn = self._fn_loadTextureD3D11_Async
         d3D11Texture2D = c_void_p()
         error = fn(textureId, byref(d3D11Device), byref(d3D11Texture2D))
         openvr.error_code.RenderModelError.check_error_value(error)
         return d3D11Texture2D.value
 
+    def loadTextureD3D11_Async_nothrow(self, textureId, d3D11Device):
+        """Like loadTextureD3D11_Async(), but returns the error code last, instead of raising it"""
+        fn = self._fn_loadTextureD3D11_Async
+        d3D11Texture2D = c_void_p()
+        error = fn(textureId, byref(d3D11Device), byref(d3D11Texture2D))
+        return d3D11Texture2D.value, error
+
     def loadIntoTextureD3D11_Async(self, textureId, dstTexture) -> None:
         """Helper function to copy the bits into an existing texture."""
-        fn = self.function_table.loadIntoTextureD3D11_Async
+        fn = self._fn_loadIntoTextureD3D11_Async
         error = fn(textureId, byref(dstTexture))
         openvr.error_code.RenderModelError.check_error_value(error)
 
+    def loadIntoTextureD3D11_Async_nothrow(self, textureId, dstTexture):
+        """Like loadIntoTextureD3D11_Async(), but returns the error code last, instead of raising it"""
+        fn = self._fn_loadIntoTextureD3D11_Async
+        error = fn(textureId, byref(dstTexture))
+        return error
+
     def freeTextureD3D11(self, d3D11Texture2D) -> None:
         """Use this to free textures created with LoadTextureD3D11_Async instead of calling Release on them."""
-        fn = self.function_table.freeTextureD3D11
+        fn = self._fn_freeTextureD3D11
         fn(byref(d3D11Texture2D))
 
     def getRenderModelName(self, renderModelIndex):
@@ -6050,7 +7212,7 @@ class IVRRenderModels(object):
         is only used for iterating over all available render models.  If the index is out of range, this function will return 0.
         Otherwise, it will return the size of the buffer required for the name.
         """
-        fn = self.function_table.getRenderModelName
+        fn = self._fn_getRenderModelName
         renderModelNameLen = fn(renderModelIndex, None, 0)
         renderModelName = ctypes.create_string_buffer(renderModelNameLen)
         fn(renderModelIndex, renderModelName, renderModelNameLen)
@@ -6058,7 +7220,7 @@ class IVRRenderModels(object):
 
     def getRenderModelCount(self):
         """Returns the number of available render models."""
-        fn = self.function_table.getRenderModelCount
+        fn = self._fn_getRenderModelCount
         result = fn()
         return result
 
@@ -6072,7 +7234,7 @@ class IVRRenderModels(object):
          If all controller components are enumerated and rendered, it will be equivalent to drawing the traditional render model
          Returns 0 if components not supported, >0 otherwise
         """
-        fn = self.function_table.getComponentCount
+        fn = self._fn_getComponentCount
         if renderModelName is not None:
             renderModelName = bytes(renderModelName, encoding='utf-8')
         result = fn(renderModelName)
@@ -6084,7 +7246,7 @@ class IVRRenderModels(object):
         is only used for iterating over all available components.  If the index is out of range, this function will return 0.
         Otherwise, it will return the size of the buffer required for the name.
         """
-        fn = self.function_table.getComponentName
+        fn = self._fn_getComponentName
         if renderModelName is not None:
             renderModelName = bytes(renderModelName, encoding='utf-8')
         componentNameLen = fn(renderModelName, componentIndex, None, 0)
@@ -6099,7 +7261,7 @@ class IVRRenderModels(object):
         Note: multiple components may be associated with the same button. Ex: two grip buttons on a single controller.
         Note: A single component may be associated with multiple buttons. Ex: A trackpad which also provides "D-pad" functionality
         """
-        fn = self.function_table.getComponentButtonMask
+        fn = self._fn_getComponentButtonMask
         if renderModelName is not None:
             renderModelName = bytes(renderModelName, encoding='utf-8')
         if componentName is not None:
@@ -6113,7 +7275,7 @@ class IVRRenderModels(object):
         If the component name is out of range, this function will return 0.
         Otherwise, it will return the size of the buffer required for the name.
         """
-        fn = self.function_table.getComponentRenderModelName
+        fn = self._fn_getComponentRenderModelName
         if renderModelName is not None:
             renderModelName = bytes(renderModelName, encoding='utf-8')
         if componentName is not None:
@@ -6123,7 +7285,7 @@ class IVRRenderModels(object):
         fn(renderModelName, componentName, componentRenderModelName, componentRenderModelNameLen)
         return bytes(componentRenderModelName.value).decode('utf-8')
 
-    def getComponentStateForDevicePath(self, renderModelName: str, componentName: str, devicePath, state):
+    def getComponentStateForDevicePath(self, renderModelName: str, componentName: str, devicePath, state, componentState=None):
         """
         Use this to query information about the component, as a function of the controller state.
 
@@ -6134,29 +7296,31 @@ class IVRRenderModels(object):
         Otherwise, return true
         Note: For dynamic objects, visibility may be dynamic. (I.e., true/false will be returned based on controller state and controller mode state )
         """
-        fn = self.function_table.getComponentStateForDevicePath
+        fn = self._fn_getComponentStateForDevicePath
         if renderModelName is not None:
             renderModelName = bytes(renderModelName, encoding='utf-8')
         if componentName is not None:
             componentName = bytes(componentName, encoding='utf-8')
-        componentState = RenderModel_ComponentState_t()
+        if componentState is None:
+            componentState = RenderModel_ComponentState_t()
         result = fn(renderModelName, componentName, devicePath, byref(state), byref(componentState))
         return result, componentState
 
-    def getComponentState(self, renderModelName: str, componentName: str, controllerState, state):
+    def getComponentState(self, renderModelName: str, componentName: str, controllerState, state, componentState=None):
         """This version of GetComponentState takes a controller state block instead of an action origin. This function is deprecated. You should use the new input system and GetComponentStateForDevicePath instead."""
-        fn = self.function_table.getComponentState
+        fn = self._fn_getComponentState
         if renderModelName is not None:
             renderModelName = bytes(renderModelName, encoding='utf-8')
         if componentName is not None:
             componentName = bytes(componentName, encoding='utf-8')
-        componentState = RenderModel_ComponentState_t()
+        if componentState is None:
+            componentState = RenderModel_ComponentState_t()
         result = fn(renderModelName, componentName, byref(controllerState), byref(state), byref(componentState))
         return result, componentState
 
     def renderModelHasComponent(self, renderModelName: str, componentName: str):
         """Returns true if the render model has a component with the specified name"""
-        fn = self.function_table.renderModelHasComponent
+        fn = self._fn_renderModelHasComponent
         if renderModelName is not None:
             renderModelName = bytes(renderModelName, encoding='utf-8')
         if componentName is not None:
@@ -6166,7 +7330,7 @@ class IVRRenderModels(object):
 
     def getRenderModelThumbnailURL(self, renderModelName: str):
         """Returns the URL of the thumbnail image for this rendermodel"""
-        fn = self.function_table.getRenderModelThumbnailURL
+        fn = self._fn_getRenderModelThumbnailURL
         if renderModelName is not None:
             renderModelName = bytes(renderModelName, encoding='utf-8')
         error = EVRRenderModelError()
@@ -6180,13 +7344,24 @@ class IVRRenderModels(object):
         openvr.error_code.RenderModelError.check_error_value(error.value)
         return bytes(thumbnailURL.value).decode('utf-8')
 
+    def getRenderModelThumbnailURL_nothrow(self, renderModelName: str):
+        """Like getRenderModelThumbnailURL(), but returns the error code last, instead of raising it"""
+        fn = self._fn_getRenderModelThumbnailURL
+        if renderModelName is not None:
+            renderModelName = bytes(renderModelName, encoding='utf-8')
+        error = EVRRenderModelError()
+        thumbnailURLLen = fn(renderModelName, None, 0, byref(error))
+        thumbnailURL = ctypes.create_string_buffer(thumbnailURLLen)
+        fn(renderModelName, thumbnailURL, thumbnailURLLen, byref(error))
+        return bytes(thumbnailURL.value).decode('utf-8'), error.value
+
     def getRenderModelOriginalPath(self, renderModelName: str):
         """
         Provides a render model path that will load the unskinned model if the model name provided has been replace by the user. If the model
         hasn't been replaced the path value will still be a valid path to load the model. Pass this to LoadRenderModel_Async, etc. to load the
         model.
         """
-        fn = self.function_table.getRenderModelOriginalPath
+        fn = self._fn_getRenderModelOriginalPath
         if renderModelName is not None:
             renderModelName = bytes(renderModelName, encoding='utf-8')
         error = EVRRenderModelError()
@@ -6200,9 +7375,20 @@ class IVRRenderModels(object):
         openvr.error_code.RenderModelError.check_error_value(error.value)
         return bytes(originalPath.value).decode('utf-8')
 
+    def getRenderModelOriginalPath_nothrow(self, renderModelName: str):
+        """Like getRenderModelOriginalPath(), but returns the error code last, instead of raising it"""
+        fn = self._fn_getRenderModelOriginalPath
+        if renderModelName is not None:
+            renderModelName = bytes(renderModelName, encoding='utf-8')
+        error = EVRRenderModelError()
+        originalPathLen = fn(renderModelName, None, 0, byref(error))
+        originalPath = ctypes.create_string_buffer(originalPathLen)
+        fn(renderModelName, originalPath, originalPathLen, byref(error))
+        return bytes(originalPath.value).decode('utf-8'), error.value
+
     def getRenderModelErrorNameFromEnum(self, error):
         """Returns a string for a render model error"""
-        fn = self.function_table.getRenderModelErrorNameFromEnum
+        fn = self._fn_getRenderModelErrorNameFromEnum
         result = fn(error)
         return result.decode('utf-8')
 
@@ -6230,10 +7416,13 @@ class IVRExtendedDisplay(object):
         if fn_table_ptr is None:
             raise OpenVRError("Error retrieving VR API for IVRExtendedDisplay")
         self.function_table = fn_table_ptr.contents
+        # Reading a function table field creates a new function object each time, so read each just once
+        for entry_name, _ in fn_type._fields_:
+            setattr(self, '_fn_' + entry_name, getattr(self.function_table, entry_name))
 
     def getWindowBounds(self):
         """Size and position that the window needs to be on the VR display."""
-        fn = self.function_table.getWindowBounds
+        fn = self._fn_getWindowBounds
         x = c_int32()
         y = c_int32()
         width = c_uint32()
@@ -6243,7 +7432,7 @@ class IVRExtendedDisplay(object):
 
     def getEyeOutputViewport(self, eye):
         """Gets the viewport in the frame buffer to draw the output of the distortion into"""
-        fn = self.function_table.getEyeOutputViewport
+        fn = self._fn_getEyeOutputViewport
         x = c_uint32()
         y = c_uint32()
         width = c_uint32()
@@ -6257,7 +7446,7 @@ class IVRExtendedDisplay(object):
         Returns the adapter index and output index that the user should pass into EnumAdapters and EnumOutputs
         to create the device and swap chain in DX10 and DX11. If an error occurs both indices will be set to -1.
         """
-        fn = self.function_table.getDXGIOutputInfo
+        fn = self._fn_getDXGIOutputInfo
         adapterIndex = c_int32()
         adapterOutputIndex = c_int32()
         fn(byref(adapterIndex), byref(adapterOutputIndex))
@@ -6284,6 +7473,8 @@ class IVRTrackedCamera_FnTable(Structure):
 
 
 class IVRTrackedCamera(object):
+    _sizeof_CameraVideoStreamFrameHeader_t = sizeof(CameraVideoStreamFrameHeader_t)
+
     def __init__(self):
         version_key = IVRTrackedCamera_Version
         _checkInterfaceVersion(version_key)
@@ -6293,24 +7484,34 @@ class IVRTrackedCamera(object):
         if fn_table_ptr is None:
             raise OpenVRError("Error retrieving VR API for IVRTrackedCamera")
         self.function_table = fn_table_ptr.contents
+        # Reading a function table field creates a new function object each time, so read each just once
+        for entry_name, _ in fn_type._fields_:
+            setattr(self, '_fn_' + entry_name, getattr(self.function_table, entry_name))
 
     def getCameraErrorNameFromEnum(self, cameraError):
         """Returns a string for an error"""
-        fn = self.function_table.getCameraErrorNameFromEnum
+        fn = self._fn_getCameraErrorNameFromEnum
         result = fn(cameraError)
         return result.decode('utf-8')
 
     def hasCamera(self, deviceIndex):
         """For convenience, same as tracked property request Prop_HasCamera_Bool"""
-        fn = self.function_table.hasCamera
+        fn = self._fn_hasCamera
         hasCamera = openvr_bool()
         error = fn(deviceIndex, byref(hasCamera))
         openvr.error_code.TrackedCameraError.check_error_value(error)
         return hasCamera
 
+    def hasCamera_nothrow(self, deviceIndex):
+        """Like hasCamera(), but returns the error code last, instead of raising it"""
+        fn = self._fn_hasCamera
+        hasCamera = openvr_bool()
+        error = fn(deviceIndex, byref(hasCamera))
+        return hasCamera, error
+
     def getCameraFrameSize(self, deviceIndex, frameType):
         """Gets size of the image frame."""
-        fn = self.function_table.getCameraFrameSize
+        fn = self._fn_getCameraFrameSize
         width = c_uint32()
         height = c_uint32()
         frameBufferSize = c_uint32()
@@ -6318,21 +7519,51 @@ class IVRTrackedCamera(object):
         openvr.error_code.TrackedCameraError.check_error_value(error)
         return width.value, height.value, frameBufferSize.value
 
-    def getCameraIntrinsics(self, deviceIndex, cameraIndex, frameType):
-        fn = self.function_table.getCameraIntrinsics
-        focalLength = HmdVector2_t()
-        center = HmdVector2_t()
+    def getCameraFrameSize_nothrow(self, deviceIndex, frameType):
+        """Like getCameraFrameSize(), but returns the error code last, instead of raising it"""
+        fn = self._fn_getCameraFrameSize
+        width = c_uint32()
+        height = c_uint32()
+        frameBufferSize = c_uint32()
+        error = fn(deviceIndex, frameType, byref(width), byref(height), byref(frameBufferSize))
+        return width.value, height.value, frameBufferSize.value, error
+
+    def getCameraIntrinsics(self, deviceIndex, cameraIndex, frameType, focalLength=None, center=None):
+        fn = self._fn_getCameraIntrinsics
+        if focalLength is None:
+            focalLength = HmdVector2_t()
+        if center is None:
+            center = HmdVector2_t()
         error = fn(deviceIndex, cameraIndex, frameType, byref(focalLength), byref(center))
         openvr.error_code.TrackedCameraError.check_error_value(error)
         return focalLength, center
 
-    def getCameraProjection(self, deviceIndex, cameraIndex, frameType, zNear: float, zFar: float):
-        fn = self.function_table.getCameraProjection
-        projection = HmdMatrix44_t()
+    def getCameraIntrinsics_nothrow(self, deviceIndex, cameraIndex, frameType, focalLength=None, center=None):
+        """Like getCameraIntrinsics(), but returns the error code last, instead of raising it"""
+        fn = self._fn_getCameraIntrinsics
+        if focalLength is None:
+            focalLength = HmdVector2_t()
+        if center is None:
+            center = HmdVector2_t()
+        error = fn(deviceIndex, cameraIndex, frameType, byref(focalLength), byref(center))
+        return focalLength, center, error
+
+    def getCameraProjection(self, deviceIndex, cameraIndex, frameType, zNear: float, zFar: float, projection=None):
+        fn = self._fn_getCameraProjection
+        if projection is None:
+            projection = HmdMatrix44_t()
         error = fn(deviceIndex, cameraIndex, frameType, zNear, zFar, byref(projection))
         openvr.error_code.TrackedCameraError.check_error_value(error)
         return projection
 
+    def getCameraProjection_nothrow(self, deviceIndex, cameraIndex, frameType, zNear: float, zFar: float, projection=None):
+        """Like getCameraProjection(), but returns the error code last, instead of raising it"""
+        fn = self._fn_getCameraProjection
+        if projection is None:
+            projection = HmdMatrix44_t()
+        error = fn(deviceIndex, cameraIndex, frameType, zNear, zFar, byref(projection))
+        return projection, error
+
     def acquireVideoStreamingService(self, deviceIndex):
         """
         Acquiring streaming service permits video streaming for the caller. Releasing hints the system that video services do not need to be maintained for this client.
@@ -6340,18 +7571,31 @@ class IVRTrackedCamera(object):
         The camera should be considered a global resource accessible for shared consumption but not exclusive to any caller.
         The camera may go inactive due to lack of active consumers or headset idleness.
         """
-        fn = self.function_table.acquireVideoStreamingService
+        fn = self._fn_acquireVideoStreamingService
         handle = TrackedCameraHandle_t()
         error = fn(deviceIndex, byref(handle))
         openvr.error_code.TrackedCameraError.check_error_value(error)
         return handle
 
+    def acquireVideoStreamingService_nothrow(self, deviceIndex):
+        """Like acquireVideoStreamingService(), but returns the error code last, instead of raising it"""
+        fn = self._fn_acquireVideoStreamingService
+        handle = TrackedCameraHandle_t()
+        error = fn(deviceIndex, byref(handle))
+        return handle, error
+
     def releaseVideoStreamingService(self, trackedCamera) -> None:
-        fn = self.function_table.releaseVideoStreamingService
+        fn = self._fn_releaseVideoStreamingService
         error = fn(trackedCamera)
         openvr.error_code.TrackedCameraError.check_error_value(error)
 
-    def getVideoStreamFrameBuffer(self, trackedCamera, frameType, frameBuffer, frameBufferSize):
+    def releaseVideoStreamingService_nothrow(self, trackedCamera):
+        """Like releaseVideoStreamingService(), but returns the error code last, instead of raising it"""
+        fn = self._fn_releaseVideoStreamingService
+        error = fn(trackedCamera)
+        return error
+
+    def getVideoStreamFrameBuffer(self, trackedCamera, frameType, frameBuffer, frameBufferSize, frameHeader=None):
         """
         Copies the image frame into a caller's provided buffer. The image data is currently provided as RGBA data, 4 bytes per pixel.
         A caller can provide null for the framebuffer or frameheader if not desired. Requesting the frame header first, followed by the frame buffer allows
@@ -6359,24 +7603,45 @@ class IVRTrackedCamera(object):
         If there is no frame available yet, due to initial camera spinup or re-activation, the error will be VRTrackedCameraError_NoFrameAvailable.
         Ideally a caller should be polling at ~16ms intervals
         """
-        fn = self.function_table.getVideoStreamFrameBuffer
-        frameHeader = CameraVideoStreamFrameHeader_t()
-        frameHeaderSize = sizeof(CameraVideoStreamFrameHeader_t)
+        fn = self._fn_getVideoStreamFrameBuffer
+        if frameHeader is None:
+            frameHeader = CameraVideoStreamFrameHeader_t()
+        frameHeaderSize = self._sizeof_CameraVideoStreamFrameHeader_t
         error = fn(trackedCamera, frameType, byref(frameBuffer), frameBufferSize, byref(frameHeader), frameHeaderSize)
         openvr.error_code.TrackedCameraError.check_error_value(error)
         return frameHeader
 
-    def getVideoStreamTextureSize(self, deviceIndex, frameType):
+    def getVideoStreamFrameBuffer_nothrow(self, trackedCamera, frameType, frameBuffer, frameBufferSize, frameHeader=None):
+        """Like getVideoStreamFrameBuffer(), but returns the error code last, instead of raising it"""
+        fn = self._fn_getVideoStreamFrameBuffer
+        if frameHeader is None:
+            frameHeader = CameraVideoStreamFrameHeader_t()
+        frameHeaderSize = self._sizeof_CameraVideoStreamFrameHeader_t
+        error = fn(trackedCamera, frameType, byref(frameBuffer), frameBufferSize, byref(frameHeader), frameHeaderSize)
+        return frameHeader, error
+
+    def getVideoStreamTextureSize(self, deviceIndex, frameType, textureBounds=None):
         """Gets size of the image frame."""
-        fn = self.function_table.getVideoStreamTextureSize
-        textureBounds = VRTextureBounds_t()
+        fn = self._fn_getVideoStreamTextureSize
+        if textureBounds is None:
+            textureBounds = VRTextureBounds_t()
         width = c_uint32()
         height = c_uint32()
         error = fn(deviceIndex, frameType, byref(textureBounds), byref(width), byref(height))
         openvr.error_code.TrackedCameraError.check_error_value(error)
         return textureBounds, width.value, height.value
 
-    def getVideoStreamTextureD3D11(self, trackedCamera, frameType, d3D11DeviceOrResource):
+    def getVideoStreamTextureSize_nothrow(self, deviceIndex, frameType, textureBounds=None):
+        """Like getVideoStreamTextureSize(), but returns the error code last, instead of raising it"""
+        fn = self._fn_getVideoStreamTextureSize
+        if textureBounds is None:
+            textureBounds = VRTextureBounds_t()
+        width = c_uint32()
+        height = c_uint32()
+        error = fn(deviceIndex, frameType, byref(textureBounds), byref(width), byref(height))
+        return textureBounds, width.value, height.value, error
+
+    def getVideoStreamTextureD3D11(self, trackedCamera, frameType, d3D11DeviceOrResource, frameHeader=None):
         """
         Access a shared D3D11 texture for the specified tracked camera stream.
         The camera frame type VRTrackedCameraFrameType_Undistorted is not supported directly as a shared texture. It is an interior subregion of the shared texture VRTrackedCameraFrameType_MaximumUndistorted.
@@ -6385,35 +7650,63 @@ class IVRTrackedCamera(object):
         by the alpha channel having a zero component. The valid regions all have a non-zero alpha component. The subregion as described by VRTrackedCameraFrameType_Undistorted
         guarantees a rectangle where all pixels are valid.
         """
-        fn = self.function_table.getVideoStreamTextureD3D11
+        fn = self._fn_getVideoStreamTextureD3D11
         d3D11ShaderResourceView = c_void_p()
-        frameHeader = CameraVideoStreamFrameHeader_t()
-        frameHeaderSize = sizeof(CameraVideoStreamFrameHeader_t)
+        if frameHeader is None:
+            frameHeader = CameraVideoStreamFrameHeader_t()
+        frameHeaderSize = self._sizeof_CameraVideoStreamFrameHeader_t
         error = fn(trackedCamera, frameType, byref(d3D11DeviceOrResource), byref(d3D11ShaderResourceView), byref(frameHeader), frameHeaderSize)
         openvr.error_code.TrackedCameraError.check_error_value(error)
         return d3D11ShaderResourceView.value, frameHeader
 
-    def getVideoStreamTextureGL(self, trackedCamera, frameType):
+    def getVideoStreamTextureD3D11_nothrow(self, trackedCamera, frameType, d3D11DeviceOrResource, frameHeader=None):
+        """Like getVideoStreamTextureD3D11(), but returns the error code last, instead of raising it"""
+        fn = self._fn_getVideoStreamTextureD3D11
+        d3D11ShaderResourceView = c_void_p()
+        if frameHeader is None:
+            frameHeader = CameraVideoStreamFrameHeader_t()
+        frameHeaderSize = self._sizeof_CameraVideoStreamFrameHeader_t
+        error = fn(trackedCamera, frameType, byref(d3D11DeviceOrResource), byref(d3D11ShaderResourceView), byref(frameHeader), frameHeaderSize)
+        return d3D11ShaderResourceView.value, frameHeader, error
+
+    def getVideoStreamTextureGL(self, trackedCamera, frameType, frameHeader=None):
         """Access a shared GL texture for the specified tracked camera stream"""
-        fn = self.function_table.getVideoStreamTextureGL
+        fn = self._fn_getVideoStreamTextureGL
         textureId = glUInt_t()
-        frameHeader = CameraVideoStreamFrameHeader_t()
-        frameHeaderSize = sizeof(CameraVideoStreamFrameHeader_t)
+        if frameHeader is None:
+            frameHeader = CameraVideoStreamFrameHeader_t()
+        frameHeaderSize = self._sizeof_CameraVideoStreamFrameHeader_t
         error = fn(trackedCamera, frameType, byref(textureId), byref(frameHeader), frameHeaderSize)
         openvr.error_code.TrackedCameraError.check_error_value(error)
         return textureId, frameHeader
 
+    def getVideoStreamTextureGL_nothrow(self, trackedCamera, frameType, frameHeader=None):
+        """Like getVideoStreamTextureGL(), but returns the error code last, instead of raising it"""
+        fn = self._fn_getVideoStreamTextureGL
+        textureId = glUInt_t()
+        if frameHeader is None:
+            frameHeader = CameraVideoStreamFrameHeader_t()
+        frameHeaderSize = self._sizeof_CameraVideoStreamFrameHeader_t
+        error = fn(trackedCamera, frameType, byref(textureId), byref(frameHeader), frameHeaderSize)
+        return textureId, frameHeader, error
+
     def releaseVideoStreamTextureGL(self, trackedCamera, textureId) -> None:
-        fn = self.function_table.releaseVideoStreamTextureGL
+        fn = self._fn_releaseVideoStreamTextureGL
         error = fn(trackedCamera, textureId)
         openvr.error_code.TrackedCameraError.check_error_value(error)
 
+    def releaseVideoStreamTextureGL_nothrow(self, trackedCamera, textureId):
+        """Like releaseVideoStreamTextureGL(), but returns the error code last, instead of raising it"""
+        fn = self._fn_releaseVideoStreamTextureGL
+        error = fn(trackedCamera, textureId)
+        return error
+
     def setCameraTrackingSpace(self, universe) -> None:
-        fn = self.function_table.setCameraTrackingSpace
+        fn = self._fn_setCameraTrackingSpace
         fn(universe)
 
     def getCameraTrackingSpace(self):
-        fn = self.function_table.getCameraTrackingSpace
+        fn = self._fn_getCameraTrackingSpace
         result = fn()
         return result
 
@@ -6442,6 +7735,9 @@ class IVRScreenshots(object):
         if fn_table_ptr is None:
             raise OpenVRError("Error retrieving VR API for IVRScreenshots")
         self.function_table = fn_table_ptr.contents
+        # Reading a function table field creates a new function object each time, so read each just once
+        for entry_name, _ in fn_type._fields_:
+            setattr(self, '_fn_' + entry_name, getattr(self.function_table, entry_name))
 
     def requestScreenshot(self, type_, previewFilename: str, vRFilename: str):
         """
@@ -6477,7 +7773,7 @@ class IVRScreenshots(object):
         will be replaced with the correct one for the format
         which is currently .png.
         """
-        fn = self.function_table.requestScreenshot
+        fn = self._fn_requestScreenshot
         outScreenshotHandle = ScreenshotHandle_t()
         if previewFilename is not None:
             previewFilename = bytes(previewFilename, encoding='utf-8')
@@ -6487,6 +7783,17 @@ class IVRScreenshots(object):
         openvr.error_code.ScreenshotError.check_error_value(error)
         return outScreenshotHandle
 
+    def requestScreenshot_nothrow(self, type_, previewFilename: str, vRFilename: str):
+        """Like requestScreenshot(), but returns the error code last, instead of raising it"""
+        fn = self._fn_requestScreenshot
+        outScreenshotHandle = ScreenshotHandle_t()
+        if previewFilename is not None:
+            previewFilename = bytes(previewFilename, encoding='utf-8')
+        if vRFilename is not None:
+            vRFilename = bytes(vRFilename, encoding='utf-8')
+        error = fn(byref(outScreenshotHandle), type_, previewFilename, vRFilename)
+        return outScreenshotHandle, error
+
     def hookScreenshot(self, supportedTypes) -> None:
         """
         Called by the running VR application to indicate that it
@@ -6498,7 +7805,7 @@ class IVRScreenshots(object):
         VREvent_RequestScreenshot event when the user presses the
         buttons to take a screenshot.
         """
-        fn = self.function_table.hookScreenshot
+        fn = self._fn_hookScreenshot
         if supportedTypes is None:
             supportedTypesArg = None
             types = 0
@@ -6512,25 +7819,48 @@ class IVRScreenshots(object):
         error = fn(supportedTypesArg, types)
         openvr.error_code.ScreenshotError.check_error_value(error)
 
+    def hookScreenshot_nothrow(self, supportedTypes):
+        """Like hookScreenshot(), but returns the error code last, instead of raising it"""
+        fn = self._fn_hookScreenshot
+        if supportedTypes is None:
+            supportedTypesArg = None
+            types = 0
+        elif isinstance(supportedTypes, ctypes.Array):
+            supportedTypesArg = byref(supportedTypes[0])
+            types = len(supportedTypes)
+        else:
+            supportedTypes = (EVRScreenshotType * 1)()
+            supportedTypesArg = byref(supportedTypes[0])
+            types = 1
+        error = fn(supportedTypesArg, types)
+        return error
+
     def getScreenshotPropertyType(self, screenshotHandle):
         """
         When your application receives a
         VREvent_RequestScreenshot event, call these functions to get
         the details of the screenshot request.
         """
-        fn = self.function_table.getScreenshotPropertyType
+        fn = self._fn_getScreenshotPropertyType
         error = EVRScreenshotError()
         result = fn(screenshotHandle, byref(error))
         openvr.error_code.ScreenshotError.check_error_value(error.value)
         return result
 
+    def getScreenshotPropertyType_nothrow(self, screenshotHandle):
+        """Like getScreenshotPropertyType(), but returns the error code last, instead of raising it"""
+        fn = self._fn_getScreenshotPropertyType
+        error = EVRScreenshotError()
+        result = fn(screenshotHandle, byref(error))
+        return result, error.value
+
     def getScreenshotPropertyFilename(self, screenshotHandle, filenameType):
         """
         Get the filename for the preview or vr image (see
         vr::EScreenshotPropertyFilenames).  The return value is
         the size of the string.
         """
-        fn = self.function_table.getScreenshotPropertyFilename
+        fn = self._fn_getScreenshotPropertyFilename
         error = EVRScreenshotError()
         filename = fn(screenshotHandle, filenameType, None, 0, byref(error))
         try:
@@ -6542,6 +7872,15 @@ class IVRScreenshots(object):
         openvr.error_code.ScreenshotError.check_error_value(error.value)
         return bytes(filename.value).decode('utf-8')
 
+    def getScreenshotPropertyFilename_nothrow(self, screenshotHandle, filenameType):
+        """Like getScreenshotPropertyFilename(), but returns the error code last, instead of raising it"""
+        fn = self._fn_getScreenshotPropertyFilename
+        error = EVRScreenshotError()
+        filename = fn(screenshotHandle, filenameType, None, 0, byref(error))
+        filename = ctypes.create_string_buffer(filename)
+        fn(screenshotHandle, filenameType, filename, filename, byref(error))
+        return bytes(filename.value).decode('utf-8'), error.value
+
     def updateScreenshotProgress(self, screenshotHandle, progress: float) -> None:
         """
         Call this if the application is taking the screen shot
@@ -6549,10 +7888,16 @@ class IVRScreenshots(object):
         in an overlay being presented that shows a completion
         bar.
         """
-        fn = self.function_table.updateScreenshotProgress
+        fn = self._fn_updateScreenshotProgress
         error = fn(screenshotHandle, progress)
         openvr.error_code.ScreenshotError.check_error_value(error)
 
+    def updateScreenshotProgress_nothrow(self, screenshotHandle, progress: float):
+        """Like updateScreenshotProgress(), but returns the error code last, instead of raising it"""
+        fn = self._fn_updateScreenshotProgress
+        error = fn(screenshotHandle, progress)
+        return error
+
     def takeStereoScreenshot(self, previewFilename: str, vRFilename: str):
         """
         Tells the compositor to take an internal screenshot of
@@ -6563,7 +7908,7 @@ class IVRScreenshots(object):
         This is similar to request screenshot, but doesn't ever
         talk to the application, just takes the shot and submits.
         """
-        fn = self.function_table.takeStereoScreenshot
+        fn = self._fn_takeStereoScreenshot
         outScreenshotHandle = ScreenshotHandle_t()
         if previewFilename is not None:
             previewFilename = bytes(previewFilename, encoding='utf-8')
@@ -6573,6 +7918,17 @@ class IVRScreenshots(object):
         openvr.error_code.ScreenshotError.check_error_value(error)
         return outScreenshotHandle
 
+    def takeStereoScreenshot_nothrow(self, previewFilename: str, vRFilename: str):
+        """Like takeStereoScreenshot(), but returns the error code last, instead of raising it"""
+        fn = self._fn_takeStereoScreenshot
+        outScreenshotHandle = ScreenshotHandle_t()
+        if previewFilename is not None:
+            previewFilename = bytes(previewFilename, encoding='utf-8')
+        if vRFilename is not None:
+            vRFilename = bytes(vRFilename, encoding='utf-8')
+        error = fn(byref(outScreenshotHandle), previewFilename, vRFilename)
+        return outScreenshotHandle, error
+
     def submitScreenshot(self, screenshotHandle, type_, sourcePreviewFilename: str, sourceVRFilename: str) -> None:
         """
         Submit the completed screenshot.  If Steam is running
@@ -6587,7 +7943,7 @@ class IVRScreenshots(object):
         was a new shot taking by the app to be saved and not
         initiated by a user (achievement earned or something)
         """
-        fn = self.function_table.submitScreenshot
+        fn = self._fn_submitScreenshot
         if sourcePreviewFilename is not None:
             sourcePreviewFilename = bytes(sourcePreviewFilename, encoding='utf-8')
         if sourceVRFilename is not None:
@@ -6595,6 +7951,16 @@ class IVRScreenshots(object):
         error = fn(screenshotHandle, type_, sourcePreviewFilename, sourceVRFilename)
         openvr.error_code.ScreenshotError.check_error_value(error)
 
+    def submitScreenshot_nothrow(self, screenshotHandle, type_, sourcePreviewFilename: str, sourceVRFilename: str):
+        """Like submitScreenshot(), but returns the error code last, instead of raising it"""
+        fn = self._fn_submitScreenshot
+        if sourcePreviewFilename is not None:
+            sourcePreviewFilename = bytes(sourcePreviewFilename, encoding='utf-8')
+        if sourceVRFilename is not None:
+            sourceVRFilename = bytes(sourceVRFilename, encoding='utf-8')
+        error = fn(screenshotHandle, type_, sourcePreviewFilename, sourceVRFilename)
+        return error
+
 
 class IVRResources_FnTable(Structure):
     _fields_ = [
@@ -6613,13 +7979,16 @@ class IVRResources(object):
         if fn_table_ptr is None:
             raise OpenVRError("Error retrieving VR API for IVRResources")
         self.function_table = fn_table_ptr.contents
+        # Reading a function table field creates a new function object each time, so read each just once
+        for entry_name, _ in fn_type._fields_:
+            setattr(self, '_fn_' + entry_name, getattr(self.function_table, entry_name))
 
     def loadSharedResource(self, resourceName: str, bufferLen):
         """
         Loads the specified resource into the provided buffer if large enough.
         Returns the size in bytes of the buffer required to hold the specified resource.
         """
-        fn = self.function_table.loadSharedResource
+        fn = self._fn_loadSharedResource
         if resourceName is not None:
             resourceName = bytes(resourceName, encoding='utf-8')
         buffer = c_char()
@@ -6632,7 +8001,7 @@ class IVRResources(object):
         drivers and other things, and this resolves all of those and returns the actual physical path.
         pchResourceTypeDirectory is the subdirectory of resources to look in.
         """
-        fn = self.function_table.getResourceFullPath
+        fn = self._fn_getResourceFullPath
         if resourceName is not None:
             resourceName = bytes(resourceName, encoding='utf-8')
         if resourceTypeDirectory is not None:
@@ -6662,29 +8031,32 @@ class IVRDriverManager(object):
         if fn_table_ptr is None:
             raise OpenVRError("Error retrieving VR API for IVRDriverManager")
         self.function_table = fn_table_ptr.contents
+        # Reading a function table field creates a new function object each time, so read each just once
+        for entry_name, _ in fn_type._fields_:
+            setattr(self, '_fn_' + entry_name, getattr(self.function_table, entry_name))
 
     def getDriverCount(self):
-        fn = self.function_table.getDriverCount
+        fn = self._fn_getDriverCount
         result = fn()
         return result
 
     def getDriverName(self, driver):
         """Returns the length of the number of bytes necessary to hold this string including the trailing null."""
-        fn = self.function_table.getDriverName
+        fn = self._fn_getDriverName
         bufferSize = fn(driver, None, 0)
         value = ctypes.create_string_buffer(bufferSize)
         fn(driver, value, bufferSize)
         return bytes(value.value).decode('utf-8')
 
     def getDriverHandle(self, driverName: str):
-        fn = self.function_table.getDriverHandle
+        fn = self._fn_getDriverHandle
         if driverName is not None:
             driverName = bytes(driverName, encoding='utf-8')
         result = fn(driverName)
         return result
 
     def isEnabled(self, driver):
-        fn = self.function_table.isEnabled
+        fn = self._fn_isEnabled
         result = fn(driver)
         return result
 
@@ -6727,6 +8099,14 @@ class IVRInput_FnTable(Structure):
 
 
 class IVRInput(object):
+    _sizeof_InputAnalogActionData_t = sizeof(InputAnalogActionData_t)
+    _sizeof_InputBindingInfo_t = sizeof(InputBindingInfo_t)
+    _sizeof_InputDigitalActionData_t = sizeof(InputDigitalActionData_t)
+    _sizeof_InputOriginInfo_t = sizeof(InputOriginInfo_t)
+    _sizeof_InputPoseActionData_t = sizeof(InputPoseActionData_t)
+    _sizeof_InputSkeletalActionData_t = sizeof(InputSkeletalActionData_t)
+    _sizeof_VRActiveActionSet_t = sizeof(VRActiveActionSet_t)
+
     def __init__(self):
         version_key = IVRInput_Version
         _checkInterfaceVersion(version_key)
@@ -6736,6 +8116,9 @@ class IVRInput(object):
         if fn_table_ptr is None:
             raise OpenVRError("Error retrieving VR API for IVRInput")
         self.function_table = fn_table_ptr.contents
+        # Reading a function table field creates a new function object each time, so read each just once
+        for entry_name, _ in fn_type._fields_:
+            setattr(self, '_fn_' + entry_name, getattr(self.function_table, entry_name))
 
     def setActionManifestPath(self, actionManifestPath: str) -> None:
         """
@@ -6744,15 +8127,23 @@ class IVRInput(object):
         setting and the path provided by this call are different, VRInputError_MismatchedActionManifest is returned.
         This call must be made before the first call to UpdateActionState or IVRSystem::PollNextEvent.
         """
-        fn = self.function_table.setActionManifestPath
+        fn = self._fn_setActionManifestPath
         if actionManifestPath is not None:
             actionManifestPath = bytes(actionManifestPath, encoding='utf-8')
         error = fn(actionManifestPath)
         openvr.error_code.InputError.check_error_value(error)
 
+    def setActionManifestPath_nothrow(self, actionManifestPath: str):
+        """Like setActionManifestPath(), but returns the error code last, instead of raising it"""
+        fn = self._fn_setActionManifestPath
+        if actionManifestPath is not None:
+            actionManifestPath = bytes(actionManifestPath, encoding='utf-8')
+        error = fn(actionManifestPath)
+        return error
+
     def getActionSetHandle(self, actionSetName: str):
         """Returns a handle for an action set. This handle is used for all performance-sensitive calls."""
-        fn = self.function_table.getActionSetHandle
+        fn = self._fn_getActionSetHandle
         if actionSetName is not None:
             actionSetName = bytes(actionSetName, encoding='utf-8')
         handle = VRActionSetHandle_t()
@@ -6760,9 +8151,18 @@ class IVRInput(object):
         openvr.error_code.InputError.check_error_value(error)
         return handle.value
 
+    def getActionSetHandle_nothrow(self, actionSetName: str):
+        """Like getActionSetHandle(), but returns the error code last, instead of raising it"""
+        fn = self._fn_getActionSetHandle
+        if actionSetName is not None:
+            actionSetName = bytes(actionSetName, encoding='utf-8')
+        handle = VRActionSetHandle_t()
+        error = fn(actionSetName, byref(handle))
+        return handle.value, error
+
     def getActionHandle(self, actionName: str):
         """Returns a handle for an action. This handle is used for all performance-sensitive calls."""
-        fn = self.function_table.getActionHandle
+        fn = self._fn_getActionHandle
         if actionName is not None:
             actionName = bytes(actionName, encoding='utf-8')
         handle = VRActionHandle_t()
@@ -6770,9 +8170,18 @@ class IVRInput(object):
         openvr.error_code.InputError.check_error_value(error)
         return handle.value
 
+    def getActionHandle_nothrow(self, actionName: str):
+        """Like getActionHandle(), but returns the error code last, instead of raising it"""
+        fn = self._fn_getActionHandle
+        if actionName is not None:
+            actionName = bytes(actionName, encoding='utf-8')
+        handle = VRActionHandle_t()
+        error = fn(actionName, byref(handle))
+        return handle.value, error
+
     def getInputSourceHandle(self, inputSourcePath: str):
         """Returns a handle for any path in the input system. E.g. /user/hand/right"""
-        fn = self.function_table.getInputSourceHandle
+        fn = self._fn_getInputSourceHandle
         if inputSourcePath is not None:
             inputSourcePath = bytes(inputSourcePath, encoding='utf-8')
         handle = VRInputValueHandle_t()
@@ -6780,12 +8189,21 @@ class IVRInput(object):
         openvr.error_code.InputError.check_error_value(error)
         return handle.value
 
+    def getInputSourceHandle_nothrow(self, inputSourcePath: str):
+        """Like getInputSourceHandle(), but returns the error code last, instead of raising it"""
+        fn = self._fn_getInputSourceHandle
+        if inputSourcePath is not None:
+            inputSourcePath = bytes(inputSourcePath, encoding='utf-8')
+        handle = VRInputValueHandle_t()
+        error = fn(inputSourcePath, byref(handle))
+        return handle.value, error
+
     def updateActionState(self, sets):
         """
         Reads the current state into all actions. After this call, the results of Get*Action calls
         will be the same until the next call to UpdateActionState.
         """
-        fn = self.function_table.updateActionState
+        fn = self._fn_updateActionState
         if sets is None:
             setsArg = None
             setCount = 0
@@ -6796,97 +8214,184 @@ class IVRInput(object):
             sets = (VRActiveActionSet_t * 1)()
             setsArg = byref(sets[0])
             setCount = 1
-        sizeOfVRSelectedActionSet_t = sizeof(VRActiveActionSet_t)
+        sizeOfVRSelectedActionSet_t = self._sizeof_VRActiveActionSet_t
         error = fn(setsArg, sizeOfVRSelectedActionSet_t, setCount)
         openvr.error_code.InputError.check_error_value(error)
         return sets
 
-    def getDigitalActionData(self, action, restrictToDevice):
+    def updateActionState_nothrow(self, sets):
+        """Like updateActionState(), but returns the error code last, instead of raising it"""
+        fn = self._fn_updateActionState
+        if sets is None:
+            setsArg = None
+            setCount = 0
+        elif isinstance(sets, ctypes.Array):
+            setsArg = byref(sets[0])
+            setCount = len(sets)
+        else:
+            sets = (VRActiveActionSet_t * 1)()
+            setsArg = byref(sets[0])
+            setCount = 1
+        sizeOfVRSelectedActionSet_t = self._sizeof_VRActiveActionSet_t
+        error = fn(setsArg, sizeOfVRSelectedActionSet_t, setCount)
+        return sets, error
+
+    def getDigitalActionData(self, action, restrictToDevice, actionData=None):
         """
         Reads the state of a digital action given its handle. This will return VRInputError_WrongType if the type of
         action is something other than digital
         """
-        fn = self.function_table.getDigitalActionData
-        actionData = InputDigitalActionData_t()
-        actionDataSize = sizeof(InputDigitalActionData_t)
+        fn = self._fn_getDigitalActionData
+        if actionData is None:
+            actionData = InputDigitalActionData_t()
+        actionDataSize = self._sizeof_InputDigitalActionData_t
         error = fn(action, byref(actionData), actionDataSize, restrictToDevice)
         openvr.error_code.InputError.check_error_value(error)
         return actionData
 
-    def getAnalogActionData(self, action, restrictToDevice):
+    def getDigitalActionData_nothrow(self, action, restrictToDevice, actionData=None):
+        """Like getDigitalActionData(), but returns the error code last, instead of raising it"""
+        fn = self._fn_getDigitalActionData
+        if actionData is None:
+            actionData = InputDigitalActionData_t()
+        actionDataSize = self._sizeof_InputDigitalActionData_t
+        error = fn(action, byref(actionData), actionDataSize, restrictToDevice)
+        return actionData, error
+
+    def getAnalogActionData(self, action, restrictToDevice, actionData=None):
         """
         Reads the state of an analog action given its handle. This will return VRInputError_WrongType if the type of
         action is something other than analog
         """
-        fn = self.function_table.getAnalogActionData
-        actionData = InputAnalogActionData_t()
-        actionDataSize = sizeof(InputAnalogActionData_t)
+        fn = self._fn_getAnalogActionData
+        if actionData is None:
+            actionData = InputAnalogActionData_t()
+        actionDataSize = self._sizeof_InputAnalogActionData_t
         error = fn(action, byref(actionData), actionDataSize, restrictToDevice)
         openvr.error_code.InputError.check_error_value(error)
         return actionData
 
-    def getPoseActionDataRelativeToNow(self, action, origin, predictedSecondsFromNow: float, restrictToDevice):
+    def getAnalogActionData_nothrow(self, action, restrictToDevice, actionData=None):
+        """Like getAnalogActionData(), but returns the error code last, instead of raising it"""
+        fn = self._fn_getAnalogActionData
+        if actionData is None:
+            actionData = InputAnalogActionData_t()
+        actionDataSize = self._sizeof_InputAnalogActionData_t
+        error = fn(action, byref(actionData), actionDataSize, restrictToDevice)
+        return actionData, error
+
+    def getPoseActionDataRelativeToNow(self, action, origin, predictedSecondsFromNow: float, restrictToDevice, actionData=None):
         """
         Reads the state of a pose action given its handle for the number of seconds relative to now. This
         will generally be called with negative times from the fUpdateTime fields in other actions.
         """
-        fn = self.function_table.getPoseActionDataRelativeToNow
-        actionData = InputPoseActionData_t()
-        actionDataSize = sizeof(InputPoseActionData_t)
+        fn = self._fn_getPoseActionDataRelativeToNow
+        if actionData is None:
+            actionData = InputPoseActionData_t()
+        actionDataSize = self._sizeof_InputPoseActionData_t
         error = fn(action, origin, predictedSecondsFromNow, byref(actionData), actionDataSize, restrictToDevice)
         openvr.error_code.InputError.check_error_value(error)
         return actionData
 
-    def getPoseActionDataForNextFrame(self, action, origin, restrictToDevice):
+    def getPoseActionDataRelativeToNow_nothrow(self, action, origin, predictedSecondsFromNow: float, restrictToDevice, actionData=None):
+        """Like getPoseActionDataRelativeToNow(), but returns the error code last, instead of raising it"""
+        fn = self._fn_getPoseActionDataRelativeToNow
+        if actionData is None:
+            actionData = InputPoseActionData_t()
+        actionDataSize = self._sizeof_InputPoseActionData_t
+        error = fn(action, origin, predictedSecondsFromNow, byref(actionData), actionDataSize, restrictToDevice)
+        return actionData, error
+
+    def getPoseActionDataForNextFrame(self, action, origin, restrictToDevice, actionData=None):
         """
         Reads the state of a pose action given its handle. The returned values will match the values returned
         by the last call to IVRCompositor::WaitGetPoses().
         """
-        fn = self.function_table.getPoseActionDataForNextFrame
-        actionData = InputPoseActionData_t()
-        actionDataSize = sizeof(InputPoseActionData_t)
+        fn = self._fn_getPoseActionDataForNextFrame
+        if actionData is None:
+            actionData = InputPoseActionData_t()
+        actionDataSize = self._sizeof_InputPoseActionData_t
         error = fn(action, origin, byref(actionData), actionDataSize, restrictToDevice)
         openvr.error_code.InputError.check_error_value(error)
         return actionData
 
-    def getSkeletalActionData(self, action):
+    def getPoseActionDataForNextFrame_nothrow(self, action, origin, restrictToDevice, actionData=None):
+        """Like getPoseActionDataForNextFrame(), but returns the error code last, instead of raising it"""
+        fn = self._fn_getPoseActionDataForNextFrame
+        if actionData is None:
+            actionData = InputPoseActionData_t()
+        actionDataSize = self._sizeof_InputPoseActionData_t
+        error = fn(action, origin, byref(actionData), actionDataSize, restrictToDevice)
+        return actionData, error
+
+    def getSkeletalActionData(self, action, actionData=None):
         """Reads the state of a skeletal action given its handle."""
-        fn = self.function_table.getSkeletalActionData
-        actionData = InputSkeletalActionData_t()
-        actionDataSize = sizeof(InputSkeletalActionData_t)
+        fn = self._fn_getSkeletalActionData
+        if actionData is None:
+            actionData = InputSkeletalActionData_t()
+        actionDataSize = self._sizeof_InputSkeletalActionData_t
         error = fn(action, byref(actionData), actionDataSize)
         openvr.error_code.InputError.check_error_value(error)
         return actionData
 
+    def getSkeletalActionData_nothrow(self, action, actionData=None):
+        """Like getSkeletalActionData(), but returns the error code last, instead of raising it"""
+        fn = self._fn_getSkeletalActionData
+        if actionData is None:
+            actionData = InputSkeletalActionData_t()
+        actionDataSize = self._sizeof_InputSkeletalActionData_t
+        error = fn(action, byref(actionData), actionDataSize)
+        return actionData, error
+
     def getDominantHand(self):
         """
         Returns the current dominant hand for the user for this application. This function will only return success for applications
         which include "supports_dominant_hand_setting": true in their action manifests. The dominant hand will only change after
         a call to UpdateActionState, and the action data returned after that point will use the new dominant hand.
         """
-        fn = self.function_table.getDominantHand
+        fn = self._fn_getDominantHand
         dominantHand = ETrackedControllerRole()
         error = fn(byref(dominantHand))
         openvr.error_code.InputError.check_error_value(error)
         return dominantHand
 
+    def getDominantHand_nothrow(self):
+        """Like getDominantHand(), but returns the error code last, instead of raising it"""
+        fn = self._fn_getDominantHand
+        dominantHand = ETrackedControllerRole()
+        error = fn(byref(dominantHand))
+        return dominantHand, error
+
     def setDominantHand(self, dominantHand) -> None:
         """Sets the dominant hand for the user for this application."""
-        fn = self.function_table.setDominantHand
+        fn = self._fn_setDominantHand
         error = fn(dominantHand)
         openvr.error_code.InputError.check_error_value(error)
 
+    def setDominantHand_nothrow(self, dominantHand):
+        """Like setDominantHand(), but returns the error code last, instead of raising it"""
+        fn = self._fn_setDominantHand
+        error = fn(dominantHand)
+        return error
+
     def getBoneCount(self, action):
         """Reads the number of bones in skeleton associated with the given action"""
-        fn = self.function_table.getBoneCount
+        fn = self._fn_getBoneCount
         boneCount = c_uint32()
         error = fn(action, byref(boneCount))
         openvr.error_code.InputError.check_error_value(error)
         return boneCount.value
 
+    def getBoneCount_nothrow(self, action):
+        """Like getBoneCount(), but returns the error code last, instead of raising it"""
+        fn = self._fn_getBoneCount
+        boneCount = c_uint32()
+        error = fn(action, byref(boneCount))
+        return boneCount.value, error
+
     def getBoneHierarchy(self, action, parentIndices):
         """Fills the given array with the index of each bone's parent in the skeleton associated with the given action"""
-        fn = self.function_table.getBoneHierarchy
+        fn = self._fn_getBoneHierarchy
         if parentIndices is None:
             parentIndicesArg = None
             indexArayCount = 0
@@ -6901,18 +8406,42 @@ class IVRInput(object):
         openvr.error_code.InputError.check_error_value(error)
         return parentIndices
 
+    def getBoneHierarchy_nothrow(self, action, parentIndices):
+        """Like getBoneHierarchy(), but returns the error code last, instead of raising it"""
+        fn = self._fn_getBoneHierarchy
+        if parentIndices is None:
+            parentIndicesArg = None
+            indexArayCount = 0
+        elif isinstance(parentIndices, ctypes.Array):
+            parentIndicesArg = byref(parentIndices[0])
+            indexArayCount = len(parentIndices)
+        else:
+            parentIndices = (BoneIndex_t * 1)()
+            parentIndicesArg = byref(parentIndices[0])
+            indexArayCount = 1
+        error = fn(action, parentIndicesArg, indexArayCount)
+        return parentIndices, error
+
     def getBoneName(self, action, boneIndex):
         """Fills the given buffer with the name of the bone at the given index in the skeleton associated with the given action"""
-        fn = self.function_table.getBoneName
+        fn = self._fn_getBoneName
         nameBufferSize = fn(action, boneIndex, None, 0)
         boneName = ctypes.create_string_buffer(nameBufferSize)
         error = fn(action, boneIndex, boneName, nameBufferSize)
         openvr.error_code.InputError.check_error_value(error)
         return bytes(boneName.value).decode('utf-8')
 
+    def getBoneName_nothrow(self, action, boneIndex):
+        """Like getBoneName(), but returns the error code last, instead of raising it"""
+        fn = self._fn_getBoneName
+        nameBufferSize = fn(action, boneIndex, None, 0)
+        boneName = ctypes.create_string_buffer(nameBufferSize)
+        error = fn(action, boneIndex, boneName, nameBufferSize)
+        return bytes(boneName.value).decode('utf-8'), error
+
     def getSkeletalReferenceTransforms(self, action, transformSpace, referencePose, transformArray):
         """Fills the given buffer with the transforms for a specific static skeletal reference pose"""
-        fn = self.function_table.getSkeletalReferenceTransforms
+        fn = self._fn_getSkeletalReferenceTransforms
         if transformArray is None:
             transformArrayArg = None
             transformArrayCount = 0
@@ -6927,17 +8456,40 @@ class IVRInput(object):
         openvr.error_code.InputError.check_error_value(error)
         return transformArray
 
+    def getSkeletalReferenceTransforms_nothrow(self, action, transformSpace, referencePose, transformArray):
+        """Like getSkeletalReferenceTransforms(), but returns the error code last, instead of raising it"""
+        fn = self._fn_getSkeletalReferenceTransforms
+        if transformArray is None:
+            transformArrayArg = None
+            transformArrayCount = 0
+        elif isinstance(transformArray, ctypes.Array):
+            transformArrayArg = byref(transformArray[0])
+            transformArrayCount = len(transformArray)
+        else:
+            transformArray = (VRBoneTransform_t * 1)()
+            transformArrayArg = byref(transformArray[0])
+            transformArrayCount = 1
+        error = fn(action, transformSpace, referencePose, transformArrayArg, transformArrayCount)
+        return transformArray, error
+
     def getSkeletalTrackingLevel(self, action):
         """Reads the level of accuracy to which the controller is able to track the user to recreate a skeletal pose"""
-        fn = self.function_table.getSkeletalTrackingLevel
+        fn = self._fn_getSkeletalTrackingLevel
         skeletalTrackingLevel = EVRSkeletalTrackingLevel()
         error = fn(action, byref(skeletalTrackingLevel))
         openvr.error_code.InputError.check_error_value(error)
         return skeletalTrackingLevel
 
+    def getSkeletalTrackingLevel_nothrow(self, action):
+        """Like getSkeletalTrackingLevel(), but returns the error code last, instead of raising it"""
+        fn = self._fn_getSkeletalTrackingLevel
+        skeletalTrackingLevel = EVRSkeletalTrackingLevel()
+        error = fn(action, byref(skeletalTrackingLevel))
+        return skeletalTrackingLevel, error
+
     def getSkeletalBoneData(self, action, transformSpace, motionRange, transformArray):
         """Reads the state of the skeletal bone data associated with this action and copies it into the given buffer."""
-        fn = self.function_table.getSkeletalBoneData
+        fn = self._fn_getSkeletalBoneData
         if transformArray is None:
             transformArrayArg = None
             transformArrayCount = 0
@@ -6952,29 +8504,61 @@ class IVRInput(object):
         openvr.error_code.InputError.check_error_value(error)
         return transformArray
 
-    def getSkeletalSummaryData(self, action, summaryType):
+    def getSkeletalBoneData_nothrow(self, action, transformSpace, motionRange, transformArray):
+        """Like getSkeletalBoneData(), but returns the error code last, instead of raising it"""
+        fn = self._fn_getSkeletalBoneData
+        if transformArray is None:
+            transformArrayArg = None
+            transformArrayCount = 0
+        elif isinstance(transformArray, ctypes.Array):
+            transformArrayArg = byref(transformArray[0])
+            transformArrayCount = len(transformArray)
+        else:
+            transformArray = (VRBoneTransform_t * 1)()
+            transformArrayArg = byref(transformArray[0])
+            transformArrayCount = 1
+        error = fn(action, transformSpace, motionRange, transformArrayArg, transformArrayCount)
+        return transformArray, error
+
+    def getSkeletalSummaryData(self, action, summaryType, skeletalSummaryData=None):
         """Reads summary information about the current pose of the skeleton associated with the given action."""
-        fn = self.function_table.getSkeletalSummaryData
-        skeletalSummaryData = VRSkeletalSummaryData_t()
+        fn = self._fn_getSkeletalSummaryData
+        if skeletalSummaryData is None:
+            skeletalSummaryData = VRSkeletalSummaryData_t()
         error = fn(action, summaryType, byref(skeletalSummaryData))
         openvr.error_code.InputError.check_error_value(error)
         return skeletalSummaryData
 
+    def getSkeletalSummaryData_nothrow(self, action, summaryType, skeletalSummaryData=None):
+        """Like getSkeletalSummaryData(), but returns the error code last, instead of raising it"""
+        fn = self._fn_getSkeletalSummaryData
+        if skeletalSummaryData is None:
+            skeletalSummaryData = VRSkeletalSummaryData_t()
+        error = fn(action, summaryType, byref(skeletalSummaryData))
+        return skeletalSummaryData, error
+
     def getSkeletalBoneDataCompressed(self, action, motionRange, compressedData, compressedSize):
         """
         Reads the state of the skeletal bone data in a compressed form that is suitable for
         sending over the network. The required buffer size will never exceed ( sizeof(VR_BoneTransform_t)*boneCount + 2).
         Usually the size will be much smaller.
         """
-        fn = self.function_table.getSkeletalBoneDataCompressed
+        fn = self._fn_getSkeletalBoneDataCompressed
         requiredCompressedSize = c_uint32()
         error = fn(action, motionRange, byref(compressedData), compressedSize, byref(requiredCompressedSize))
         openvr.error_code.InputError.check_error_value(error)
         return requiredCompressedSize.value
 
+    def getSkeletalBoneDataCompressed_nothrow(self, action, motionRange, compressedData, compressedSize):
+        """Like getSkeletalBoneDataCompressed(), but returns the error code last, instead of raising it"""
+        fn = self._fn_getSkeletalBoneDataCompressed
+        requiredCompressedSize = c_uint32()
+        error = fn(action, motionRange, byref(compressedData), compressedSize, byref(requiredCompressedSize))
+        return requiredCompressedSize.value, error
+
     def decompressSkeletalBoneData(self, compressedBuffer, compressedBufferSize, transformSpace, transformArray):
         """Turns a compressed buffer from GetSkeletalBoneDataCompressed and turns it back into a bone transform array."""
-        fn = self.function_table.decompressSkeletalBoneData
+        fn = self._fn_decompressSkeletalBoneData
         if transformArray is None:
             transformArrayArg = None
             transformArrayCount = 0
@@ -6989,15 +8573,37 @@ class IVRInput(object):
         openvr.error_code.InputError.check_error_value(error)
         return transformArray
 
+    def decompressSkeletalBoneData_nothrow(self, compressedBuffer, compressedBufferSize, transformSpace, transformArray):
+        """Like decompressSkeletalBoneData(), but returns the error code last, instead of raising it"""
+        fn = self._fn_decompressSkeletalBoneData
+        if transformArray is None:
+            transformArrayArg = None
+            transformArrayCount = 0
+        elif isinstance(transformArray, ctypes.Array):
+            transformArrayArg = byref(transformArray[0])
+            transformArrayCount = len(transformArray)
+        else:
+            transformArray = (VRBoneTransform_t * 1)()
+            transformArrayArg = byref(transformArray[0])
+            transformArrayCount = 1
+        error = fn(byref(compressedBuffer), compressedBufferSize, transformSpace, transformArrayArg, transformArrayCount)
+        return transformArray, error
+
     def triggerHapticVibrationAction(self, action, startSecondsFromNow: float, durationSeconds: float, frequency: float, amplitude: float, restrictToDevice) -> None:
         """Triggers a haptic event as described by the specified action"""
-        fn = self.function_table.triggerHapticVibrationAction
+        fn = self._fn_triggerHapticVibrationAction
         error = fn(action, startSecondsFromNow, durationSeconds, frequency, amplitude, restrictToDevice)
         openvr.error_code.InputError.check_error_value(error)
 
+    def triggerHapticVibrationAction_nothrow(self, action, startSecondsFromNow: float, durationSeconds: float, frequency: float, amplitude: float, restrictToDevice):
+        """Like triggerHapticVibrationAction(), but returns the error code last, instead of raising it"""
+        fn = self._fn_triggerHapticVibrationAction
+        error = fn(action, startSecondsFromNow, durationSeconds, frequency, amplitude, restrictToDevice)
+        return error
+
     def getActionOrigins(self, actionSetHandle, digitalActionHandle, originsOut):
         """Retrieve origin handles for an action"""
-        fn = self.function_table.getActionOrigins
+        fn = self._fn_getActionOrigins
         if originsOut is None:
             originsOutArg = None
             originOutCount = 0
@@ -7012,30 +8618,64 @@ class IVRInput(object):
         openvr.error_code.InputError.check_error_value(error)
         return originsOut.value
 
+    def getActionOrigins_nothrow(self, actionSetHandle, digitalActionHandle, originsOut):
+        """Like getActionOrigins(), but returns the error code last, instead of raising it"""
+        fn = self._fn_getActionOrigins
+        if originsOut is None:
+            originsOutArg = None
+            originOutCount = 0
+        elif isinstance(originsOut, ctypes.Array):
+            originsOutArg = byref(originsOut[0])
+            originOutCount = len(originsOut)
+        else:
+            originsOut = (VRInputValueHandle_t * 1)()
+            originsOutArg = byref(originsOut[0])
+            originOutCount = 1
+        error = fn(actionSetHandle, digitalActionHandle, originsOutArg, originOutCount)
+        return originsOut.value, error
+
     def getOriginLocalizedName(self, origin, stringSectionsToInclude):
         """
         Retrieves the name of the origin in the current language. unStringSectionsToInclude is a bitfield of values in EVRInputStringBits that allows the
         application to specify which parts of the origin's information it wants a string for.
         """
-        fn = self.function_table.getOriginLocalizedName
+        fn = self._fn_getOriginLocalizedName
         nameArraySize = fn(origin, None, 0, stringSectionsToInclude)
         nameArray = ctypes.create_string_buffer(nameArraySize)
         error = fn(origin, nameArray, nameArraySize, stringSectionsToInclude)
         openvr.error_code.InputError.check_error_value(error)
         return bytes(nameArray.value).decode('utf-8')
 
-    def getOriginTrackedDeviceInfo(self, origin):
+    def getOriginLocalizedName_nothrow(self, origin, stringSectionsToInclude):
+        """Like getOriginLocalizedName(), but returns the error code last, instead of raising it"""
+        fn = self._fn_getOriginLocalizedName
+        nameArraySize = fn(origin, None, 0, stringSectionsToInclude)
+        nameArray = ctypes.create_string_buffer(nameArraySize)
+        error = fn(origin, nameArray, nameArraySize, stringSectionsToInclude)
+        return bytes(nameArray.value).decode('utf-8'), error
+
+    def getOriginTrackedDeviceInfo(self, origin, originInfo=None):
         """Retrieves useful information for the origin of this action"""
-        fn = self.function_table.getOriginTrackedDeviceInfo
-        originInfo = InputOriginInfo_t()
-        originInfoSize = sizeof(InputOriginInfo_t)
+        fn = self._fn_getOriginTrackedDeviceInfo
+        if originInfo is None:
+            originInfo = InputOriginInfo_t()
+        originInfoSize = self._sizeof_InputOriginInfo_t
         error = fn(origin, byref(originInfo), originInfoSize)
         openvr.error_code.InputError.check_error_value(error)
         return originInfo
 
+    def getOriginTrackedDeviceInfo_nothrow(self, origin, originInfo=None):
+        """Like getOriginTrackedDeviceInfo(), but returns the error code last, instead of raising it"""
+        fn = self._fn_getOriginTrackedDeviceInfo
+        if originInfo is None:
+            originInfo = InputOriginInfo_t()
+        originInfoSize = self._sizeof_InputOriginInfo_t
+        error = fn(origin, byref(originInfo), originInfoSize)
+        return originInfo, error
+
     def getActionBindingInfo(self, action, originInfo):
         """Retrieves useful information about the bindings for an action"""
-        fn = self.function_table.getActionBindingInfo
+        fn = self._fn_getActionBindingInfo
         if originInfo is None:
             originInfoArg = None
             bindingInfoCount = 0
@@ -7046,21 +8686,45 @@ class IVRInput(object):
             originInfo = (InputBindingInfo_t * 1)()
             originInfoArg = byref(originInfo[0])
             bindingInfoCount = 1
-        bindingInfoSize = sizeof(InputBindingInfo_t)
+        bindingInfoSize = self._sizeof_InputBindingInfo_t
         returnedBindingInfoCount = c_uint32()
         error = fn(action, originInfoArg, bindingInfoSize, bindingInfoCount, byref(returnedBindingInfoCount))
         openvr.error_code.InputError.check_error_value(error)
         return originInfo, returnedBindingInfoCount.value
 
+    def getActionBindingInfo_nothrow(self, action, originInfo):
+        """Like getActionBindingInfo(), but returns the error code last, instead of raising it"""
+        fn = self._fn_getActionBindingInfo
+        if originInfo is None:
+            originInfoArg = None
+            bindingInfoCount = 0
+        elif isinstance(originInfo, ctypes.Array):
+            originInfoArg = byref(originInfo[0])
+            bindingInfoCount = len(originInfo)
+        else:
+            originInfo = (InputBindingInfo_t * 1)()
+            originInfoArg = byref(originInfo[0])
+            bindingInfoCount = 1
+        bindingInfoSize = self._sizeof_InputBindingInfo_t
+        returnedBindingInfoCount = c_uint32()
+        error = fn(action, originInfoArg, bindingInfoSize, bindingInfoCount, byref(returnedBindingInfoCount))
+        return originInfo, returnedBindingInfoCount.value, error
+
     def showActionOrigins(self, actionSetHandle, actionHandle) -> None:
         """Shows the current binding for the action in-headset"""
-        fn = self.function_table.showActionOrigins
+        fn = self._fn_showActionOrigins
         error = fn(actionSetHandle, actionHandle)
         openvr.error_code.InputError.check_error_value(error)
 
+    def showActionOrigins_nothrow(self, actionSetHandle, actionHandle):
+        """Like showActionOrigins(), but returns the error code last, instead of raising it"""
+        fn = self._fn_showActionOrigins
+        error = fn(actionSetHandle, actionHandle)
+        return error
+
     def showBindingsForActionSet(self, sets, originToHighlight):
         """Shows the current binding all the actions in the specified action sets"""
-        fn = self.function_table.showBindingsForActionSet
+        fn = self._fn_showBindingsForActionSet
         if sets is None:
             setsArg = None
             setCount = 0
@@ -7071,27 +8735,58 @@ class IVRInput(object):
             sets = (VRActiveActionSet_t * 1)()
             setsArg = byref(sets[0])
             setCount = 1
-        sizeOfVRSelectedActionSet_t = sizeof(VRActiveActionSet_t)
+        sizeOfVRSelectedActionSet_t = self._sizeof_VRActiveActionSet_t
         error = fn(setsArg, sizeOfVRSelectedActionSet_t, setCount, originToHighlight)
         openvr.error_code.InputError.check_error_value(error)
         return sets
 
-    def getComponentStateForBinding(self, renderModelName: str, componentName: str, originInfo, bindingInfoCount):
+    def showBindingsForActionSet_nothrow(self, sets, originToHighlight):
+        """Like showBindingsForActionSet(), but returns the error code last, instead of raising it"""
+        fn = self._fn_showBindingsForActionSet
+        if sets is None:
+            setsArg = None
+            setCount = 0
+        elif isinstance(sets, ctypes.Array):
+            setsArg = byref(sets[0])
+            setCount = len(sets)
+        else:
+            sets = (VRActiveActionSet_t * 1)()
+            setsArg = byref(sets[0])
+            setCount = 1
+        sizeOfVRSelectedActionSet_t = self._sizeof_VRActiveActionSet_t
+        error = fn(setsArg, sizeOfVRSelectedActionSet_t, setCount, originToHighlight)
+        return sets, error
+
+    def getComponentStateForBinding(self, renderModelName: str, componentName: str, originInfo, bindingInfoCount, componentState=None):
         """Use this to query what action on the component returned by GetOriginTrackedDeviceInfo would trigger this binding."""
-        fn = self.function_table.getComponentStateForBinding
+        fn = self._fn_getComponentStateForBinding
         if renderModelName is not None:
             renderModelName = bytes(renderModelName, encoding='utf-8')
         if componentName is not None:
             componentName = bytes(componentName, encoding='utf-8')
-        bindingInfoSize = sizeof(InputBindingInfo_t)
-        componentState = RenderModel_ComponentState_t()
+        bindingInfoSize = self._sizeof_InputBindingInfo_t
+        if componentState is None:
+            componentState = RenderModel_ComponentState_t()
         error = fn(renderModelName, componentName, byref(originInfo), bindingInfoSize, bindingInfoCount, byref(componentState))
         openvr.error_code.InputError.check_error_value(error)
         return componentState
 
+    def getComponentStateForBinding_nothrow(self, renderModelName: str, componentName: str, originInfo, bindingInfoCount, componentState=None):
+        """Like getComponentStateForBinding(), but returns the error code last, instead of raising it"""
+        fn = self._fn_getComponentStateForBinding
+        if renderModelName is not None:
+            renderModelName = bytes(renderModelName, encoding='utf-8')
+        if componentName is not None:
+            componentName = bytes(componentName, encoding='utf-8')
+        bindingInfoSize = self._sizeof_InputBindingInfo_t
+        if componentState is None:
+            componentState = RenderModel_ComponentState_t()
+        error = fn(renderModelName, componentName, byref(originInfo), bindingInfoSize, bindingInfoCount, byref(componentState))
+        return componentState, error
+
     def isUsingLegacyInput(self):
         """--------------- Legacy Input -------------------"""
-        fn = self.function_table.isUsingLegacyInput
+        fn = self._fn_isUsingLegacyInput
         result = fn()
         return result
 
@@ -7100,24 +8795,40 @@ class IVRInput(object):
         Opens the binding user interface. If no app key is provided it will use the key from the calling process.
         If no set is provided it will open to the root of the app binding page.
         """
-        fn = self.function_table.openBindingUI
+        fn = self._fn_openBindingUI
         if appKey is not None:
             appKey = bytes(appKey, encoding='utf-8')
         error = fn(appKey, actionSetHandle, deviceHandle, showOnDesktop)
         openvr.error_code.InputError.check_error_value(error)
 
+    def openBindingUI_nothrow(self, appKey: str, actionSetHandle, deviceHandle, showOnDesktop):
+        """Like openBindingUI(), but returns the error code last, instead of raising it"""
+        fn = self._fn_openBindingUI
+        if appKey is not None:
+            appKey = bytes(appKey, encoding='utf-8')
+        error = fn(appKey, actionSetHandle, deviceHandle, showOnDesktop)
+        return error
+
     def getBindingVariant(self, devicePath):
         """
         Returns the variant set in the current bindings. If the binding doesn't include a variant setting, this function
         will return an empty string
         """
-        fn = self.function_table.getBindingVariant
+        fn = self._fn_getBindingVariant
         variantArraySize = fn(devicePath, None, 0)
         variantArray = ctypes.create_string_buffer(variantArraySize)
         error = fn(devicePath, variantArray, variantArraySize)
         openvr.error_code.InputError.check_error_value(error)
         return bytes(variantArray.value).decode('utf-8')
 
+    def getBindingVariant_nothrow(self, devicePath):
+        """Like getBindingVariant(), but returns the error code last, instead of raising it"""
+        fn = self._fn_getBindingVariant
+        variantArraySize = fn(devicePath, None, 0)
+        variantArray = ctypes.create_string_buffer(variantArraySize)
+        error = fn(devicePath, variantArray, variantArraySize)
+        return bytes(variantArray.value).decode('utf-8'), error
+
 
 class IVRIOBuffer_FnTable(Structure):
     _fields_ = [
@@ -7146,10 +8857,13 @@ class IVRIOBuffer(object):
         if fn_table_ptr is None:
             raise OpenVRError("Error retrieving VR API for IVRIOBuffer")
         self.function_table = fn_table_ptr.contents
+        # Reading a function table field creates a new function object each time, so read each just once
+        for entry_name, _ in fn_type._fields_:
+            setattr(self, '_fn_' + entry_name, getattr(self.function_table, entry_name))
 
     def open(self, path: str, mode, elementSize, elements):
         """opens an existing or creates a new IOBuffer of unSize bytes"""
-        fn = self.function_table.open
+        fn = self._fn_open
         if path is not None:
             path = bytes(path, encoding='utf-8')
         buffer = IOBufferHandle_t()
@@ -7157,35 +8871,63 @@ class IVRIOBuffer(object):
         openvr.error_code.IOBufferError.check_error_value(error)
         return buffer
 
+    def open_nothrow(self, path: str, mode, elementSize, elements):
+        """Like open(), but returns the error code last, instead of raising it"""
+        fn = self._fn_open
+        if path is not None:
+            path = bytes(path, encoding='utf-8')
+        buffer = IOBufferHandle_t()
+        error = fn(path, mode, elementSize, elements, byref(buffer))
+        return buffer, error
+
     def close(self, buffer) -> None:
         """closes a previously opened or created buffer"""
-        fn = self.function_table.close
+        fn = self._fn_close
         error = fn(buffer)
         openvr.error_code.IOBufferError.check_error_value(error)
 
+    def close_nothrow(self, buffer):
+        """Like close(), but returns the error code last, instead of raising it"""
+        fn = self._fn_close
+        error = fn(buffer)
+        return error
+
     def read(self, buffer, dst, bytes_):
         """reads up to unBytes from buffer into *pDst, returning number of bytes read in *punRead"""
-        fn = self.function_table.read
+        fn = self._fn_read
         read = c_uint32()
         error = fn(buffer, byref(dst), bytes_, byref(read))
         openvr.error_code.IOBufferError.check_error_value(error)
         return read.value
 
+    def read_nothrow(self, buffer, dst, bytes_):
+        """Like read(), but returns the error code last, instead of raising it"""
+        fn = self._fn_read
+        read = c_uint32()
+        error = fn(buffer, byref(dst), bytes_, byref(read))
+        return read.value, error
+
     def write(self, buffer, src, bytes_) -> None:
         """writes unBytes of data from *pSrc into a buffer."""
-        fn = self.function_table.write
+        fn = self._fn_write
         error = fn(buffer, byref(src), bytes_)
         openvr.error_code.IOBufferError.check_error_value(error)
 
+    def write_nothrow(self, buffer, src, bytes_):
+        """Like write(), but returns the error code last, instead of raising it"""
+        fn = self._fn_write
+        error = fn(buffer, byref(src), bytes_)
+        return error
+
     def propertyContainer(self, buffer):
         """retrieves the property container of an buffer."""
-        fn = self.function_table.propertyContainer
+        fn = self._fn_propertyContainer
         result = fn(buffer)
         return result
 
     def hasReaders(self, buffer):
         """inexpensively checks for readers to allow writers to fast-fail potentially expensive copies and writes."""
-        fn = self.function_table.hasReaders
+        fn = self._fn_hasReaders
         result = fn(buffer)
         return result
 
@@ -7209,6 +8951,9 @@ class IVRSpatialAnchors(object):
         if fn_table_ptr is None:
             raise OpenVRError("Error retrieving VR API for IVRSpatialAnchors")
         self.function_table = fn_table_ptr.contents
+        # Reading a function table field creates a new function object each time, so read each just once
+        for entry_name, _ in fn_type._fields_:
+            setattr(self, '_fn_' + entry_name, getattr(self.function_table, entry_name))
 
     def createSpatialAnchorFromDescriptor(self, descriptor: str):
         """
@@ -7216,7 +8961,7 @@ class IVRSpatialAnchors(object):
         will contain a handle valid for this session.  Caller can wait for an event or occasionally
         poll GetSpatialAnchorPose() to find the virtual coordinate associated with this anchor.
         """
-        fn = self.function_table.createSpatialAnchorFromDescriptor
+        fn = self._fn_createSpatialAnchorFromDescriptor
         if descriptor is not None:
             descriptor = bytes(descriptor, encoding='utf-8')
         handleOut = SpatialAnchorHandle_t()
@@ -7224,7 +8969,16 @@ class IVRSpatialAnchors(object):
         openvr.error_code.SpatialAnchorError.check_error_value(error)
         return handleOut.value
 
-    def createSpatialAnchorFromPose(self, deviceIndex, origin):
+    def createSpatialAnchorFromDescriptor_nothrow(self, descriptor: str):
+        """Like createSpatialAnchorFromDescriptor(), but returns the error code last, instead of raising it"""
+        fn = self._fn_createSpatialAnchorFromDescriptor
+        if descriptor is not None:
+            descriptor = bytes(descriptor, encoding='utf-8')
+        handleOut = SpatialAnchorHandle_t()
+        error = fn(descriptor, byref(handleOut))
+        return handleOut.value, error
+
+    def createSpatialAnchorFromPose(self, deviceIndex, origin, pose=None):
         """
         Returns a handle for an new spatial anchor at pPose.  On success, pHandle
         will contain a handle valid for this session.  Caller can wait for an event or occasionally
@@ -7240,24 +8994,43 @@ class IVRSpatialAnchors(object):
         The caller may decide to apply offsets from this initial pose, but is advised to stay relatively close to the
         original pose location for highest fidelity.
         """
-        fn = self.function_table.createSpatialAnchorFromPose
-        pose = SpatialAnchorPose_t()
+        fn = self._fn_createSpatialAnchorFromPose
+        if pose is None:
+            pose = SpatialAnchorPose_t()
         handleOut = SpatialAnchorHandle_t()
         error = fn(deviceIndex, origin, byref(pose), byref(handleOut))
         openvr.error_code.SpatialAnchorError.check_error_value(error)
         return pose, handleOut.value
 
-    def getSpatialAnchorPose(self, handle, origin):
+    def createSpatialAnchorFromPose_nothrow(self, deviceIndex, origin, pose=None):
+        """Like createSpatialAnchorFromPose(), but returns the error code last, instead of raising it"""
+        fn = self._fn_createSpatialAnchorFromPose
+        if pose is None:
+            pose = SpatialAnchorPose_t()
+        handleOut = SpatialAnchorHandle_t()
+        error = fn(deviceIndex, origin, byref(pose), byref(handleOut))
+        return pose, handleOut.value, error
+
+    def getSpatialAnchorPose(self, handle, origin, poseOut=None):
         """
         Get the pose for a given handle.  This is intended to be cheap enough to call every frame (or fairly often)
         so that the driver can refine this position when it has more information available.
         """
-        fn = self.function_table.getSpatialAnchorPose
-        poseOut = SpatialAnchorPose_t()
+        fn = self._fn_getSpatialAnchorPose
+        if poseOut is None:
+            poseOut = SpatialAnchorPose_t()
         error = fn(handle, origin, byref(poseOut))
         openvr.error_code.SpatialAnchorError.check_error_value(error)
         return poseOut
 
+    def getSpatialAnchorPose_nothrow(self, handle, origin, poseOut=None):
+        """Like getSpatialAnchorPose(), but returns the error code last, instead of raising it"""
+        fn = self._fn_getSpatialAnchorPose
+        if poseOut is None:
+            poseOut = SpatialAnchorPose_t()
+        error = fn(handle, origin, byref(poseOut))
+        return poseOut, error
+
     def getSpatialAnchorDescriptor(self, handle):
         """
         Get the descriptor for a given handle.  This will be empty for handles where the driver has not
@@ -7267,13 +9040,21 @@ class IVRSpatialAnchors(object):
         Returns true if the descriptor fits into the buffer, else false.  Buffer size should be at least
         k_unMaxSpatialAnchorDescriptorSize.
         """
-        fn = self.function_table.getSpatialAnchorDescriptor
+        fn = self._fn_getSpatialAnchorDescriptor
         descriptorBufferLenInOut = fn(handle, None, 0)
         descriptorOut = ctypes.create_string_buffer(descriptorBufferLenInOut)
         error = fn(handle, descriptorOut, descriptorBufferLenInOut)
         openvr.error_code.SpatialAnchorError.check_error_value(error)
         return bytes(descriptorOut.value).decode('utf-8')
 
+    def getSpatialAnchorDescriptor_nothrow(self, handle):
+        """Like getSpatialAnchorDescriptor(), but returns the error code last, instead of raising it"""
+        fn = self._fn_getSpatialAnchorDescriptor
+        descriptorBufferLenInOut = fn(handle, None, 0)
+        descriptorOut = ctypes.create_string_buffer(descriptorBufferLenInOut)
+        error = fn(handle, descriptorOut, descriptorBufferLenInOut)
+        return bytes(descriptorOut.value).decode('utf-8'), error
+
 
 class IVRDebug_FnTable(Structure):
     _fields_ = [
@@ -7294,6 +9075,9 @@ class IVRDebug(object):
         if fn_table_ptr is None:
             raise OpenVRError("Error retrieving VR API for IVRDebug")
         self.function_table = fn_table_ptr.contents
+        # Reading a function table field creates a new function object each time, so read each just once
+        for entry_name, _ in fn_type._fields_:
+            setattr(self, '_fn_' + entry_name, getattr(self.function_table, entry_name))
 
     def emitVrProfilerEvent(self, message: str) -> None:
         """
@@ -7301,24 +9085,39 @@ class IVRDebug(object):
         The event will be associated with the message provided in pchMessage, and the current
         time will be used as the event timestamp.
         """
-        fn = self.function_table.emitVrProfilerEvent
+        fn = self._fn_emitVrProfilerEvent
         if message is not None:
             message = bytes(message, encoding='utf-8')
         error = fn(message)
         openvr.error_code.DebugError.check_error_value(error)
 
+    def emitVrProfilerEvent_nothrow(self, message: str):
+        """Like emitVrProfilerEvent(), but returns the error code last, instead of raising it"""
+        fn = self._fn_emitVrProfilerEvent
+        if message is not None:
+            message = bytes(message, encoding='utf-8')
+        error = fn(message)
+        return error
+
     def beginVrProfilerEvent(self):
         """
         Create an vr profiler duration event (line)
         The current time will be used as the timestamp for the start of the line.
         On success, pHandleOut will contain a handle valid for terminating this event.
         """
-        fn = self.function_table.beginVrProfilerEvent
+        fn = self._fn_beginVrProfilerEvent
         handleOut = VrProfilerEventHandle_t()
         error = fn(byref(handleOut))
         openvr.error_code.DebugError.check_error_value(error)
         return handleOut.value
 
+    def beginVrProfilerEvent_nothrow(self):
+        """Like beginVrProfilerEvent(), but returns the error code last, instead of raising it"""
+        fn = self._fn_beginVrProfilerEvent
+        handleOut = VrProfilerEventHandle_t()
+        error = fn(byref(handleOut))
+        return handleOut.value, error
+
     def finishVrProfilerEvent(self, handle, message: str) -> None:
         """
         Terminate a vr profiler event
@@ -7326,19 +9125,27 @@ class IVRDebug(object):
         The current time will be used assocaited to the termination time of the event, and
         pchMessage will be used as the event title.
         """
-        fn = self.function_table.finishVrProfilerEvent
+        fn = self._fn_finishVrProfilerEvent
         if message is not None:
             message = bytes(message, encoding='utf-8')
         error = fn(handle, message)
         openvr.error_code.DebugError.check_error_value(error)
 
+    def finishVrProfilerEvent_nothrow(self, handle, message: str):
+        """Like finishVrProfilerEvent(), but returns the error code last, instead of raising it"""
+        fn = self._fn_finishVrProfilerEvent
+        if message is not None:
+            message = bytes(message, encoding='utf-8')
+        error = fn(handle, message)
+        return error
+
     def driverDebugRequest(self, deviceIndex, request: str):
         """
         Sends a request to the driver for the specified device and returns the response. The maximum response size is 32k,
         but this method can be called with a smaller buffer. If the response exceeds the size of the buffer, it is truncated.
         The size of the response including its terminating null is returned.
         """
-        fn = self.function_table.driverDebugRequest
+        fn = self._fn_driverDebugRequest
         if request is not None:
             request = bytes(request, encoding='utf-8')
         responseBufferSize = fn(deviceIndex, request, None, 0)
@@ -7508,6 +9315,7 @@ def initInternal2(applicationType, startupInfo: str):
     if startupInfo is not None:
         startupInfo = bytes(startupInfo, encoding='utf-8')
     result = fn(byref(error), applicationType, startupInfo)
+    _internal_module_context.reset()
     openvr.error_code.InitError.check_error_value(error.value)
     return result
 
@@ -7519,3 +9327,4 @@ _openvr.VR_ShutdownInternal.argtypes = []
 def shutdownInternal() -> None:
     fn = _openvr.VR_ShutdownInternal
     fn()
+    _internal_module_context.reset()
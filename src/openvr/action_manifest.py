@@ -0,0 +1,184 @@
+#!/bin/env python
+
+# file action_manifest.py
+
+import json
+import keyword
+import os
+import re
+
+import openvr
+
+"""
+Action, action set and input source handles of an IVRInput action manifest, resolved once and read as attributes
+"""
+
+# Input sources resolved for every manifest, as attributes of ActionManifest.sources
+common_input_sources = {
+    'head': '/user/head',
+    'left_hand': '/user/hand/left',
+    'right_hand': '/user/hand/right',
+    'gamepad': '/user/gamepad',
+    'treadmill': '/user/treadmill',
+}
+
+# Events after which the runtime may have assigned new handles
+_reload_events = frozenset((
+    openvr.VREvent_ActionBindingReloaded,
+    openvr.VREvent_Input_ActionManifestReloaded,
+))
+
+
+def _attribute_name(path_component):
+    name = re.sub(r'\W', '_', path_component)
+    if not name or name[0].isdigit():
+        name = '_' + name
+    if keyword.iskeyword(name):
+        name += '_'
+    return name
+
+
+# ActionSetHandles attributes that action names may not shadow
+_reserved_action_names = frozenset(('handle', 'path'))
+
+
+class ActionSetHandles(object):
+    """
+    The handle of one action set, as the attribute handle, and the handles of its actions, as attributes named
+    after the last component of each action path, e.g. HideCubes for /actions/demo/in/HideCubes.
+    ActionManifest raises ValueError for manifests where two actions of a set would share an attribute name,
+    or where one would be named handle or path.
+    """
+
+    def __init__(self, path):
+        self.path = path
+        self.handle = openvr.k_ulInvalidActionSetHandle
+
+
+class ActionSets(object):
+    """ActionSetHandles objects, as attributes named after the last component of each action set path"""
+    pass
+
+
+class InputSourceHandles(object):
+    """Input source handles, as attributes named after the keys of common_input_sources"""
+    pass
+
+
+class ActionManifest(object):
+    """
+    Parses an action manifest JSON file, and resolves the handle of every action and action set it declares,
+    and of the common_input_sources, with one IVRInput call each, up front.
+
+    Action sets are attributes of sets, named after the set's path component, each holding its action handles:
+        manifest = ActionManifest('actions.json')
+        demo = manifest.sets.demo
+        active_action_set.ulActionSet = demo.handle
+        openvr.VRInput().getDigitalActionData(demo.HideCubes, manifest.sources.left_hand)
+    action(), action_set() and input_source() look handles up by path instead; input_source() resolves other
+    input paths on first use, and remembers them too.
+
+    Unless set_manifest_path is False, the constructor also passes the file to IVRInput.setActionManifestPath().
+    Pass every polled event to process_event(): handles are resolved again, in place, after
+    VREvent_ActionBindingReloaded and VREvent_Input_ActionManifestReloaded, and after openvr was shut down and
+    re-initialized, when the manifest path is set again too. Unless an IVRInput object is given, openvr.VRInput()
+    is used, and re-initialization is detected automatically.
+    """
+
+    def __init__(self, path, input_=None, set_manifest_path=True):
+        self.path = os.path.abspath(path)
+        self.set_manifest_path = set_manifest_path
+        self.sets = ActionSets()
+        self.sources = InputSourceHandles()
+        self._action_sets = dict()  # lower case action set path -> ActionSetHandles
+        self._actions = dict()  # lower case action path -> (ActionSetHandles, attribute name, path)
+        self._action_handles = dict()  # lower case action path -> handle
+        self._source_paths = dict()  # lower case input source path -> handle
+        self._input = input_
+        self._follow_context = input_ is None
+        with open(self.path, encoding='utf-8') as f:
+            manifest = json.load(f)
+        for action_set in manifest.get('action_sets', ()):
+            self._add_action_set(action_set['name'])
+        for action in manifest.get('actions', ()):
+            self._add_action(action['name'])
+        if self._input is None:
+            self._input = openvr.VRInput()
+        self.resolve()
+
+    def _add_action_set(self, path):
+        key = path.lower()
+        action_set = self._action_sets.get(key)
+        if action_set is None:
+            action_set = self._action_sets[key] = ActionSetHandles(path)
+            # Action set paths look like /actions/<set name>
+            setattr(self.sets, _attribute_name(path.rstrip('/').split('/')[-1]), action_set)
+        return action_set
+
+    def _add_action(self, path):
+        # Action paths look like /actions/<set name>/<in or out>/<action name>
+        components = path.split('/')
+        if len(components) < 5 or components[1] != 'actions':
+            raise ValueError(f"Not an action path: {path}")
+        action_set = self._add_action_set('/'.join(components[:3]))
+        name = _attribute_name(components[-1])
+        if name in _reserved_action_names:
+            raise ValueError(f"Action {path} would shadow the {name} attribute of its action set")
+        if hasattr(action_set, name):
+            raise ValueError(f"Action {path} has the same attribute name, {name}, as another action of its set")
+        key = path.lower()
+        if key in self._actions:
+            raise ValueError(f"Action {path} is declared twice")
+        self._actions[key] = (action_set, name, path)
+        self._action_handles[key] = openvr.k_ulInvalidActionHandle
+        setattr(action_set, name, openvr.k_ulInvalidActionHandle)
+
+    def resolve(self):
+        """Set the manifest path, if so configured, and resolve all handles again"""
+        if self.set_manifest_path:
+            self._input.setActionManifestPath(self.path)
+        self._resolve_handles()
+
+    def _resolve_handles(self):
+        input_ = self._input
+        for action_set in self._action_sets.values():
+            action_set.handle = input_.getActionSetHandle(action_set.path)
+        for key, (action_set, name, path) in self._actions.items():
+            handle = self._action_handles[key] = input_.getActionHandle(path)
+            setattr(action_set, name, handle)
+        for name, path in common_input_sources.items():
+            setattr(self.sources, name, input_.getInputSourceHandle(path))
+        for path in self._source_paths:
+            self._source_paths[path] = input_.getInputSourceHandle(path)
+
+    def refresh(self):
+        """Resolve everything again if openvr was re-initialized since the last resolution"""
+        if self._follow_context:
+            input_ = openvr.VRInput()
+            if input_ is not self._input:
+                self._input = input_
+                self.resolve()
+
+    def process_event(self, event):
+        """Resolve handles again when an openvr.VREvent_t makes them stale. Returns True if the event was relevant."""
+        self.refresh()
+        if event.eventType in _reload_events:
+            self._resolve_handles()
+            return True
+        return False
+
+    def action(self, path):
+        """The handle of an action declared in the manifest, by path"""
+        return self._action_handles[path.lower()]
+
+    def action_set(self, path):
+        """The handle of an action set used in the manifest, by path"""
+        return self._action_sets[path.lower()].handle
+
+    def input_source(self, path):
+        """The handle of any input source path, resolved on first use"""
+        key = path.lower()
+        handle = self._source_paths.get(key)
+        if handle is None:
+            handle = self._source_paths[key] = self._input.getInputSourceHandle(path)
+        return handle
@@ -0,0 +1,183 @@
+#!/bin/env python
+
+# file aio.py
+
+import asyncio
+import concurrent.futures
+
+import openvr
+from openvr.event_buffer import EventBuffer
+from openvr.pose_buffers import PoseBuffers
+
+"""
+asyncio integration: awaitable frame pacing, event streams, and asynchronous render model and spatial anchor loading
+"""
+
+
+class FrameIterator(object):
+    """
+    Asynchronous iterator over frames, for use with "async for".
+
+    Each step runs a blocking wait on a dedicated thread, so the event loop keeps serving other tasks meanwhile,
+    and resumes the iterating task with the wait's result once the frame starts. Only one wait is ever in flight,
+    and the next one starts only when the loop asks for the next frame, so the results can be read freely
+    between steps. Use frames() or overlay_frames() to create one, and close() it, or use it as an
+    async context manager, to stop its thread. Waits that retry check closed, so they end soon after close().
+    """
+
+    def __init__(self, wait, name='openvr frame wait'):
+        self._wait = wait
+        self._executor = concurrent.futures.ThreadPoolExecutor(max_workers=1, thread_name_prefix=name)
+        self.closed = False
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        if self.closed:
+            raise StopAsyncIteration
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, self._wait)
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, _exc_type, _exc_value, _traceback):
+        self.close()
+
+    def close(self):
+        self.closed = True
+        self._executor.shutdown(wait=False)
+
+
+def frames(pose_buffers=None):
+    """
+    Iterate over compositor frames. Each step calls IVRCompositor.waitGetPoses() on the frame thread, through
+    a PoseBuffers object, and yields its render_poses array.
+    """
+    if pose_buffers is None:
+        pose_buffers = PoseBuffers()
+    return FrameIterator(pose_buffers.wait_get_poses)
+
+
+def overlay_frames(timeout_ms=100, overlay=None):
+    """
+    Iterate over frames for overlay applications. Each step calls IVROverlay.waitFrameSync(timeout_ms) on the
+    frame thread, and yields the number of frames waited for so far, starting at 1. Timeouts, e.g. while
+    SteamVR is idle or the headset sleeps, are waited through; other errors are raised.
+    """
+    if overlay is None:
+        overlay = openvr.VROverlay()
+    frame_count = 0
+
+    def wait():
+        nonlocal frame_count
+        error = overlay.waitFrameSync_nothrow(timeout_ms)
+        while error == openvr.VROverlayError_TimedOut:
+            if iterator.closed:
+                return frame_count
+            error = overlay.waitFrameSync_nothrow(timeout_ms)
+        openvr.error_code.OverlayError.check_error_value(error)
+        frame_count += 1
+        return frame_count
+
+    iterator = FrameIterator(wait, name='openvr overlay frame wait')
+    return iterator
+
+
+def _copy_event(event):
+    return openvr.VREvent_t.from_buffer_copy(event)
+
+
+async def events(system=None, poll_interval=0.005, capacity=64):
+    """
+    Asynchronous generator of IVRSystem events, as openvr.VREvent_t copies the consumer may keep.
+
+    Events are drained in batches of up to capacity, and only when the consumer has taken every event of the
+    previous batch. A slow consumer therefore leaves events in the runtime's own queue, instead of growing a
+    Python one. While no events are pending, the queue is checked every poll_interval seconds.
+    """
+    buffer = EventBuffer(capacity)
+    while True:
+        if buffer.drain(system) == 0:
+            await asyncio.sleep(poll_interval)
+            continue
+        for event in buffer:
+            yield _copy_event(event)
+
+
+async def overlay_events(overlay_handle, overlay=None, poll_interval=0.005, capacity=64):
+    """Like events(), but for the events of one overlay, from IVROverlay.pollNextOverlayEvent()"""
+    buffer = EventBuffer(capacity)
+    while True:
+        if buffer.drain_overlay(overlay_handle, overlay) == 0:
+            await asyncio.sleep(poll_interval)
+            continue
+        for event in buffer:
+            yield _copy_event(event)
+
+
+async def _poll_until_ready(poll, not_ready_error, error_class, min_interval, max_interval):
+    """
+    Call poll(), which returns (result, error), until the error is not not_ready_error, sleeping between
+    attempts with exponential backoff. Returns the result, or raises the error_class exception for the error.
+    """
+    interval = min_interval
+    while True:
+        result, error = poll()
+        if error != not_ready_error:
+            error_class.check_error_value(error)
+            return result
+        await asyncio.sleep(interval)
+        interval = min(2 * interval, max_interval)
+
+
+async def load_render_model(name, render_models=None, min_poll_interval=0.005, max_poll_interval=0.25):
+    """
+    Await IVRRenderModels.loadRenderModel_Async(), retried while the model is still loading.
+    Returns the openvr.RenderModel_t, which the caller must eventually pass to freeRenderModel().
+    """
+    if render_models is None:
+        render_models = openvr.VRRenderModels()
+    return await _poll_until_ready(
+        lambda: render_models.loadRenderModel_Async_nothrow(name),
+        openvr.VRRenderModelError_Loading, openvr.error_code.RenderModelError,
+        min_poll_interval, max_poll_interval)
+
+
+async def load_texture(texture_id, render_models=None, min_poll_interval=0.005, max_poll_interval=0.25):
+    """
+    Await IVRRenderModels.loadTexture_Async(), retried while the texture is still loading.
+    Returns the openvr.RenderModel_TextureMap_t, which the caller must eventually pass to freeTexture().
+    """
+    if render_models is None:
+        render_models = openvr.VRRenderModels()
+    return await _poll_until_ready(
+        lambda: render_models.loadTexture_Async_nothrow(texture_id),
+        openvr.VRRenderModelError_Loading, openvr.error_code.RenderModelError,
+        min_poll_interval, max_poll_interval)
+
+
+async def spatial_anchor_pose(handle, origin, spatial_anchors=None, min_poll_interval=0.01, max_poll_interval=0.5):
+    """
+    Await IVRSpatialAnchors.getSpatialAnchorPose(), retried while the driver has not yet located the anchor.
+    Returns the openvr.SpatialAnchorPose_t.
+    """
+    if spatial_anchors is None:
+        spatial_anchors = openvr.VRSpatialAnchors()
+    return await _poll_until_ready(
+        lambda: spatial_anchors.getSpatialAnchorPose_nothrow(handle, origin),
+        openvr.VRSpatialAnchorError_NotYetAvailable, openvr.error_code.SpatialAnchorError,
+        min_poll_interval, max_poll_interval)
+
+
+async def spatial_anchor_from_descriptor(descriptor, origin, spatial_anchors=None, **kwargs):
+    """
+    Create a spatial anchor with IVRSpatialAnchors.createSpatialAnchorFromDescriptor(), and await its pose.
+    Returns (handle, openvr.SpatialAnchorPose_t).
+    """
+    if spatial_anchors is None:
+        spatial_anchors = openvr.VRSpatialAnchors()
+    handle = spatial_anchors.createSpatialAnchorFromDescriptor(descriptor)
+    pose = await spatial_anchor_pose(handle, origin, spatial_anchors, **kwargs)
+    return handle, pose
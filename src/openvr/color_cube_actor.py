@@ -8,6 +8,7 @@ from OpenGL.GL import *  # @UnusedWildImport # this comment squelches an IDE war
 from OpenGL.GL.shaders import compileShader, compileProgram
 
 from openvr.glframework import shader_string
+from openvr.gl_renderer import FrameUniforms
 
 """
 Color cube for use in "hello world" openvr apps
@@ -25,19 +26,39 @@ class ColorCubeActor(object):
       | /0    | /1
       |/______|/
       4       5
+
+    Camera matrices are read from the FrameMatrices uniform block bound by OpenVrGlRenderer. Elsewhere,
+    display_gl() uploads its modelview and projection arguments into a FrameUniforms buffer of its own.
     """
     
     def __init__(self):
         self.shader = 0
+        self.stereo_shader = 0
         self.vao = None
+        self.frame_uniforms = FrameUniforms()
     
-    def init_gl(self):
-        vertex_shader = compileShader(
-            shader_string("""
+    @staticmethod
+    def _vertex_source(defines=()):
+        return shader_string("""
             // Adapted from @jherico's RiftDemo.py in pyovr
             
-            layout(location = 0) uniform mat4 Projection = mat4(1);
-            layout(location = 4) uniform mat4 ModelView = mat4(1);
+            #ifdef SINGLE_PASS_STEREO
+            // See openvr.gl_renderer.StereoUniforms
+            layout(std140, binding = 1) uniform StereoMatrices {
+              mat4 view_projection[2];
+              mat4 view[2];
+              mat4 projection[2];
+            };
+            #else
+            // See openvr.gl_renderer.FrameUniforms
+            layout(std140, binding = 0) uniform FrameMatrices {
+              mat4 projection;
+              mat4 view;
+              mat4 view_projection;
+              mat4 hmd_pose;
+            };
+            #endif
+            
             layout(location = 8) uniform float Size = 0.3;
             
             // Minimum Y value is zero, so cube sits on the floor in room scale
@@ -82,36 +103,65 @@ class ColorCubeActor(object):
                   _color = vec3(1.0) + _color;
               }
             
-              gl_Position = Projection * ModelView * vec4(UNIT_CUBE[vertexIndex] * Size, 1.0);
+            #ifdef SINGLE_PASS_STEREO
+              int eye = gl_InstanceID % 2;
+              vec4 clip = view_projection[eye] * vec4(UNIT_CUBE[vertexIndex] * Size, 1.0);
+              // Squeeze into this eye's half of the side by side framebuffer
+              clip.x = 0.5 * clip.x + (eye == 0 ? -0.5 : 0.5) * clip.w;
+              gl_ClipDistance[0] = eye == 0 ? -clip.x : clip.x;
+              gl_Position = clip;
+            #else
+              gl_Position = view_projection * vec4(UNIT_CUBE[vertexIndex] * Size, 1.0);
+            #endif
             }
-            """), 
-            GL_VERTEX_SHADER)
-        fragment_shader = compileShader(
-            shader_string("""
+            """, defines=defines)
+
+    def init_gl(self):
+        vertex_source = self._vertex_source()
+        fragment_source = shader_string("""
             in vec3 _color;
             out vec4 FragColor;
             
             void main() {
               FragColor = vec4(_color, 1.0);
             }
-            """), 
-            GL_FRAGMENT_SHADER)
-        self.shader = compileProgram(vertex_shader, fragment_shader)
+            """)
+        self.shader = compileProgram(
+            compileShader(vertex_source, GL_VERTEX_SHADER),
+            compileShader(fragment_source, GL_FRAGMENT_SHADER))
+        # Same shader, for drawing both eyes at once
+        self.stereo_shader = compileProgram(
+            compileShader(self._vertex_source(defines=('SINGLE_PASS_STEREO',)), GL_VERTEX_SHADER),
+            compileShader(fragment_source, GL_FRAGMENT_SHADER))
         #
         self.vao = glGenVertexArrays(1)
         glBindVertexArray(self.vao)
         glEnable(GL_DEPTH_TEST)
+        self.frame_uniforms.init_gl()
         
     def display_gl(self, modelview, projection):
+        # Camera matrices come from the FrameMatrices uniform block, bound by OpenVrGlRenderer, if any
+        upload = not FrameUniforms.bound
+        if upload:
+            self.frame_uniforms.bind_matrices(modelview, projection)
         glUseProgram(self.shader)
-        glUniformMatrix4fv(0, 1, False, projection)
-        glUniformMatrix4fv(4, 1, False, modelview)
         glBindVertexArray(self.vao)
         glDrawArrays(GL_TRIANGLES, 0, 36)
+        if upload:
+            FrameUniforms.unbind()
+
+    def display_stereo_gl(self, modelviews, projections):
+        "Draw the cube for both eyes, with one instanced draw call, for OpenVrGlRenderer(single_pass_stereo=True)"
+        glUseProgram(self.stereo_shader)
+        glBindVertexArray(self.vao)
+        glDrawArraysInstanced(GL_TRIANGLES, 0, 36, 2)
     
     def dispose_gl(self):
         glDeleteProgram(self.shader)
         self.shader = 0
+        glDeleteProgram(self.stereo_shader)
+        self.stereo_shader = 0
         if self.vao:
             glDeleteVertexArrays(1, (self.vao,))
         self.vao = 0
+        self.frame_uniforms.dispose_gl()
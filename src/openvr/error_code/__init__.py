@@ -17,6 +17,8 @@ class ErrorCode(OpenVRError):
 
     @classmethod
     def check_error_value(cls, error_value, message=''):
+        if error_value == 0:
+            return  # Success, in every category
         error_class = cls.error_index[int(error_value)]
         if not error_class.is_error:
             return
@@ -492,7 +494,7 @@ class NotificationError(ErrorCode):
 
 
 class NotificationError_OK(NotificationError):
-    pass
+    is_error = False
 
 
 class NotificationError_InvalidNotificationId(NotificationError):
@@ -0,0 +1,91 @@
+#!/bin/env python
+
+# file event_buffer.py
+
+from ctypes import byref
+
+import numpy
+
+import openvr
+from openvr.numpy_arrays import vr_event_dtype
+
+"""
+Batched polling of OpenVR events into a reusable buffer, readable as a NumPy structured array
+"""
+
+
+class EventBuffer(object):
+    """
+    A preallocated array of openvr.VREvent_t, filled by draining the event queue in one call.
+
+    drain() polls IVRSystem.pollNextEvent() into consecutive slots until the queue is empty or the buffer
+    is full, and returns the number of events read. drain_overlay() does the same with
+    IVROverlay.pollNextOverlayEvent(), and can append to events already in the buffer. The bound native
+    function and the argument of each slot are looked up once, in advance, so each event costs only the
+    native call itself.
+
+    The same memory is visible two ways:
+        events          (capacity,) numpy array with dtype numpy_arrays.vr_event_dtype, for vectorized
+                        filtering on eventType, trackedDeviceIndex and eventAgeSeconds
+        ctypes_events   ctypes array of openvr.VREvent_t, for decoding the data union of selected events
+    Only the first count entries hold events from the latest drain().
+
+    If drain() returns capacity, more events may be pending:
+        while buffer.drain() == buffer.capacity: ...
+    """
+
+    def __init__(self, capacity=64):
+        self.capacity = capacity
+        self.ctypes_events = (openvr.VREvent_t * capacity)()
+        self.events = numpy.frombuffer(self.ctypes_events, dtype=vr_event_dtype, count=capacity)
+        self.count = 0
+        self._event_refs = [byref(event) for event in self.ctypes_events]
+
+    def __len__(self):
+        return self.count
+
+    def __getitem__(self, index):
+        "The openvr.VREvent_t in one slot, sharing memory with the buffer"
+        if not -self.count <= index < self.count:
+            raise IndexError(index)
+        return self.ctypes_events[index % self.count]
+
+    def __iter__(self):
+        "Iterate over the events from the latest drain(), as openvr.VREvent_t structures"
+        for index in range(self.count):
+            yield self.ctypes_events[index]
+
+    def valid_events(self):
+        "The numpy view of the events from the latest drain()"
+        return self.events[:self.count]
+
+    def drain(self, system=None):
+        "Poll pending system events into the buffer, replacing its contents. Returns the number of events read."
+        if system is None:
+            system = openvr.VRSystem()
+        poll = system._fn_pollNextEvent
+        event_size = system._sizeof_VREvent_t
+        count = 0
+        for event_ref in self._event_refs:
+            if not poll(event_ref, event_size):
+                break
+            count += 1
+        self.count = count
+        return count
+
+    def drain_overlay(self, overlay_handle, overlay=None, start=0):
+        """
+        Poll pending events of one overlay into the buffer, from slot start on, keeping the slots before it.
+        Returns the number of events read; count becomes start plus that number.
+        """
+        if overlay is None:
+            overlay = openvr.VROverlay()
+        poll = overlay._fn_pollNextOverlayEvent
+        event_size = overlay._sizeof_VREvent_t
+        count = 0
+        for event_ref in self._event_refs[start:]:
+            if not poll(overlay_handle, event_ref, event_size):
+                break
+            count += 1
+        self.count = start + count
+        return count
@@ -0,0 +1,125 @@
+#!/bin/env python
+
+# file event_dispatcher.py
+
+import numpy
+
+import openvr
+from openvr.event_buffer import EventBuffer
+
+"""
+Routing of OpenVR events to handlers registered per event type, with payloads decoded from the event data union
+"""
+
+
+class _Subscription(object):
+    __slots__ = ('handler', 'device_index', 'overlay_handle')
+
+    def __init__(self, handler, device_index, overlay_handle):
+        self.handler = handler
+        self.device_index = device_index
+        self.overlay_handle = overlay_handle
+
+    def accepts(self, device_index, overlay_handle):
+        if self.device_index is not None and self.device_index != device_index:
+            return False
+        if self.overlay_handle is not None and self.overlay_handle != overlay_handle:
+            return False
+        return True
+
+
+class EventDispatcher(object):
+    """
+    Calls the handlers registered for each event's EVREventType, found with one dictionary lookup.
+
+    Handlers are called as handler(event, data), where event is the openvr.VREvent_t, and data is its payload:
+    the member of event.data named for that event type in openvr.EVENT_DATA_MEMBERS, e.g. a VREvent_Controller_t
+    for VREvent_ButtonPress, or None for event types without a known payload. The payload is decoded once per
+    event, and only if some handler accepts the event. Events from dispatch_buffer() and poll() share memory with
+    the buffer, so handlers should copy anything they keep beyond the call.
+
+    A handler added with a device_index only receives events whose trackedDeviceIndex matches. One added with
+    an overlay_handle only receives events polled from that overlay, which are passed to dispatch() together with
+    the handle they were polled from; events from IVRSystem.pollNextEvent() have no overlay handle.
+
+    dispatch_buffer() routes the contents of an EventBuffer: event types nobody handles are filtered out with
+    one vectorized comparison, and filters are checked on the numpy fields, so dropped events never become
+    ctypes objects.
+    """
+
+    def __init__(self):
+        self._subscriptions = dict()  # event type -> [_Subscription]
+        self._event_types = numpy.zeros(0, dtype=numpy.uint32)  # keys of _subscriptions, for vectorized filtering
+        self._event_buffer = None
+
+    def add_handler(self, event_type, handler, device_index=None, overlay_handle=None):
+        """Call handler(event, data) for each dispatched event of the given type that passes the filters"""
+        subscriptions = self._subscriptions.setdefault(event_type, [])
+        subscriptions.append(_Subscription(handler, device_index, overlay_handle))
+        self._update_event_types()
+
+    def remove_handler(self, event_type, handler):
+        """Remove every registration of handler for the given event type"""
+        subscriptions = [s for s in self._subscriptions.get(event_type, ()) if s.handler != handler]
+        if subscriptions:
+            self._subscriptions[event_type] = subscriptions
+        else:
+            self._subscriptions.pop(event_type, None)
+        self._update_event_types()
+
+    def handles(self, event_type):
+        """Whether any handler is registered for an event type"""
+        return event_type in self._subscriptions
+
+    def _update_event_types(self):
+        self._event_types = numpy.fromiter(self._subscriptions.keys(), dtype=numpy.uint32)
+
+    def _accepting(self, event_type, device_index, overlay_handle):
+        subscriptions = self._subscriptions.get(event_type)
+        if subscriptions is None:
+            return ()
+        return [s for s in subscriptions if s.accepts(device_index, overlay_handle)]
+
+    @staticmethod
+    def _call(subscriptions, event):
+        event_type = event.eventType
+        member = openvr.EVENT_DATA_MEMBERS.get(event_type)
+        data = None if member is None else getattr(event.data, member[0])
+        for subscription in subscriptions:
+            subscription.handler(event, data)
+
+    def dispatch(self, event, overlay_handle=None):
+        """Pass one openvr.VREvent_t to its handlers. Returns True if any handler was called."""
+        subscriptions = self._accepting(event.eventType, event.trackedDeviceIndex, overlay_handle)
+        if not subscriptions:
+            return False
+        self._call(subscriptions, event)
+        return True
+
+    def dispatch_buffer(self, event_buffer, overlay_handle=None):
+        """Pass the events of the latest EventBuffer.drain() to their handlers. Returns the number dispatched."""
+        events = event_buffer.valid_events()
+        candidates = numpy.flatnonzero(numpy.isin(events['eventType'], self._event_types))
+        if len(candidates) == 0:
+            return 0
+        event_types = events['eventType'][candidates].tolist()
+        device_indices = events['trackedDeviceIndex'][candidates].tolist()
+        dispatched = 0
+        for index, event_type, device_index in zip(candidates.tolist(), event_types, device_indices):
+            subscriptions = self._accepting(event_type, device_index, overlay_handle)
+            if subscriptions:
+                self._call(subscriptions, event_buffer.ctypes_events[index])
+                dispatched += 1
+        return dispatched
+
+    def poll(self, system=None):
+        """Drain and dispatch all pending IVRSystem events. Returns the number dispatched."""
+        if self._event_buffer is None:
+            self._event_buffer = EventBuffer()
+        buffer = self._event_buffer
+        dispatched = 0
+        while True:
+            count = buffer.drain(system)
+            dispatched += self.dispatch_buffer(buffer)
+            if count < buffer.capacity:
+                return dispatched
@@ -0,0 +1,919 @@
+#!/bin/env python
+
+# file fake_runtime.py
+
+import collections
+import ctypes
+import inspect
+import platform
+from ctypes import CFUNCTYPE, POINTER, addressof, c_char_p, c_void_p, memmove, sizeof
+
+import openvr
+
+"""
+In-process stand-in for the OpenVR runtime, for testing and benchmarking pyopenvr without SteamVR.
+
+FakeRuntime replaces the native openvr_api library used by the openvr module, and serves each
+IVR*_FnTable structure populated with OPENVR_FNTABLE_CALLTYPE callbacks. So all the usual
+wrapper code, e.g. openvr.VRSystem().getTrackedDeviceClass(), runs unchanged, against scripted
+devices, poses, events, frame timings and render models:
+
+    with FakeRuntime() as runtime:
+        runtime.add_device(openvr.TrackedDeviceClass_HMD)
+        vr_system = openvr.init(openvr.VRApplication_Scene)
+        ...
+        openvr.shutdown()
+
+Function table entries without a scripted implementation return zero, False or an empty string.
+"""
+
+
+def _enum_names(prefix):
+    """Map enum values to their symbolic names, for all openvr constants starting with prefix"""
+    result = dict()
+    for name in dir(openvr):
+        if name.startswith(prefix):
+            value = getattr(openvr, name)
+            if isinstance(value, int):
+                result.setdefault(value, name)
+    return result
+
+
+def _write_string(value, buffer, buffer_size):
+    """
+    Copy a string into a caller-provided char buffer, if it fits.
+    Returns the required buffer size, including the terminating null character.
+    """
+    data = value.encode('utf-8') + b'\0'
+    if buffer and buffer_size >= len(data):
+        memmove(buffer, data, len(data))
+    return len(data)
+
+
+def _read_string(address):
+    if not address:
+        return None
+    return ctypes.string_at(address).decode('utf-8')
+
+
+def _set_error(error_pointer, value):
+    if error_pointer:
+        error_pointer[0] = value
+
+
+def _returns_struct_in_memory(struct_type):
+    """
+    Whether the native calling convention returns this structure through a hidden pointer argument,
+    which a ctypes callback can emulate. Returns False for structures returned in registers,
+    which ctypes callbacks cannot produce.
+    """
+    if platform.machine().lower() not in ('x86_64', 'amd64'):
+        return False
+    size = sizeof(struct_type)
+    if platform.system() == 'Windows':
+        return size not in (1, 2, 4, 8)
+    return size > 16
+
+
+def _as_matrix34(matrix):
+    if isinstance(matrix, openvr.HmdMatrix34_t):
+        return matrix
+    result = openvr.HmdMatrix34_t()
+    for i in range(3):
+        for j in range(4):
+            result.m[i][j] = matrix[i][j]
+    return result
+
+
+def _identity34():
+    return _as_matrix34(((1, 0, 0, 0), (0, 1, 0, 0), (0, 0, 1, 0)))
+
+
+def _array_of(element_type, values):
+    """Convert a ctypes array, a buffer such as a numpy array, or a sequence into a ctypes array"""
+    if isinstance(values, ctypes.Array):
+        return values
+    try:
+        data = memoryview(values).cast('B')
+    except TypeError:
+        data = None
+    if data is not None:
+        return (element_type * (len(data) // sizeof(element_type))).from_buffer_copy(data)
+    values = list(values)
+    result = (element_type * len(values))()
+    for i, value in enumerate(values):
+        if issubclass(element_type, ctypes.Structure):
+            floats = _array_of(ctypes.c_float, value)
+            memmove(addressof(result[i]), addressof(floats), min(sizeof(floats), sizeof(element_type)))
+        else:
+            result[i] = value
+    return result
+
+
+class FakeTrackedDevice(object):
+    """A scripted tracked device, with a pose, properties and controller state"""
+
+    def __init__(self, index, device_class, properties=None, controller_role=openvr.TrackedControllerRole_Invalid):
+        self.index = index
+        self.device_class = device_class
+        self.controller_role = controller_role
+        self.properties = {
+            openvr.Prop_DeviceClass_Int32: int(device_class),
+            openvr.Prop_SerialNumber_String: f'FAKE-{index:02d}',
+            openvr.Prop_TrackingSystemName_String: 'fake',
+        }
+        if properties is not None:
+            self.properties.update(properties)
+        self.pose = openvr.TrackedDevicePose_t()
+        self.controller_state = openvr.VRControllerState_t()
+        self.connected = True
+        self.set_pose()
+
+    @property
+    def connected(self):
+        return bool(self.pose.bDeviceIsConnected)
+
+    @connected.setter
+    def connected(self, value):
+        self.pose.bDeviceIsConnected = bool(value)
+        if not value:
+            self.pose.bPoseIsValid = False
+
+    def set_pose(self, matrix=None, velocity=(0, 0, 0), angular_velocity=(0, 0, 0), valid=True,
+                 tracking_result=openvr.TrackingResult_Running_OK):
+        """Set the device-to-absolute-tracking pose from a 3x4 nested sequence or HmdMatrix34_t"""
+        if matrix is None:
+            matrix = _identity34()
+        self.pose.mDeviceToAbsoluteTracking = _as_matrix34(matrix)
+        self.pose.vVelocity = openvr.HmdVector3_t(*velocity)
+        self.pose.vAngularVelocity = openvr.HmdVector3_t(*angular_velocity)
+        self.pose.bPoseIsValid = bool(valid)
+        self.pose.eTrackingResult = tracking_result
+
+
+class FakeRenderModel(object):
+    """A scripted render model, and optionally its diffuse texture"""
+
+    def __init__(self, name, vertices, indices, texture=None, texture_id=0, original_path=None, loading_polls=0):
+        self.name = name
+        self.vertices = _array_of(openvr.RenderModel_Vertex_t, vertices)
+        self.indices = _array_of(ctypes.c_uint16, indices)
+        self.model = openvr.RenderModel_t()
+        self.model.rVertexData = ctypes.cast(self.vertices, POINTER(openvr.RenderModel_Vertex_t))
+        self.model.unVertexCount = len(self.vertices)
+        self.model.rIndexData = ctypes.cast(self.indices, POINTER(ctypes.c_uint16))
+        self.model.unTriangleCount = len(self.indices) // 3
+        self.model.diffuseTextureId = texture_id
+        self.texture_map = None
+        if texture is not None:
+            width, height, rgba = texture
+            self.texture_data = (ctypes.c_uint8 * (width * height * 4)).from_buffer_copy(rgba)
+            self.texture_map = openvr.RenderModel_TextureMap_t()
+            self.texture_map.unWidth = width
+            self.texture_map.unHeight = height
+            self.texture_map.rubTextureMapData = ctypes.cast(self.texture_data, POINTER(ctypes.c_uint8))
+            self.texture_map.format = openvr.VRRenderModelTextureFormat_RGBA8_SRGB
+            self.texture_map.unMipLevels = 1
+        self.original_path = original_path if original_path is not None else f'/fake/rendermodels/{name}.obj'
+        # Number of load attempts that report VRRenderModelError_Loading, to exercise polling code
+        self.loading_polls = loading_polls
+        self.texture_loading_polls = loading_polls
+
+
+class _FakeSystem(object):
+    """Implementations of IVRSystem_FnTable entries"""
+
+    def __init__(self, runtime):
+        self.runtime = runtime
+
+    def _device(self, index):
+        return self.runtime.devices.get(index)
+
+    def getRecommendedRenderTargetSize(self, width, height):
+        width[0], height[0] = self.runtime.recommended_render_target_size
+
+    def getProjectionRaw(self, eye, left, right, top, bottom):
+        left[0], right[0], top[0], bottom[0] = self.runtime.projection_raw
+
+    def getProjectionMatrix(self, eye, near_z, far_z):
+        left, right, top, bottom = self.runtime.projection_raw
+        idx = 1.0 / (right - left)
+        idy = 1.0 / (bottom - top)
+        idz = 1.0 / (far_z - near_z)
+        result = openvr.HmdMatrix44_t()
+        result.m[0][0] = 2 * idx
+        result.m[0][2] = (right + left) * idx
+        result.m[1][1] = 2 * idy
+        result.m[1][2] = (bottom + top) * idy
+        result.m[2][2] = -far_z * idz
+        result.m[2][3] = -far_z * near_z * idz
+        result.m[3][2] = -1.0
+        return result
+
+    def getEyeToHeadTransform(self, eye):
+        result = _identity34()
+        half_ipd = 0.5 * self.runtime.ipd
+        result.m[0][3] = -half_ipd if eye == openvr.Eye_Left else half_ipd
+        return result
+
+    def getSeatedZeroPoseToStandingAbsoluteTrackingPose(self):
+        return _identity34()
+
+    def getRawZeroPoseToStandingAbsoluteTrackingPose(self):
+        return _identity34()
+
+    def getDeviceToAbsoluteTrackingPose(self, origin, predicted_seconds, poses, count):
+        self.runtime.copy_poses(poses, count)
+
+    def getSortedTrackedDeviceIndicesOfClass(self, device_class, indices, count, relative_to):
+        matches = sorted(i for i, d in self.runtime.devices.items()
+                         if d.connected and d.device_class == device_class)
+        for i, index in enumerate(matches[:count]):
+            if indices:
+                indices[i] = index
+        return len(matches)
+
+    def getTrackedDeviceIndexForControllerRole(self, role):
+        for index, device in sorted(self.runtime.devices.items()):
+            if device.connected and device.controller_role == role:
+                return index
+        return openvr.k_unTrackedDeviceIndexInvalid
+
+    def getControllerRoleForTrackedDeviceIndex(self, index):
+        device = self._device(index)
+        return device.controller_role if device is not None else openvr.TrackedControllerRole_Invalid
+
+    def getTrackedDeviceClass(self, index):
+        device = self._device(index)
+        if device is None or not device.connected:
+            return openvr.TrackedDeviceClass_Invalid
+        return device.device_class
+
+    def isTrackedDeviceConnected(self, index):
+        device = self._device(index)
+        return device is not None and device.connected
+
+    def _property(self, index, prop, error, is_type, default):
+        self.runtime.property_query_count += 1
+        device = self._device(index)
+        if device is None:
+            _set_error(error, openvr.TrackedProp_InvalidDevice)
+            return default
+        if prop not in device.properties:
+            _set_error(error, openvr.TrackedProp_UnknownProperty)
+            return default
+        value = device.properties[prop]
+        if not is_type(value):
+            _set_error(error, openvr.TrackedProp_WrongDataType)
+            return default
+        _set_error(error, openvr.TrackedProp_Success)
+        return value
+
+    def getBoolTrackedDeviceProperty(self, index, prop, error):
+        return self._property(index, prop, error, lambda v: isinstance(v, bool), False)
+
+    def getFloatTrackedDeviceProperty(self, index, prop, error):
+        return self._property(index, prop, error, lambda v: isinstance(v, float), 0.0)
+
+    def getInt32TrackedDeviceProperty(self, index, prop, error):
+        return self._property(index, prop, error, lambda v: isinstance(v, int) and not isinstance(v, bool), 0)
+
+    def getUint64TrackedDeviceProperty(self, index, prop, error):
+        return self._property(index, prop, error, lambda v: isinstance(v, int) and not isinstance(v, bool), 0)
+
+    def getMatrix34TrackedDeviceProperty(self, index, prop, error):
+        return self._property(index, prop, error, lambda v: isinstance(v, openvr.HmdMatrix34_t),
+                              openvr.HmdMatrix34_t())
+
+    def getStringTrackedDeviceProperty(self, index, prop, buffer, buffer_size, error):
+        value = self._property(index, prop, error, lambda v: isinstance(v, str), None)
+        if value is None:
+            return 0
+        required = _write_string(value, buffer, buffer_size)
+        if buffer_size < required:
+            _set_error(error, openvr.TrackedProp_BufferTooSmall)
+        return required
+
+    def getArrayTrackedDeviceProperty(self, index, prop, tag, buffer, buffer_size, error):
+        value = self._property(index, prop, error, lambda v: isinstance(v, (bytes, ctypes.Array)), None)
+        if value is None:
+            return 0
+        data = bytes(value)
+        if buffer and buffer_size >= len(data):
+            memmove(buffer, data, len(data))
+        else:
+            _set_error(error, openvr.TrackedProp_BufferTooSmall)
+        return len(data)
+
+    def getPropErrorNameFromEnum(self, error):
+        return _enum_names('TrackedProp_').get(error, 'Unknown error')
+
+    def pollNextEvent(self, event, event_size):
+        if not self.runtime.events:
+            return False
+        next_event = self.runtime.events.popleft()
+        memmove(event, addressof(next_event), min(event_size, sizeof(next_event)))
+        return True
+
+    def pollNextEventWithPose(self, origin, event, event_size, pose):
+        if not self.pollNextEvent(event, event_size):
+            return False
+        device = self._device(event[0].trackedDeviceIndex)
+        if pose and device is not None:
+            pose[0] = device.pose
+        return True
+
+    def getEventTypeNameFromEnum(self, event_type):
+        return _enum_names('VREvent_').get(event_type, 'Unknown event')
+
+    def getHiddenAreaMesh(self, eye, mesh_type):
+        result = openvr.HiddenAreaMesh_t()
+        vertices = self.runtime.hidden_area_meshes.get((eye, mesh_type))
+        if vertices:
+            result.pVertexData = ctypes.cast(vertices, POINTER(openvr.HmdVector2_t))
+            result.unTriangleCount = len(vertices) // 3
+        return result
+
+    def getControllerState(self, index, state, state_size):
+        device = self._device(index)
+        if device is None or not device.connected:
+            return False
+        memmove(state, addressof(device.controller_state), min(state_size, sizeof(openvr.VRControllerState_t)))
+        return True
+
+    def getControllerStateWithPose(self, origin, index, state, state_size, pose):
+        if not self.getControllerState(index, state, state_size):
+            return False
+        if pose:
+            pose[0] = self._device(index).pose
+        return True
+
+    def isInputAvailable(self):
+        return True
+
+    def getRuntimeVersion(self):
+        return 'fake'
+
+
+class _FakeCompositor(object):
+    """Implementations of IVRCompositor_FnTable entries"""
+
+    def __init__(self, runtime):
+        self.runtime = runtime
+
+    def waitGetPoses(self, render_poses, render_count, game_poses, game_count):
+        runtime = self.runtime
+        runtime.frame_index += 1
+        for callback in runtime.frame_callbacks:
+            callback(runtime)
+        timing = openvr.Compositor_FrameTiming()
+        memmove(addressof(timing), addressof(runtime.frame_timing), sizeof(timing))
+        timing.m_nSize = sizeof(timing)
+        timing.m_nFrameIndex = runtime.frame_index
+        runtime.frame_timings.append(timing)
+        if runtime.compositor_error != openvr.VRCompositorError_None:
+            return runtime.compositor_error
+        return self.getLastPoses(render_poses, render_count, game_poses, game_count)
+
+    def getLastPoses(self, render_poses, render_count, game_poses, game_count):
+        self.runtime.copy_poses(render_poses, render_count)
+        self.runtime.copy_poses(game_poses, game_count)
+        return openvr.VRCompositorError_None
+
+    def getLastPoseForTrackedDeviceIndex(self, index, render_pose, game_pose):
+        device = self.runtime.devices.get(index)
+        if device is None:
+            return openvr.VRCompositorError_IndexOutOfRange
+        for pose in (render_pose, game_pose):
+            if pose:
+                pose[0] = device.pose
+        return openvr.VRCompositorError_None
+
+    def submit(self, eye, texture, bounds, flags):
+        bounds_tuple = None
+        if bounds:
+            b = bounds[0]
+            bounds_tuple = (b.uMin, b.vMin, b.uMax, b.vMax)
+        self.runtime.submit_count += 1
+        self.runtime.submits.append((eye, texture[0].handle, bounds_tuple, flags))
+        return openvr.VRCompositorError_None
+
+    def submitWithArrayIndex(self, eye, texture, array_index, bounds, flags):
+        return self.submit(eye, texture, bounds, flags)
+
+    def getFrameTiming(self, timing, frames_ago):
+        timings = self.runtime.frame_timings
+        if frames_ago >= len(timings):
+            return False
+        source = timings[-1 - frames_ago]
+        memmove(timing, addressof(source), min(timing[0].m_nSize, sizeof(source)))
+        return True
+
+    def getFrameTimings(self, timings, count):
+        if count <= 0 or not timings:
+            return 0
+        recent = list(self.runtime.frame_timings)[-count:]
+        for i, source in enumerate(recent):
+            memmove(addressof(timings[i]), addressof(source), sizeof(source))
+        return len(recent)
+
+    def getFrameTimeRemaining(self):
+        return self.runtime.frame_time_remaining
+
+    def shouldAppRenderWithLowResources(self):
+        return self.runtime.low_resources
+
+
+class _FakeRenderModels(object):
+    """Implementations of IVRRenderModels_FnTable entries"""
+
+    def __init__(self, runtime):
+        self.runtime = runtime
+
+    def loadRenderModel_Async(self, name, model_pointer):
+        model = self.runtime.render_models.get(_read_string(name))
+        if model is None:
+            return openvr.VRRenderModelError_InvalidModel
+        if model.loading_polls > 0:
+            model.loading_polls -= 1
+            return openvr.VRRenderModelError_Loading
+        model_pointer[0] = ctypes.pointer(model.model)
+        self.runtime.loaded_model_count += 1
+        return openvr.VRRenderModelError_None
+
+    def freeRenderModel(self, model):
+        self.runtime.freed_model_count += 1
+
+    def loadTexture_Async(self, texture_id, texture_pointer):
+        for model in self.runtime.render_models.values():
+            if model.texture_map is not None and model.model.diffuseTextureId == texture_id:
+                if model.texture_loading_polls > 0:
+                    model.texture_loading_polls -= 1
+                    return openvr.VRRenderModelError_Loading
+                texture_pointer[0] = ctypes.pointer(model.texture_map)
+                self.runtime.loaded_texture_count += 1
+                return openvr.VRRenderModelError_None
+        return openvr.VRRenderModelError_InvalidTexture
+
+    def freeTexture(self, texture):
+        self.runtime.freed_texture_count += 1
+
+    def getRenderModelName(self, index, buffer, buffer_size):
+        names = list(self.runtime.render_models)
+        if index >= len(names):
+            return 0
+        return _write_string(names[index], buffer, buffer_size)
+
+    def getRenderModelCount(self):
+        return len(self.runtime.render_models)
+
+    def getRenderModelOriginalPath(self, name, buffer, buffer_size, error):
+        model = self.runtime.render_models.get(_read_string(name))
+        if model is None:
+            _set_error(error, openvr.VRRenderModelError_InvalidModel)
+            return 0
+        required = _write_string(model.original_path, buffer, buffer_size)
+        _set_error(error, openvr.VRRenderModelError_None if buffer_size >= required
+                   else openvr.VRRenderModelError_BufferTooSmall)
+        return required
+
+    def getRenderModelErrorNameFromEnum(self, error):
+        return _enum_names('VRRenderModelError_').get(error, 'Unknown error')
+
+
+class FakeOverlay(object):
+    """A scripted overlay, with its own event queue"""
+
+    def __init__(self, handle, key, name, visible=False):
+        self.handle = handle
+        self.key = key
+        self.name = name
+        self.visible = visible
+        self.events = collections.deque()
+
+
+class _FakeOverlay(object):
+    """Implementations of IVROverlay_FnTable entries"""
+
+    def __init__(self, runtime):
+        self.runtime = runtime
+
+    def createOverlay(self, key, name, handle_pointer):
+        overlay = self.runtime.add_overlay(_read_string(key), _read_string(name))
+        handle_pointer[0] = overlay.handle
+        return openvr.VROverlayError_None
+
+    def destroyOverlay(self, handle):
+        if self.runtime.overlays.pop(handle, None) is None:
+            return openvr.VROverlayError_UnknownOverlay
+        return openvr.VROverlayError_None
+
+    def _set_visible(self, handle, visible):
+        overlay = self.runtime.overlays.get(handle)
+        if overlay is None:
+            return openvr.VROverlayError_UnknownOverlay
+        if overlay.visible != visible:
+            overlay.visible = visible
+            event_type = openvr.VREvent_OverlayShown if visible else openvr.VREvent_OverlayHidden
+            self.runtime.queue_overlay_event(handle, event_type)
+        return openvr.VROverlayError_None
+
+    def showOverlay(self, handle):
+        return self._set_visible(handle, True)
+
+    def hideOverlay(self, handle):
+        return self._set_visible(handle, False)
+
+    def isOverlayVisible(self, handle):
+        overlay = self.runtime.overlays.get(handle)
+        return overlay is not None and overlay.visible
+
+    def waitFrameSync(self, timeout_ms):
+        self.runtime.frame_sync_count += 1
+        errors = self.runtime.frame_sync_errors
+        return errors.popleft() if errors else openvr.VROverlayError_None
+
+    def pollNextOverlayEvent(self, handle, event, event_size):
+        self.runtime.overlay_poll_count += 1
+        overlay = self.runtime.overlays.get(handle)
+        if overlay is None or not overlay.events:
+            return False
+        next_event = overlay.events.popleft()
+        memmove(event, addressof(next_event), min(event_size, sizeof(next_event)))
+        return True
+
+
+class _FakeInput(object):
+    """Implementations of IVRInput_FnTable entries"""
+
+    def __init__(self, runtime):
+        self.runtime = runtime
+
+    def setActionManifestPath(self, path):
+        self.runtime.action_manifest_path = _read_string(path)
+        return openvr.VRInputError_None
+
+    def _handle(self, path, handle_pointer):
+        self.runtime.input_handle_query_count += 1
+        path = _read_string(path).lower()  # input paths are case insensitive
+        handles = self.runtime.input_handles
+        if path not in handles:
+            handles[path] = max(handles.values(), default=0) + 1
+        handle_pointer[0] = handles[path]
+        return openvr.VRInputError_None
+
+    def getActionSetHandle(self, name, handle_pointer):
+        return self._handle(name, handle_pointer)
+
+    def getActionHandle(self, name, handle_pointer):
+        return self._handle(name, handle_pointer)
+
+    def getInputSourceHandle(self, path, handle_pointer):
+        return self._handle(path, handle_pointer)
+
+
+class FakeRuntime(object):
+    """
+    Opt-in stand-in for the OpenVR runtime. Use install()/uninstall(), or a "with" block,
+    around code that calls openvr.init()/openvr.shutdown() as usual.
+
+    Scripting:
+        add_device()            tracked devices, with poses and properties
+        queue_event()           events returned by pollNextEvent()
+        frame_timing            template for the timing recorded at each waitGetPoses()
+        frame_callbacks         callables run at each waitGetPoses(), e.g. to animate poses
+        add_render_model()      models and textures for IVRRenderModels
+        add_overlay()           overlays, whose events queue_overlay_event() scripts
+        frame_sync_errors       EVROverlayError values returned by the next waitFrameSync() calls, then None
+        input_handles           lower case action, action set and input source path -> handle, filled on demand
+    Observation:
+        frame_index, submits, submit_count, property_query_count, loaded/freed model and texture counts,
+        overlay_poll_count, frame_sync_count, action_manifest_path, input_handle_query_count
+    """
+
+    _fake_interfaces = {
+        'IVRSystem': _FakeSystem,
+        'IVRCompositor': _FakeCompositor,
+        'IVRRenderModels': _FakeRenderModels,
+        'IVROverlay': _FakeOverlay,
+        'IVRInput': _FakeInput,
+    }
+
+    def __init__(self):
+        self.devices = dict()
+        self.events = collections.deque()
+        self.render_models = dict()
+        self.overlays = dict()  # handle -> FakeOverlay
+        self.overlay_poll_count = 0
+        self.frame_sync_errors = collections.deque()
+        self.frame_sync_count = 0
+        self.input_handles = dict()
+        self.input_handle_query_count = 0
+        self.action_manifest_path = None
+        self.hidden_area_meshes = dict()
+        self.recommended_render_target_size = (1512, 1680)
+        self.projection_raw = (-1.0, 1.0, -1.0, 1.0)  # left, right, top, bottom tangents
+        self.ipd = 0.064
+        self.frame_index = 0
+        self.frame_timing = openvr.Compositor_FrameTiming()
+        self.frame_timings = collections.deque(maxlen=128)
+        self.frame_callbacks = []
+        self.frame_time_remaining = 0.011
+        self.low_resources = False
+        self.compositor_error = openvr.VRCompositorError_None
+        self.submits = collections.deque(maxlen=64)
+        self.submit_count = 0
+        self.property_query_count = 0
+        self.loaded_model_count = 0
+        self.freed_model_count = 0
+        self.loaded_texture_count = 0
+        self.freed_texture_count = 0
+        self.hmd_present = True
+        self.init_error = openvr.VRInitError_None
+        self.application_type = None
+        self.is_initialized = False
+        self._init_token = 0
+        self._native_library = None
+        self._function_tables = dict()
+        self._strings = dict()  # keeps returned char* values alive
+        self._callbacks = []  # keeps ctypes callbacks alive
+        self._patched_methods = []
+        self.library = self._create_library()
+
+    # Scripting
+
+    def add_device(self, device_class, index=None, properties=None, matrix=None,
+                   controller_role=openvr.TrackedControllerRole_Invalid):
+        """Connect a new tracked device. The HMD defaults to index 0, other devices to the next free index."""
+        if index is None:
+            if device_class == openvr.TrackedDeviceClass_HMD:
+                index = openvr.k_unTrackedDeviceIndex_Hmd
+            else:
+                index = next(i for i in range(1, openvr.k_unMaxTrackedDeviceCount) if i not in self.devices)
+        device = FakeTrackedDevice(index, device_class, properties=properties, controller_role=controller_role)
+        if matrix is not None:
+            device.set_pose(matrix)
+        self.devices[index] = device
+        return device
+
+    def set_property(self, index, prop, value, notify=True):
+        """Change a device property, and queue a VREvent_PropertyChanged event if notify is set"""
+        self.devices[index].properties[prop] = value
+        if notify:
+            data = openvr.VREvent_Property_t()
+            data.prop = prop
+            self.queue_event(openvr.VREvent_PropertyChanged, index, data)
+
+    def queue_event(self, event_type, tracked_device_index=openvr.k_unTrackedDeviceIndexInvalid,
+                    data=None, age_seconds=0.0):
+        """Queue an event. data is any of the VREvent_Data_t member structures, e.g. a VREvent_Controller_t."""
+        event = self._event(event_type, tracked_device_index, data, age_seconds)
+        self.events.append(event)
+        return event
+
+    def add_overlay(self, key, name=None, visible=False):
+        """Create an overlay, as IVROverlay.createOverlay() does"""
+        handle = max(self.overlays, default=0) + 1
+        overlay = FakeOverlay(handle, key, key if name is None else name, visible=visible)
+        self.overlays[handle] = overlay
+        return overlay
+
+    def queue_overlay_event(self, overlay_handle, event_type, tracked_device_index=openvr.k_unTrackedDeviceIndexInvalid,
+                            data=None, age_seconds=0.0):
+        """Queue an event for pollNextOverlayEvent() on one overlay"""
+        event = self._event(event_type, tracked_device_index, data, age_seconds)
+        self.overlays[overlay_handle].events.append(event)
+        return event
+
+    @staticmethod
+    def _event(event_type, tracked_device_index, data, age_seconds):
+        event = openvr.VREvent_t()
+        event.eventType = event_type
+        event.trackedDeviceIndex = tracked_device_index
+        event.eventAgeSeconds = age_seconds
+        if data is not None:
+            memmove(addressof(event.data), addressof(data), min(sizeof(data), sizeof(event.data)))
+        return event
+
+    def add_render_model(self, name, vertices, indices, texture=None, texture_id=None, **kwargs):
+        """
+        Add a render model, from (N, 8) float vertex data (position, normal, texture coordinate)
+        and a flat sequence of uint16 triangle indices. texture is an optional (width, height, rgba_bytes) tuple.
+        """
+        if texture_id is None:
+            texture_id = len(self.render_models) if texture is not None else openvr.INVALID_TEXTURE_ID
+        model = FakeRenderModel(name, vertices, indices, texture=texture, texture_id=texture_id, **kwargs)
+        self.render_models[name] = model
+        return model
+
+    def copy_poses(self, poses, count):
+        """Fill a native TrackedDevicePose_t array with the current device poses"""
+        if not poses:
+            return
+        pose_size = sizeof(openvr.TrackedDevicePose_t)
+        ctypes.memset(poses, 0, pose_size * count)
+        base = addressof(poses.contents)
+        for index, device in self.devices.items():
+            if index < count:
+                memmove(base + index * pose_size, addressof(device.pose), pose_size)
+
+    # Installation
+
+    def install(self):
+        """Route the openvr module's native calls to this runtime"""
+        if self._native_library is not None:
+            return
+        self._native_library = openvr._openvr
+        openvr._openvr = self.library
+        openvr._internal_module_context.reset()
+
+    def uninstall(self):
+        """Restore the native openvr_api library"""
+        if self._native_library is None:
+            return
+        for cls, name, method in reversed(self._patched_methods):
+            setattr(cls, name, method)
+        self._patched_methods = []
+        # Tables are rebuilt, re-applying the method patches, at the next install().
+        # Their callbacks stay alive, for interface objects that outlive this installation.
+        self._function_tables.clear()
+        openvr._openvr = self._native_library
+        self._native_library = None
+        self.is_initialized = False
+        openvr._internal_module_context.reset()
+
+    def __enter__(self):
+        self.install()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.uninstall()
+
+    # Native library entry points
+
+    def _string_address(self, value):
+        """Returns the address of a persistent null-terminated copy of value, for char* return values"""
+        if value is None:
+            return None
+        if value not in self._strings:
+            self._strings[value] = ctypes.create_string_buffer(value.encode('utf-8'))
+        return addressof(self._strings[value])
+
+    def _create_library(self):
+        """Build callbacks standing in for each VR_* function the openvr module calls through its _openvr handle"""
+        init_errors = _enum_names('VRInitError_')
+
+        def init_internal2(error, application_type, startup_info):
+            if self.init_error != openvr.VRInitError_None:
+                error[0] = self.init_error
+                return 0
+            self.is_initialized = True
+            self.application_type = application_type
+            self._init_token += 1
+            error[0] = openvr.VRInitError_None
+            return self._init_token
+
+        def shutdown_internal():
+            self.is_initialized = False
+            self._init_token += 1
+
+        def get_generic_interface(version, error):
+            if not self.is_initialized:
+                error[0] = openvr.VRInitError_Init_NotInitialized
+                return None
+            table = self._function_table(_read_string(version))
+            if table is None:
+                error[0] = openvr.VRInitError_Init_InvalidInterface
+                return None
+            error[0] = openvr.VRInitError_None
+            return addressof(table)
+
+        def get_runtime_path(buffer, buffer_size, required_size):
+            required_size[0] = _write_string('/fake/openvr/runtime', buffer, buffer_size)
+            return True
+
+        implementations = {
+            'VR_InitInternal2': init_internal2,
+            'VR_ShutdownInternal': shutdown_internal,
+            'VR_GetGenericInterface': get_generic_interface,
+            'VR_IsInterfaceVersionValid': lambda version: self._function_table('FnTable:' + _read_string(version)) is not None,
+            'VR_GetInitToken': lambda: self._init_token,
+            'VR_IsHmdPresent': lambda: self.hmd_present,
+            'VR_IsRuntimeInstalled': lambda: True,
+            'VR_GetRuntimePath': get_runtime_path,
+            'VR_GetVRInitErrorAsSymbol': lambda error: self._string_address(init_errors.get(error, 'Unknown')),
+            'VR_GetVRInitErrorAsEnglishDescription': lambda error: self._string_address(init_errors.get(error, 'Unknown')),
+        }
+        library = _FakeLibrary()
+        native_library = openvr._openvr
+        for name, implementation in implementations.items():
+            native = getattr(native_library, name)
+            prototype = CFUNCTYPE(native.restype, *native.argtypes)
+            setattr(library, name, self._callback(prototype, implementation, callback_type=CFUNCTYPE))
+        return library
+
+    # Function tables
+
+    def _callback(self, prototype, implementation, returns_struct_in_memory=False, callback_type=None):
+        """
+        Wrap a python implementation as a native function pointer with the given prototype.
+        char* arguments and results are passed as addresses, so implementations can fill caller buffers.
+        """
+        restype = prototype._restype_
+        argtypes = [c_void_p if t is c_char_p else t for t in prototype._argtypes_]
+        function = implementation
+        if restype is c_char_p:
+            restype = c_void_p
+
+            def function(*args):
+                return self._string_address(implementation(*args))
+        elif returns_struct_in_memory:
+            struct_size = sizeof(restype)
+            restype = c_void_p
+            argtypes.insert(0, c_void_p)
+
+            def function(result, *args):
+                value = implementation(*args)
+                memmove(result, addressof(value), struct_size)
+                return result
+        if callback_type is None:
+            callback_type = openvr.OPENVR_FNTABLE_CALLTYPE
+        callback = callback_type(restype, *argtypes)(function)
+        self._callbacks.append(callback)
+        return ctypes.cast(callback, prototype)
+
+    def _function_table(self, key):
+        if key in self._function_tables:
+            return self._function_tables[key]
+        table = None
+        for name in dir(openvr):
+            if not name.endswith('_FnTable'):
+                continue
+            interface_name = name[:-len('_FnTable')]
+            if 'FnTable:' + getattr(openvr, interface_name + '_Version', '') == key:
+                table = self._create_function_table(interface_name, getattr(openvr, name))
+                break
+        self._function_tables[key] = table
+        return table
+
+    def _create_function_table(self, interface_name, table_type):
+        fake_interface = self._fake_interfaces.get(interface_name, object)
+        fake_interface = fake_interface(self) if fake_interface is not object else None
+        table = table_type()
+        for name, prototype in table_type._fields_:
+            implementation = getattr(fake_interface, name, None)
+            restype = prototype._restype_
+            if implementation is None:
+                implementation = self._default_implementation(restype)
+            in_memory = False
+            if isinstance(restype, type) and issubclass(restype, (ctypes.Structure, ctypes.Union)):
+                in_memory = _returns_struct_in_memory(restype)
+                if not in_memory:
+                    # ctypes cannot return structures in registers from a callback.
+                    # Override the python wrapper method instead, while this runtime is installed.
+                    self._patch_method(getattr(openvr, interface_name), name, prototype, implementation)
+                    callback = openvr.OPENVR_FNTABLE_CALLTYPE(None)(self._default_implementation(None))
+                    self._callbacks.append(callback)
+                    setattr(table, name, ctypes.cast(callback, prototype))
+                    continue
+            setattr(table, name, self._callback(prototype, implementation, returns_struct_in_memory=in_memory))
+        self._callbacks.append(table)
+        return table
+
+    @staticmethod
+    def _default_implementation(restype):
+        if restype is None:
+            return lambda *args: None
+        if restype is c_char_p:
+            return lambda *args: ''
+        if isinstance(restype, type) and issubclass(restype, (ctypes.Structure, ctypes.Union)):
+            return lambda *args: restype()
+        return lambda *args: 0
+
+    def _patch_method(self, cls, name, prototype, implementation):
+        """
+        Replace a generated wrapper method whose native result is a structure returned in registers,
+        keeping the wrapper's signature and default argument values.
+        """
+        original = cls.__dict__[name]
+        signature = inspect.signature(original)
+        # The only such function with an error argument, on platforms where 48-byte structures come back in registers
+        has_property_error = name == 'getMatrix34TrackedDeviceProperty'
+
+        def method(*args, **kwargs):
+            bound = signature.bind(*args, **kwargs)
+            bound.apply_defaults()
+            args = list(bound.arguments.values())[1:]
+            if not has_property_error:
+                return implementation(*args)
+            error = openvr.ETrackedPropertyError()
+            result = implementation(*args, ctypes.pointer(error))
+            openvr.error_code.TrackedPropertyError.check_error_value(error.value)
+            return result
+        self._patched_methods.append((cls, name, original))
+        setattr(cls, name, method)
+
+
+class _FakeLibrary(object):
+    """Attribute holder standing in for the ctypes handle to the native openvr_api library"""
+    pass
@@ -0,0 +1,137 @@
+#!/bin/env python
+
+# file frame_profiler.py
+
+import csv
+import time
+
+import numpy
+from OpenGL import GL
+
+"""
+CPU and GPU timing of the phases of each rendered frame, kept in a fixed-size ring buffer
+"""
+
+
+class FrameProfiler(object):
+    """
+    Records how long named phases of each frame take, on the CPU with time.perf_counter_ns(), and optionally
+    on the GPU with GL_TIME_ELAPSED queries, for the last "capacity" frames.
+
+    Per frame, call begin_frame(), then begin(phase name) and end() around each phase, then end_frame().
+    Phases must not nest, since GL_TIME_ELAPSED queries cannot. A phase that runs several times in one
+    frame, such as an actor drawn once per eye, accumulates its times. set_frame_index() labels the current
+    frame, e.g. with Compositor_FrameTiming.m_nFrameIndex, so rows can be matched to compositor timings.
+
+    GPU query results are read two frames later, using two alternating sets of query objects, so reading
+    them never stalls the pipeline. Results that are still not available then are recorded as missing.
+    The GPU columns require a current OpenGL context; with gpu=False, no OpenGL calls are made.
+    """
+
+    def __init__(self, capacity=512, max_phases=32, gpu=True):
+        self.capacity = capacity
+        self.max_phases = max_phases
+        self.gpu = gpu
+        self.phase_names = []
+        self._phase_columns = dict()  # phase name -> column
+        self.frame_indices = numpy.zeros(capacity, dtype=numpy.int64)
+        self.cpu_ns = numpy.zeros((capacity, max_phases), dtype=numpy.int64)
+        self.gpu_ns = numpy.full((capacity, max_phases), -1, dtype=numpy.int64)
+        self.frame_count = 0
+        self._row = None
+        self._phase = None  # column of the running phase
+        self._phase_start = 0
+        self._queries = ([], [])  # reusable query objects, for even and odd frames
+        self._query_uses = ([], [])  # (row, column) timed by each query in use, for even and odd frames
+
+    def _column(self, name):
+        column = self._phase_columns.get(name)
+        if column is None:
+            column = len(self.phase_names)
+            if column >= self.max_phases:
+                raise ValueError(f"More than {self.max_phases} phases")
+            self.phase_names.append(name)
+            self._phase_columns[name] = column
+        return column
+
+    def begin_frame(self, frame_index=None):
+        "Start a new row in the ring buffer, overwriting the oldest one once it is full"
+        parity = self.frame_count % 2
+        if self.gpu:
+            self._collect_gpu_results(parity)
+        row = self.frame_count % self.capacity
+        self.frame_count += 1
+        self._row = row
+        self.frame_indices[row] = -1 if frame_index is None else frame_index
+        self.cpu_ns[row] = 0
+        self.gpu_ns[row] = -1
+
+    def set_frame_index(self, frame_index):
+        "Label the current frame"
+        self.frame_indices[self._row] = frame_index
+
+    def begin(self, name):
+        "Start timing a phase of the current frame"
+        column = self._column(name)
+        self._phase = column
+        if self.gpu:
+            parity = (self.frame_count - 1) % 2
+            uses = self._query_uses[parity]
+            queries = self._queries[parity]
+            if len(uses) == len(queries):
+                queries.append(int(GL.glGenQueries(1)))
+            GL.glBeginQuery(GL.GL_TIME_ELAPSED, queries[len(uses)])
+            uses.append((self._row, column))
+        self._phase_start = time.perf_counter_ns()
+
+    def end(self):
+        "Stop timing the phase started by begin()"
+        self.cpu_ns[self._row, self._phase] += time.perf_counter_ns() - self._phase_start
+        if self.gpu:
+            GL.glEndQuery(GL.GL_TIME_ELAPSED)
+        self._phase = None
+
+    def end_frame(self):
+        self._row = None
+
+    def _collect_gpu_results(self, parity):
+        uses = self._query_uses[parity]
+        if not uses:
+            return
+        queries = self._queries[parity]
+        if GL.glGetQueryObjectiv(queries[len(uses) - 1], GL.GL_QUERY_RESULT_AVAILABLE):
+            # Queries complete in order, so all earlier results are available too
+            for query, (row, column) in zip(queries, uses):
+                elapsed = int(GL.glGetQueryObjectui64v(query, GL.GL_QUERY_RESULT))
+                if self.gpu_ns[row, column] < 0:
+                    self.gpu_ns[row, column] = elapsed
+                else:
+                    self.gpu_ns[row, column] += elapsed
+        uses.clear()
+
+    def frames(self, count=None):
+        """
+        Returns the recorded frames, oldest first, as a dict of numpy arrays:
+            'frame_index'           (N,) frame labels, -1 where none was set
+            '<phase>_cpu_ms'        (N,) float64 CPU milliseconds, 0 where the phase did not run
+            '<phase>_gpu_ms'        (N,) float64 GPU milliseconds, NaN where the phase did not run or no result
+        The most recent frames have no GPU results yet.
+        """
+        available = min(self.frame_count, self.capacity)
+        if count is None or count > available:
+            count = available
+        rows = numpy.arange(self.frame_count - count, self.frame_count) % self.capacity
+        result = {'frame_index': self.frame_indices[rows]}
+        for column, name in enumerate(self.phase_names):
+            result[name + '_cpu_ms'] = self.cpu_ns[rows, column] / 1e6
+            gpu = self.gpu_ns[rows, column]
+            result[name + '_gpu_ms'] = numpy.where(gpu < 0, numpy.nan, gpu / 1e6)
+        return result
+
+    def save_csv(self, file_name, count=None):
+        "Write the recorded frames, as returned by frames(), to a CSV file with one row per frame"
+        columns = self.frames(count)
+        with open(file_name, 'w', newline='') as f:
+            writer = csv.writer(f)
+            writer.writerow(columns.keys())
+            writer.writerows(zip(*(column.tolist() for column in columns.values())))
@@ -3,39 +3,51 @@
 # file openvr_gl_renderer.py
 
 from OpenGL.GL import *  # @UnusedWildImport # this comment squelches an IDE warning
+from OpenGL.GL.shaders import compileShader, compileProgram
 import numpy
 
 import openvr
+from openvr.glframework import shader_string
+from openvr.numpy_arrays import hidden_area_mesh_vertices, inverse_matrices_to_gl, matrices_to_gl
+from openvr.pose_buffers import PoseBuffers
 
 """
 Renders OpenGL scenes to virtual reality headsets using OpenVR API
 """
 
 
-# TODO: matrixForOpenVrMatrix() is not general, it is specific the perspective and 
-# modelview matrices used in this example
+# Desktop mirror modes, for OpenVrGlRenderer.mirror_mode
+MIRROR_SCENE = 'scene'  # draw the scene once more, from the left eye, into the window
+MIRROR_LEFT_EYE = 'left'  # copy the rendered left eye image to the window
+MIRROR_RIGHT_EYE = 'right'  # copy the rendered right eye image to the window
+MIRROR_BOTH_EYES = 'both'  # copy both rendered eye images to the window, side by side
+MIRROR_COMPOSITOR = 'compositor'  # copy the compositor's left eye output, from IVRCompositor.getMirrorTextureGL()
+
+
+def _crop_to_aspect(x, y, width, height, aspect):
+    "Returns the centered sub-rectangle of a rectangle, with width / height equal to aspect"
+    if width > aspect * height:
+        cropped = int(round(aspect * height))
+        return x + (width - cropped) // 2, y, cropped, height
+    cropped = int(round(width / aspect))
+    return x, y + (height - cropped) // 2, width, cropped
+
+
 def matrixForOpenVrMatrix(mat):
-    if len(mat.m) == 4: # HmdMatrix44_t?
-        result = numpy.matrix(
-                ((mat.m[0][0], mat.m[1][0], mat.m[2][0], mat.m[3][0]),
-                 (mat.m[0][1], mat.m[1][1], mat.m[2][1], mat.m[3][1]), 
-                 (mat.m[0][2], mat.m[1][2], mat.m[2][2], mat.m[3][2]), 
-                 (mat.m[0][3], mat.m[1][3], mat.m[2][3], mat.m[3][3]),)
-            , numpy.float32)
-    elif len(mat.m) == 3: # HmdMatrix34_t?
-        result = numpy.matrix(
-                ((mat.m[0][0], mat.m[1][0], mat.m[2][0], 0.0),
-                 (mat.m[0][1], mat.m[1][1], mat.m[2][1], 0.0), 
-                 (mat.m[0][2], mat.m[1][2], mat.m[2][2], 0.0), 
-                 (mat.m[0][3], mat.m[1][3], mat.m[2][3], 1.0),)
-            , numpy.float32)
-    return result
+    """
+    Converts an HmdMatrix34_t or HmdMatrix44_t into a 4x4 numpy.matrix in OpenGL layout.
+    Per-frame code should prefer openvr.numpy_arrays.matrices_to_gl(), which can convert
+    whole pose arrays at once, into preallocated storage.
+    """
+    return numpy.matrix(matrices_to_gl(mat)[0])
 
 
 class OpenVrFramebuffer(object):
-    "Framebuffer for rendering one eye"
+    """
+    Framebuffer for rendering one eye, or both eyes side by side, with the left eye in the left half
+    """
     
-    def __init__(self, width, height, multisample = 0):
+    def __init__(self, width, height, multisample = 0, side_by_side = False):
         self.fb = 0
         self.depth_buffer = 0
         self.texture_id = 0
@@ -43,6 +55,28 @@ class OpenVrFramebuffer(object):
         self.height = height
         self.compositor = None
         self.multisample = multisample
+        self.side_by_side = side_by_side
+        # Texture coordinate ranges submitted for each eye; None for the whole texture
+        self.bounds = None
+        self.left_bounds = openvr.VRTextureBounds_t()
+        self.right_bounds = openvr.VRTextureBounds_t()
+        self.set_eye_size(width // 2 if side_by_side else width, height)
+
+    def set_eye_size(self, eye_width, eye_height):
+        """
+        Render and submit only the lower left eye_width by eye_height pixels of each eye image, e.g. for
+        dynamic resolution. With side_by_side, the right eye image starts at x = eye_width.
+        """
+        self.eye_width = eye_width
+        self.eye_height = eye_height
+        u = eye_width / self.width
+        v = eye_height / self.height
+        self.left_bounds.uMin, self.left_bounds.vMin, self.left_bounds.uMax, self.left_bounds.vMax = 0.0, 0.0, u, v
+        self.right_bounds.uMin, self.right_bounds.vMin, self.right_bounds.uMax, self.right_bounds.vMax = u, 0.0, 2 * u, v
+        if (eye_width, eye_height) == (self.width, self.height):
+            self.bounds = None
+        else:
+            self.bounds = self.left_bounds
         
     def init_gl(self):
         # Set up framebuffer and render textures
@@ -100,16 +134,36 @@ class OpenVrFramebuffer(object):
         self.texture.eType = openvr.TextureType_OpenGL
         self.texture.eColorSpace = openvr.ColorSpace_Gamma
         
-    def submit(self, eye):
+    @property
+    def resolved_fb(self):
+        "The framebuffer holding the final image, after resolve()"
+        return self.resolve_fb if self.multisample > 0 else self.fb
+
+    def resolve(self):
+        "With multisample antialiasing, resolve the rendered image into the texture that is submitted"
         if self.multisample > 0:
             glBindFramebuffer(GL_READ_FRAMEBUFFER, self.fb)
             glBindFramebuffer(GL_DRAW_FRAMEBUFFER, self.resolve_fb)
-            glBlitFramebuffer(0, 0, self.width, self.height, 
-                              0, 0, self.width, self.height,
+            w = 2 * self.eye_width if self.side_by_side else self.eye_width
+            h = self.eye_height
+            glBlitFramebuffer(0, 0, w, h, 
+                              0, 0, w, h,
                               GL_COLOR_BUFFER_BIT, GL_LINEAR)
             glBindFramebuffer(GL_READ_FRAMEBUFFER, 0)
             glBindFramebuffer(GL_DRAW_FRAMEBUFFER, 0)
-        openvr.VRCompositor().submit(eye, self.texture)
+
+    def submit(self, eye, resolve=True):
+        if resolve:
+            self.resolve()
+        openvr.VRCompositor().submit(eye, self.texture, self.bounds)
+
+    def submit_side_by_side(self, resolve=True):
+        "Submit the left eye image, and the right eye image to its right, for side_by_side framebuffers"
+        if resolve:
+            self.resolve()
+        compositor = openvr.VRCompositor()
+        compositor.submit(openvr.Eye_Left, self.texture, self.left_bounds)
+        compositor.submit(openvr.Eye_Right, self.texture, self.right_bounds)
         
     def dispose_gl(self):
         glDeleteTextures([self.texture_id])
@@ -121,16 +175,289 @@ class OpenVrFramebuffer(object):
             glDeleteFramebuffers(1, [self.resolve_fb])
 
 
+class HiddenAreaMask(object):
+    """
+    Marks the pixels of each eye image that the headset lenses hide, in the stencil buffer,
+    so the scene drawn afterwards skips them.
+    """
+
+    def __init__(self):
+        self.shader = 0
+        self.vao = None
+        self.vbo = None
+        self.eye_ranges = dict()  # eye -> (first vertex, vertex count)
+
+    def init_gl(self, vr_system):
+        "Fetch the standard hidden area mesh of each eye, and upload both to one vertex buffer"
+        vertices = []
+        first = 0
+        for eye in (openvr.Eye_Left, openvr.Eye_Right):
+            mesh = vr_system.getHiddenAreaMesh(eye, openvr.k_eHiddenAreaMesh_Standard)
+            # Texture coordinates, with y down, to normalized device coordinates, with y up
+            ndc = hidden_area_mesh_vertices(mesh) * numpy.array([2, -2], dtype=numpy.float32) \
+                + numpy.array([-1, 1], dtype=numpy.float32)
+            vertices.append(ndc)
+            self.eye_ranges[eye] = (first, len(ndc))
+            first += len(ndc)
+        vertices = numpy.ascontiguousarray(numpy.concatenate(vertices), dtype=numpy.float32)
+        vertex_shader = compileShader(
+            shader_string("""
+            layout(location = 0) in vec2 in_Position;
+            
+            void main() {
+              gl_Position = vec4(in_Position, 0.0, 1.0);
+            }
+            """),
+            GL_VERTEX_SHADER)
+        fragment_shader = compileShader(
+            shader_string("""
+            void main() {}
+            """),
+            GL_FRAGMENT_SHADER)
+        self.shader = compileProgram(vertex_shader, fragment_shader)
+        self.vao = glGenVertexArrays(1)
+        glBindVertexArray(self.vao)
+        self.vbo = glGenBuffers(1)
+        glBindBuffer(GL_ARRAY_BUFFER, self.vbo)
+        glBufferData(GL_ARRAY_BUFFER, vertices.nbytes, vertices, GL_STATIC_DRAW)
+        glEnableVertexAttribArray(0)
+        glVertexAttribPointer(0, 2, GL_FLOAT, False, 0, None)
+        glBindVertexArray(0)
+        glBindBuffer(GL_ARRAY_BUFFER, 0)
+
+    def begin(self, eye):
+        """
+        Write the hidden area of one eye into the stencil buffer of the bound framebuffer, then leave the
+        stencil test enabled, so that only visible pixels are drawn until end() is called
+        """
+        glClear(GL_STENCIL_BUFFER_BIT)
+        glEnable(GL_STENCIL_TEST)
+        self._write_stencil(((eye, None), ))
+
+    def begin_side_by_side(self, width, height):
+        "Like begin(), for both eyes of a side by side framebuffer, where each eye is width by height pixels"
+        glClear(GL_STENCIL_BUFFER_BIT)
+        glEnable(GL_STENCIL_TEST)
+        viewport = glGetIntegerv(GL_VIEWPORT)
+        self._write_stencil(((openvr.Eye_Left, (0, 0, width, height)), (openvr.Eye_Right, (width, 0, width, height))))
+        glViewport(*viewport)
+
+    def _write_stencil(self, eye_viewports):
+        glStencilFunc(GL_ALWAYS, 1, 0xFF)
+        glStencilOp(GL_KEEP, GL_KEEP, GL_REPLACE)
+        glColorMask(GL_FALSE, GL_FALSE, GL_FALSE, GL_FALSE)
+        glDepthMask(GL_FALSE)
+        depth_test = glIsEnabled(GL_DEPTH_TEST)
+        glDisable(GL_DEPTH_TEST)
+        glUseProgram(self.shader)
+        glBindVertexArray(self.vao)
+        for eye, viewport in eye_viewports:
+            first, count = self.eye_ranges[eye]
+            if count == 0:
+                continue
+            if viewport is not None:
+                glViewport(*viewport)
+            glDrawArrays(GL_TRIANGLES, first, count)
+        glBindVertexArray(0)
+        glColorMask(GL_TRUE, GL_TRUE, GL_TRUE, GL_TRUE)
+        glDepthMask(GL_TRUE)
+        if depth_test:
+            glEnable(GL_DEPTH_TEST)
+        glStencilFunc(GL_EQUAL, 0, 0xFF)
+        glStencilOp(GL_KEEP, GL_KEEP, GL_KEEP)
+
+    def end(self):
+        glDisable(GL_STENCIL_TEST)
+
+    def dispose_gl(self):
+        if self.vao is not None:
+            glDeleteVertexArrays(1, (self.vao,))
+            glDeleteBuffers(1, (self.vbo,))
+            self.vao = None
+            self.vbo = None
+        glDeleteProgram(self.shader)
+        self.shader = 0
+
+
+class FrameUniforms(object):
+    """
+    Uniform buffer holding the camera matrices of each eye, uploaded once per frame, so actors only need to
+    upload their own model matrices. Matrices use the same layout as the arguments of display_gl():
+
+        layout(std140, binding = 0) uniform FrameMatrices {
+            mat4 projection;  // eye to clip space
+            mat4 view;  // room to eye space; the modelview argument of display_gl()
+            mat4 view_projection;  // room to clip space
+            mat4 hmd_pose;  // head to room space
+        };
+
+    Both eyes' blocks live in one buffer; bind(eye) selects which one the shaders see.
+
+    bind() and unbind() keep track, in the class attribute bound, of whether any FrameUniforms is bound, so
+    actors can tell without querying OpenGL. Actors drawn without OpenVrGlRenderer find bound False. They keep
+    their own FrameUniforms, and upload the matrices passed to their display_gl() with bind_matrices().
+    """
+
+    binding = 0
+    bound = False
+
+    def __init__(self):
+        self.ubo = None
+        self.block_stride = 0
+        self.matrices = None
+        self._camera_pose = numpy.identity(4, dtype=numpy.float32)
+
+    def init_gl(self):
+        block_size = 4 * 4 * 4 * 4
+        alignment = int(glGetIntegerv(GL_UNIFORM_BUFFER_OFFSET_ALIGNMENT))
+        self.block_stride = (block_size + alignment - 1) // alignment * alignment
+        # (eye, matrix, 4, 4), padded so each eye's block starts at an allowed buffer offset
+        storage = numpy.zeros((2, self.block_stride // 4), dtype=numpy.float32)
+        self.matrices = storage[:, :block_size // 4].reshape(2, 4, 4, 4)
+        self._storage = storage
+        self.ubo = glGenBuffers(1)
+        glBindBuffer(GL_UNIFORM_BUFFER, self.ubo)
+        glBufferData(GL_UNIFORM_BUFFER, storage.nbytes, None, GL_DYNAMIC_DRAW)
+        glBindBuffer(GL_UNIFORM_BUFFER, 0)
+
+    def update(self, modelviews, projections, hmd_pose):
+        "Upload the left and right eye matrices with a single call"
+        for eye in range(2):
+            projection, view, view_projection, pose = self.matrices[eye]
+            projection[:] = projections[eye]
+            view[:] = modelviews[eye]
+            numpy.matmul(view, projection, out=view_projection)
+            pose[:] = hmd_pose
+        glBindBuffer(GL_UNIFORM_BUFFER, self.ubo)
+        glBufferSubData(GL_UNIFORM_BUFFER, 0, self._storage.nbytes, self._storage)
+        glBindBuffer(GL_UNIFORM_BUFFER, 0)
+
+    def bind(self, eye):
+        "Show one eye's matrices to shaders, at the FrameMatrices binding point"
+        glBindBufferRange(GL_UNIFORM_BUFFER, self.binding, self.ubo, eye * self.block_stride, 4 * 4 * 4 * 4)
+        FrameUniforms.bound = True
+
+    def bind_matrices(self, modelview, projection):
+        "Upload and bind one camera's matrices, with the camera pose, the rigid inverse of the view, as hmd_pose"
+        # The transposed GL layout modelview holds the 3x4 matrix inverse_matrices_to_gl() expects in its first rows
+        inverse_matrices_to_gl(numpy.transpose(modelview)[:3], out=self._camera_pose)
+        self.update((modelview, modelview), (projection, projection), self._camera_pose)
+        self.bind(0)
+
+    @staticmethod
+    def unbind():
+        "Leave nothing bound at the FrameMatrices binding point"
+        glBindBufferBase(GL_UNIFORM_BUFFER, FrameUniforms.binding, 0)
+        FrameUniforms.bound = False
+
+    def dispose_gl(self):
+        if self.ubo is not None:
+            glDeleteBuffers(1, (self.ubo,))
+            self.ubo = None
+
+
+class StereoUniforms(object):
+    """
+    Uniform buffer holding the matrices of both eyes, for actors that draw both eyes in a single pass.
+    Matrices use the same layout as the modelview and projection arguments of display_gl():
+
+        layout(std140, binding = 1) uniform StereoMatrices {
+            mat4 view_projection[2];  // room to clip space, left eye then right eye
+            mat4 view[2];  // room to eye space
+            mat4 projection[2];  // eye to clip space
+        };
+
+    Single pass actors draw each primitive twice, with instanced draws, and use gl_InstanceID % 2 as the
+    eye index. Into the side by side framebuffer, the vertex shader squeezes each clip space position into
+    its eye's half, and clips it at the center line:
+
+        clip.x = 0.5 * clip.x + (eye == 0 ? -0.5 : 0.5) * clip.w;
+        gl_ClipDistance[0] = eye == 0 ? -clip.x : clip.x;
+    """
+
+    binding = 1
+
+    def __init__(self):
+        self.ubo = None
+        self.matrices = numpy.zeros((3, 2, 4, 4), dtype=numpy.float32)
+
+    def init_gl(self):
+        self.ubo = glGenBuffers(1)
+        glBindBuffer(GL_UNIFORM_BUFFER, self.ubo)
+        glBufferData(GL_UNIFORM_BUFFER, self.matrices.nbytes, None, GL_DYNAMIC_DRAW)
+        glBindBuffer(GL_UNIFORM_BUFFER, 0)
+
+    def pack(self, modelviews, projections):
+        "Fill matrices, whose bytes are the std140 contents of the StereoMatrices block, from both eyes' matrices"
+        view_projection, view, projection = self.matrices
+        for eye in range(2):
+            view[eye] = modelviews[eye]
+            projection[eye] = projections[eye]
+        numpy.matmul(view, projection, out=view_projection)
+        return self.matrices
+
+    def update(self, modelviews, projections):
+        "Upload both eyes' matrices with a single call, and bind the buffer to its binding point"
+        self.pack(modelviews, projections)
+        glBindBuffer(GL_UNIFORM_BUFFER, self.ubo)
+        glBufferSubData(GL_UNIFORM_BUFFER, 0, self.matrices.nbytes, self.matrices)
+        glBindBuffer(GL_UNIFORM_BUFFER, 0)
+        glBindBufferBase(GL_UNIFORM_BUFFER, self.binding, self.ubo)
+
+    def dispose_gl(self):
+        if self.ubo is not None:
+            glDeleteBuffers(1, (self.ubo,))
+            self.ubo = None
+
+
 class OpenVrGlRenderer(list):
     "Renders to virtual reality headset using OpenVR and OpenGL APIs"
 
-    def __init__(self, actor=None, window_size=(800,600), multisample=0):
+    def __init__(self, actor=None, window_size=(800,600), multisample=0, hidden_area_mask=False,
+                 side_by_side=False, single_pass_stereo=False, resolution_governor=None, profiler=None):
+        """
+        With hidden_area_mask=True, pixels hidden by the headset lenses are masked out with the stencil buffer
+        before each eye is drawn, which saves fragment shading in fill-rate bound scenes. Actors must then not
+        change the stencil test state themselves.
+
+        With side_by_side=True, both eyes are rendered into one double-width framebuffer, which is bound and
+        resolved once per frame, instead of once per eye. Each eye is submitted with its half's texture bounds.
+        Actors must then not change the scissor test state themselves.
+
+        With single_pass_stereo=True, which implies side_by_side, actors that have a display_stereo_gl() method
+        draw both eyes at once, with matrices from a StereoUniforms buffer, so their per-draw CPU overhead is
+        paid once per frame rather than once per eye. It is called with the same (modelview, projection)
+        arguments as display_gl(), as pairs of left and right eye matrices. Other actors are drawn once per eye.
+
+        When do_mirror is set, the window also shows the view, as chosen by mirror_mode. The default,
+        MIRROR_SCENE, draws the scene a third time. The other modes instead copy already rendered eye images,
+        or the compositor's own output, which costs one framebuffer blit.
+
+        With a ResolutionGovernor, from openvr.resolution_governor, eye framebuffers are allocated for the
+        governor's max_scale, and each frame renders into, and submits, only the fraction chosen by the governor.
+
+        With a FrameProfiler, from openvr.frame_profiler, each frame's waitGetPoses() wait, actor drawing,
+        multisample resolve, submit and mirror phases are timed. Each actor gets its own phase, named after
+        its class. Frames are labeled with Compositor_FrameTiming.m_nFrameIndex.
+
+        During each actor display_gl() call, the current eye's camera matrices are available to shaders in the
+        FrameMatrices uniform block, see FrameUniforms. Nothing is left bound there after the frame.
+        """
         self.vr_system = None
         self.left_fb = None
         self.right_fb = None
+        self.stereo_fb = None
+        self.side_by_side = side_by_side or single_pass_stereo
+        self.stereo_uniforms = StereoUniforms() if single_pass_stereo else None
+        self.frame_uniforms = FrameUniforms()
+        self.resolution_governor = resolution_governor
+        self.render_target_size = None  # recommended size of one eye image, at scale 1.0
+        self.profiler = profiler
+        self._actor_phases = dict()  # id(actor) -> profiler phase name
+        self._frame_timing = openvr.Compositor_FrameTiming()
         self.window_size = window_size
-        poses_t = openvr.TrackedDevicePose_t * openvr.k_unMaxTrackedDeviceCount
-        self.poses = poses_t()
+        self.pose_buffers = PoseBuffers(game_poses=False)
+        self.poses = self.pose_buffers.render_poses
         if actor is not None:
             try:
                 len(actor)
@@ -138,84 +465,317 @@ class OpenVrGlRenderer(list):
             except TypeError:
                 self.append(actor)
         self.do_mirror = False
+        self.mirror_mode = MIRROR_SCENE
+        self._mirror_texture = None  # (texture id, shared texture handle) from getMirrorTextureGL()
+        self._mirror_fb = 0
         self.multisample = multisample
         self.compositor = None
+        self.hidden_area_mask = HiddenAreaMask() if hidden_area_mask else None
+        # Preallocated per-frame matrices
+        self.hmd_pose = numpy.identity(4, dtype=numpy.float32)  # head_X_room in Kane notation
+        self.hmd_view = numpy.identity(4, dtype=numpy.float32)  # room_X_head in Kane notation
+        self.modelview_left = numpy.identity(4, dtype=numpy.float32)
+        self.modelview_right = numpy.identity(4, dtype=numpy.float32)
 
     def init_gl(self):
         "allocate OpenGL resources"
         self.vr_system = openvr.init(openvr.VRApplication_Scene)
         w, h = self.vr_system.getRecommendedRenderTargetSize()
-        self.left_fb = OpenVrFramebuffer(w, h, multisample=self.multisample)
-        self.right_fb = OpenVrFramebuffer(w, h, multisample=self.multisample)
+        self.render_target_size = (w, h)
+        if self.resolution_governor is not None:
+            max_scale = self.resolution_governor.max_scale
+            w, h = int(w * max_scale), int(h * max_scale)
+        if self.side_by_side:
+            self.stereo_fb = OpenVrFramebuffer(2 * w, h, multisample=self.multisample, side_by_side=True)
+        else:
+            self.left_fb = OpenVrFramebuffer(w, h, multisample=self.multisample)
+            self.right_fb = OpenVrFramebuffer(w, h, multisample=self.multisample)
         self.compositor = openvr.VRCompositor()
         if self.compositor is None:
             raise Exception("Unable to create compositor") 
-        self.left_fb.init_gl()
-        self.right_fb.init_gl()
+        self.pose_buffers.bind(compositor=self.compositor, system=self.vr_system)
+        if self.stereo_fb is not None:
+            self.stereo_fb.init_gl()
+            if self.stereo_uniforms is not None:
+                self.stereo_uniforms.init_gl()
+        else:
+            self.left_fb.init_gl()
+            self.right_fb.init_gl()
+        self.frame_uniforms.init_gl()
+        if self.hidden_area_mask is not None:
+            self.hidden_area_mask.init_gl(self.vr_system)
         # Compute projection matrix
         zNear = 0.2
         zFar = 500.0
-        self.projection_left = numpy.asarray(matrixForOpenVrMatrix(self.vr_system.getProjectionMatrix(
+        self.projection_left = matrices_to_gl(self.vr_system.getProjectionMatrix(
                 openvr.Eye_Left, 
-                zNear, zFar)))
-        self.projection_right = numpy.asarray(matrixForOpenVrMatrix(self.vr_system.getProjectionMatrix(
+                zNear, zFar))[0]
+        self.projection_right = matrices_to_gl(self.vr_system.getProjectionMatrix(
                 openvr.Eye_Right, 
-                zNear, zFar)))
-        self.view_left = matrixForOpenVrMatrix(
-            self.vr_system.getEyeToHeadTransform(openvr.Eye_Left)).I  # head_X_eye in Kane notation
-        self.view_right = matrixForOpenVrMatrix(
-            self.vr_system.getEyeToHeadTransform(openvr.Eye_Right)).I  # head_X_eye in Kane notation
+                zNear, zFar))[0]
+        self.view_left = inverse_matrices_to_gl(
+            self.vr_system.getEyeToHeadTransform(openvr.Eye_Left))[0]  # head_X_eye in Kane notation
+        self.view_right = inverse_matrices_to_gl(
+            self.vr_system.getEyeToHeadTransform(openvr.Eye_Right))[0]  # head_X_eye in Kane notation
         for actor in self:
             actor.init_gl()
 
     def render_scene(self):
         if self.compositor is None:
             return
-        self.compositor.waitGetPoses(self.poses, None)
+        profiler = self.profiler
+        if profiler is None:
+            self.render_frame()
+            return
+        profiler.begin_frame()
+        try:
+            self.render_frame()
+        finally:
+            profiler.end_frame()
+
+    def render_frame(self):
+        "Wait for poses, then render, submit, and possibly mirror, one frame"
+        profiler = self.profiler
+        if profiler is not None:
+            profiler.begin('wait_get_poses')
+        self.pose_buffers.wait_get_poses()
+        if profiler is not None:
+            profiler.end()
+            self.compositor.getFrameTiming(0, self._frame_timing)
+            profiler.set_frame_index(self._frame_timing.m_nFrameIndex)
         hmd_pose0 = self.poses[openvr.k_unTrackedDeviceIndex_Hmd]
         if not hmd_pose0.bPoseIsValid:
             return
         hmd_pose1 = hmd_pose0.mDeviceToAbsoluteTracking # head_X_room in Kane notation
-        hmd_pose = matrixForOpenVrMatrix(hmd_pose1).I # room_X_head in Kane notation
-        # Use the pose to compute things
-        modelview = hmd_pose
-        mvl = modelview * self.view_left # room_X_eye(left) in Kane notation
-        mvr = modelview * self.view_right # room_X_eye(right) in Kane notation
-        # Repack the resulting matrices to have default stride, to avoid
-        # problems with weird strides and OpenGL
-        mvl = numpy.asarray(numpy.matrix(mvl, dtype=numpy.float32))
-        mvr = numpy.asarray(numpy.matrix(mvr, dtype=numpy.float32))
+        modelview = inverse_matrices_to_gl(hmd_pose1, out=self.hmd_view) # room_X_head in Kane notation
+        # Use the pose to compute things. Results are written into contiguous
+        # preallocated arrays, so OpenGL sees the default stride.
+        mvl = numpy.matmul(modelview, self.view_left, out=self.modelview_left) # room_X_eye(left) in Kane notation
+        mvr = numpy.matmul(modelview, self.view_right, out=self.modelview_right) # room_X_eye(right) in Kane notation
+        matrices_to_gl(hmd_pose1, out=self.hmd_pose)
+        self.frame_uniforms.update((mvl, mvr), (self.projection_left, self.projection_right), self.hmd_pose)
+        if self.resolution_governor is not None:
+            self.resolution_governor.update()
+            self.set_eye_size(*self.resolution_governor.eye_size(*self.render_target_size))
         # 1) On-screen render:
-        if self.do_mirror:
+        if self.do_mirror and self.mirror_mode == MIRROR_SCENE:
             glViewport(0, 0, self.window_size[0], self.window_size[1])
+            self.frame_uniforms.bind(openvr.Eye_Left)
             # Display left eye view to screen
             self.display_gl(mvl, self.projection_left)
         # 2) VR render
+        if self.stereo_fb is not None:
+            self.render_side_by_side(mvl, mvr)
+        else:
+            self.render_eyes(mvl, mvr)
+        # Don't leave this frame's matrices bound for actors drawn elsewhere
+        FrameUniforms.unbind()
+        # 3) On-screen copy of the VR render
+        if self.do_mirror and self.mirror_mode != MIRROR_SCENE:
+            if profiler is not None:
+                profiler.begin('mirror')
+            self.blit_mirror_gl()
+            if profiler is not None:
+                profiler.end()
+
+    def set_eye_size(self, width, height):
+        "Render each eye image into a width by height pixel region of its framebuffer"
+        for fb in (self.left_fb, self.right_fb, self.stereo_fb):
+            if fb is not None:
+                w = min(width, fb.width // 2 if fb.side_by_side else fb.width)
+                fb.set_eye_size(w, min(height, fb.height))
+
+    def render_eyes(self, mvl, mvr):
+        "Render and submit each eye, with its own framebuffer"
         # Left eye view
         glBindFramebuffer(GL_FRAMEBUFFER, self.left_fb.fb)
-        glViewport(0, 0, self.left_fb.width, self.left_fb.height)
-        self.display_gl(mvl, self.projection_left)
-        self.left_fb.submit(openvr.Eye_Left)
+        glViewport(0, 0, self.left_fb.eye_width, self.left_fb.eye_height)
+        self.display_eye_gl(openvr.Eye_Left, mvl, self.projection_left)
+        self.submit_gl(self.left_fb, openvr.Eye_Left)
         # self.compositor.submit(openvr.Eye_Left, self.left_fb.texture)
         # Right eye view
         glBindFramebuffer(GL_FRAMEBUFFER, self.right_fb.fb)
-        self.display_gl(mvr, self.projection_right)
-        self.right_fb.submit(openvr.Eye_Right)
+        self.display_eye_gl(openvr.Eye_Right, mvr, self.projection_right)
+        self.submit_gl(self.right_fb, openvr.Eye_Right)
         # self.compositor.submit(openvr.Eye_Right, self.right_fb.texture)
         glBindFramebuffer(GL_FRAMEBUFFER, 0)
         
+    def submit_gl(self, fb, eye=None):
+        "Resolve and submit one eye's framebuffer, or, with eye None, both eyes of the side by side framebuffer"
+        profiler = self.profiler
+        if profiler is not None:
+            profiler.begin('resolve')
+        fb.resolve()
+        if profiler is not None:
+            profiler.end()
+            profiler.begin('submit')
+        if eye is None:
+            fb.submit_side_by_side(resolve=False)
+        else:
+            fb.submit(eye, resolve=False)
+        if profiler is not None:
+            profiler.end()
+
+    def _actor_phase(self, actor):
+        "Profiler phase name of an actor: its class name, numbered if several actors share a class"
+        name = self._actor_phases.get(id(actor))
+        if name is None:
+            name = type(actor).__name__
+            count = 1
+            while name in self._actor_phases.values():
+                count += 1
+                name = f'{type(actor).__name__}#{count}'
+            self._actor_phases[id(actor)] = name
+        return name
+
+    def _eye_image(self, eye):
+        "Returns the framebuffer, and x, y, width and height, of one eye's rendered image"
+        if self.stereo_fb is not None:
+            w = self.stereo_fb.eye_width
+            return self.stereo_fb.resolved_fb, eye * w, 0, w, self.stereo_fb.eye_height
+        fb = self.left_fb if eye == openvr.Eye_Left else self.right_fb
+        return fb.resolved_fb, 0, 0, fb.eye_width, fb.eye_height
+
+    def blit_mirror_gl(self):
+        "Copy eye images, as selected by mirror_mode, to the window"
+        if self.mirror_mode == MIRROR_COMPOSITOR:
+            self._blit_compositor_mirror_gl()
+            return
+        eyes = {
+            MIRROR_LEFT_EYE: (openvr.Eye_Left, ),
+            MIRROR_RIGHT_EYE: (openvr.Eye_Right, ),
+            MIRROR_BOTH_EYES: (openvr.Eye_Left, openvr.Eye_Right),
+        }[self.mirror_mode]
+        self._blit_to_window_gl([self._eye_image(eye) for eye in eyes])
+
+    def _blit_compositor_mirror_gl(self):
+        if self._mirror_texture is None:
+            texture_id, handle = self.compositor.getMirrorTextureGL(openvr.Eye_Left)
+            self._mirror_texture = (texture_id.value, handle)
+            self._mirror_fb = glGenFramebuffers(1)
+            glBindFramebuffer(GL_READ_FRAMEBUFFER, self._mirror_fb)
+            glFramebufferTexture2D(GL_READ_FRAMEBUFFER, GL_COLOR_ATTACHMENT0, GL_TEXTURE_2D, texture_id.value, 0)
+            glBindTexture(GL_TEXTURE_2D, texture_id.value)
+            self._mirror_size = (
+                int(glGetTexLevelParameteriv(GL_TEXTURE_2D, 0, GL_TEXTURE_WIDTH)),
+                int(glGetTexLevelParameteriv(GL_TEXTURE_2D, 0, GL_TEXTURE_HEIGHT)))
+            glBindTexture(GL_TEXTURE_2D, 0)
+        handle = self._mirror_texture[1]
+        self.compositor.lockGLSharedTextureForAccess(handle)
+        self._blit_to_window_gl([(self._mirror_fb, 0, 0) + self._mirror_size])
+        self.compositor.unlockGLSharedTextureForAccess(handle)
+
+    def _blit_to_window_gl(self, images):
+        "Copy (framebuffer, x, y, width, height) images to equal-width columns of the window, cropped to fit"
+        window_width, window_height = self.window_size
+        column_width = window_width // len(images)
+        glBindFramebuffer(GL_DRAW_FRAMEBUFFER, 0)
+        for column, (fb, x, y, w, h) in enumerate(images):
+            x, y, w, h = _crop_to_aspect(x, y, w, h, column_width / window_height)
+            glBindFramebuffer(GL_READ_FRAMEBUFFER, fb)
+            glBlitFramebuffer(x, y, x + w, y + h,
+                              column * column_width, 0, (column + 1) * column_width, window_height,
+                              GL_COLOR_BUFFER_BIT, GL_LINEAR)
+        glBindFramebuffer(GL_READ_FRAMEBUFFER, 0)
+
+    def render_side_by_side(self, modelview_left, modelview_right):
+        "Render both eyes into the halves of one framebuffer, and submit it"
+        fb = self.stereo_fb
+        w = fb.eye_width
+        h = fb.eye_height
+        glBindFramebuffer(GL_FRAMEBUFFER, fb.fb)
+        if self.stereo_uniforms is not None:
+            self.render_single_pass(modelview_left, modelview_right)
+        else:
+            # glClear() ignores the viewport, so the scissor rectangle keeps each eye's clear in its own half
+            glEnable(GL_SCISSOR_TEST)
+            glViewport(0, 0, w, h)
+            glScissor(0, 0, w, h)
+            self.display_eye_gl(openvr.Eye_Left, modelview_left, self.projection_left)
+            glViewport(w, 0, w, h)
+            glScissor(w, 0, w, h)
+            self.display_eye_gl(openvr.Eye_Right, modelview_right, self.projection_right)
+            glDisable(GL_SCISSOR_TEST)
+        self.submit_gl(fb)
+        glBindFramebuffer(GL_FRAMEBUFFER, 0)
+
+    def render_single_pass(self, modelview_left, modelview_right):
+        "Draw both eyes into the bound side by side framebuffer, with one pass over the single pass actors"
+        fb = self.stereo_fb
+        w = fb.eye_width
+        h = fb.eye_height
+        modelviews = (modelview_left, modelview_right)
+        projections = (self.projection_left, self.projection_right)
+        self.stereo_uniforms.update(modelviews, projections)
+        glViewport(0, 0, 2 * w, h)
+        glClearColor(0.5, 0.5, 0.5, 0.0) # gray background
+        glClear(GL_COLOR_BUFFER_BIT | GL_DEPTH_BUFFER_BIT)
+        if self.hidden_area_mask is not None:
+            self.hidden_area_mask.begin_side_by_side(w, h)
+        profiler = self.profiler
+        glEnable(GL_CLIP_DISTANCE0)
+        for actor in self:
+            if hasattr(actor, 'display_stereo_gl'):
+                if profiler is not None:
+                    profiler.begin(self._actor_phase(actor))
+                actor.display_stereo_gl(modelviews, projections)
+                if profiler is not None:
+                    profiler.end()
+        glDisable(GL_CLIP_DISTANCE0)
+        for eye, x in ((openvr.Eye_Left, 0), (openvr.Eye_Right, w)):
+            glViewport(x, 0, w, h)
+            self.frame_uniforms.bind(eye)
+            for actor in self:
+                if not hasattr(actor, 'display_stereo_gl'):
+                    if profiler is not None:
+                        profiler.begin(self._actor_phase(actor))
+                    actor.display_gl(modelviews[eye], projections[eye])
+                    if profiler is not None:
+                        profiler.end()
+        if self.hidden_area_mask is not None:
+            self.hidden_area_mask.end()
+
+    def display_eye_gl(self, eye, modelview, projection):
+        "Draw the scene for one eye, into the bound framebuffer"
+        self.frame_uniforms.bind(eye)
+        if self.hidden_area_mask is None:
+            self.display_gl(modelview, projection)
+            return
+        self.hidden_area_mask.begin(eye)
+        self.display_gl(modelview, projection)
+        self.hidden_area_mask.end()
+
     def display_gl(self, modelview, projection):
         glClearColor(0.5, 0.5, 0.5, 0.0) # gray background
         glClear(GL_COLOR_BUFFER_BIT | GL_DEPTH_BUFFER_BIT)
+        profiler = self.profiler
+        if profiler is None:
+            for actor in self:
+                actor.display_gl(modelview, projection)
+            return
         for actor in self:
+            profiler.begin(self._actor_phase(actor))
             actor.display_gl(modelview, projection)
+            profiler.end()
 
     def dispose_gl(self):
         for actor in self:
             actor.dispose_gl()
+        if self.hidden_area_mask is not None:
+            self.hidden_area_mask.dispose_gl()
+        if self._mirror_texture is not None:
+            glDeleteFramebuffers(1, [self._mirror_fb])
+            self.compositor.releaseSharedGLTexture(*self._mirror_texture)
+            self._mirror_texture = None
         if self.vr_system is not None:
             openvr.shutdown()
             self.vr_system = None
         if self.left_fb is not None:
             self.left_fb.dispose_gl()
             self.right_fb.dispose_gl()
+        if self.stereo_fb is not None:
+            self.stereo_fb.dispose_gl()
+            self.stereo_fb = None
+        if self.stereo_uniforms is not None:
+            self.stereo_uniforms.dispose_gl()
+        self.frame_uniforms.dispose_gl()
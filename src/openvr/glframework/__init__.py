@@ -1,14 +1,16 @@
 import inspect
+import sys
 import textwrap
 
 
-def shader_string(body, glsl_version='450 core'):
+def shader_string(body, glsl_version='450 core', defines=()):
     """
     Call this method from a function that defines a literal shader string as the "body" argument.
-    Dresses up a shader string in three ways:
+    Dresses up a shader string in four ways:
         1) Insert #version at the top
-        2) Insert #line number declaration
-        3) un-indents
+        2) Insert a #define line for each name in defines, e.g. to compile variants of one shader
+        3) Insert #line number declaration
+        4) un-indents
     The line number information can help debug glsl compile errors.
     The version string needs to be the very first characters in the shader,
     which can be distracting, requiring backslashes or other tricks.
@@ -17,10 +19,11 @@ def shader_string(body, glsl_version='450 core'):
     """
     line_count = len(body.split('\n'))
     line_number = inspect.currentframe().f_back.f_lineno + 1 - line_count
+    define_lines = ''.join('#define %s\n' % name for name in defines)
     return """\
 #version %s
-%s
-""" % (glsl_version, shader_substring(body, stack_frame=2))
+%s%s
+""" % (glsl_version, define_lines, shader_substring(body, stack_frame=2))
 
 
 def shader_substring(body, stack_frame=1):
@@ -33,8 +36,10 @@ def shader_substring(body, stack_frame=1):
     The unindenting allows you to type the shader code at a pleasing indent level
     in your python method, while still creating an unindented GLSL string at the end.
     """
-    line_count = len(body.splitlines(True))
-    line_number = inspect.stack()[stack_frame][2] + 1 - line_count
+    line_number = inspect.stack()[stack_frame][2]
+    if sys.version_info < (3, 8):
+        # Older versions report the last line of a call spanning several lines, rather than the first
+        line_number += 1 - len(body.splitlines(True))
     return """\
 #line %d
 %s
@@ -0,0 +1,233 @@
+#!/bin/env python
+
+# file numpy_arrays.py
+
+import ctypes
+from ctypes import sizeof
+
+import numpy
+
+import openvr
+
+"""
+Zero-copy NumPy views of OpenVR ctypes structures, for vectorized per-frame processing
+"""
+
+
+def _structure_dtype(struct_type, fields):
+    """
+    Build a numpy structured dtype that exactly overlays the memory layout of a ctypes Structure.
+    Field offsets and the item size are taken from ctypes itself, so platform packing rules are respected.
+    """
+    names = []
+    formats = []
+    offsets = []
+    for name, dtype in fields:
+        names.append(name)
+        formats.append(dtype)
+        offsets.append(getattr(struct_type, name).offset)
+    return numpy.dtype({
+        'names': names,
+        'formats': formats,
+        'offsets': offsets,
+        'itemsize': sizeof(struct_type),
+    })
+
+
+# Mirrors openvr.TrackedDevicePose_t
+tracked_device_pose_dtype = _structure_dtype(openvr.TrackedDevicePose_t, (
+    ('mDeviceToAbsoluteTracking', (numpy.float32, (3, 4))),
+    ('vVelocity', (numpy.float32, (3,))),
+    ('vAngularVelocity', (numpy.float32, (3,))),
+    ('eTrackingResult', numpy.uint32),
+    ('bPoseIsValid', numpy.uint8),
+    ('bDeviceIsConnected', numpy.uint8),
+))
+
+
+# Mirrors openvr.VREvent_t. The VREvent_Data_t union is kept as raw bytes, to be decoded per event type.
+vr_event_dtype = _structure_dtype(openvr.VREvent_t, (
+    ('eventType', numpy.uint32),
+    ('trackedDeviceIndex', numpy.uint32),
+    ('eventAgeSeconds', numpy.float32),
+    ('data', (numpy.uint8, (sizeof(openvr.VREvent_Data_t),))),
+))
+
+
+def pose_array_as_numpy(pose_array):
+    """
+    Returns a structured numpy array, with dtype tracked_device_pose_dtype, sharing memory with
+    a ctypes array of openvr.TrackedDevicePose_t. No data are copied, so the numpy array always
+    reflects the most recent contents of the ctypes array, e.g. after each call to waitGetPoses().
+    """
+    if not issubclass(pose_array._type_, openvr.TrackedDevicePose_t):
+        raise TypeError(f"Expected an array of TrackedDevicePose_t, not of {pose_array._type_.__name__}")
+    return numpy.frombuffer(pose_array, dtype=tracked_device_pose_dtype, count=len(pose_array))
+
+
+class PoseArrayView(object):
+    """
+    Vectorized, zero-copy view of a ctypes array of openvr.TrackedDevicePose_t.
+
+    For the default array of k_unMaxTrackedDeviceCount poses:
+        matrices           (64, 3, 4) float32  device-to-absolute-tracking transforms
+        velocities         (64, 3) float32     meters per second
+        angular_velocities (64, 3) float32     radians per second
+        tracking_results   (64,) uint32        ETrackingResult values
+        valid              (64,) bool          bPoseIsValid
+        connected          (64,) bool          bDeviceIsConnected
+    All of these arrays alias the ctypes memory, so they need only be created once.
+    """
+
+    def __init__(self, pose_array=None):
+        if pose_array is None:
+            pose_array = (openvr.TrackedDevicePose_t * openvr.k_unMaxTrackedDeviceCount)()
+        self.pose_array = pose_array
+        self.array = pose_array_as_numpy(pose_array)
+        self.matrices = self.array['mDeviceToAbsoluteTracking']
+        self.velocities = self.array['vVelocity']
+        self.angular_velocities = self.array['vAngularVelocity']
+        self.tracking_results = self.array['eTrackingResult']
+        self.valid = self.array['bPoseIsValid'].view(numpy.bool_)
+        self.connected = self.array['bDeviceIsConnected'].view(numpy.bool_)
+
+    def __len__(self):
+        return len(self.array)
+
+    def valid_indices(self):
+        """Device indices with a valid pose"""
+        return numpy.flatnonzero(self.valid)
+
+
+def _as_matrix_stack(matrices):
+    """
+    Returns a float32 numpy array of shape (N, 3, 4) or (N, 4, 4), without copying when possible,
+    for a single HmdMatrix34_t/HmdMatrix44_t, a ctypes array of either of those or of TrackedDevicePose_t,
+    a PoseArrayView, or a numpy array of 3x4 or 4x4 matrices.
+    """
+    if isinstance(matrices, PoseArrayView):
+        return matrices.matrices
+    if isinstance(matrices, openvr.HmdMatrix34_t):
+        return numpy.frombuffer(matrices, dtype=numpy.float32).reshape(1, 3, 4)
+    if isinstance(matrices, openvr.HmdMatrix44_t):
+        return numpy.frombuffer(matrices, dtype=numpy.float32).reshape(1, 4, 4)
+    if isinstance(matrices, ctypes.Array):
+        element_type = matrices._type_
+        if issubclass(element_type, openvr.TrackedDevicePose_t):
+            return pose_array_as_numpy(matrices)['mDeviceToAbsoluteTracking']
+        if issubclass(element_type, openvr.HmdMatrix34_t):
+            return numpy.frombuffer(matrices, dtype=numpy.float32).reshape(-1, 3, 4)
+        if issubclass(element_type, openvr.HmdMatrix44_t):
+            return numpy.frombuffer(matrices, dtype=numpy.float32).reshape(-1, 4, 4)
+        raise TypeError(f"Cannot convert an array of {element_type.__name__} to matrices")
+    matrices = numpy.asarray(matrices, dtype=numpy.float32)
+    if matrices.shape[-2:] not in ((3, 4), (4, 4)):
+        raise ValueError(f"Expected 3x4 or 4x4 matrices, not shape {matrices.shape}")
+    return matrices.reshape((-1, ) + matrices.shape[-2:])
+
+
+def _output_stack(count, out):
+    if out is None:
+        return numpy.empty((count, 4, 4), dtype=numpy.float32)
+    if out.shape[-2:] != (4, 4) or out.dtype != numpy.float32 or not out.flags.c_contiguous:
+        raise ValueError("out must be a C-contiguous float32 array of 4x4 matrices")
+    out_stack = out.reshape(-1, 4, 4)  # a view, because out is contiguous
+    if len(out_stack) != count:
+        raise ValueError(f"out holds {len(out_stack)} matrices, but {count} are needed")
+    return out_stack
+
+
+def matrices_to_gl(matrices, out=None):
+    """
+    Converts OpenVR matrices to contiguous float32 4x4 matrices in OpenGL (column-major) layout,
+    suitable for glUniformMatrix4fv(..., False, ...) and for right-multiplying row vectors.
+
+    "matrices" may be a single HmdMatrix34_t or HmdMatrix44_t, a ctypes array of those,
+    a ctypes array of TrackedDevicePose_t (mDeviceToAbsoluteTracking is used),
+    a PoseArrayView, or a numpy array of shape (..., 3, 4) or (..., 4, 4).
+    3x4 matrices are extended with a (0, 0, 0, 1) bottom row.
+
+    Returns an array of shape (N, 4, 4). Pass a preallocated array as "out" to avoid any allocation.
+    """
+    src = _as_matrix_stack(matrices)
+    result = _output_stack(len(src), out)
+    rows = src.shape[1]
+    # Column-major storage of M is the row-major storage of M transposed
+    numpy.copyto(result[:, :, :rows], src.transpose(0, 2, 1))
+    if rows == 3:
+        result[:, :3, 3] = 0.0
+        result[:, 3, 3] = 1.0
+    return result if out is None else out
+
+
+def inverse_matrices_to_gl(matrices, out=None):
+    """
+    Like matrices_to_gl(), but returns the inverse of each matrix, e.g. for converting
+    an HMD pose (head_X_room) into a view matrix (room_X_head).
+
+    3x4 matrices are treated as rigid transforms, as all OpenVR poses and eye-to-head transforms are,
+    so they are inverted by transposition, and invalid all-zero poses stay finite.
+    4x4 matrices get a general inverse.
+    """
+    src = _as_matrix_stack(matrices)
+    result = _output_stack(len(src), out)
+    if src.shape[1] == 4:
+        numpy.copyto(result, numpy.linalg.inv(src).transpose(0, 2, 1))
+        return result if out is None else out
+    rotation = src[:, :, :3]
+    translation = src[:, :, 3]
+    # Inverse is [R^T | -R^T t]. Transposed into GL layout, R^T becomes R, and -R^T t becomes the bottom row.
+    numpy.copyto(result[:, :3, :3], rotation)
+    result[:, :3, 3] = 0.0
+    numpy.einsum('nji,nj->ni', rotation, translation, out=result[:, 3, :3])
+    numpy.negative(result[:, 3, :3], out=result[:, 3, :3])
+    result[:, 3, 3] = 1.0
+    return result if out is None else out
+
+
+def _pointer_as_array(pointer, element_type, shape):
+    """Returns a numpy array sharing memory with the C array a ctypes pointer points to"""
+    count = int(numpy.prod(shape))
+    if count == 0:
+        return numpy.empty(shape, dtype=element_type)
+    if not pointer:
+        raise ValueError("Cannot create an array from a NULL pointer")
+    return numpy.ctypeslib.as_array(ctypes.cast(pointer, ctypes.POINTER(element_type)), shape=shape)
+
+
+def render_model_vertices(render_model):
+    """
+    Returns a zero-copy (unVertexCount, 8) float32 view of the vertex data in an openvr.RenderModel_t.
+    Each row holds position X, Y, Z, normal X, Y, Z, and texture coordinates U, V,
+    ready for glBufferData() with a stride of 32 bytes.
+
+    The view aliases memory owned by the OpenVR runtime, so it is only valid until
+    IVRRenderModels.freeRenderModel() is called for this model.
+    """
+    assert sizeof(openvr.RenderModel_Vertex_t) == 8 * sizeof(ctypes.c_float)
+    return _pointer_as_array(render_model.rVertexData, ctypes.c_float, (render_model.unVertexCount, 8))
+
+
+def render_model_indices(render_model):
+    """
+    Returns a zero-copy (unTriangleCount * 3,) uint16 view of the triangle vertex indices in an openvr.RenderModel_t,
+    for drawing with GL_UNSIGNED_SHORT. Valid until IVRRenderModels.freeRenderModel() is called for this model.
+    """
+    return _pointer_as_array(render_model.rIndexData, ctypes.c_uint16, (render_model.unTriangleCount * 3, ))
+
+
+def render_model_texture_pixels(texture_map):
+    """
+    Returns a zero-copy (unHeight, unWidth, 4) uint8 view of the RGBA pixels in an openvr.RenderModel_TextureMap_t.
+    Valid until IVRRenderModels.freeTexture() is called for this texture.
+    """
+    return _pointer_as_array(texture_map.rubTextureMapData, ctypes.c_uint8,
+                             (texture_map.unHeight, texture_map.unWidth, 4))
+
+
+def hidden_area_mesh_vertices(hidden_area_mesh):
+    """
+    Returns a zero-copy (unTriangleCount * 3, 2) float32 view of the vertices in an openvr.HiddenAreaMesh_t,
+    in texture coordinates, with (0, 0) at the upper left of the eye image.
+    """
+    return _pointer_as_array(hidden_area_mesh.pVertexData, ctypes.c_float, (hidden_area_mesh.unTriangleCount * 3, 2))
@@ -0,0 +1,155 @@
+#!/bin/env python
+
+# file overlay_events.py
+
+import heapq
+import itertools
+
+import openvr
+from openvr.event_buffer import EventBuffer
+
+"""
+Servicing of the event queues of many overlays, at a cost proportional to the events rather than to the overlays
+"""
+
+
+class _OverlayEntry(object):
+    __slots__ = ('handle', 'callback', 'visible', 'interval', 'next_poll', 'registered', 'events_read')
+
+    def __init__(self, handle, callback, visible):
+        self.handle = handle
+        self.callback = callback
+        self.visible = visible
+        self.interval = 1  # frames between polls
+        self.next_poll = 0
+        self.registered = True
+        self.events_read = 0
+
+
+class OverlayEventMultiplexer(object):
+    """
+    Drains the event queues of a set of registered overlays into one shared EventBuffer, once per call to poll(),
+    and passes each event to its overlay's callback, as callback(overlay_handle, event), and to an optional
+    EventDispatcher, as dispatch(event, overlay_handle). Events share memory with the buffer, so callbacks should
+    copy anything they keep beyond the call.
+
+    Overlays are kept in a queue ordered by the frame, counted in calls to poll(), at which they are next due,
+    so each poll() only visits the overlays due then. Visible overlays are due every frame. Hidden overlays, as
+    reported by isOverlayVisible() at registration and by later VREvent_OverlayShown and VREvent_OverlayHidden
+    events, are only due every max_interval frames, just to notice when they are shown again. With adaptive set,
+    the interval of a visible overlay also doubles, up to max_interval, each time it is polled without events,
+    and drops back to every frame as soon as it has one. Call wake() to poll an overlay at the next frame anyway,
+    e.g. when the user's pointer approaches it.
+    """
+
+    def __init__(self, overlay=None, dispatcher=None, capacity=256, adaptive=False, max_interval=16):
+        self.dispatcher = dispatcher
+        self.adaptive = adaptive
+        self.max_interval = max_interval
+        self.frame_count = 0
+        self._overlay = overlay
+        self._buffer = EventBuffer(capacity)
+        self._entries = dict()  # overlay handle -> _OverlayEntry
+        self._schedule = []  # heap of (next poll frame, sequence number, _OverlayEntry)
+        self._sequence = itertools.count()
+
+    def __contains__(self, overlay_handle):
+        return overlay_handle in self._entries
+
+    def __len__(self):
+        return len(self._entries)
+
+    def register(self, overlay_handle, callback=None):
+        """Start servicing an overlay's events, passing each one to callback(overlay_handle, event), if given"""
+        if self._overlay is None:
+            self._overlay = openvr.VROverlay()
+        self.unregister(overlay_handle)
+        visible = bool(self._overlay.isOverlayVisible(overlay_handle))
+        entry = self._entries[overlay_handle] = _OverlayEntry(overlay_handle, callback, visible)
+        self._push(entry, self.frame_count + 1)
+
+    def unregister(self, overlay_handle):
+        """Stop servicing an overlay, e.g. before destroying it. Its pending events stay queued."""
+        entry = self._entries.pop(overlay_handle, None)
+        if entry is not None:
+            entry.registered = False
+
+    def wake(self, overlay_handle):
+        """Poll an overlay at the next poll(), and every frame after that while it has events"""
+        entry = self._entries[overlay_handle]
+        entry.interval = 1
+        if entry.next_poll > self.frame_count + 1:
+            # The queued position is now stale; replace the entry, rather than searching the heap
+            entry.registered = False
+            entry = self._entries[overlay_handle] = _OverlayEntry(overlay_handle, entry.callback, entry.visible)
+            self._push(entry, self.frame_count + 1)
+
+    def _push(self, entry, frame):
+        entry.next_poll = frame
+        heapq.heappush(self._schedule, (frame, next(self._sequence), entry))
+
+    def poll(self):
+        """Drain and dispatch the events of the overlays due this frame. Returns the number of events."""
+        self.frame_count += 1
+        frame = self.frame_count
+        schedule = self._schedule
+        due = []
+        while schedule and schedule[0][0] <= frame:
+            entry = heapq.heappop(schedule)[2]
+            if entry.registered:
+                due.append(entry)
+        if not due:
+            return 0
+        buffer = self._buffer
+        buffer.count = 0
+        segments = []  # (entry, first slot, event count)
+        dispatched = 0
+        for entry in due:
+            entry.events_read = 0
+            while True:
+                start = buffer.count
+                count = buffer.drain_overlay(entry.handle, self._overlay, start)
+                if count:
+                    segments.append((entry, start, count))
+                    entry.events_read += count
+                if buffer.count < buffer.capacity:
+                    break
+                # Buffer full: dispatch what it holds, and keep draining this overlay
+                dispatched += self._dispatch(segments)
+                segments = []
+                buffer.count = 0
+        dispatched += self._dispatch(segments)
+        for entry in due:
+            if entry.registered:
+                self._reschedule(entry)
+        return dispatched
+
+    def _dispatch(self, segments):
+        events = self._buffer.ctypes_events
+        dispatcher = self.dispatcher
+        count = 0
+        for entry, start, length in segments:
+            handle = entry.handle
+            callback = entry.callback
+            for index in range(start, start + length):
+                event = events[index]
+                event_type = event.eventType
+                if event_type == openvr.VREvent_OverlayShown:
+                    entry.visible = True
+                elif event_type == openvr.VREvent_OverlayHidden:
+                    entry.visible = False
+                if callback is not None:
+                    callback(handle, event)
+                if dispatcher is not None:
+                    dispatcher.dispatch(event, overlay_handle=handle)
+                count += 1
+        return count
+
+    def _reschedule(self, entry):
+        if not entry.visible:
+            entry.interval = self.max_interval
+        elif entry.events_read or not self.adaptive:
+            entry.interval = 1
+        else:
+            entry.interval = min(2 * entry.interval, self.max_interval)
+        self._push(entry, self.frame_count + entry.interval)
@@ -0,0 +1,106 @@
+#!/bin/env python
+
+# file pose_buffers.py
+
+import ctypes
+
+import openvr
+from openvr.error_code import CompositorError
+
+"""
+Persistent, reusable pose buffers for allocation-free pose acquisition in render loops
+"""
+
+
+class PoseBuffers(object):
+    """
+    Owns a render pose array and a game pose array of TrackedDevicePose_t, allocated once,
+    together with the pointer and count arguments used to fill them.
+
+    IVRCompositor.waitGetPoses() and friends allocate new arrays and pointer objects whenever
+    they are not handed a ctypes array. The methods here instead call straight into the OpenVR
+    function table with cached arguments, so acquiring poses each frame is one native call and
+    creates no new Python objects beyond the returned error code.
+
+    The function table entries are resolved once, on first use or by bind(). Call bind() again
+    if OpenVR is shut down and re-initialized while this object is alive.
+    """
+
+    def __init__(self, count=openvr.k_unMaxTrackedDeviceCount, game_poses=True, compositor=None, system=None):
+        self.count = count
+        self.render_poses = (openvr.TrackedDevicePose_t * count)()
+        self._render_arg = ctypes.byref(self.render_poses[0])
+        if game_poses:
+            self.game_poses = (openvr.TrackedDevicePose_t * count)()
+            self._game_arg = ctypes.byref(self.game_poses[0])
+            self._game_count = count
+        else:
+            self.game_poses = None
+            self._game_arg = None
+            self._game_count = 0
+        self._wait_get_poses = None
+        self._get_last_poses = None
+        self._get_device_to_absolute_tracking_pose = None
+        self._render_view = None
+        self._game_view = None
+        self.bind(compositor=compositor, system=system)
+
+    def bind(self, compositor=None, system=None):
+        """
+        Cache the native functions used to fill the buffers, from the given interface objects.
+        Interfaces not given here are taken from openvr.VRCompositor() and openvr.VRSystem()
+        the first time they are needed.
+        """
+        if compositor is not None:
+            self._wait_get_poses = compositor.function_table.waitGetPoses
+            self._get_last_poses = compositor.function_table.getLastPoses
+        if system is not None:
+            self._get_device_to_absolute_tracking_pose = system.function_table.getDeviceToAbsoluteTrackingPose
+
+    def wait_get_poses(self):
+        """
+        Block until the compositor is ready for the next frame, then fill render_poses and game_poses.
+        Equivalent to IVRCompositor.waitGetPoses(render_poses, game_poses).
+        """
+        if self._wait_get_poses is None:
+            self.bind(compositor=openvr.VRCompositor())
+        error = self._wait_get_poses(self._render_arg, self.count, self._game_arg, self._game_count)
+        if error != 0:
+            CompositorError.check_error_value(error)
+        return self.render_poses
+
+    def get_last_poses(self):
+        """Fill render_poses and game_poses with the last set of poses returned by wait_get_poses()"""
+        if self._get_last_poses is None:
+            self.bind(compositor=openvr.VRCompositor())
+        error = self._get_last_poses(self._render_arg, self.count, self._game_arg, self._game_count)
+        if error != 0:
+            CompositorError.check_error_value(error)
+        return self.render_poses
+
+    def get_device_to_absolute_tracking_pose(self, origin, predicted_seconds_to_photons_from_now=0.0):
+        """
+        Fill render_poses with the poses the tracker predicts for the given number of seconds from now.
+        Equivalent to IVRSystem.getDeviceToAbsoluteTrackingPose(origin, seconds, render_poses).
+        """
+        if self._get_device_to_absolute_tracking_pose is None:
+            self.bind(system=openvr.VRSystem())
+        self._get_device_to_absolute_tracking_pose(
+            origin, predicted_seconds_to_photons_from_now, self._render_arg, self.count)
+        return self.render_poses
+
+    @property
+    def render_view(self):
+        """Zero-copy openvr.numpy_arrays.PoseArrayView of render_poses (requires numpy)"""
+        if self._render_view is None:
+            from openvr.numpy_arrays import PoseArrayView
+            self._render_view = PoseArrayView(self.render_poses)
+        return self._render_view
+
+    @property
+    def game_view(self):
+        """Zero-copy openvr.numpy_arrays.PoseArrayView of game_poses (requires numpy)"""
+        if self._game_view is None and self.game_poses is not None:
+            from openvr.numpy_arrays import PoseArrayView
+            self._game_view = PoseArrayView(self.game_poses)
+        return self._game_view
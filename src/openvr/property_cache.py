@@ -0,0 +1,166 @@
+#!/bin/env python
+
+# file property_cache.py
+
+import ctypes
+
+import openvr
+from openvr.error_code import TrackedPropertyError
+
+"""
+Event-invalidated cache of tracked device properties, to avoid repeated IPC calls for values that rarely change
+"""
+
+# Property errors that may go away without any event announcing it, so they are never cached
+_transient_errors = frozenset((
+    openvr.TrackedProp_BufferTooSmall,
+    openvr.TrackedProp_CouldNotContactServer,
+    openvr.TrackedProp_NotYetAvailable,
+    openvr.TrackedProp_IPCReadFailure,
+    openvr.TrackedProp_OutOfMemory,
+))
+
+# Events after which every cached property of the event's device is discarded
+_device_events = frozenset((
+    openvr.VREvent_TrackedDeviceActivated,
+    openvr.VREvent_TrackedDeviceDeactivated,
+    openvr.VREvent_TrackedDeviceUpdated,
+))
+
+
+class TrackedDevicePropertyCache(object):
+    """
+    Caches the results of the IVRSystem get*TrackedDeviceProperty() methods, per device and property.
+
+    The first request for a property makes the native call; later requests are dictionary reads, and raise
+    the same TrackedPropertyError subclasses the IVRSystem methods do. String properties are fetched with
+    a single call into a reused k_unMaxPropertyStringSize buffer, rather than a size probe followed by a fetch.
+
+    Cached values are discarded
+        * for one property, by a VREvent_PropertyChanged event passed to process_event()
+        * for one device, by VREvent_TrackedDeviceActivated, Deactivated, or Updated events passed to process_event()
+        * for all devices, when openvr is shut down and re-initialized, or by invalidate()
+    So applications should pass every event they poll to process_event().
+
+    Unless an IVRSystem object is given, openvr.VRSystem() is used, and re-initialization is detected automatically.
+    Returned HmdMatrix34_t values are shared by all callers, and should not be modified.
+    """
+
+    def __init__(self, system=None):
+        self._system = None
+        self._follow_context = system is None
+        self._properties = dict()  # device index -> {(prop, getter type): (value, error)}
+        self._error = openvr.ETrackedPropertyError()
+        self._error_arg = ctypes.byref(self._error)
+        self._string_buffer = ctypes.create_string_buffer(openvr.k_unMaxPropertyStringSize)
+        if system is not None:
+            self.bind(system)
+
+    def bind(self, system):
+        """Use the function table of the given IVRSystem object, and discard all cached values"""
+        self._system = system
+        table = system.function_table
+        self._scalar_getters = {
+            'bool': table.getBoolTrackedDeviceProperty,
+            'float': table.getFloatTrackedDeviceProperty,
+            'int32': table.getInt32TrackedDeviceProperty,
+            'uint64': table.getUint64TrackedDeviceProperty,
+            'matrix34': table.getMatrix34TrackedDeviceProperty,
+        }
+        self._get_array = table.getArrayTrackedDeviceProperty
+        self._get_string = table.getStringTrackedDeviceProperty
+        self._properties.clear()
+
+    def invalidate(self, device_index=None, prop=None):
+        """
+        Discard cached values: all of them, all of one device's, or one property of one device
+        """
+        if device_index is None:
+            self._properties.clear()
+        elif prop is None:
+            self._properties.pop(device_index, None)
+        else:
+            properties = self._properties.get(device_index)
+            if properties:
+                for key in [k for k in properties if k[0] == prop]:
+                    del properties[key]
+
+    def process_event(self, event):
+        """Discard any cached values made stale by an openvr.VREvent_t. Returns True if the event was relevant."""
+        event_type = event.eventType
+        if event_type == openvr.VREvent_PropertyChanged:
+            self.invalidate(event.trackedDeviceIndex, event.data.property.prop)
+            return True
+        if event_type in _device_events:
+            self.invalidate(event.trackedDeviceIndex)
+            return True
+        return False
+
+    def _lookup(self, device_index, key, fetch, *args):
+        if self._follow_context:
+            system = openvr.VRSystem()
+            if system is not self._system:
+                self.bind(system)  # first use, or openvr was re-initialized
+        properties = self._properties.get(device_index)
+        if properties is None:
+            properties = self._properties[device_index] = dict()
+        entry = properties.get(key)
+        if entry is None:
+            entry = fetch(device_index, key[0], *args)
+            if entry[1] not in _transient_errors:
+                properties[key] = entry
+        value, error = entry
+        if error != 0:
+            TrackedPropertyError.check_error_value(error)
+        return value
+
+    def _fetch_scalar(self, device_index, prop, getter_type):
+        value = self._scalar_getters[getter_type](device_index, prop, self._error_arg)
+        return value, self._error.value
+
+    def _fetch_string(self, device_index, prop):
+        self._get_string(device_index, prop, self._string_buffer, openvr.k_unMaxPropertyStringSize, self._error_arg)
+        error = self._error.value
+        if error != openvr.TrackedProp_Success:
+            return '', error
+        return self._string_buffer.value.decode('utf-8'), error
+
+    def _fetch_array(self, device_index, prop, type_):
+        size = self._get_array(device_index, prop, type_, None, 0, self._error_arg)
+        error = self._error.value
+        if error not in (openvr.TrackedProp_Success, openvr.TrackedProp_BufferTooSmall):
+            return b'', error
+        buffer = ctypes.create_string_buffer(size)
+        self._get_array(device_index, prop, type_, buffer, size, self._error_arg)
+        return buffer.raw, self._error.value
+
+    def get_bool(self, device_index, prop):
+        """Cached IVRSystem.getBoolTrackedDeviceProperty()"""
+        return bool(self._lookup(device_index, (prop, 'bool'), self._fetch_scalar, 'bool'))
+
+    def get_float(self, device_index, prop):
+        """Cached IVRSystem.getFloatTrackedDeviceProperty()"""
+        return self._lookup(device_index, (prop, 'float'), self._fetch_scalar, 'float')
+
+    def get_int32(self, device_index, prop):
+        """Cached IVRSystem.getInt32TrackedDeviceProperty()"""
+        return self._lookup(device_index, (prop, 'int32'), self._fetch_scalar, 'int32')
+
+    def get_uint64(self, device_index, prop):
+        """Cached IVRSystem.getUint64TrackedDeviceProperty()"""
+        return self._lookup(device_index, (prop, 'uint64'), self._fetch_scalar, 'uint64')
+
+    def get_matrix34(self, device_index, prop):
+        """Cached IVRSystem.getMatrix34TrackedDeviceProperty()"""
+        return self._lookup(device_index, (prop, 'matrix34'), self._fetch_scalar, 'matrix34')
+
+    def get_string(self, device_index, prop):
+        """Cached IVRSystem.getStringTrackedDeviceProperty()"""
+        return self._lookup(device_index, (prop, 'string'), self._fetch_string)
+
+    def get_array(self, device_index, prop, type_):
+        """
+        Cached IVRSystem.getArrayTrackedDeviceProperty(), returning the property contents as bytes,
+        e.g. for use with (element_type * n).from_buffer_copy()
+        """
+        return self._lookup(device_index, (prop, 'array', type_), self._fetch_array, type_)
@@ -0,0 +1,117 @@
+#!/bin/env python
+
+# file property_snapshot.py
+
+import ctypes
+
+import numpy
+
+import openvr
+
+"""
+Bulk, exception-free reading of a fixed set of tracked device properties, for many devices at once
+"""
+
+# Serial, model, render model, battery, class, role and firmware, as shown by typical device dashboards
+default_snapshot_properties = (
+    openvr.Prop_SerialNumber_String,
+    openvr.Prop_ModelNumber_String,
+    openvr.Prop_RenderModelName_String,
+    openvr.Prop_DeviceBatteryPercentage_Float,
+    openvr.Prop_DeviceClass_Int32,
+    openvr.Prop_ControllerRoleHint_Int32,
+    openvr.Prop_FirmwareVersion_Uint64,
+)
+
+# Property name suffix -> (IVRSystem_FnTable entry, numpy column dtype)
+_property_types = {
+    'String': ('getStringTrackedDeviceProperty', object),
+    'Bool': ('getBoolTrackedDeviceProperty', numpy.bool_),
+    'Float': ('getFloatTrackedDeviceProperty', numpy.float32),
+    'Int32': ('getInt32TrackedDeviceProperty', numpy.int32),
+    'Uint64': ('getUint64TrackedDeviceProperty', numpy.uint64),
+    'Matrix34': ('getMatrix34TrackedDeviceProperty', (numpy.float32, (3, 4))),
+}
+
+_property_names = None
+
+
+def _property_name(prop):
+    """Returns the symbolic name, such as 'Prop_SerialNumber_String', of an ETrackedDeviceProperty value"""
+    global _property_names
+    if isinstance(prop, str):
+        return prop
+    if _property_names is None:
+        _property_names = dict()
+        for name in dir(openvr):
+            if name.startswith('Prop_'):
+                _property_names.setdefault(getattr(openvr, name), name)
+    return _property_names[prop]
+
+
+def snapshot_device_properties(properties=default_snapshot_properties, device_indices=None, system=None):
+    """
+    Reads each of the given properties, for each of the given devices, and returns a dict of numpy arrays:
+        'device_index'          (N,) uint32 device indices, one row per device
+        '<property name>'       (N,) values, e.g. result['Prop_SerialNumber_String'][row]
+        '<property name>_error' (N,) int32 ETrackedPropertyError codes; 0 (TrackedProp_Success) where the value is valid
+
+    "properties" holds ETrackedDeviceProperty values, or their names, whose type suffix (_String, _Bool, _Float,
+    _Int32, _Uint64 or _Matrix34) determines the column type. String columns hold python str objects, and
+    matrix columns have shape (N, 3, 4). Values are zero, or empty, wherever the error code is not 0.
+
+    "device_indices" defaults to all k_unMaxTrackedDeviceCount slots. Errors such as TrackedProp_UnknownProperty
+    are recorded instead of raised. Once a slot reports TrackedProp_InvalidDevice, its remaining properties
+    are not queried.
+    """
+    if system is None:
+        system = openvr.VRSystem()
+    if device_indices is None:
+        device_indices = range(openvr.k_unMaxTrackedDeviceCount)
+    device_indices = numpy.asarray(device_indices, dtype=numpy.uint32)
+    count = len(device_indices)
+    table = system.function_table
+    columns = []  # (prop, getter, value column, error column)
+    result = {'device_index': device_indices}
+    for prop in properties:
+        name = _property_name(prop)
+        prop = getattr(openvr, name)
+        suffix = name.rsplit('_', 1)[-1]
+        if suffix not in _property_types:
+            raise ValueError(f"Unsupported property type for {name}")
+        getter_name, dtype = _property_types[suffix]
+        if dtype is object:
+            values = numpy.full(count, '', dtype=object)
+        else:
+            values = numpy.zeros(count, dtype=dtype)
+        errors = numpy.zeros(count, dtype=numpy.int32)
+        result[name] = values
+        result[name + '_error'] = errors
+        columns.append((prop, suffix, getattr(table, getter_name), values, errors))
+    error = openvr.ETrackedPropertyError()
+    error_arg = ctypes.byref(error)
+    buffer_size = openvr.k_unMaxPropertyStringSize
+    string_buffer = ctypes.create_string_buffer(buffer_size)
+    invalid_device = openvr.TrackedProp_InvalidDevice
+    for row, device_index in enumerate(device_indices.tolist()):
+        for prop, suffix, getter, values, errors in columns:
+            if suffix == 'String':
+                getter(device_index, prop, string_buffer, buffer_size, error_arg)
+                value = None
+                if error.value == 0:
+                    value = string_buffer.value.decode('utf-8')
+            else:
+                value = getter(device_index, prop, error_arg)
+            error_value = error.value
+            if error_value == invalid_device:
+                for column in columns:
+                    column[4][row] = invalid_device
+                break
+            errors[row] = error_value
+            if error_value != 0:
+                continue
+            if suffix == 'Matrix34':
+                values[row] = numpy.ctypeslib.as_array(value.m)
+            else:
+                values[row] = value
+    return result
@@ -0,0 +1,173 @@
+#!/bin/env python
+
+# file render_model_cache.py
+
+import hashlib
+import os
+import re
+import tempfile
+
+import numpy
+
+import openvr
+
+"""
+Persistent on-disk cache of render model vertex, index and texture data, in a format that numpy can memory-map
+"""
+
+# File layout, all little-endian:
+#   header      _header_dtype, 32 bytes
+#   key         key_size bytes of utf-8 validation key, zero-padded to a multiple of 16 bytes
+#   vertices    vertex_count * 8 float32 (position, normal, texture coordinate), as in RenderModel_Vertex_t
+#   indices     index_count uint16, zero-padded to a multiple of 16 bytes
+#   texture     texture_height * texture_width * 4 uint8 RGBA pixels, absent if texture_width is 0
+_magic = b'PYOVRRMC'
+_format_version = 1
+_header_dtype = numpy.dtype([
+    ('magic', 'S8'),
+    ('version', '<u4'),
+    ('key_size', '<u4'),
+    ('vertex_count', '<u4'),
+    ('index_count', '<u4'),
+    ('texture_width', '<u4'),
+    ('texture_height', '<u4'),
+])
+
+
+def _aligned(size, alignment=16):
+    return (size + alignment - 1) // alignment * alignment
+
+
+def default_cache_directory():
+    """$PYOPENVR_RENDER_MODEL_CACHE if set, otherwise a 'pyopenvr/rendermodels' folder in the user cache directory"""
+    directory = os.environ.get('PYOPENVR_RENDER_MODEL_CACHE')
+    if directory:
+        return directory
+    base = os.environ.get('XDG_CACHE_HOME') or os.environ.get('LOCALAPPDATA')
+    if not base:
+        base = os.path.join(os.path.expanduser('~'), '.cache')
+    return os.path.join(base, 'pyopenvr', 'rendermodels')
+
+
+class CachedRenderModel(object):
+    """
+    Read-only arrays memory-mapped from a render model cache file:
+        vertices        (N, 8) float32
+        indices         (T * 3,) uint16
+        texture_pixels  (height, width, 4) uint8, or None
+    """
+
+    def __init__(self, vertices, indices, texture_pixels):
+        self.vertices = vertices
+        self.indices = indices
+        self.texture_pixels = texture_pixels
+
+
+class RenderModelDiskCache(object):
+    """
+    Stores render model data under a directory, one flat file per model name, so later processes can
+    memory-map it instead of loading and converting the model through IVRRenderModels again.
+
+    Each file records a validation key, made from IVRRenderModels.getRenderModelOriginalPath() and the size
+    and modification time of that file. Entries whose key no longer matches, e.g. after a SteamVR update
+    or a user model replacement, are treated as missing, and overwritten by the next store(). Models whose
+    source file cannot be examined have no validation key, and are never cached.
+    """
+
+    def __init__(self, directory=None):
+        if directory is None:
+            directory = default_cache_directory()
+        self.directory = directory
+
+    def path(self, model_name):
+        """The cache file name for a render model name"""
+        safe_name = re.sub(r'[^A-Za-z0-9_.-]', '_', model_name)
+        digest = hashlib.sha1(model_name.encode('utf-8')).hexdigest()[:8]
+        return os.path.join(self.directory, f'{safe_name}-{digest}.rmcache')
+
+    @staticmethod
+    def validation_key(model_name, render_models=None):
+        """
+        Returns a string identifying the current source of a render model, or None if the runtime reports
+        no source file, or the file cannot be examined, in which case the model should not be cached
+        """
+        if render_models is None:
+            render_models = openvr.VRRenderModels()
+        original_path, error = render_models.getRenderModelOriginalPath_nothrow(model_name)
+        if error != openvr.VRRenderModelError_None or not original_path:
+            return None
+        try:
+            stat = os.stat(original_path)
+        except OSError:
+            return None  # Replacements of the file would go unnoticed
+        return f'{original_path}|{stat.st_size}|{stat.st_mtime_ns}'
+
+    def load(self, model_name, key):
+        """
+        Returns a CachedRenderModel for the named model, or None if it is not cached with the given validation key
+        """
+        if key is None:
+            return None
+        try:
+            data = numpy.memmap(self.path(model_name), dtype=numpy.uint8, mode='r')
+        except (OSError, ValueError):
+            return None  # Missing or empty file
+        if len(data) < _header_dtype.itemsize:
+            return None
+        header = data[:_header_dtype.itemsize].view(_header_dtype)[0]
+        if header['magic'] != _magic or header['version'] != _format_version:
+            return None
+        offset = _header_dtype.itemsize
+        key_size = int(header['key_size'])
+        if data[offset:offset + key_size].tobytes() != key.encode('utf-8'):
+            return None
+        offset += _aligned(key_size)
+        vertex_size = int(header['vertex_count']) * 8 * 4
+        index_count = int(header['index_count'])
+        width, height = int(header['texture_width']), int(header['texture_height'])
+        texture_offset = offset + vertex_size + _aligned(index_count * 2)
+        if len(data) != texture_offset + width * height * 4:
+            return None  # Truncated, perhaps by a crash while writing
+        vertices = data[offset:offset + vertex_size].view(numpy.float32).reshape(-1, 8)
+        offset += vertex_size
+        indices = data[offset:offset + index_count * 2].view(numpy.uint16)
+        texture_pixels = None
+        if width > 0:
+            texture_pixels = data[texture_offset:].reshape(height, width, 4)
+        return CachedRenderModel(vertices, indices, texture_pixels)
+
+    def store(self, model_name, key, vertices, indices, texture_pixels=None):
+        """
+        Write one render model to the cache. The file is replaced atomically, so concurrent readers,
+        such as other applications starting up, see either the old or the new contents.
+        """
+        vertices = numpy.ascontiguousarray(vertices, dtype='<f4').reshape(-1, 8)
+        indices = numpy.ascontiguousarray(indices, dtype='<u2').reshape(-1)
+        key_bytes = key.encode('utf-8')
+        header = numpy.zeros(1, dtype=_header_dtype)
+        header['magic'] = _magic
+        header['version'] = _format_version
+        header['key_size'] = len(key_bytes)
+        header['vertex_count'] = len(vertices)
+        header['index_count'] = len(indices)
+        if texture_pixels is not None:
+            texture_pixels = numpy.ascontiguousarray(texture_pixels, dtype=numpy.uint8)
+            header['texture_height'], header['texture_width'] = texture_pixels.shape[:2]
+        os.makedirs(self.directory, exist_ok=True)
+        path = self.path(model_name)
+        # A unique temporary file in the same directory, so concurrent writers, in any process or thread,
+        # never share one, and os.replace() stays on one file system
+        fd, temp_path = tempfile.mkstemp(suffix='.tmp', prefix=os.path.basename(path) + '.', dir=self.directory)
+        try:
+            with os.fdopen(fd, 'wb') as f:
+                f.write(header.tobytes())
+                f.write(key_bytes.ljust(_aligned(len(key_bytes)), b'\0'))
+                f.write(vertices.tobytes())
+                index_bytes = indices.tobytes()
+                f.write(index_bytes.ljust(_aligned(len(index_bytes)), b'\0'))
+                if texture_pixels is not None:
+                    f.write(texture_pixels.tobytes())
+            os.replace(temp_path, path)
+        except BaseException:
+            os.unlink(temp_path)
+            raise
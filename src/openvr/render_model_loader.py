@@ -0,0 +1,346 @@
+#!/bin/env python
+
+# file render_model_loader.py
+
+import collections
+import threading
+import time
+
+import openvr
+from openvr.numpy_arrays import render_model_indices, render_model_texture_pixels, render_model_vertices
+
+"""
+Background loading of render models and their textures, with a reference-counted cache shared by all users
+"""
+
+# RenderModelAsset.state values
+LOADING = 'loading'
+READY = 'ready'
+FAILED = 'failed'
+
+
+class RenderModelAsset(object):
+    """
+    One render model, and its diffuse texture, as loaded by a RenderModelLoader.
+
+    While state is LOADING, the array attributes are None. Once state is READY
+        vertices        (N, 8) float32 positions, normals and texture coordinates, see render_model_vertices()
+        indices         (T * 3,) uint16 triangle indices
+        texture_pixels  (height, width, 4) uint8 RGBA pixels, or None if the model has no usable texture
+    are zero-copy views of runtime-owned memory, which stay valid until the asset is released by all its users.
+    If the model cannot be loaded, state is FAILED, and error holds the EVRRenderModelError value.
+    """
+
+    def __init__(self, name):
+        self.name = name
+        self.state = LOADING
+        self.error = openvr.VRRenderModelError_None
+        self.texture_error = openvr.VRRenderModelError_None
+        self.vertices = None
+        self.indices = None
+        self.texture_pixels = None
+        self.ref_count = 0
+        self._model = None
+        self._texture = None
+        self._poll_interval = 0
+        self._next_poll = 0
+        self._cache_key = None
+        self._cache_checked = False
+
+    @property
+    def is_ready(self):
+        return self.state == READY
+
+
+class _TextureEntry(object):
+    """A diffuse texture, shared by every cached model that uses its texture id"""
+
+    def __init__(self, texture_id):
+        self.texture_id = texture_id
+        self.state = LOADING
+        self.error = openvr.VRRenderModelError_None
+        self.texture_map = None
+        self.pixels = None
+        self.ref_count = 0
+        self.waiting_assets = []
+        self._poll_interval = 0
+        self._next_poll = 0
+
+
+class RenderModelLoader(object):
+    """
+    Polls IVRRenderModels.loadRenderModel_Async() and loadTexture_Async() on a worker thread, so render loops
+    never wait for, or see exceptions from, models that are still loading.
+
+    acquire() returns a shared RenderModelAsset, and starts loading it if it is not already cached. Each pending
+    load is retried with exponential backoff, from min_poll_interval up to max_poll_interval seconds. Textures
+    are cached by diffuseTextureId, so models sharing a texture load it once. When the last user of an asset
+    calls release(), the native memory is returned with freeRenderModel() and, for the last model using a
+    texture, freeTexture().
+
+    With a RenderModelDiskCache, each model is first looked up on disk; hits are memory-mapped, without any
+    IVRRenderModels calls, and models loaded from the runtime are written to the cache for the next process.
+
+    The OpenGL thread can either check asset.is_ready each frame, or collect newly finished assets with
+    take_ready(), and upload their arrays. Call close() to stop the worker and free everything still cached.
+
+    Unless an IVRRenderModels object is given, openvr.VRRenderModels() is used, and checked again by each
+    acquire() and before each polling pass. After openvr was shut down and re-initialized, models and textures loaded from the previous
+    runtime, whose memory is gone, are loaded again, so their assets return to LOADING until then.
+    """
+
+    def __init__(self, render_models=None, min_poll_interval=0.005, max_poll_interval=0.25, disk_cache=None):
+        self.min_poll_interval = min_poll_interval
+        self.max_poll_interval = max_poll_interval
+        self.disk_cache = disk_cache
+        self._render_models = render_models
+        self._follow_context = render_models is None
+        self._condition = threading.Condition()
+        self._assets = dict()  # model name -> RenderModelAsset
+        self._textures = dict()  # texture id -> _TextureEntry
+        self._pending = []  # assets and texture entries still loading
+        self._ready = collections.deque()
+        self._to_store = []  # (name, key, vertices, indices, texture pixels) to write to disk_cache
+        self._thread = None
+        self._running = False
+
+    def __enter__(self):
+        self.start()
+        return self
+
+    def __exit__(self, _exc_type, _exc_value, _traceback):
+        self.close()
+
+    def start(self):
+        """Start the worker thread. acquire() does this automatically."""
+        with self._condition:
+            if self._thread is not None:
+                return
+            self._running = True
+            self._thread = threading.Thread(target=self._run, name='openvr render model loader', daemon=True)
+            self._thread.start()
+
+    def close(self):
+        """Stop the worker thread, and free all cached models and textures"""
+        with self._condition:
+            thread = self._thread
+            self._running = False
+            self._condition.notify_all()
+        if thread is not None:
+            thread.join()
+        with self._condition:
+            self._thread = None
+            for asset in list(self._assets.values()):
+                asset.ref_count = 0
+                self._evict(asset)
+            self._ready.clear()
+
+    def acquire(self, model_name):
+        """Returns the cached RenderModelAsset for a model name, loading it in the background if necessary"""
+        with self._condition:
+            self._follow_runtime()
+            asset = self._assets.get(model_name)
+            if asset is None:
+                asset = self._assets[model_name] = RenderModelAsset(model_name)
+                self._schedule(asset)
+            asset.ref_count += 1
+        self.start()
+        return asset
+
+    def release(self, asset):
+        """Give up one reference to an asset returned by acquire(), freeing its native memory after the last one"""
+        with self._condition:
+            asset.ref_count -= 1
+            if asset.ref_count <= 0:
+                self._evict(asset)
+
+    def take_ready(self):
+        """Returns the list of assets that became READY or FAILED since the previous call, without blocking"""
+        result = []
+        while self._ready:
+            result.append(self._ready.popleft())
+        return result
+
+    def _schedule(self, entry):
+        entry._poll_interval = self.min_poll_interval
+        entry._next_poll = 0
+        self._pending.append(entry)
+        self._condition.notify()
+
+    def _evict(self, asset):
+        if self._assets.get(asset.name) is asset:
+            del self._assets[asset.name]
+        if asset in self._pending:
+            self._pending.remove(asset)
+        asset.vertices = asset.indices = asset.texture_pixels = None
+        if asset._model is not None:
+            self._render_models.freeRenderModel(asset._model)
+            asset._model = None
+        texture = asset._texture
+        asset._texture = None
+        if texture is not None:
+            if asset in texture.waiting_assets:
+                texture.waiting_assets.remove(asset)
+            texture.ref_count -= 1
+            if texture.ref_count <= 0:
+                self._evict_texture(texture)
+
+    def _evict_texture(self, texture):
+        if self._textures.get(texture.texture_id) is texture:
+            del self._textures[texture.texture_id]
+        if texture in self._pending:
+            self._pending.remove(texture)
+        texture.pixels = None
+        if texture.texture_map is not None:
+            self._render_models.freeTexture(texture.texture_map)
+            texture.texture_map = None
+
+    def _run(self):
+        condition = self._condition
+        while True:
+            with condition:
+                while self._running:
+                    now = time.monotonic()
+                    due = [entry for entry in self._pending if entry._next_poll <= now]
+                    if due:
+                        break
+                    timeout = None
+                    if self._pending:
+                        timeout = min(entry._next_poll for entry in self._pending) - now
+                    condition.wait(timeout)
+                if not self._running:
+                    return
+                bound = self._follow_runtime()
+            if bound:
+                # Poll outside the lock, so acquire() and release() never wait for the runtime
+                results = [(entry, self._poll(entry)) for entry in due]
+            else:
+                # openvr is shut down; back off, as if still loading, until it is initialized again
+                results = [(entry, (None, openvr.VRRenderModelError_Loading)) for entry in due]
+            with condition:
+                now = time.monotonic()
+                for entry, (loaded, error) in results:
+                    if error is None:
+                        self._cache_hit(entry, loaded)
+                    elif error == openvr.VRRenderModelError_Loading:
+                        entry._next_poll = now + entry._poll_interval
+                        entry._poll_interval = min(2 * entry._poll_interval, self.max_poll_interval)
+                    elif isinstance(entry, RenderModelAsset):
+                        self._model_finished(entry, loaded, error)
+                    else:
+                        self._texture_finished(entry, loaded, error)
+                to_store, self._to_store = self._to_store, []
+            for args in to_store:
+                try:
+                    self.disk_cache.store(*args)
+                except OSError:
+                    pass  # The cache only speeds up later loads
+
+    def _follow_runtime(self):
+        "Bind openvr.VRRenderModels(), if it changed. Returns False while openvr is not initialized."
+        if not self._follow_context:
+            return True
+        try:
+            render_models = openvr.VRRenderModels()
+        except openvr.error_code.InitError:
+            return False
+        if render_models is not self._render_models:
+            self._bind(render_models)  # first use, or openvr was re-initialized
+        return True
+
+    def _bind(self, render_models):
+        previous = self._render_models
+        self._render_models = render_models
+        if previous is None:
+            return
+        # The native models and textures of the previous runtime were freed by openvr.shutdown()
+        self._pending = [entry for entry in self._pending if isinstance(entry, RenderModelAsset)]
+        self._textures.clear()
+        for asset in self._assets.values():
+            if asset._model is None and asset._texture is None:
+                continue  # still loading, or memory-mapped from the disk cache
+            asset._model = None
+            asset._texture = None
+            asset.vertices = asset.indices = asset.texture_pixels = None
+            asset.state = LOADING
+            asset._cache_checked = False
+            self._schedule(asset)
+
+    def _poll(self, entry):
+        if isinstance(entry, RenderModelAsset):
+            if self.disk_cache is not None and not entry._cache_checked:
+                entry._cache_checked = True
+                entry._cache_key = self.disk_cache.validation_key(entry.name, self._render_models)
+                cached = self.disk_cache.load(entry.name, entry._cache_key)
+                if cached is not None:
+                    return cached, None
+            return self._render_models.loadRenderModel_Async_nothrow(entry.name)
+        return self._render_models.loadTexture_Async_nothrow(entry.texture_id)
+
+    def _cache_hit(self, asset, cached):
+        if asset not in self._pending:
+            return  # released while loading
+        self._pending.remove(asset)
+        asset.vertices = cached.vertices
+        asset.indices = cached.indices
+        asset.texture_pixels = cached.texture_pixels
+        asset.state = READY
+        self._ready.append(asset)
+
+    def _model_finished(self, asset, model, error):
+        if asset in self._pending:
+            self._pending.remove(asset)
+        elif model is not None:
+            self._render_models.freeRenderModel(model)  # released while loading
+            return
+        if model is None:
+            asset.state = FAILED
+            asset.error = error if error != openvr.VRRenderModelError_None else openvr.VRRenderModelError_InvalidModel
+            self._ready.append(asset)
+            return
+        asset._model = model
+        asset.vertices = render_model_vertices(model)
+        asset.indices = render_model_indices(model)
+        texture_id = model.diffuseTextureId
+        if texture_id == openvr.INVALID_TEXTURE_ID:
+            self._set_ready(asset)
+            return
+        texture = self._textures.get(texture_id)
+        if texture is None:
+            texture = self._textures[texture_id] = _TextureEntry(texture_id)
+            self._schedule(texture)
+        texture.ref_count += 1
+        asset._texture = texture
+        if texture.state == LOADING:
+            texture.waiting_assets.append(asset)
+        else:
+            self._set_ready(asset)
+
+    def _texture_finished(self, texture, texture_map, error):
+        if texture in self._pending:
+            self._pending.remove(texture)
+        elif texture_map is not None:
+            self._render_models.freeTexture(texture_map)  # released while loading
+            return
+        if texture_map is None:
+            texture.state = FAILED
+            texture.error = error
+        else:
+            texture.state = READY
+            texture.texture_map = texture_map
+            texture.pixels = render_model_texture_pixels(texture_map)
+        for asset in texture.waiting_assets:
+            self._set_ready(asset)
+        texture.waiting_assets = []
+
+    def _set_ready(self, asset):
+        texture = asset._texture
+        if texture is not None:
+            asset.texture_pixels = texture.pixels
+            asset.texture_error = texture.error
+        asset.state = READY
+        if asset._cache_key is not None:
+            # Copy now: the native memory may be freed before the worker gets to write it
+            pixels = None if asset.texture_pixels is None else asset.texture_pixels.copy()
+            self._to_store.append((asset.name, asset._cache_key, asset.vertices.copy(), asset.indices.copy(), pixels))
+        self._ready.append(asset)
@@ -0,0 +1,113 @@
+#!/bin/env python
+
+# file resolution_governor.py
+
+import ctypes
+
+import openvr
+
+"""
+Adaptive render resolution, driven by compositor frame timing, to keep applications out of reprojection
+"""
+
+# Reprojection caused by this application being late, on the CPU or on the GPU
+_late_frame_flags = openvr.VRCompositor_ReprojectionReason_Cpu | openvr.VRCompositor_ReprojectionReason_Gpu
+
+
+class ResolutionGovernor(object):
+    """
+    Chooses, once per frame, the fraction of each eye framebuffer's width and height to render into.
+
+    update() reads the timing of the frames the compositor finished since its previous call, and returns the
+    new scale, between min_scale and max_scale. The scale is lowered by one step as soon as a frame
+    was dropped, was reprojected because this application was late, took more than high_water of the frame
+    interval on the GPU, or when IVRCompositor.shouldAppRenderWithLowResources() is true. It is raised by one step
+    only after raise_after consecutive frames under low_water of the frame interval. After each change, the next
+    settle_frames frames are ignored, since their timing may predate the change.
+
+    Renderers allocate framebuffers for max_scale, render into the scaled viewport, and submit only that
+    region, with VRTextureBounds_t. OpenVrGlRenderer does this when given a governor.
+    """
+
+    def __init__(self, min_scale=0.6, max_scale=1.0, step=0.05, low_water=0.7, high_water=0.9,
+                 raise_after=45, settle_frames=4, frame_interval=None, compositor=None, system=None):
+        self.min_scale = min_scale
+        self.max_scale = max_scale
+        self.step = step
+        self.low_water = low_water
+        self.high_water = high_water
+        self.raise_after = raise_after
+        self.settle_frames = settle_frames
+        self.frame_interval = frame_interval  # seconds, taken from the HMD display frequency if None
+        self.scale = max_scale
+        self.low_resources = False
+        self._compositor = compositor
+        self._system = system
+        self._timings = (openvr.Compositor_FrameTiming * 8)()
+        self._timings[0].m_nSize = ctypes.sizeof(openvr.Compositor_FrameTiming)
+        self._last_frame_index = None
+        self._fast_frames = 0
+        self._settle = 0
+
+    def reset(self, scale=None):
+        "Forget the timing history, and start again from the given scale, or max_scale"
+        self.scale = self.max_scale if scale is None else scale
+        self._last_frame_index = None
+        self._fast_frames = 0
+        self._settle = 0
+
+    def _frame_budget_ms(self):
+        if self.frame_interval is None:
+            if self._system is None:
+                self._system = openvr.VRSystem()
+            frequency, error = self._system.getFloatTrackedDeviceProperty_nothrow(
+                openvr.k_unTrackedDeviceIndex_Hmd, openvr.Prop_DisplayFrequency_Float)
+            if error != openvr.TrackedProp_Success or frequency <= 0:
+                frequency = 90.0
+            self.frame_interval = 1.0 / frequency
+        return 1000.0 * self.frame_interval
+
+    def update(self):
+        "Call once per frame, after waitGetPoses(). Returns the scale to render this frame with."
+        if self._compositor is None:
+            self._compositor = openvr.VRCompositor()
+        count, timings = self._compositor.getFrameTimings(self._timings)
+        self.low_resources = bool(self._compositor.shouldAppRenderWithLowResources())
+        budget_ms = self._frame_budget_ms()
+        late = False
+        for i in range(count):
+            timing = timings[i]
+            frame_index = timing.m_nFrameIndex
+            if self._last_frame_index is not None and frame_index <= self._last_frame_index:
+                continue  # already seen
+            self._last_frame_index = frame_index
+            if self._settle > 0:
+                self._settle -= 1
+                continue
+            gpu_ms = timing.m_flTotalRenderGpuMs
+            if (timing.m_nNumDroppedFrames > 0 or timing.m_nReprojectionFlags & _late_frame_flags
+                    or gpu_ms > self.high_water * budget_ms):
+                late = True
+            elif gpu_ms < self.low_water * budget_ms:
+                self._fast_frames += 1
+            else:
+                self._fast_frames = 0
+        if self.low_resources and self._settle == 0:
+            late = True
+        if late:
+            self._fast_frames = 0
+            self._change(-self.step)
+        elif self._fast_frames >= self.raise_after:
+            self._fast_frames = 0
+            self._change(self.step)
+        return self.scale
+
+    def _change(self, delta):
+        scale = round(min(self.max_scale, max(self.min_scale, self.scale + delta)), 6)
+        if scale != self.scale:
+            self.scale = scale
+            self._settle = self.settle_frames
+
+    def eye_size(self, width, height):
+        "The scaled size, in pixels, of an eye image whose full size is width by height"
+        return max(1, int(width * self.scale)), max(1, int(height * self.scale))
@@ -12,8 +12,12 @@ from OpenGL.arrays import vbo
 from OpenGL.GL.EXT.texture_filter_anisotropic import GL_TEXTURE_MAX_ANISOTROPY_EXT, GL_MAX_TEXTURE_MAX_ANISOTROPY_EXT
 
 import openvr
-from openvr.gl_renderer import matrixForOpenVrMatrix
+from openvr.error_code import TrackedPropertyError
+from openvr.numpy_arrays import matrices_to_gl
+from openvr.property_cache import TrackedDevicePropertyCache
+from openvr.render_model_loader import RenderModelLoader
 from openvr.glframework import shader_string
+from openvr.gl_renderer import FrameUniforms
 
 """
 Tracked item (controllers, lighthouses, etc) actor for "hello world" openvr apps
@@ -21,42 +25,29 @@ Tracked item (controllers, lighthouses, etc) actor for "hello world" openvr apps
 
 
 class TrackedDeviceMesh(object):
-    def __init__(self, model_name):
-        """This constructor must only be called with a live OpenGL context"""
+    def __init__(self, model_name, loader=None):
+        """
+        This constructor must only be called with a live OpenGL context.
+        The model is loaded in the background by a RenderModelLoader, and drawn once it is ready.
+        """
         self.model_name = model_name
+        self._owns_loader = loader is None
+        if loader is None:
+            loader = RenderModelLoader()
+        self.loader = loader
+        self.asset = loader.acquire(model_name)
         self.model_is_loaded = False
         self.texture_is_loaded = False
         self.vao = None
         self.vbo = None
-        self._try_load_model()
+        self.diffuse_texture = None
+        self.model_matrix = numpy.identity(4, dtype=numpy.float32)
         self.vertexPositions = None
+        self.frame_uniforms = None  # only created when drawn without a bound FrameMatrices block
 
-    def _try_load_model(self):
-        try:
-            model = openvr.VRRenderModels().loadRenderModel_Async(self.model_name)
-        except openvr.error_code.RenderModelError_Loading:
-            return
-        vertices0 = list()
-        indices0 = list()
-        if model is not None:
-            for v in range(model.unVertexCount):
-                vd = model.rVertexData[v]
-                vertices0.append(float(vd.vPosition.v[0]))  # position X
-                vertices0.append(float(vd.vPosition.v[1]))  # position Y
-                vertices0.append(float(vd.vPosition.v[2]))  # position Z
-                vertices0.append(float(vd.vNormal.v[0]))  # normal X
-                vertices0.append(float(vd.vNormal.v[1]))  # normal Y
-                vertices0.append(float(vd.vNormal.v[2]))  # normal Z
-                vertices0.append(float(vd.rfTextureCoord[0]))  # texture coordinate U
-                vertices0.append(float(vd.rfTextureCoord[1]))  # texture coordinate V
-            for i in range(model.unTriangleCount * 3):
-                index = model.rIndexData[i]
-                indices0.append(int(index))
-        vertices0 = numpy.array(vertices0, dtype=numpy.float32)
-        indices0 = numpy.array(indices0, dtype=numpy.uint32)
-        #
-        self.vertexPositions = vbo.VBO(vertices0)
-        self.indexPositions = vbo.VBO(indices0, target=GL.GL_ELEMENT_ARRAY_BUFFER)
+    def _load_model(self):
+        self.vertexPositions = vbo.VBO(self.asset.vertices)
+        self.indexPositions = vbo.VBO(self.asset.indices, target=GL.GL_ELEMENT_ARRAY_BUFFER)
         # http://stackoverflow.com/questions/14365484/how-to-draw-with-vertex-array-objects-and-gldrawelements-in-pyopengl
         self.vao = GL.glGenVertexArrays(1)
         GL.glBindVertexArray(self.vao)
@@ -73,22 +64,21 @@ class TrackedDeviceMesh(object):
         GL.glEnableVertexAttribArray(2)
         GL.glVertexAttribPointer(2, 2, GL.GL_FLOAT, False, 8 * fsize, cast(6 * fsize, c_void_p))
         GL.glBindVertexArray(0)
-        self.model = model
         self.model_is_loaded = True
-        self._try_load_texture()
+        self._load_texture()
 
-    def _try_load_texture(self):
+    def _load_texture(self):
         # Surface texture
-        try:
-            texture_map = openvr.VRRenderModels().loadTexture_Async(self.model.diffuseTextureId)
-        except openvr.error_code.RenderModelError_Loading:
-            return
-        self.texture_map = texture_map
+        pixels = self.asset.texture_pixels
+        self.texture_is_loaded = True
+        if pixels is None:
+            return  # No texture, or it failed to load
+        height, width = pixels.shape[:2]
         self.diffuse_texture = GL.glGenTextures(1)
         GL.glBindTexture(GL.GL_TEXTURE_2D, self.diffuse_texture)
-        GL.glTexImage2D(GL.GL_TEXTURE_2D, 0, GL.GL_RGBA, self.texture_map.unWidth, self.texture_map.unHeight,
+        GL.glTexImage2D(GL.GL_TEXTURE_2D, 0, GL.GL_RGBA, width, height,
                         0, GL.GL_RGBA,
-                        GL.GL_UNSIGNED_BYTE, self.texture_map.rubTextureMapData)
+                        GL.GL_UNSIGNED_BYTE, pixels)
         GL.glGenerateMipmap(GL.GL_TEXTURE_2D)
         GL.glTexParameteri(GL.GL_TEXTURE_2D, GL.GL_TEXTURE_WRAP_S, GL.GL_CLAMP_TO_EDGE)
         GL.glTexParameteri(GL.GL_TEXTURE_2D, GL.GL_TEXTURE_WRAP_T, GL.GL_CLAMP_TO_EDGE)
@@ -97,28 +87,31 @@ class TrackedDeviceMesh(object):
         fLargest = GL.glGetFloatv(GL_MAX_TEXTURE_MAX_ANISOTROPY_EXT)
         GL.glTexParameterf(GL.GL_TEXTURE_2D, GL_TEXTURE_MAX_ANISOTROPY_EXT, fLargest)
         GL.glBindTexture(GL.GL_TEXTURE_2D, 0)
-        self.texture_is_loaded = True
 
     def display_gl(self, modelview, projection, pose):
+        """
+        Draw the model at a device pose, with the shader program in use. Camera matrices come from the
+        FrameMatrices uniform block, if one is bound, or else are uploaded from the arguments.
+        """
         if not self.model_is_loaded:
-            self._try_load_model()
-            return
-        if not self.texture_is_loaded:
-            self._try_load_texture()
-            return
-        controller_X_room = pose.mDeviceToAbsoluteTracking
-        controller_X_room = matrixForOpenVrMatrix(controller_X_room)
-        modelview0 = controller_X_room * modelview
-        # Repack before use, just in case
-        modelview0 = numpy.asarray(numpy.matrix(modelview0, dtype=numpy.float32))
-        GL.glUniformMatrix4fv(4, 1, False, modelview0)
-        normal_matrix = numpy.asarray(controller_X_room)
-        GL.glUniformMatrix4fv(8, 1, False, normal_matrix)
+            if not self.asset.is_ready:
+                return  # Still loading in the background, or failed to load
+            self._load_model()
+        upload = not FrameUniforms.bound
+        if upload:
+            if self.frame_uniforms is None:
+                self.frame_uniforms = FrameUniforms()
+                self.frame_uniforms.init_gl()
+            self.frame_uniforms.bind_matrices(modelview, projection)
+        controller_X_room = matrices_to_gl(pose.mDeviceToAbsoluteTracking, out=self.model_matrix)
+        GL.glUniformMatrix4fv(4, 1, False, controller_X_room)
         GL.glActiveTexture(GL.GL_TEXTURE0)
-        GL.glBindTexture(GL.GL_TEXTURE_2D, self.diffuse_texture)
+        GL.glBindTexture(GL.GL_TEXTURE_2D, self.diffuse_texture or 0)
         GL.glBindVertexArray(self.vao)
-        GL.glDrawElements(GL.GL_TRIANGLES, len(self.indexPositions), GL.GL_UNSIGNED_INT, None)
+        GL.glDrawElements(GL.GL_TRIANGLES, len(self.indexPositions), GL.GL_UNSIGNED_SHORT, None)
         GL.glBindVertexArray(0)
+        if upload:
+            FrameUniforms.unbind()
 
     def dispose_gl(self):
         if self.vao is not None:
@@ -130,35 +123,70 @@ class TrackedDeviceMesh(object):
             self.vertexPositions = None
             self.indexPositions.delete()
             self.indexPositions = None
+        if self.diffuse_texture is not None:
+            GL.glDeleteTextures([self.diffuse_texture])
+            self.diffuse_texture = None
+        if self.frame_uniforms is not None:
+            self.frame_uniforms.dispose_gl()
+            self.frame_uniforms = None
+        if self.asset is not None:
+            self.loader.release(self.asset)
+            self.asset = None
+        if self._owns_loader:
+            self.loader.close()
 
 
 class TrackedDevicesActor(object):
     """
     Draws Vive controllers and lighthouses.
+
+    Camera matrices are read from the FrameMatrices uniform block bound by OpenVrGlRenderer. Elsewhere,
+    display_gl() uploads its modelview and projection arguments into a FrameUniforms buffer of its own.
     """
 
-    def __init__(self, pose_array):
+    def __init__(self, pose_array, property_cache=None, model_loader=None):
         self.shader = 0
         self.poses = pose_array
         self.meshes = dict()
         self.show_controllers_only = True
+        if property_cache is None:
+            property_cache = TrackedDevicePropertyCache()
+        self.property_cache = property_cache
+        self._owns_model_loader = model_loader is None
+        if model_loader is None:
+            model_loader = RenderModelLoader()
+        self.model_loader = model_loader
+        self._connected = [False] * len(pose_array)
+        self.frame_uniforms = FrameUniforms()
+
+    def process_event(self, event):
+        "Pass polled openvr.VREvent_t events here, so changed device properties are noticed promptly"
+        self.property_cache.process_event(event)
 
     def _check_devices(self):
         "Enumerate OpenVR tracked devices and check whether any need to be initialized"
         for i in range(1, len(self.poses)):
             pose = self.poses[i]
             if not pose.bDeviceIsConnected:
+                self._connected[i] = False
                 continue
+            if not self._connected[i]:
+                # A newly connected device might not be the one that last used this index
+                self.property_cache.invalidate(i)
+                self._connected[i] = True
             if not pose.bPoseIsValid:
                 continue
             if self.show_controllers_only:
-                device_class = openvr.VRSystem().getTrackedDeviceClass(i)
+                try:
+                    device_class = self.property_cache.get_int32(i, openvr.Prop_DeviceClass_Int32)
+                except TrackedPropertyError:
+                    device_class = openvr.TrackedDeviceClass_Invalid
                 if not device_class == openvr.TrackedDeviceClass_Controller:
                     continue
-            model_name = openvr.VRSystem().getStringTrackedDeviceProperty(i, openvr.Prop_RenderModelName_String)
+            model_name = self.property_cache.get_string(i, openvr.Prop_RenderModelName_String)
             # Create a new mesh object, if necessary
             if model_name not in self.meshes:
-                self.meshes[model_name] = TrackedDeviceMesh(model_name)
+                self.meshes[model_name] = TrackedDeviceMesh(model_name, self.model_loader)
 
     def init_gl(self):
         vertex_shader = compileShader(
@@ -167,16 +195,22 @@ class TrackedDevicesActor(object):
             layout(location = 1) in vec3 in_Normal;
             layout(location = 2) in vec2 in_TexCoord;
             
-            layout(location = 0) uniform mat4 projection = mat4(1);
-            layout(location = 4) uniform mat4 model_view = mat4(1);
-            layout(location = 8) uniform mat4 normal_matrix = mat4(1);
+            // See openvr.gl_renderer.FrameUniforms
+            layout(std140, binding = 0) uniform FrameMatrices {
+              mat4 projection;
+              mat4 view;
+              mat4 view_projection;
+              mat4 hmd_pose;
+            };
+            
+            layout(location = 4) uniform mat4 model = mat4(1);
             
             out vec3 color;
             out vec2 fragTexCoord;
             
             void main() {
-              gl_Position = projection * model_view * vec4(in_Position, 1.0);
-              vec3 normal = normalize((normal_matrix * vec4(in_Normal, 0)).xyz);
+              gl_Position = view_projection * model * vec4(in_Position, 1.0);
+              vec3 normal = normalize((model * vec4(in_Normal, 0)).xyz);
               color = (normal + vec3(1,1,1)) * 0.5; // color by normal
               fragTexCoord = in_TexCoord;
               // color = vec3(in_TexCoord, 0.5); // color by texture coordinate
@@ -199,26 +233,35 @@ class TrackedDevicesActor(object):
         self.shader = compileProgram(vertex_shader, fragment_shader)
         self._check_devices()
         GL.glEnable(GL.GL_DEPTH_TEST)
+        self.frame_uniforms.init_gl()
 
     def display_gl(self, modelview, projection):
         self._check_devices()
         GL.glEnable(GL.GL_DEPTH_TEST)
+        # Camera matrices come from the FrameMatrices uniform block, bound by OpenVrGlRenderer, if any
+        upload = not FrameUniforms.bound
+        if upload:
+            self.frame_uniforms.bind_matrices(modelview, projection)
         GL.glUseProgram(self.shader)
-        GL.glUniformMatrix4fv(0, 1, False, projection)
         for i in range(1, len(self.poses)):
             pose = self.poses[i]
             if not pose.bPoseIsValid:
                 continue
-            model_name = openvr.VRSystem().getStringTrackedDeviceProperty(i, openvr.Prop_RenderModelName_String)
+            model_name = self.property_cache.get_string(i, openvr.Prop_RenderModelName_String)
             if model_name not in self.meshes:
                 continue  # Come on, we already tried to load it a moment ago. Maybe next time.
             mesh = self.meshes[model_name]
             mesh.display_gl(modelview, projection, pose)
+        if upload:
+            FrameUniforms.unbind()
 
     def dispose_gl(self):
         GL.glDeleteProgram(self.shader)
         self.shader = 0
+        self.frame_uniforms.dispose_gl()
         for key in list(self.meshes):
             mesh = self.meshes[key]
             mesh.dispose_gl()
             del self.meshes[key]
+        if self._owns_model_loader:
+            self.model_loader.close()
@@ -2,6 +2,8 @@
 
 # file hello_glfw.py
 
+import argparse
+
 from openvr.glframework.glfw_app import GlfwApp
 from openvr.gl_renderer import OpenVrGlRenderer
 from openvr.color_cube_actor import ColorCubeActor
@@ -12,7 +14,11 @@ Minimal glfw programming example which colored OpenGL cube scene that can be clo
 
 
 if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="OpenVR color cube, drawn with glfw")
+    parser.add_argument('--single-pass-stereo', action='store_true',
+                        help="draw both eyes in one pass, into a side by side framebuffer")
+    args = parser.parse_args()
     actor = ColorCubeActor()
-    renderer = OpenVrGlRenderer(actor)
+    renderer = OpenVrGlRenderer(actor, single_pass_stereo=args.single_pass_stereo)
     with GlfwApp(renderer, "glfw OpenVR color cube") as glfwApp:
         glfwApp.run_loop()
@@ -10,7 +10,6 @@ import time
 # Third party modules
 import glfw
 import numpy
-from numpy.linalg import inv
 from OpenGL import GL
 from OpenGL.GL import shaders
 from OpenGL.GL.EXT.texture_filter_anisotropic import GL_MAX_TEXTURE_MAX_ANISOTROPY_EXT, GL_TEXTURE_MAX_ANISOTROPY_EXT
@@ -18,6 +17,7 @@ from PIL import Image
 
 # Local modules
 import openvr
+from openvr.numpy_arrays import inverse_matrices_to_gl, matrices_to_gl, render_model_indices, render_model_vertices
 
 Left = 0
 Right = 1
@@ -32,9 +32,8 @@ class CGLRenderModel(object):
         # Populate a vertex buffer
         self.vertex_buffer = GL.glGenBuffers(1)
         GL.glBindBuffer(GL.GL_ARRAY_BUFFER, self.vertex_buffer)
-        GL.glBufferData(GL.GL_ARRAY_BUFFER,
-                        sizeof(openvr.RenderModel_Vertex_t) * vr_model.unVertexCount,
-                        vr_model.rVertexData, GL.GL_STATIC_DRAW)
+        vertices = render_model_vertices(vr_model)
+        GL.glBufferData(GL.GL_ARRAY_BUFFER, vertices.nbytes, vertices, GL.GL_STATIC_DRAW)
         # Identify the components in the vertex buffer
         GL.glEnableVertexAttribArray(0)
         hv3sz = sizeof(openvr.HmdVector3_t)
@@ -49,9 +48,8 @@ class CGLRenderModel(object):
         # Create and populate the index buffer
         self.index_buffer = GL.glGenBuffers(1)
         GL.glBindBuffer(GL.GL_ELEMENT_ARRAY_BUFFER, self.index_buffer)
-        GL.glBufferData(GL.GL_ELEMENT_ARRAY_BUFFER,
-                        sizeof(c_uint16) * vr_model.unTriangleCount * 3,
-                        vr_model.rIndexData, GL.GL_STATIC_DRAW)
+        indices = render_model_indices(vr_model)
+        GL.glBufferData(GL.GL_ELEMENT_ARRAY_BUFFER, indices.nbytes, indices, GL.GL_STATIC_DRAW)
         GL.glBindVertexArray(0)
         # create and populate the texture
         self.texture = int(GL.glGenTextures(1))
@@ -67,7 +65,7 @@ class CGLRenderModel(object):
         f_largest = GL.glGetFloatv(GL_MAX_TEXTURE_MAX_ANISOTROPY_EXT)
         GL.glTexParameterf(GL.GL_TEXTURE_2D, GL_TEXTURE_MAX_ANISOTROPY_EXT, f_largest)
         GL.glBindTexture(GL.GL_TEXTURE_2D, 0)
-        self.vertex_count = vr_model.unTriangleCount * 3
+        self.vertex_count = len(indices)
 
     def cleanup(self):
         GL.glDeleteBuffers(1, [self.index_buffer])
@@ -373,25 +371,13 @@ class CMainApplication(object):
         if not self.hmd:
             return numpy.identity(4, dtype=numpy.float32)
         mat = self.hmd.getProjectionMatrix(eye=eye, nearZ=0.1, farZ=30.0)
-        mat = numpy.array((
-            (mat[0][0], mat[1][0], mat[2][0], mat[3][0]),
-            (mat[0][1], mat[1][1], mat[2][1], mat[3][1]),
-            (mat[0][2], mat[1][2], mat[2][2], mat[3][2]),
-            (mat[0][3], mat[1][3], mat[2][3], mat[3][3]),
-        ), dtype=numpy.float32)
-        return mat
+        return matrices_to_gl(mat)[0]
 
     def get_hmd_matrix_pose_eye(self, eye):
         if not self.hmd:
             return numpy.identity(4, dtype=numpy.float32)
         mat = self.hmd.getEyeToHeadTransform(eye)
-        mat = numpy.array((
-            (mat[0][0], mat[1][0], mat[2][0], 0.0),
-            (mat[0][1], mat[1][1], mat[2][1], 0.0),
-            (mat[0][2], mat[1][2], mat[2][2], 0.0),
-            (mat[0][3], mat[1][3], mat[2][3], 1.0),
-        ), dtype=numpy.float32)
-        return inv(mat)
+        return inverse_matrices_to_gl(mat)[0]
 
     def handle_input(self):
         # Note: Key events are handled by glfw in key_callback
@@ -819,8 +805,7 @@ class CMainApplication(object):
                 self.pose_classes += self.dev_class_char[nDevice]
         hp = self.poses[openvr.k_unTrackedDeviceIndex_Hmd]
         if hp.bPoseIsValid:
-            p = convert_steam_vr_matrix(hp.mDeviceToAbsoluteTracking)
-            self.hmd_pose = inv(p)
+            self.hmd_pose = inverse_matrices_to_gl(hp.mDeviceToAbsoluteTracking)[0]
 
 
 class ControllerInfo(object):
@@ -878,12 +863,7 @@ class FramebufferDesc(object):
 
 
 def convert_steam_vr_matrix(pose):
-    return numpy.array((
-        (pose[0][0], pose[1][0], pose[2][0], 0.0),
-        (pose[0][1], pose[1][1], pose[2][1], 0.0),
-        (pose[0][2], pose[1][2], pose[2][2], 0.0),
-        (pose[0][3], pose[1][3], pose[2][3], 1.0),
-    ), dtype=numpy.float32)
+    return matrices_to_gl(pose)[0]
 
 
 def get_digital_action_rising_edge(action, device_path=None):
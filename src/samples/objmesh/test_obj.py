@@ -20,6 +20,7 @@ import glfw
 import openvr
 
 from openvr.glframework.glfw_app import GlfwApp
+from openvr.event_buffer import EventBuffer
 from openvr.gl_renderer import OpenVrGlRenderer
 from openvr.tracked_devices_actor import TrackedDevicesActor
 from openvr.glframework.glmatrix import pack
@@ -651,11 +652,18 @@ class SpatialInteractor(object):
         self.velocity_damping = 1.5 # meters per second per second
         self.speed = 0.0 # meters per second inertial velocity
         self.min_velocity = 0.01 # meters per second
+        self.event_buffer = EventBuffer()
 
     def update_controller_states(self):
-        new_event = openvr.VREvent_t()
-        while openvr.VRSystem().pollNextEvent(new_event):
-            self._check_controller_drag(new_event)
+        while True:
+            count = self.event_buffer.drain()
+            # Only touch events can change drag state, so skip decoding everything else
+            event_types = self.event_buffer.valid_events()['eventType']
+            touches = (event_types == openvr.VREvent_ButtonTouch) | (event_types == openvr.VREvent_ButtonUntouch)
+            for index in numpy.flatnonzero(touches):
+                self._check_controller_drag(self.event_buffer[index])
+            if count < self.event_buffer.capacity:
+                break
         now_is_dragging = self.left_controller.is_dragging or self.right_controller.is_dragging
         
         xform = self._compute_controllers_transform()
@@ -0,0 +1,95 @@
+#!/bin/env python
+
+import json
+import os
+import tempfile
+import unittest
+
+import openvr
+from openvr.action_manifest import ActionManifest
+from openvr.fake_runtime import FakeRuntime
+
+
+class TestActionManifest(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.path = os.path.join(self.directory.name, 'actions.json')
+        with open(self.path, 'w') as f:
+            json.dump({
+                'action_sets': [{'name': '/actions/menu', 'usage': 'single'}],
+                'actions': [
+                    {'name': '/actions/demo/in/HideCubes', 'type': 'boolean'},
+                    {'name': '/actions/demo/out/haptic_left', 'type': 'vibration'},
+                    {'name': '/actions/menu/in/Select', 'type': 'boolean'},
+                ],
+            }, f)
+        self.runtime = FakeRuntime()
+        self.runtime.install()
+        openvr.init(openvr.VRApplication_Scene)
+
+    def tearDown(self):
+        openvr.shutdown()
+        self.runtime.uninstall()
+        self.directory.cleanup()
+
+    def test_handles(self):
+        manifest = ActionManifest(self.path)
+        self.assertEqual(self.path, self.runtime.action_manifest_path)
+        handles = self.runtime.input_handles
+        self.assertEqual(handles['/actions/demo'], manifest.sets.demo.handle)
+        self.assertEqual(handles['/actions/demo/in/hidecubes'], manifest.sets.demo.HideCubes)
+        self.assertEqual(handles['/actions/demo/out/haptic_left'], manifest.sets.demo.haptic_left)
+        self.assertEqual(handles['/actions/menu/in/select'], manifest.sets.menu.Select)
+        self.assertEqual(handles['/user/hand/left'], manifest.sources.left_hand)
+        self.assertEqual(manifest.sets.demo.HideCubes, manifest.action('/actions/demo/in/hidecubes'))
+        self.assertEqual(manifest.sets.menu.handle, manifest.action_set('/actions/menu'))
+        queries = self.runtime.input_handle_query_count
+        for _ in range(3):
+            manifest.input_source('/user/hand/left/input/trigger')
+        self.assertEqual(queries + 1, self.runtime.input_handle_query_count)
+
+    def write_actions(self, *names):
+        with open(self.path, 'w') as f:
+            json.dump({'actions': [{'name': name, 'type': 'boolean'} for name in names]}, f)
+
+    def test_shared_action_name(self):
+        self.write_actions('/actions/demo/in/Haptic', '/actions/demo/out/Haptic')
+        with self.assertRaises(ValueError):
+            ActionManifest(self.path)
+
+    def test_action_named_handle(self):
+        self.write_actions('/actions/demo/in/handle')
+        with self.assertRaises(ValueError):
+            ActionManifest(self.path)
+
+    def test_same_name_in_other_sets(self):
+        self.write_actions('/actions/demo/in/Select', '/actions/menu/in/Select')
+        manifest = ActionManifest(self.path)
+        handles = self.runtime.input_handles
+        self.assertEqual(handles['/actions/demo/in/select'], manifest.action('/actions/demo/in/Select'))
+        self.assertEqual(handles['/actions/menu/in/select'], manifest.sets.menu.Select)
+        self.assertNotEqual(manifest.sets.demo.Select, manifest.sets.menu.Select)
+
+    def test_binding_reloaded(self):
+        manifest = ActionManifest(self.path)
+        demo = manifest.sets.demo
+        self.runtime.input_handles['/actions/demo/in/hidecubes'] = 100
+        self.assertFalse(manifest.process_event(self.runtime.queue_event(openvr.VREvent_ButtonPress)))
+        self.assertTrue(manifest.process_event(self.runtime.queue_event(openvr.VREvent_ActionBindingReloaded)))
+        self.assertEqual(100, demo.HideCubes)
+        self.assertEqual(100, manifest.action('/actions/demo/in/HideCubes'))
+
+    def test_reinit(self):
+        manifest = ActionManifest(self.path)
+        openvr.shutdown()
+        self.runtime.action_manifest_path = None
+        self.runtime.input_handles['/user/head'] = 200
+        openvr.init(openvr.VRApplication_Scene)
+        manifest.refresh()
+        self.assertEqual(self.path, self.runtime.action_manifest_path)
+        self.assertEqual(200, manifest.sources.head)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,131 @@
+#!/bin/env python
+
+import asyncio
+import unittest
+
+import openvr
+from openvr import aio
+from openvr.error_code import (OverlayError_RequestFailed, RenderModelError_InvalidModel,
+                               SpatialAnchorError_UnknownHandle)
+from openvr.fake_runtime import FakeRuntime
+
+
+class TestAio(unittest.TestCase):
+
+    def setUp(self):
+        self.runtime = FakeRuntime()
+        self.runtime.install()
+        openvr.init(openvr.VRApplication_Scene)
+
+    def tearDown(self):
+        openvr.shutdown()
+        self.runtime.uninstall()
+
+    def test_frames(self):
+        async def run():
+            frame_indices = []
+            async with aio.frames() as frames:
+                async for poses in frames:
+                    self.assertEqual(openvr.k_unMaxTrackedDeviceCount, len(poses))
+                    frame_indices.append(self.runtime.frame_index)
+                    if len(frame_indices) == 3:
+                        break
+            return frame_indices
+
+        self.assertEqual([1, 2, 3], asyncio.run(run()))
+
+    def test_events(self):
+        for i in range(5):
+            self.runtime.queue_event(openvr.VREvent_PropertyChanged, i)
+
+        async def run():
+            device_indices = []
+            async for event in aio.events(capacity=2, poll_interval=0.001):
+                device_indices.append(event.trackedDeviceIndex)
+                if len(device_indices) == 3:
+                    break
+            return device_indices
+
+        self.assertEqual([0, 1, 2], asyncio.run(run()))
+        # Events the consumer did not ask for stay queued in the runtime
+        self.assertEqual([4], [event.trackedDeviceIndex for event in self.runtime.events])
+
+    def test_load_render_model(self):
+        self.runtime.add_render_model('box', [[0] * 8] * 3, [0, 1, 2], loading_polls=3)
+        model = asyncio.run(aio.load_render_model('box', min_poll_interval=0.001))
+        self.assertEqual(3, model.unVertexCount)
+        with self.assertRaises(RenderModelError_InvalidModel):
+            asyncio.run(aio.load_render_model('missing'))
+
+    def overlay_frame_counts(self, count):
+        async def run():
+            frame_counts = []
+            async with aio.overlay_frames(timeout_ms=1) as frames:
+                async for frame_count in frames:
+                    frame_counts.append(frame_count)
+                    if len(frame_counts) == count:
+                        break
+            return frame_counts
+
+        return asyncio.run(run())
+
+    def test_overlay_frames(self):
+        timed_out = openvr.VROverlayError_TimedOut
+        self.runtime.frame_sync_errors.extend([timed_out, timed_out, openvr.VROverlayError_None, timed_out])
+        self.assertEqual([1, 2, 3], self.overlay_frame_counts(3))
+        self.assertEqual(6, self.runtime.frame_sync_count)
+
+    def test_overlay_frames_error(self):
+        self.runtime.frame_sync_errors.extend([openvr.VROverlayError_TimedOut, openvr.VROverlayError_RequestFailed])
+        with self.assertRaises(OverlayError_RequestFailed):
+            self.overlay_frame_counts(1)
+
+    def test_overlay_events(self):
+        handle = self.runtime.add_overlay('test.overlay').handle
+        for i in range(3):
+            self.runtime.queue_overlay_event(handle, openvr.VREvent_MouseMove, i)
+
+        async def run():
+            device_indices = []
+            async for event in aio.overlay_events(handle, capacity=2, poll_interval=0.001):
+                device_indices.append(event.trackedDeviceIndex)
+                if len(device_indices) == 3:
+                    break
+            return device_indices
+
+        self.assertEqual([0, 1, 2], asyncio.run(run()))
+
+    def test_spatial_anchor_pose(self):
+        anchors = _ScriptedSpatialAnchors(not_available_polls=2)
+        handle, pose = asyncio.run(aio.spatial_anchor_from_descriptor(
+            'descriptor', openvr.TrackingUniverseStanding, anchors, min_poll_interval=0.001))
+        self.assertEqual(7, handle)
+        self.assertEqual(1.0, pose.mAnchorToAbsoluteTracking.m[0][3])
+        self.assertEqual(3, anchors.poll_count)
+        with self.assertRaises(SpatialAnchorError_UnknownHandle):
+            asyncio.run(aio.spatial_anchor_pose(8, openvr.TrackingUniverseStanding, anchors))
+
+
+class _ScriptedSpatialAnchors(object):
+    """Stands in for IVRSpatialAnchors, which FakeRuntime does not implement"""
+
+    def __init__(self, not_available_polls):
+        self.not_available_polls = not_available_polls
+        self.poll_count = 0
+
+    def createSpatialAnchorFromDescriptor(self, descriptor):
+        return 7
+
+    def getSpatialAnchorPose_nothrow(self, handle, origin):
+        self.poll_count += 1
+        pose = openvr.SpatialAnchorPose_t()
+        if handle != 7:
+            return pose, openvr.VRSpatialAnchorError_UnknownHandle
+        if self.poll_count <= self.not_available_polls:
+            return pose, openvr.VRSpatialAnchorError_NotYetAvailable
+        pose.mAnchorToAbsoluteTracking.m[0][3] = 1.0
+        return pose, openvr.VRSpatialAnchorError_Success
+
+
+if __name__ == '__main__':
+    unittest.main()
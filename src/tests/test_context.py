@@ -0,0 +1,38 @@
+#!/bin/env python
+
+import unittest
+from unittest import mock
+
+import openvr
+
+
+class TestContext(unittest.TestCase):
+
+    def setUp(self):
+        self.context = openvr._internal_module_context
+        self.context.reset()
+        self.system = object()
+        self.context.m_pVRSystem = self.system
+
+    def tearDown(self):
+        self.context.reset()
+
+    def test_accessor_is_cached(self):
+        with mock.patch.object(openvr, 'getInitToken', side_effect=AssertionError("token queried")):
+            self.assertIs(self.system, openvr.VRSystem())
+            self.assertIs(self.system, openvr.VRSystem())
+
+    def test_check_clear(self):
+        openvr.checkClear()  # token unchanged
+        self.assertIs(self.system, self.context.m_pVRSystem)
+        with mock.patch.object(openvr, 'getInitToken', return_value=openvr.getInitToken() + 1):
+            openvr.checkClear()
+        self.assertIsNone(self.context.m_pVRSystem)
+
+    def test_shutdown_resets(self):
+        openvr.shutdown()
+        self.assertIsNone(self.context.m_pVRSystem)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,58 @@
+#!/bin/env python
+
+import unittest
+
+import openvr
+from openvr.error_code import NotificationError, RenderModelError, TrackedPropertyError
+from openvr.fake_runtime import FakeRuntime
+
+
+class TestCheckErrorValue(unittest.TestCase):
+
+    def test_success(self):
+        TrackedPropertyError.check_error_value(openvr.TrackedProp_Success)
+        NotificationError.check_error_value(openvr.VRNotificationError_OK)
+
+    def test_failure(self):
+        with self.assertRaises(openvr.error_code.RenderModelError_Loading) as context:
+            RenderModelError.check_error_value(openvr.VRRenderModelError_Loading)
+        self.assertEqual(openvr.VRRenderModelError_Loading, context.exception.error_value)
+
+    def test_non_zero_success(self):
+        openvr.error_code.FirmwareError.check_error_value(openvr.VRFirmwareError_Success)
+
+
+class TestNothrowMethods(unittest.TestCase):
+
+    def setUp(self):
+        self.runtime = FakeRuntime()
+        self.runtime.install()
+        self.runtime.add_device(openvr.TrackedDeviceClass_HMD)
+        self.runtime.add_render_model('box', [[0] * 8] * 3, [0, 1, 2], loading_polls=1)
+        self.vr_system = openvr.init(openvr.VRApplication_Scene)
+
+    def tearDown(self):
+        openvr.shutdown()
+        self.runtime.uninstall()
+
+    def test_property(self):
+        value, error = self.vr_system.getStringTrackedDeviceProperty_nothrow(0, openvr.Prop_SerialNumber_String)
+        self.assertEqual(('FAKE-00', openvr.TrackedProp_Success), (value, error))
+        value, error = self.vr_system.getFloatTrackedDeviceProperty_nothrow(
+            0, openvr.Prop_DeviceBatteryPercentage_Float)
+        self.assertEqual(openvr.TrackedProp_UnknownProperty, error)
+        value, error = self.vr_system.getStringTrackedDeviceProperty_nothrow(9, openvr.Prop_SerialNumber_String)
+        self.assertEqual(('', openvr.TrackedProp_InvalidDevice), (value, error))
+
+    def test_error_result(self):
+        render_models = openvr.VRRenderModels()
+        model, error = render_models.loadRenderModel_Async_nothrow('box')
+        self.assertIsNone(model)
+        self.assertEqual(openvr.VRRenderModelError_Loading, error)
+        model, error = render_models.loadRenderModel_Async_nothrow('box')
+        self.assertEqual(openvr.VRRenderModelError_None, error)
+        self.assertEqual(3, model.unVertexCount)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,52 @@
+#!/bin/env python
+
+import unittest
+
+import numpy
+
+import openvr
+from openvr.event_buffer import EventBuffer
+from openvr.fake_runtime import FakeRuntime
+
+
+class TestEventBuffer(unittest.TestCase):
+
+    def setUp(self):
+        self.runtime = FakeRuntime()
+        self.runtime.install()
+        openvr.init(openvr.VRApplication_Scene)
+
+    def tearDown(self):
+        openvr.shutdown()
+        self.runtime.uninstall()
+
+    def test_drain(self):
+        data = openvr.VREvent_Controller_t()
+        data.button = openvr.k_EButton_SteamVR_Trigger
+        self.runtime.queue_event(openvr.VREvent_ButtonPress, 3, data, age_seconds=0.25)
+        self.runtime.queue_event(openvr.VREvent_TrackedDeviceActivated, 4)
+        buffer = EventBuffer(capacity=8)
+        self.assertEqual(2, buffer.drain())
+        events = buffer.valid_events()
+        self.assertEqual([openvr.VREvent_ButtonPress, openvr.VREvent_TrackedDeviceActivated], list(events['eventType']))
+        self.assertEqual([3, 4], list(events['trackedDeviceIndex']))
+        self.assertEqual(0.25, events['eventAgeSeconds'][0])
+        self.assertEqual(openvr.k_EButton_SteamVR_Trigger, events['data'][0][:4].view(numpy.uint32)[0])
+        self.assertEqual(openvr.k_EButton_SteamVR_Trigger, buffer[0].data.controller.button)
+        self.assertEqual([3, 4], [event.trackedDeviceIndex for event in buffer])
+        self.assertEqual(0, buffer.drain())
+        self.assertEqual(0, len(buffer))
+
+    def test_full_buffer(self):
+        for i in range(5):
+            self.runtime.queue_event(openvr.VREvent_PropertyChanged, i)
+        buffer = EventBuffer(capacity=3)
+        self.assertEqual(3, buffer.drain())
+        self.assertEqual(2, buffer.drain())
+        self.assertEqual([3, 4], list(buffer.valid_events()['trackedDeviceIndex']))
+        with self.assertRaises(IndexError):
+            buffer[2]
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,87 @@
+#!/bin/env python
+
+import unittest
+
+import openvr
+from openvr.event_buffer import EventBuffer
+from openvr.event_dispatcher import EventDispatcher
+from openvr.fake_runtime import FakeRuntime
+
+
+class TestEventDataMembers(unittest.TestCase):
+
+    def test_table(self):
+        self.assertEqual(('controller', openvr.VREvent_Controller_t), openvr.EVENT_DATA_MEMBERS[openvr.VREvent_ButtonPress])
+        self.assertEqual(('property', openvr.VREvent_Property_t), openvr.EVENT_DATA_MEMBERS[openvr.VREvent_PropertyChanged])
+        self.assertEqual(('overlay', openvr.VREvent_Overlay_t), openvr.EVENT_DATA_MEMBERS[openvr.VREvent_FocusEnter])
+        self.assertNotIn(openvr.VREvent_TrackedDeviceActivated, openvr.EVENT_DATA_MEMBERS)
+
+
+class TestEventDispatcher(unittest.TestCase):
+
+    def setUp(self):
+        self.runtime = FakeRuntime()
+        self.runtime.install()
+        openvr.init(openvr.VRApplication_Scene)
+        self.dispatcher = EventDispatcher()
+        self.received = []
+
+    def tearDown(self):
+        openvr.shutdown()
+        self.runtime.uninstall()
+
+    def record(self, event, data):
+        self.received.append((event.eventType, event.trackedDeviceIndex, data))
+
+    def queue_button_press(self, device_index, button):
+        data = openvr.VREvent_Controller_t()
+        data.button = button
+        self.runtime.queue_event(openvr.VREvent_ButtonPress, device_index, data)
+
+    def test_decoded_payload(self):
+        self.dispatcher.add_handler(openvr.VREvent_ButtonPress, self.record)
+        self.dispatcher.add_handler(openvr.VREvent_TrackedDeviceActivated, self.record)
+        self.queue_button_press(1, openvr.k_EButton_Grip)
+        self.runtime.queue_event(openvr.VREvent_TrackedDeviceActivated, 2)
+        self.runtime.queue_event(openvr.VREvent_Quit)
+        self.assertEqual(2, self.dispatcher.poll())
+        (press_type, _, press_data), activated = self.received
+        self.assertEqual(openvr.VREvent_ButtonPress, press_type)
+        self.assertEqual(openvr.k_EButton_Grip, press_data.button)
+        self.assertEqual((openvr.VREvent_TrackedDeviceActivated, 2, None), activated)
+
+    def test_device_filter(self):
+        self.dispatcher.add_handler(openvr.VREvent_ButtonPress, self.record, device_index=2)
+        self.queue_button_press(1, openvr.k_EButton_Grip)
+        self.queue_button_press(2, openvr.k_EButton_Grip)
+        self.assertEqual(1, self.dispatcher.poll())
+        self.assertEqual([2], [device_index for _, device_index, _ in self.received])
+
+    def test_overlay_filter(self):
+        self.dispatcher.add_handler(openvr.VREvent_MouseMove, self.record, overlay_handle=5)
+        event = openvr.VREvent_t()
+        event.eventType = openvr.VREvent_MouseMove
+        self.assertFalse(self.dispatcher.dispatch(event))
+        self.assertFalse(self.dispatcher.dispatch(event, overlay_handle=6))
+        self.assertTrue(self.dispatcher.dispatch(event, overlay_handle=5))
+
+    def test_remove_handler(self):
+        self.dispatcher.add_handler(openvr.VREvent_ButtonPress, self.record)
+        self.dispatcher.remove_handler(openvr.VREvent_ButtonPress, self.record)
+        self.assertFalse(self.dispatcher.handles(openvr.VREvent_ButtonPress))
+        self.queue_button_press(1, openvr.k_EButton_Grip)
+        self.assertEqual(0, self.dispatcher.poll())
+        self.assertEqual([], self.received)
+
+    def test_many_events(self):
+        self.dispatcher.add_handler(openvr.VREvent_PropertyChanged, self.record)
+        for i in range(100):
+            self.runtime.queue_event(openvr.VREvent_PropertyChanged, i % 8)
+        buffer = EventBuffer(capacity=16)
+        self.assertEqual(16, buffer.drain())
+        self.assertEqual(16, self.dispatcher.dispatch_buffer(buffer))
+        self.assertEqual(84, self.dispatcher.poll())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,139 @@
+#!/bin/env python
+
+import unittest
+
+import openvr
+from openvr.fake_runtime import FakeRuntime
+from openvr.pose_buffers import PoseBuffers
+
+
+class TestFakeRuntime(unittest.TestCase):
+
+    def setUp(self):
+        self.runtime = FakeRuntime()
+        self.runtime.install()
+        self.hmd = self.runtime.add_device(openvr.TrackedDeviceClass_HMD, properties={
+            openvr.Prop_ModelNumber_String: 'Fake HMD',
+            openvr.Prop_DisplayFrequency_Float: 90.0,
+        })
+        self.controller = self.runtime.add_device(
+            openvr.TrackedDeviceClass_Controller,
+            controller_role=openvr.TrackedControllerRole_RightHand,
+            matrix=((1, 0, 0, 0.5), (0, 1, 0, 1.0), (0, 0, 1, -0.25)))
+        self.vr_system = openvr.init(openvr.VRApplication_Scene)
+
+    def tearDown(self):
+        openvr.shutdown()
+        self.runtime.uninstall()
+
+    def test_init_and_shutdown(self):
+        self.assertTrue(self.runtime.is_initialized)
+        self.assertEqual(openvr.VRApplication_Scene, self.runtime.application_type)
+        token = openvr.getInitToken()
+        openvr.shutdown()
+        self.assertFalse(self.runtime.is_initialized)
+        self.assertNotEqual(token, openvr.getInitToken())
+        with self.assertRaises(openvr.error_code.InitError):
+            openvr.VRSystem()
+        self.vr_system = openvr.init(openvr.VRApplication_Scene)
+        self.assertIsNotNone(openvr.VRCompositor())
+
+    def test_uninstall_restores_library(self):
+        library = openvr._openvr
+        self.assertIs(self.runtime.library, library)
+        runtime = FakeRuntime()
+        with runtime:
+            self.assertIs(runtime.library, openvr._openvr)
+        self.assertIs(library, openvr._openvr)
+
+    def test_reinstall(self):
+        self.runtime.hidden_area_meshes[(openvr.Eye_Left, openvr.k_eHiddenAreaMesh_Standard)] = (
+            openvr.HmdVector2_t * 3)()
+        for _ in range(2):
+            self.assertEqual(1, openvr.VRSystem().getHiddenAreaMesh(openvr.Eye_Left).unTriangleCount)
+            openvr.shutdown()
+            self.runtime.uninstall()
+            self.runtime.install()
+            openvr.init(openvr.VRApplication_Scene)
+
+    def test_devices(self):
+        self.assertEqual(1, self.controller.index)
+        self.assertEqual(openvr.TrackedDeviceClass_Controller, self.vr_system.getTrackedDeviceClass(1))
+        self.assertEqual(openvr.TrackedDeviceClass_Invalid, self.vr_system.getTrackedDeviceClass(2))
+        self.assertEqual(1, self.vr_system.getTrackedDeviceIndexForControllerRole(
+            openvr.TrackedControllerRole_RightHand))
+        self.controller.connected = False
+        self.assertFalse(self.vr_system.isTrackedDeviceConnected(1))
+
+    def test_properties(self):
+        self.assertEqual('Fake HMD', self.vr_system.getStringTrackedDeviceProperty(
+            openvr.k_unTrackedDeviceIndex_Hmd, openvr.Prop_ModelNumber_String))
+        self.assertEqual(90.0, self.vr_system.getFloatTrackedDeviceProperty(
+            openvr.k_unTrackedDeviceIndex_Hmd, openvr.Prop_DisplayFrequency_Float))
+        self.assertEqual('FAKE-01', self.vr_system.getStringTrackedDeviceProperty(1, openvr.Prop_SerialNumber_String))
+        with self.assertRaises(openvr.error_code.TrackedProp_UnknownProperty):
+            self.vr_system.getStringTrackedDeviceProperty(1, openvr.Prop_ModelNumber_String)
+        with self.assertRaises(openvr.error_code.TrackedProp_InvalidDevice):
+            self.vr_system.getStringTrackedDeviceProperty(7, openvr.Prop_ModelNumber_String)
+        with self.assertRaises(openvr.error_code.TrackedProp_WrongDataType):
+            self.vr_system.getInt32TrackedDeviceProperty(0, openvr.Prop_ModelNumber_String)
+
+    def test_events(self):
+        self.runtime.set_property(1, openvr.Prop_ModelNumber_String, 'Fake Controller')
+        event = openvr.VREvent_t()
+        self.assertTrue(self.vr_system.pollNextEvent(event))
+        self.assertEqual(openvr.VREvent_PropertyChanged, event.eventType)
+        self.assertEqual(1, event.trackedDeviceIndex)
+        self.assertEqual(openvr.Prop_ModelNumber_String, event.data.property.prop)
+        self.assertFalse(self.vr_system.pollNextEvent(event))
+        self.assertEqual('Fake Controller', self.vr_system.getStringTrackedDeviceProperty(
+            1, openvr.Prop_ModelNumber_String))
+
+    def test_struct_results(self):
+        projection = self.vr_system.getProjectionMatrix(openvr.Eye_Left, 0.1, 100.0)
+        self.assertAlmostEqual(-1.0, projection.m[3][2])
+        self.assertAlmostEqual(1.0, projection.m[0][0])
+        eye_to_head = self.vr_system.getEyeToHeadTransform(openvr.Eye_Right)
+        self.assertAlmostEqual(0.032, eye_to_head.m[0][3])
+        self.assertEqual(0, self.vr_system.getHiddenAreaMesh(openvr.Eye_Left).unTriangleCount)
+
+    def test_wait_get_poses(self):
+        buffers = PoseBuffers()
+        poses = buffers.wait_get_poses()
+        self.assertTrue(poses[0].bPoseIsValid)
+        self.assertAlmostEqual(0.5, poses[1].mDeviceToAbsoluteTracking[0][3])
+        self.assertFalse(poses[2].bDeviceIsConnected)
+        self.assertEqual(1, self.runtime.frame_index)
+
+    def test_frame_timing(self):
+        self.runtime.frame_timing.m_flClientFrameIntervalMs = 11.1
+        compositor = openvr.VRCompositor()
+        compositor.waitGetPoses(None, None)
+        compositor.waitGetPoses(None, None)
+        result, timing = compositor.getFrameTiming(1)
+        self.assertTrue(result)
+        self.assertEqual(1, timing.m_nFrameIndex)
+        self.assertAlmostEqual(11.1, timing.m_flClientFrameIntervalMs, places=5)
+        self.assertEqual(0, compositor.getFrameTimings(None)[0])
+
+    def test_render_models(self):
+        vertices = [[0, 0, 0, 0, 0, 1, 0, 0], [1, 0, 0, 0, 0, 1, 1, 0], [0, 1, 0, 0, 0, 1, 0, 1]]
+        self.runtime.add_render_model('triangle', vertices, [0, 1, 2], texture=(1, 1, b'\xff\x00\x00\xff'),
+                                      loading_polls=2)
+        render_models = openvr.VRRenderModels()
+        self.assertEqual(1, render_models.getRenderModelCount())
+        self.assertEqual('triangle', render_models.getRenderModelName(0))
+        for i in range(2):
+            with self.assertRaises(openvr.error_code.RenderModelError_Loading):
+                render_models.loadRenderModel_Async('triangle')
+        model = render_models.loadRenderModel_Async('triangle')
+        self.assertEqual(3, model.unVertexCount)
+        self.assertEqual(1, model.unTriangleCount)
+        self.assertAlmostEqual(1.0, model.rVertexData[1].vPosition.v[0])
+        self.assertEqual(2, model.rIndexData[2])
+        render_models.freeRenderModel(model)
+        self.assertEqual(1, self.runtime.freed_model_count)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,93 @@
+#!/bin/env python
+
+import csv
+import os
+import tempfile
+import unittest
+
+import numpy
+
+import openvr
+from openvr.fake_runtime import FakeRuntime
+from openvr.frame_profiler import FrameProfiler
+
+
+class TestFrameProfiler(unittest.TestCase):
+
+    def record(self, profiler, frame_index, phases):
+        profiler.begin_frame(frame_index)
+        for name in phases:
+            profiler.begin(name)
+            profiler.end()
+        profiler.end_frame()
+
+    def test_phases(self):
+        profiler = FrameProfiler(capacity=4, gpu=False)
+        self.record(profiler, 10, ['wait_get_poses', 'ColorCubeActor', 'ColorCubeActor', 'submit'])
+        self.record(profiler, 11, ['wait_get_poses', 'submit'])
+        self.assertEqual(['wait_get_poses', 'ColorCubeActor', 'submit'], profiler.phase_names)
+        frames = profiler.frames()
+        self.assertEqual([10, 11], list(frames['frame_index']))
+        self.assertTrue(frames['ColorCubeActor_cpu_ms'][0] > 0)
+        self.assertEqual(0, frames['ColorCubeActor_cpu_ms'][1])
+        self.assertTrue(numpy.all(numpy.isnan(frames['submit_gpu_ms'])))
+
+    def test_ring_buffer(self):
+        profiler = FrameProfiler(capacity=3, gpu=False)
+        for i in range(5):
+            self.record(profiler, i, ['submit'])
+        self.assertEqual([2, 3, 4], list(profiler.frames()['frame_index']))
+        self.assertEqual([3, 4], list(profiler.frames(2)['frame_index']))
+        self.assertEqual(5, profiler.frame_count)
+
+    def test_too_many_phases(self):
+        profiler = FrameProfiler(max_phases=1, gpu=False)
+        profiler.begin_frame()
+        profiler.begin('first')
+        profiler.end()
+        with self.assertRaises(ValueError):
+            profiler.begin('second')
+
+    def test_save_csv(self):
+        profiler = FrameProfiler(gpu=False)
+        self.record(profiler, 7, ['submit'])
+        with tempfile.TemporaryDirectory() as directory:
+            file_name = os.path.join(directory, 'frames.csv')
+            profiler.save_csv(file_name)
+            with open(file_name, newline='') as f:
+                rows = list(csv.reader(f))
+        self.assertEqual(['frame_index', 'submit_cpu_ms', 'submit_gpu_ms'], rows[0])
+        self.assertEqual('7', rows[1][0])
+        self.assertEqual('nan', rows[1][2])
+
+
+class TestCompositorFrameIndex(unittest.TestCase):
+
+    def setUp(self):
+        self.runtime = FakeRuntime()
+        self.runtime.install()
+        openvr.init(openvr.VRApplication_Scene)
+
+    def tearDown(self):
+        openvr.shutdown()
+        self.runtime.uninstall()
+
+    def test_frame_index(self):
+        compositor = openvr.VRCompositor()
+        poses = (openvr.TrackedDevicePose_t * openvr.k_unMaxTrackedDeviceCount)()
+        timing = openvr.Compositor_FrameTiming()
+        profiler = FrameProfiler(gpu=False)
+        for _ in range(3):
+            profiler.begin_frame()
+            profiler.begin('wait_get_poses')
+            compositor.waitGetPoses(poses, None)
+            profiler.end()
+            compositor.getFrameTiming(0, timing)
+            profiler.set_frame_index(timing.m_nFrameIndex)
+            profiler.end_frame()
+        count, timings = compositor.getFrameTimings((openvr.Compositor_FrameTiming * 3)())
+        self.assertEqual([t.m_nFrameIndex for t in timings[:count]], list(profiler.frames()['frame_index']))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,76 @@
+#!/bin/env python
+
+import unittest
+
+import numpy
+
+import openvr
+from openvr.fake_runtime import FakeRuntime
+from openvr.gl_renderer import OpenVrFramebuffer, StereoUniforms, _crop_to_aspect
+
+
+class TestSideBySideSubmit(unittest.TestCase):
+
+    def setUp(self):
+        self.runtime = FakeRuntime()
+        self.runtime.install()
+        openvr.init(openvr.VRApplication_Scene)
+
+    def tearDown(self):
+        openvr.shutdown()
+        self.runtime.uninstall()
+
+    def test_submit_side_by_side(self):
+        fb = OpenVrFramebuffer(200, 100, side_by_side=True)
+        fb.texture = openvr.Texture_t(7, openvr.TextureType_OpenGL, openvr.ColorSpace_Gamma)  # normally by init_gl()
+        fb.submit_side_by_side()
+        self.assertEqual([
+            (openvr.Eye_Left, 7, (0.0, 0.0, 0.5, 1.0), openvr.Submit_Default),
+            (openvr.Eye_Right, 7, (0.5, 0.0, 1.0, 1.0), openvr.Submit_Default),
+        ], list(self.runtime.submits))
+
+    def test_scaled_eye_size(self):
+        fb = OpenVrFramebuffer(200, 100)
+        fb.texture = openvr.Texture_t(7, openvr.TextureType_OpenGL, openvr.ColorSpace_Gamma)
+        fb.submit(openvr.Eye_Left)
+        fb.set_eye_size(150, 50)
+        fb.submit(openvr.Eye_Right)
+        self.assertEqual([None, (0.0, 0.0, 0.75, 0.5)], [submit[2] for submit in self.runtime.submits])
+        stereo_fb = OpenVrFramebuffer(200, 100, side_by_side=True)
+        stereo_fb.set_eye_size(50, 100)
+        self.assertEqual((0.25, 0.5), (stereo_fb.right_bounds.uMin, stereo_fb.right_bounds.uMax))
+
+
+class TestMirrorCrop(unittest.TestCase):
+
+    def test_crop_to_aspect(self):
+        self.assertEqual((0, 320, 1512, 1040), _crop_to_aspect(0, 0, 1512, 1680, 1512 / 1040))
+        self.assertEqual((1668, 0, 1200, 1680), _crop_to_aspect(1512, 0, 1512, 1680, 800 / 1120))
+        self.assertEqual((0, 0, 800, 600), _crop_to_aspect(0, 0, 800, 600, 4 / 3))
+
+
+class TestStereoUniforms(unittest.TestCase):
+
+    def test_pack(self):
+        views = [numpy.identity(4, dtype=numpy.float32) for _ in range(2)]
+        views[0][3, :3] = (0.032, -1.6, 0.0)  # GL layout: translation in the bottom row
+        views[1][3, :3] = (-0.032, -1.6, 0.0)
+        projections = [numpy.diag([1.0, 1.0, -1.0, 0.0]).astype(numpy.float32) for _ in range(2)]
+        for projection, offset in zip(projections, (-0.2, -0.3)):
+            projection[2, 3] = -1.0  # w is the distance in front of the eye
+            projection[3, 2] = offset
+        data = numpy.frombuffer(StereoUniforms().pack(views, projections).tobytes(), dtype=numpy.float32)
+        # std140: mat4 arrays are 64 byte matrices, one after another, in declaration order
+        view_projection, view, projection = data.reshape(3, 2, 4, 4)
+        for eye in range(2):
+            numpy.testing.assert_array_equal(views[eye], view[eye])
+            numpy.testing.assert_array_equal(projections[eye], projection[eye])
+            numpy.testing.assert_allclose(views[eye] @ projections[eye], view_projection[eye])
+        # Row vector points transform by view, then projection
+        point = numpy.array([0.0, 1.6, -1.0, 1.0], dtype=numpy.float32)
+        numpy.testing.assert_allclose(point @ view_projection[0], [0.032, 0.0, 0.8, 1.0], atol=1e-6)
+        numpy.testing.assert_allclose(point @ view_projection[1], [-0.032, 0.0, 0.7, 1.0], atol=1e-6)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,29 @@
+#!/bin/env python
+
+import inspect
+import unittest
+
+from openvr.glframework import shader_string
+
+
+class TestShaderString(unittest.TestCase):
+
+    def test_defines(self):
+        source = shader_string("""
+            void main() {}
+            """, glsl_version='330', defines=('FIRST', 'SECOND'))
+        self.assertEqual(['#version 330', '#define FIRST', '#define SECOND'], source.splitlines()[:3])
+
+    def test_line_numbers(self):
+        first_line = inspect.currentframe().f_lineno + 2
+        source = shader_string("""
+            void main() {}
+            """)
+        lines = source.splitlines()
+        # #line sets the number of the line after it, the empty first line of the literal
+        self.assertEqual(f'#line {first_line - 1}', lines[1])
+        self.assertEqual('void main() {}', lines[3])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,143 @@
+#!/bin/env python
+
+import ctypes
+import unittest
+from ctypes import sizeof
+
+import numpy
+
+import openvr
+from openvr.fake_runtime import FakeRenderModel
+from openvr.numpy_arrays import (
+    PoseArrayView, hidden_area_mesh_vertices, inverse_matrices_to_gl, matrices_to_gl, render_model_indices,
+    render_model_texture_pixels, render_model_vertices, tracked_device_pose_dtype)
+
+
+class TestPoseArrayView(unittest.TestCase):
+
+    def test_dtype_size(self):
+        self.assertEqual(sizeof(openvr.TrackedDevicePose_t), tracked_device_pose_dtype.itemsize)
+
+    def test_shapes(self):
+        view = PoseArrayView()
+        self.assertEqual((64, 3, 4), view.matrices.shape)
+        self.assertEqual((64, 3), view.velocities.shape)
+        self.assertEqual((64, 3), view.angular_velocities.shape)
+        self.assertEqual(numpy.bool_, view.valid.dtype)
+        self.assertEqual(numpy.bool_, view.connected.dtype)
+
+    def test_shares_memory(self):
+        poses = (openvr.TrackedDevicePose_t * openvr.k_unMaxTrackedDeviceCount)()
+        view = PoseArrayView(poses)
+        poses[3].mDeviceToAbsoluteTracking[1][2] = 5.0
+        poses[3].vVelocity[0] = 2.0
+        poses[3].vAngularVelocity[2] = -1.0
+        poses[3].bPoseIsValid = 1
+        poses[5].bDeviceIsConnected = 1
+        poses[5].eTrackingResult = openvr.TrackingResult_Running_OK
+        self.assertEqual(5.0, view.matrices[3, 1, 2])
+        self.assertEqual(2.0, view.velocities[3, 0])
+        self.assertEqual(-1.0, view.angular_velocities[3, 2])
+        self.assertEqual([3], list(view.valid_indices()))
+        self.assertTrue(view.connected[5])
+        self.assertFalse(view.connected[3])
+        self.assertEqual(openvr.TrackingResult_Running_OK, view.tracking_results[5])
+        # Writes go the other way too
+        view.matrices[0, 0, 3] = 7.0
+        self.assertEqual(7.0, poses[0].mDeviceToAbsoluteTracking[0][3])
+
+
+class TestMatrixConversion(unittest.TestCase):
+
+    def setUp(self):
+        # Rotation by 90 degrees about Y, plus a translation
+        self.pose = openvr.HmdMatrix34_t()
+        rows = ((0, 0, 1, 1), (0, 1, 0, 2), (-1, 0, 0, 3))
+        for i, row in enumerate(rows):
+            for j, value in enumerate(row):
+                self.pose.m[i][j] = value
+        self.expected = numpy.array(rows + ((0, 0, 0, 1),), dtype=numpy.float32)
+
+    def test_single_matrix34(self):
+        result = matrices_to_gl(self.pose)
+        self.assertEqual((1, 4, 4), result.shape)
+        self.assertTrue(result.flags.c_contiguous)
+        numpy.testing.assert_array_equal(self.expected.T, result[0])
+
+    def test_matrix44(self):
+        mat = openvr.HmdMatrix44_t()
+        for i in range(4):
+            for j in range(4):
+                mat.m[i][j] = 4 * i + j
+        numpy.testing.assert_array_equal(numpy.arange(16).reshape(4, 4).T, matrices_to_gl(mat)[0])
+        numpy.testing.assert_allclose(
+            numpy.linalg.inv(self.expected).T,
+            inverse_matrices_to_gl(self.expected)[0], atol=1e-6)
+
+    def test_inverse(self):
+        result = inverse_matrices_to_gl(self.pose)[0]
+        numpy.testing.assert_allclose(numpy.linalg.inv(self.expected).T, result, atol=1e-6)
+
+    def test_pose_array_out(self):
+        poses = (openvr.TrackedDevicePose_t * openvr.k_unMaxTrackedDeviceCount)()
+        poses[2].mDeviceToAbsoluteTracking = self.pose
+        out = numpy.zeros((openvr.k_unMaxTrackedDeviceCount, 4, 4), dtype=numpy.float32)
+        self.assertIs(out, matrices_to_gl(poses, out=out))
+        numpy.testing.assert_array_equal(self.expected.T, out[2])
+        self.assertEqual(1.0, out[0, 3, 3])
+        # Invalid all-zero poses still invert to finite values
+        self.assertIs(out, inverse_matrices_to_gl(PoseArrayView(poses), out=out))
+        self.assertTrue(numpy.all(numpy.isfinite(out)))
+
+    def test_out_shape_mismatch(self):
+        out = numpy.zeros((2, 4, 4), dtype=numpy.float32)
+        self.assertRaises(ValueError, matrices_to_gl, self.pose, out)
+
+
+class TestRenderModelArrays(unittest.TestCase):
+
+    def setUp(self):
+        vertices = numpy.arange(24, dtype=numpy.float32).reshape(3, 8)
+        pixels = bytes(range(2 * 3 * 4))
+        self.fake = FakeRenderModel('triangle', vertices, [0, 1, 2], texture=(3, 2, pixels))
+
+    def test_vertices(self):
+        vertices = render_model_vertices(self.fake.model)
+        self.assertEqual((3, 8), vertices.shape)
+        self.assertEqual(numpy.float32, vertices.dtype)
+        self.assertEqual(9.0, vertices[1, 1])
+        self.fake.vertices[2].vNormal.v[0] = -1.0
+        self.assertEqual(-1.0, vertices[2, 3])  # shares memory
+
+    def test_indices(self):
+        indices = render_model_indices(self.fake.model)
+        self.assertEqual(numpy.uint16, indices.dtype)
+        self.assertEqual([0, 1, 2], list(indices))
+
+    def test_texture(self):
+        pixels = render_model_texture_pixels(self.fake.texture_map)
+        self.assertEqual((2, 3, 4), pixels.shape)
+        self.assertEqual(23, pixels[1, 2, 3])
+
+    def test_empty(self):
+        model = openvr.RenderModel_t()
+        self.assertEqual((0, 8), render_model_vertices(model).shape)
+        self.assertEqual((0, ), render_model_indices(model).shape)
+
+
+class TestHiddenAreaMesh(unittest.TestCase):
+
+    def test_vertices(self):
+        points = (openvr.HmdVector2_t * 3)()
+        points[2].v[0] = 0.25
+        mesh = openvr.HiddenAreaMesh_t()
+        mesh.pVertexData = ctypes.cast(points, ctypes.POINTER(openvr.HmdVector2_t))
+        mesh.unTriangleCount = 1
+        vertices = hidden_area_mesh_vertices(mesh)
+        self.assertEqual((3, 2), vertices.shape)
+        self.assertEqual(0.25, vertices[2, 0])
+        self.assertEqual((0, 2), hidden_area_mesh_vertices(openvr.HiddenAreaMesh_t()).shape)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,53 @@
+#!/bin/env python
+
+import unittest
+
+import openvr
+from openvr.fake_runtime import FakeRuntime
+
+
+class TestOutputStructs(unittest.TestCase):
+
+    def setUp(self):
+        self.runtime = FakeRuntime()
+        self.runtime.install()
+        self.runtime.add_device(openvr.TrackedDeviceClass_HMD)
+        self.controller = self.runtime.add_device(openvr.TrackedDeviceClass_Controller)
+        self.controller.controller_state.unPacketNum = 42
+        self.vr_system = openvr.init(openvr.VRApplication_Scene)
+        self.compositor = openvr.VRCompositor()
+
+    def tearDown(self):
+        openvr.shutdown()
+        self.runtime.uninstall()
+
+    def test_controller_state(self):
+        state = openvr.VRControllerState_t()
+        result, state2 = self.vr_system.getControllerState(1, state)
+        self.assertTrue(result)
+        self.assertIs(state, state2)
+        self.assertEqual(42, state.unPacketNum)
+        # Without an output argument, a new structure is returned each time
+        result, state3 = self.vr_system.getControllerState(1)
+        self.assertIsNot(state, state3)
+        self.assertEqual(42, state3.unPacketNum)
+
+    def test_frame_timing(self):
+        self.compositor.waitGetPoses(None, None)
+        timing = openvr.Compositor_FrameTiming()
+        result, timing2 = self.compositor.getFrameTiming(timing=timing)
+        self.assertTrue(result)
+        self.assertIs(timing, timing2)
+        self.assertEqual(1, timing.m_nFrameIndex)
+
+    def test_last_pose(self):
+        self.controller.set_pose(((1, 0, 0, 2.0), (0, 1, 0, 0), (0, 0, 1, 0)))
+        pose = openvr.TrackedDevicePose_t()
+        pose2, game_pose = self.compositor.getLastPoseForTrackedDeviceIndex(1, outputPose=pose)
+        self.assertIs(pose, pose2)
+        self.assertAlmostEqual(2.0, pose.mDeviceToAbsoluteTracking[0][3])
+        self.assertAlmostEqual(2.0, game_pose.mDeviceToAbsoluteTracking[0][3])
+
+
+if __name__ == '__main__':
+    unittest.main()
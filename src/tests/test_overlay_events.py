@@ -0,0 +1,108 @@
+#!/bin/env python
+
+import unittest
+
+import openvr
+from openvr.event_dispatcher import EventDispatcher
+from openvr.fake_runtime import FakeRuntime
+from openvr.overlay_events import OverlayEventMultiplexer
+
+
+class TestOverlayEventMultiplexer(unittest.TestCase):
+
+    def setUp(self):
+        self.runtime = FakeRuntime()
+        self.runtime.install()
+        openvr.init(openvr.VRApplication_Overlay)
+        self.overlay = openvr.VROverlay()
+        self.received = []
+
+    def tearDown(self):
+        openvr.shutdown()
+        self.runtime.uninstall()
+
+    def record(self, overlay_handle, event):
+        self.received.append((overlay_handle, event.eventType))
+
+    def create(self, key, visible=True):
+        handle = self.overlay.createOverlay(key, key)
+        if visible:
+            self.overlay.showOverlay(handle)
+        return handle
+
+    def test_callbacks(self):
+        first = self.create('first')
+        second = self.create('second')
+        multiplexer = OverlayEventMultiplexer(capacity=2)
+        multiplexer.register(first, self.record)
+        multiplexer.register(second, self.record)
+        for _ in range(2):
+            self.runtime.queue_overlay_event(second, openvr.VREvent_MouseMove)
+        self.assertEqual(4, multiplexer.poll())
+        self.assertEqual([
+            (first, openvr.VREvent_OverlayShown),
+            (second, openvr.VREvent_OverlayShown),
+            (second, openvr.VREvent_MouseMove),
+            (second, openvr.VREvent_MouseMove),
+        ], self.received)
+
+    def test_dispatcher(self):
+        handle = self.create('menu')
+        dispatcher = EventDispatcher()
+        dispatcher.add_handler(openvr.VREvent_MouseButtonDown, lambda event, data: self.received.append(data.button),
+                               overlay_handle=handle)
+        multiplexer = OverlayEventMultiplexer(dispatcher=dispatcher)
+        multiplexer.register(handle)
+        data = openvr.VREvent_Mouse_t()
+        data.button = openvr.VRMouseButton_Left
+        self.runtime.queue_overlay_event(handle, openvr.VREvent_MouseButtonDown, data=data)
+        multiplexer.poll()
+        self.assertEqual([openvr.VRMouseButton_Left], self.received)
+
+    def test_hidden_overlays(self):
+        handle = self.create('hidden', visible=False)
+        multiplexer = OverlayEventMultiplexer(max_interval=4)
+        multiplexer.register(handle, self.record)
+        self.overlay.showOverlay(handle)
+        multiplexer.poll()
+        self.assertEqual([(handle, openvr.VREvent_OverlayShown)], self.received)
+        polls = self.runtime.overlay_poll_count
+        for _ in range(8):
+            multiplexer.poll()
+        self.assertEqual(8, self.runtime.overlay_poll_count - polls)
+        self.overlay.hideOverlay(handle)
+        multiplexer.poll()
+        polls = self.runtime.overlay_poll_count
+        for _ in range(8):
+            multiplexer.poll()
+        self.assertEqual(2, self.runtime.overlay_poll_count - polls)
+
+    def test_adaptive_polling(self):
+        handles = [self.create(f'panel {i}') for i in range(20)]
+        multiplexer = OverlayEventMultiplexer(adaptive=True, max_interval=16)
+        for handle in handles:
+            multiplexer.register(handle, self.record)
+        for _ in range(40):
+            multiplexer.poll()
+        polls = self.runtime.overlay_poll_count
+        multiplexer.wake(handles[3])
+        self.runtime.queue_overlay_event(handles[3], openvr.VREvent_MouseMove)
+        for _ in range(16):
+            multiplexer.poll()
+        # Idle overlays are polled once in 16 frames. The woken one is polled at frames 1, 2, 4, 8 and 16,
+        # as it backs off again, with one more call at frame 1 to read its event.
+        self.assertEqual(len(handles) - 1 + 6, self.runtime.overlay_poll_count - polls)
+        self.assertIn((handles[3], openvr.VREvent_MouseMove), self.received)
+
+    def test_unregister(self):
+        handle = self.create('gone')
+        multiplexer = OverlayEventMultiplexer()
+        multiplexer.register(handle, self.record)
+        multiplexer.unregister(handle)
+        self.assertNotIn(handle, multiplexer)
+        self.assertEqual(0, multiplexer.poll())
+        self.assertEqual([], self.received)
+
+
+if __name__ == '__main__':
+    unittest.main()
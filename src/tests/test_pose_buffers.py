@@ -0,0 +1,55 @@
+#!/bin/env python
+
+import unittest
+from ctypes import POINTER
+from types import SimpleNamespace
+
+import openvr
+from openvr.pose_buffers import PoseBuffers
+
+
+class TestPoseBuffers(unittest.TestCase):
+
+    def setUp(self):
+        self.calls = []
+
+        def wait_get_poses(render_poses, render_count, game_poses, game_count):
+            self.calls.append((render_count, game_count))
+            for i in range(render_count):
+                render_poses[i].bPoseIsValid = 1
+                render_poses[i].mDeviceToAbsoluteTracking[0][3] = float(len(self.calls))
+            return openvr.VRCompositorError_None
+
+        fn_type = openvr.OPENVR_FNTABLE_CALLTYPE(
+            openvr.EVRCompositorError,
+            POINTER(openvr.TrackedDevicePose_t), openvr.c_uint32,
+            POINTER(openvr.TrackedDevicePose_t), openvr.c_uint32)
+        self.wait_get_poses = fn_type(wait_get_poses)
+        self.compositor = SimpleNamespace(function_table=SimpleNamespace(
+            waitGetPoses=self.wait_get_poses,
+            getLastPoses=fn_type(lambda *args: openvr.VRCompositorError_DoNotHaveFocus),
+        ))
+
+    def test_buffers_are_reused(self):
+        buffers = PoseBuffers(compositor=self.compositor)
+        poses1 = buffers.wait_get_poses()
+        poses2 = buffers.wait_get_poses()
+        self.assertIs(poses1, poses2)
+        self.assertIs(buffers.render_poses, poses1)
+        self.assertEqual([(64, 64), (64, 64)], self.calls)
+        self.assertTrue(poses2[63].bPoseIsValid)
+        self.assertEqual(2.0, poses2[0].mDeviceToAbsoluteTracking[0][3])
+
+    def test_without_game_poses(self):
+        buffers = PoseBuffers(count=4, game_poses=False, compositor=self.compositor)
+        buffers.wait_get_poses()
+        self.assertIsNone(buffers.game_poses)
+        self.assertEqual([(4, 0)], self.calls)
+
+    def test_error(self):
+        buffers = PoseBuffers(compositor=self.compositor)
+        self.assertRaises(openvr.error_code.CompositorError_DoNotHaveFocus, buffers.get_last_poses)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,78 @@
+#!/bin/env python
+
+import unittest
+
+import openvr
+from openvr.fake_runtime import FakeRuntime
+from openvr.property_cache import TrackedDevicePropertyCache
+
+
+class TestTrackedDevicePropertyCache(unittest.TestCase):
+
+    def setUp(self):
+        self.runtime = FakeRuntime()
+        self.runtime.install()
+        self.runtime.add_device(openvr.TrackedDeviceClass_HMD, properties={
+            openvr.Prop_RenderModelName_String: 'hmd_model',
+            openvr.Prop_DisplayFrequency_Float: 90.0,
+            openvr.Prop_WillDriftInYaw_Bool: False,
+            openvr.Prop_HardwareRevision_Uint64: 7,
+            openvr.Prop_DisplayHiddenArea_Binary_Start: b'\x01\x02\x03',
+        })
+        openvr.init(openvr.VRApplication_Scene)
+        self.cache = TrackedDevicePropertyCache()
+
+    def tearDown(self):
+        openvr.shutdown()
+        self.runtime.uninstall()
+
+    def test_values(self):
+        self.assertEqual('hmd_model', self.cache.get_string(0, openvr.Prop_RenderModelName_String))
+        self.assertEqual(90.0, self.cache.get_float(0, openvr.Prop_DisplayFrequency_Float))
+        self.assertIs(False, self.cache.get_bool(0, openvr.Prop_WillDriftInYaw_Bool))
+        self.assertEqual(7, self.cache.get_uint64(0, openvr.Prop_HardwareRevision_Uint64))
+        self.assertEqual(openvr.TrackedDeviceClass_HMD, self.cache.get_int32(0, openvr.Prop_DeviceClass_Int32))
+        self.assertEqual(b'\x01\x02\x03', self.cache.get_array(
+            0, openvr.Prop_DisplayHiddenArea_Binary_Start, openvr.k_unHiddenAreaPropertyTag))
+
+    def test_values_are_cached(self):
+        for i in range(3):
+            self.cache.get_string(0, openvr.Prop_RenderModelName_String)
+            self.cache.get_float(0, openvr.Prop_DisplayFrequency_Float)
+        self.assertEqual(2, self.runtime.property_query_count)
+
+    def test_errors_are_cached(self):
+        for i in range(3):
+            with self.assertRaises(openvr.error_code.TrackedProp_UnknownProperty):
+                self.cache.get_string(0, openvr.Prop_ModelNumber_String)
+        with self.assertRaises(openvr.error_code.TrackedProp_InvalidDevice):
+            self.cache.get_string(3, openvr.Prop_RenderModelName_String)
+        self.assertEqual(2, self.runtime.property_query_count)
+
+    def test_property_changed_event(self):
+        self.assertEqual('hmd_model', self.cache.get_string(0, openvr.Prop_RenderModelName_String))
+        self.runtime.set_property(0, openvr.Prop_RenderModelName_String, 'other_model')
+        self.assertEqual('hmd_model', self.cache.get_string(0, openvr.Prop_RenderModelName_String))
+        event = openvr.VREvent_t()
+        while openvr.VRSystem().pollNextEvent(event):
+            self.assertTrue(self.cache.process_event(event))
+        self.assertEqual('other_model', self.cache.get_string(0, openvr.Prop_RenderModelName_String))
+
+    def test_device_events(self):
+        self.cache.get_float(0, openvr.Prop_DisplayFrequency_Float)
+        self.runtime.set_property(0, openvr.Prop_DisplayFrequency_Float, 120.0, notify=False)
+        event = self.runtime.queue_event(openvr.VREvent_TrackedDeviceUpdated, 0)
+        self.assertTrue(self.cache.process_event(event))
+        self.assertEqual(120.0, self.cache.get_float(0, openvr.Prop_DisplayFrequency_Float))
+        self.assertFalse(self.cache.process_event(self.runtime.queue_event(openvr.VREvent_ButtonPress, 0)))
+
+    def test_reinit(self):
+        self.cache.get_string(0, openvr.Prop_RenderModelName_String)
+        self.runtime.set_property(0, openvr.Prop_RenderModelName_String, 'other_model', notify=False)
+        openvr.shutdown()
+        openvr.init(openvr.VRApplication_Scene)
+        self.assertEqual('other_model', self.cache.get_string(0, openvr.Prop_RenderModelName_String))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,60 @@
+#!/bin/env python
+
+import unittest
+
+import numpy
+
+import openvr
+from openvr.fake_runtime import FakeRuntime
+from openvr.property_snapshot import snapshot_device_properties
+
+
+class TestPropertySnapshot(unittest.TestCase):
+
+    def setUp(self):
+        self.runtime = FakeRuntime()
+        self.runtime.install()
+        self.runtime.add_device(openvr.TrackedDeviceClass_HMD, properties={
+            openvr.Prop_ModelNumber_String: 'Fake HMD',
+            openvr.Prop_StatusDisplayTransform_Matrix34: openvr.HmdMatrix34_t(),
+        })
+        self.runtime.add_device(openvr.TrackedDeviceClass_Controller, properties={
+            openvr.Prop_DeviceBatteryPercentage_Float: 0.5,
+            openvr.Prop_ControllerRoleHint_Int32: openvr.TrackedControllerRole_LeftHand,
+        })
+        openvr.init(openvr.VRApplication_Other)
+
+    def tearDown(self):
+        openvr.shutdown()
+        self.runtime.uninstall()
+
+    def test_default_properties(self):
+        snapshot = snapshot_device_properties()
+        self.assertEqual(openvr.k_unMaxTrackedDeviceCount, len(snapshot['device_index']))
+        self.assertEqual(['FAKE-00', 'FAKE-01', ''], list(snapshot['Prop_SerialNumber_String'][:3]))
+        self.assertEqual('Fake HMD', snapshot['Prop_ModelNumber_String'][0])
+        self.assertEqual(openvr.TrackedProp_UnknownProperty, snapshot['Prop_ModelNumber_String_error'][1])
+        self.assertEqual(numpy.float32, snapshot['Prop_DeviceBatteryPercentage_Float'].dtype)
+        self.assertAlmostEqual(0.5, snapshot['Prop_DeviceBatteryPercentage_Float'][1])
+        self.assertEqual(openvr.TrackedControllerRole_LeftHand, snapshot['Prop_ControllerRoleHint_Int32'][1])
+        self.assertEqual([openvr.TrackedDeviceClass_HMD, openvr.TrackedDeviceClass_Controller],
+                         list(snapshot['Prop_DeviceClass_Int32'][:2]))
+        self.assertTrue(numpy.all(snapshot['Prop_SerialNumber_String_error'][2:] == openvr.TrackedProp_InvalidDevice))
+
+    def test_invalid_devices_are_skipped(self):
+        snapshot_device_properties(device_indices=[5, 6])
+        # Only the first property of each missing device is queried
+        self.assertEqual(2, self.runtime.property_query_count)
+
+    def test_property_names_and_matrices(self):
+        snapshot = snapshot_device_properties(
+            ['Prop_StatusDisplayTransform_Matrix34', openvr.Prop_WillDriftInYaw_Bool], device_indices=[0])
+        self.assertEqual((1, 3, 4), snapshot['Prop_StatusDisplayTransform_Matrix34'].shape)
+        self.assertEqual(0, snapshot['Prop_StatusDisplayTransform_Matrix34_error'][0])
+        self.assertEqual(openvr.TrackedProp_UnknownProperty, snapshot['Prop_WillDriftInYaw_Bool_error'][0])
+        with self.assertRaises(ValueError):
+            snapshot_device_properties([openvr.Prop_DisplayHiddenArea_Binary_Start])
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,114 @@
+#!/bin/env python
+
+import os
+import tempfile
+import time
+import unittest
+
+import numpy
+
+import openvr
+from openvr.fake_runtime import FakeRuntime
+from openvr.render_model_cache import RenderModelDiskCache
+from openvr.render_model_loader import READY, RenderModelLoader
+
+
+class TestRenderModelDiskCache(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.cache = RenderModelDiskCache(os.path.join(self.directory.name, 'models'))
+        self.vertices = numpy.arange(24, dtype=numpy.float32).reshape(3, 8)
+        self.pixels = numpy.arange(24, dtype=numpy.uint8).reshape(2, 3, 4)
+
+    def tearDown(self):
+        self.directory.cleanup()
+
+    def test_round_trip(self):
+        self.assertIsNone(self.cache.load('{vendor}model/1', 'key'))
+        self.cache.store('{vendor}model/1', 'key', self.vertices, [0, 1, 2], self.pixels)
+        cached = self.cache.load('{vendor}model/1', 'key')
+        numpy.testing.assert_array_equal(self.vertices, cached.vertices)
+        self.assertEqual(numpy.uint16, cached.indices.dtype)
+        self.assertEqual([0, 1, 2], list(cached.indices))
+        numpy.testing.assert_array_equal(self.pixels, cached.texture_pixels)
+        self.assertIsInstance(cached.vertices.base, numpy.memmap)
+
+    def test_no_texture(self):
+        self.cache.store('model', 'key', self.vertices, [0, 1, 2])
+        self.assertIsNone(self.cache.load('model', 'key').texture_pixels)
+
+    def test_stale_and_damaged_entries(self):
+        self.cache.store('model', 'key', self.vertices, [0, 1, 2], self.pixels)
+        self.assertIsNone(self.cache.load('model', 'other key'))
+        self.assertIsNone(self.cache.load('model', None))
+        path = self.cache.path('model')
+        with open(path, 'r+b') as f:
+            f.truncate(os.path.getsize(path) - 1)
+        self.assertIsNone(self.cache.load('model', 'key'))
+
+    def test_no_temporary_files(self):
+        self.cache.store('model', 'key', self.vertices, [0, 1, 2])
+        self.cache.store('model', 'key', self.vertices, [0, 1, 2])
+        self.assertEqual([os.path.basename(self.cache.path('model'))], os.listdir(self.cache.directory))
+
+
+class TestLoaderWithDiskCache(unittest.TestCase):
+
+    def setUp(self):
+        self.directory = tempfile.TemporaryDirectory()
+        self.runtime = FakeRuntime()
+        self.runtime.install()
+        self.runtime.add_render_model('box', [[i] * 8 for i in range(3)], [0, 1, 2],
+                                      texture=(1, 1, b'\x01\x02\x03\x04'), loading_polls=2,
+                                      original_path=self.write_source('box.obj'))
+        openvr.init(openvr.VRApplication_Scene)
+        self.cache = RenderModelDiskCache(os.path.join(self.directory.name, 'cache'))
+
+    def tearDown(self):
+        openvr.shutdown()
+        self.runtime.uninstall()
+        self.directory.cleanup()
+
+    def write_source(self, file_name):
+        path = os.path.join(self.directory.name, file_name)
+        with open(path, 'w') as f:
+            f.write('box')
+        return path
+
+    def load_box(self):
+        with RenderModelLoader(min_poll_interval=0.001, disk_cache=self.cache) as loader:
+            asset = loader.acquire('box')
+            deadline = time.monotonic() + 5.0
+            while not (asset.is_ready and os.path.exists(self.cache.path('box'))) and time.monotonic() < deadline:
+                time.sleep(0.001)
+            self.assertEqual(READY, asset.state)
+            return list(asset.indices), asset.texture_pixels.tobytes()
+
+    def test_warm_start(self):
+        self.assertEqual(([0, 1, 2], b'\x01\x02\x03\x04'), self.load_box())
+        self.assertEqual(1, self.runtime.loaded_model_count)
+        self.assertEqual(([0, 1, 2], b'\x01\x02\x03\x04'), self.load_box())
+        self.assertEqual(1, self.runtime.loaded_model_count)
+        self.assertEqual(1, self.runtime.loaded_texture_count)
+
+    def test_replaced_model(self):
+        self.load_box()
+        self.runtime.render_models['box'].original_path = self.write_source('replacement.obj')
+        self.load_box()
+        self.assertEqual(2, self.runtime.loaded_model_count)
+
+    def test_missing_source(self):
+        self.runtime.render_models['box'].original_path = os.path.join(self.directory.name, 'missing.obj')
+        self.assertIsNone(self.cache.validation_key('box'))
+        with RenderModelLoader(min_poll_interval=0.001, disk_cache=self.cache) as loader:
+            asset = loader.acquire('box')
+            deadline = time.monotonic() + 5.0
+            while not asset.is_ready and time.monotonic() < deadline:
+                time.sleep(0.001)
+            self.assertEqual(READY, asset.state)
+        self.assertFalse(os.path.exists(self.cache.path('box')))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,85 @@
+#!/bin/env python
+
+import time
+import unittest
+
+import openvr
+from openvr.fake_runtime import FakeRuntime
+from openvr.render_model_loader import FAILED, READY, RenderModelLoader
+
+
+class TestRenderModelLoader(unittest.TestCase):
+
+    def setUp(self):
+        self.runtime = FakeRuntime()
+        self.runtime.install()
+        vertices = [[i] * 8 for i in range(3)]
+        self.runtime.add_render_model('box', vertices, [0, 1, 2], texture=(2, 1, bytes(range(8))), loading_polls=3)
+        self.runtime.add_render_model('box_lid', vertices, [2, 1, 0], texture_id=0)
+        openvr.init(openvr.VRApplication_Scene)
+        self.loader = RenderModelLoader(min_poll_interval=0.001, max_poll_interval=0.004)
+
+    def tearDown(self):
+        self.loader.close()
+        openvr.shutdown()
+        self.runtime.uninstall()
+
+    def wait_for(self, count):
+        finished = []
+        deadline = time.monotonic() + 5.0
+        while len(finished) < count and time.monotonic() < deadline:
+            finished.extend(self.loader.take_ready())
+            time.sleep(0.001)
+        return finished
+
+    def test_load(self):
+        asset = self.loader.acquire('box')
+        self.assertFalse(asset.is_ready)
+        self.assertEqual([asset], self.wait_for(1))
+        self.assertEqual(READY, asset.state)
+        self.assertEqual((3, 8), asset.vertices.shape)
+        self.assertEqual([0, 1, 2], list(asset.indices))
+        self.assertEqual((1, 2, 4), asset.texture_pixels.shape)
+        self.assertEqual(7, asset.texture_pixels[0, 1, 3])
+
+    def test_shared_cache(self):
+        asset = self.loader.acquire('box')
+        self.assertIs(asset, self.loader.acquire('box'))
+        lid = self.loader.acquire('box_lid')
+        self.assertEqual(2, len(self.wait_for(2)))
+        self.assertIs(asset.texture_pixels, lid.texture_pixels)
+        self.assertEqual((2, 1), (self.runtime.loaded_model_count, self.runtime.loaded_texture_count))
+        self.loader.release(asset)
+        self.loader.release(lid)
+        self.assertEqual((1, 0), (self.runtime.freed_model_count, self.runtime.freed_texture_count))
+        self.loader.release(asset)
+        self.assertEqual((2, 1), (self.runtime.freed_model_count, self.runtime.freed_texture_count))
+        self.assertIsNone(asset.vertices)
+
+    def test_reinit(self):
+        asset = self.loader.acquire('box')
+        self.assertEqual([asset], self.wait_for(1))
+        openvr.shutdown()
+        openvr.init(openvr.VRApplication_Scene)
+        lid = self.loader.acquire('box_lid')
+        self.assertIs(openvr.VRRenderModels(), self.loader._render_models)
+        self.assertFalse(asset.is_ready)
+        self.assertEqual({asset, lid}, set(self.wait_for(2)))
+        self.assertEqual(7, asset.texture_pixels[0, 1, 3])
+        self.assertEqual((3, 2), (self.runtime.loaded_model_count, self.runtime.loaded_texture_count))
+
+    def test_invalid_model(self):
+        asset = self.loader.acquire('no_such_model')
+        self.assertEqual([asset], self.wait_for(1))
+        self.assertEqual(FAILED, asset.state)
+        self.assertEqual(openvr.VRRenderModelError_InvalidModel, asset.error)
+
+    def test_close(self):
+        self.loader.acquire('box_lid')
+        self.wait_for(1)
+        self.loader.close()
+        self.assertEqual(1, self.runtime.freed_model_count)
+
+
+if __name__ == '__main__':
+    unittest.main()
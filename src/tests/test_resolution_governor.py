@@ -0,0 +1,57 @@
+#!/bin/env python
+
+import unittest
+
+import openvr
+from openvr.fake_runtime import FakeRuntime
+from openvr.resolution_governor import ResolutionGovernor
+
+
+class TestResolutionGovernor(unittest.TestCase):
+
+    def setUp(self):
+        self.runtime = FakeRuntime()
+        self.runtime.install()
+        self.runtime.add_device(openvr.TrackedDeviceClass_HMD, properties={openvr.Prop_DisplayFrequency_Float: 100.0})
+        openvr.init(openvr.VRApplication_Scene)
+        self.compositor = openvr.VRCompositor()
+        self.governor = ResolutionGovernor(min_scale=0.5, step=0.1, raise_after=3, settle_frames=2)
+
+    def tearDown(self):
+        openvr.shutdown()
+        self.runtime.uninstall()
+
+    def frame(self, gpu_ms=5.0, dropped=0, reprojection_flags=0):
+        self.runtime.frame_timing.m_flTotalRenderGpuMs = gpu_ms
+        self.runtime.frame_timing.m_nNumDroppedFrames = dropped
+        self.runtime.frame_timing.m_nReprojectionFlags = reprojection_flags
+        self.compositor.waitGetPoses(None, None)
+        return self.governor.update()
+
+    def test_slow_frames_lower_scale(self):
+        self.assertEqual(1.0, self.frame())
+        self.assertAlmostEqual(0.9, self.frame(gpu_ms=9.5))
+        # Frames just after a change are ignored
+        self.assertAlmostEqual(0.9, self.frame(dropped=1))
+        self.assertAlmostEqual(0.9, self.frame(dropped=1))
+        self.assertAlmostEqual(0.8, self.frame(reprojection_flags=openvr.VRCompositor_ReprojectionReason_Gpu))
+        self.assertEqual(10.0, 1000 * self.governor.frame_interval)
+
+    def test_hysteresis(self):
+        self.governor.reset(0.5)
+        self.assertEqual([0.5, 0.5, 0.6], [self.frame(gpu_ms=5.0) for _ in range(3)])
+        # Between the low and high water marks, the scale stays put
+        self.assertEqual([0.6] * 8, [self.frame(gpu_ms=8.0) for _ in range(8)])
+        for _ in range(40):
+            self.frame(dropped=1)
+        self.assertEqual(0.5, self.governor.scale)
+
+    def test_low_resources(self):
+        self.runtime.low_resources = True
+        self.assertAlmostEqual(0.9, self.frame())
+        self.assertTrue(self.governor.low_resources)
+        self.assertEqual((907, 1008), self.governor.eye_size(1008, 1120))
+
+
+if __name__ == '__main__':
+    unittest.main()
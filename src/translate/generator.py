@@ -101,6 +101,8 @@ class CTypesGenerator(object):
             
                 @classmethod
                 def check_error_value(cls, error_value, message=''):
+                    if error_value == 0:
+                        return  # Success, in every category
                     error_class = cls.error_index[int(error_value)]
                     if not error_class.is_error:
                         return
@@ -146,6 +148,8 @@ class CTypesGenerator(object):
                     is_error = False
                 if error_name.endswith('_Success'):
                     is_error = False
+                if error_name.endswith('_OK'):
+                    is_error = False
                 base_classes = f'{error_category}'
                 if error_name.endswith('BufferTooSmall'):
                     base_classes += ', BufferTooSmallError'
@@ -259,6 +263,7 @@ class CTypesGenerator(object):
             if isinstance(declaration, model.Struct):
                 print(declaration, file=file_out)
                 print('\n', file=file_out)
+        CTypesGenerator.write_event_data_members(declarations=declarations, file_out=file_out)
 
         for declaration in declarations:
             if isinstance(declaration, model.COpenVRContext):
@@ -320,6 +325,26 @@ class CTypesGenerator(object):
         print('Generate complete')
 
 
+    @staticmethod
+    def write_event_data_members(declarations, file_out):
+        union_members = dict()
+        event_types = []
+        for declaration in declarations:
+            if isinstance(declaration, model.Struct) and declaration.name.endswith('VREvent_Data_t'):
+                for field in declaration.fields:
+                    union_members[field.name] = model.translate_type(field.type)
+            elif isinstance(declaration, model.EnumDecl) and declaration.name.endswith('EVREventType'):
+                event_types = declaration.constants
+        print('# VREvent_Data_t member name, and structure type, holding the payload of each EVREventType', file=file_out)
+        print('EVENT_DATA_MEMBERS = {', file=file_out)
+        for constant in event_types:
+            member = constant.event_data_member()
+            if member in union_members:
+                print(f"    {constant.name}: ('{member}', {union_members[member]}),", file=file_out)
+        print('}', file=file_out)
+        print('\n', file=file_out)
+
+
 def get_version(declarations):
     version = [0, 0, 0]
     for declaration in declarations:
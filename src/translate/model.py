@@ -18,6 +18,7 @@ class FunctionBase(Declaration):
         super().__init__(name=name, docstring=docstring)
         self.type = type_
         self.parameters = []
+        self.struct_size_types = set()
         self._count_parameter_names = set()
 
     def __str__(self):
@@ -44,9 +45,14 @@ class FunctionBase(Declaration):
                     sized_param = self.parameters[pix - 1]
                     t = sized_param.type.get_pointee().spelling
                     t = translate_type(t)
-                    p.always_value = f'sizeof({t})'
-
-    def ctypes_string(self, in_params=()):
+                    p.always_value = self.struct_size_value(t)
+
+    def ctypes_string(self, in_params=(), nothrow=False):
+        """
+        Python wrapper method source code.
+        With nothrow=True, returns source for a "_nothrow" variant, which returns the error code
+        after any other results, instead of raising an exception.
+        """
         in_params = list(in_params)
         self.annotate_parameters()
         call_params = []
@@ -58,15 +64,22 @@ class FunctionBase(Declaration):
             out_params.append(param)
         pre_call_statements = ''
         post_call_statements = ''
+        error_result = None
+        out_struct_params = []
         for p in self.parameters:
             if p.input_param_name():
                 in_params.append(p.input_param_name())
+            if p.is_output_struct():
+                # Callers may pass a preallocated instance, to be filled in place
+                out_struct_params.append(f'{p.py_name}=None')
             if p.call_param_name():
                 call_params.append(p.call_param_name())
             if p.return_param_name():
                 out_params.append(p.return_param_name())
             pre_call_statements += p.pre_call_block()
-            post_call_statements += p.post_call_block()
+            post_call_statements += p.post_call_block(check_error=not nothrow)
+            if p.is_error() and error_result is None:
+                error_result = f'{p.py_name}.value'
         # Handle output strings
         for pix, p in enumerate(self.parameters):
             if p.is_output_string():
@@ -109,7 +122,8 @@ class FunctionBase(Declaration):
                                 pt = p2.type.get_pointee()
                                 error_category = translate_error_category(pt)
                                 break
-                    if error_category is not None:
+                    # Errors from the size query are reported again by the second call
+                    if error_category is not None and not nothrow:
                         pre_call_statements += textwrap.dedent(f'''\
                             try:
                                 {error_category}.check_error_value(error.value)
@@ -125,14 +139,20 @@ class FunctionBase(Declaration):
                         {len_param.py_name} = {required_len_param.py_name}.value
                         {p.py_name} = ctypes.create_string_buffer({len_param.py_name})
                     ''')
-        param_list1 = ', '.join(in_params)
+        param_list1 = ', '.join(in_params + out_struct_params)
         # pythonically downcase first letter of method name
         result_annotation = ''
         if len(out_params) == 0:
             result_annotation = ' -> None'
-        method_string = f'def {self.py_method_name()}({param_list1}){result_annotation}:\n'
+        method_name = self.py_method_name()
+        if nothrow:
+            method_name += '_nothrow'
+            result_annotation = ''
+        method_string = f'def {method_name}({param_list1}){result_annotation}:\n'
         body_string = ''
-        if self.docstring:
+        if nothrow:
+            body_string += f'"""Like {self.py_method_name()}(), but returns the error code last, instead of raising it"""\n'
+        elif self.docstring:
             body_string += f'"""{self.docstring}"""\n'
         body_string += f'fn = {self.inner_function_name()}\n'
         body_string += pre_call_statements
@@ -143,9 +163,17 @@ class FunctionBase(Declaration):
             body_string += f'result = fn({param_list2})'
         else:
             body_string += f'fn({param_list2})'
+        if self.resets_context():
+            # Cached interface objects are only valid between init and shutdown
+            body_string += '\n_internal_module_context.reset()'
         if self.raise_error_code():
-            error_category = translate_error_category(self.type)
-            post_call_statements += f'\n{error_category}.check_error_value(error)'
+            if nothrow:
+                error_result = 'error'
+            else:
+                error_category = translate_error_category(self.type)
+                post_call_statements += f'\n{error_category}.check_error_value(error)'
+        if nothrow:
+            out_params.append(error_result)
         body_string += post_call_statements
         if self.py_method_name() == 'pollNextEvent':
             body_string += '\nreturn result != 0'  # Custom return statement
@@ -156,6 +184,12 @@ class FunctionBase(Declaration):
         method_string += body_string
         return method_string
 
+    def has_error_code(self):
+        """Whether this function reports an error code, either as its result or through an output parameter"""
+        if self.raise_error_code():
+            return True
+        return any(p.is_error() for p in self.parameters)
+
     def has_return(self):
         if self.type.spelling == 'void':
             return False
@@ -165,7 +199,7 @@ class FunctionBase(Declaration):
         return True
 
     def inner_function_name(self):
-        return f'self.function_table.{self.py_method_name()}'
+        return f'self._fn_{self.py_method_name()}'
 
     def py_method_name(self):
         n = self.name
@@ -176,6 +210,12 @@ class FunctionBase(Declaration):
     def raise_error_code(self):
         return re.match(r'(?:vr::)?E\S+Error$', self.type.spelling)
 
+    def resets_context(self):
+        return False
+
+    def struct_size_value(self, type_name):
+        return f'sizeof({type_name})'
+
     def returns_const_string(self):
         if not self.type.kind == TypeKind.POINTER:
             return False
@@ -205,10 +245,20 @@ class COpenVRContext(Declaration):
         class_string += textwrap.indent(textwrap.dedent(f'''\
                 
                 def checkClear(self):
+                    """
+                    Re-validate the cached interfaces against the OpenVR init token.
+                    Only needed if OpenVR might have been initialized or shut down outside of this module.
+                    """
                     global _vr_token
                     if _vr_token != getInitToken():
                         self.clear()
                         _vr_token = getInitToken()
+
+                def reset(self):
+                    """Drop the cached interfaces. Called whenever this module initializes or shuts down OpenVR."""
+                    global _vr_token
+                    self.clear()
+                    _vr_token = getInitToken()
                         
                 def clear(self):  
         '''), ' '*4)
@@ -218,7 +268,6 @@ class COpenVRContext(Declaration):
         for m in self.vr_method_names:
             method_string = textwrap.dedent(f'''\
                 def {m}(self):
-                    self.checkClear()
                     if self.m_p{m} is None:
                         self.m_p{m} = I{m}()
                     return self.m_p{m}
@@ -230,6 +279,15 @@ class COpenVRContext(Declaration):
             # Globals for context management
             _vr_token = None
             _internal_module_context = COpenVRContext()
+            
+            
+            def checkClear():
+                """
+                Interface objects returned by VRSystem(), VRCompositor() etc. are cached until init(), shutdown(),
+                initInternal2() or shutdownInternal() is called. Call checkClear() to re-validate them, if OpenVR
+                might have been re-initialized by other means, for example by another library in the same process.
+                """
+                _internal_module_context.checkClear()
         ''')
         for m in self.vr_method_names:
             method_string = textwrap.dedent(f'''\
@@ -261,18 +319,28 @@ class IVRClass(Declaration):
         name = translate_type(self.name)
         methods = 'pass'
         fn_table_methods = ''
+        struct_size_types = set()
         if len(self.methods) > 0:
             methods = '\n'
             for method in self.methods:
                 methods += textwrap.indent(str(method), 16*' ') + '\n\n'
+                if method.has_error_code():
+                    methods += textwrap.indent(method.ctypes_string(nothrow=True), 16*' ') + '\n\n'
                 fn_table_methods += '\n' + ' '*20 + f'{method.ctypes_fntable_string()}'
+                struct_size_types.update(method.struct_size_types)
+        struct_sizes = ''
+        if struct_size_types:
+            if not docstring:
+                struct_sizes += '\n'
+            for t in sorted(struct_size_types):
+                struct_sizes += ' '*16 + f'_sizeof_{t} = sizeof({t})\n'
         return inspect.cleandoc(f'''
             class {name}_FnTable(Structure):
                 _fields_ = [{fn_table_methods}
                 ]
         
 
-            class {name}({self.base}):{docstring}
+            class {name}({self.base}):{docstring}{struct_sizes}
                 def __init__(self):
                     version_key = {name}_Version
                     _checkInterfaceVersion(version_key)
@@ -281,7 +349,10 @@ class IVRClass(Declaration):
                     fn_table_ptr = cast(getGenericInterface(fn_key), POINTER(fn_type))
                     if fn_table_ptr is None:
                         raise OpenVRError("Error retrieving VR API for {name}")
-                    self.function_table = fn_table_ptr.contents\n{methods}
+                    self.function_table = fn_table_ptr.contents
+                    # Reading a function table field creates a new function object each time, so read each just once
+                    for entry_name, _ in fn_type._fields_:
+                        setattr(self, '_fn_' + entry_name, getattr(self.function_table, entry_name))\n{methods}
         ''')
 
     def add_method(self, method):
@@ -315,11 +386,59 @@ class EnumDecl(Declaration):
         return result
 
 
+# VREvent_Data_t members holding the payload of events whose openvr.h comment does not say "data is ..."
+_undocumented_event_data_members = {
+    'VREvent_IpdChanged': 'ipd',
+    'VREvent_PropertyChanged': 'property',
+    'VREvent_OverlayShown': 'overlay',
+    'VREvent_OverlayHidden': 'overlay',
+    'VREvent_DashboardActivated': 'overlay',
+    'VREvent_DashboardDeactivated': 'overlay',
+    'VREvent_ImageLoaded': 'overlay',
+    'VREvent_ImageFailed': 'overlay',
+    'VREvent_OverlayGamepadFocusGained': 'overlay',
+    'VREvent_OverlayGamepadFocusLost': 'overlay',
+    'VREvent_ScreenshotTriggered': 'screenshot',
+    'VREvent_RequestScreenshot': 'screenshot',
+    'VREvent_ScreenshotTaken': 'screenshot',
+    'VREvent_ScreenshotFailed': 'screenshot',
+    'VREvent_SubmitScreenshotToDashboard': 'screenshot',
+    'VREvent_ScreenshotProgressToDashboard': 'screenshotProgress',
+    'VREvent_Notification_Shown': 'notification',
+    'VREvent_Notification_Hidden': 'notification',
+    'VREvent_Notification_BeginInteraction': 'notification',
+    'VREvent_Notification_Destroyed': 'notification',
+    'VREvent_ChaperoneUniverseHasChanged': 'chaperone',
+    'VREvent_StatusUpdate': 'status',
+    'VREvent_KeyboardClosed': 'keyboard',
+    'VREvent_KeyboardCharInput': 'keyboard',
+    'VREvent_KeyboardDone': 'keyboard',
+    'VREvent_TrackedCamera_EditingSurface': 'cameraSurface',
+    'VREvent_PerformanceTest_FidelityLevel': 'performanceTest',
+    'VREvent_MessageOverlay_Closed': 'messageOverlay',
+    'VREvent_Audio_SetSpeakersVolume': 'audioVolumeControl',
+    'VREvent_Audio_SetMicrophoneVolume': 'audioVolumeControl',
+    'VREvent_Audio_SetSpeakersMute': 'audioMuteControl',
+    'VREvent_Audio_SetMicrophoneMute': 'audioMuteControl',
+}
+
+
 class EnumConstant(Declaration):
     def __init__(self, name, value, docstring=None):
         super().__init__(name=name, docstring=docstring)
         self.value = value
 
+    def event_data_member(self):
+        """For EVREventType constants, the VREvent_Data_t member holding the event payload, if known"""
+        if self.name in _undocumented_event_data_members:
+            return _undocumented_event_data_members[self.name]
+        if self.docstring is None:
+            return None
+        match = re.search(r'\b[Dd]ata(?: is |\.)(\w+)', self.docstring)
+        if match is None:
+            return None
+        return match.group(1)
+
     def __str__(self):
         return f'{self.name} = ENUM_VALUE_TYPE({self.value})'
 
@@ -328,6 +447,9 @@ class Function(FunctionBase):
     def inner_function_name(self):
         return f'_openvr.{self.name}'
 
+    def resets_context(self):
+        return self.name in ('VR_InitInternal2', 'VR_ShutdownInternal')
+
     def ctypes_string(self):
         restype = translate_type(self.type.spelling)
         param_types = []
@@ -354,8 +476,13 @@ class Method(FunctionBase):
         result = f'("{method_name}", OPENVR_FNTABLE_CALLTYPE({params})),'
         return result
 
-    def ctypes_string(self):
-        return super().ctypes_string(in_params=['self', ])
+    def ctypes_string(self, nothrow=False):
+        return super().ctypes_string(in_params=['self', ], nothrow=nothrow)
+
+    def struct_size_value(self, type_name):
+        # Computed once, as a class attribute of the interface
+        self.struct_size_types.add(type_name)
+        return f'self._sizeof_{type_name}'
 
 
 class Parameter(Declaration):
@@ -428,6 +555,12 @@ class Parameter(Declaration):
             return False
         return str(self.annotation) == 'out_string: ;'
 
+    def is_output_struct(self):
+        """Whether this is a pointer to a structure that the function fills in"""
+        if self.is_input() or not self.is_output():
+            return False
+        return self.type.get_pointee().get_canonical().kind == TypeKind.RECORD
+
     def is_output(self):
         if self.is_count:
             return False
@@ -519,6 +652,12 @@ class Parameter(Declaration):
             return ''
         elif self.always_value is not None:
             return f'{self.py_name} = {self.always_value}\n'
+        elif self.is_output_struct():
+            t = translate_type(self.type.get_pointee().spelling)
+            return textwrap.dedent(f'''\
+                if {self.py_name} is None:
+                    {self.py_name} = {t}()
+            ''')
         elif not self.is_input():
             t = translate_type(self.type.get_pointee().spelling)
             return f'{self.py_name} = {t}()\n'
@@ -531,9 +670,9 @@ class Parameter(Declaration):
         else:
             return ''
 
-    def post_call_block(self):
+    def post_call_block(self, check_error=True):
         result = ''
-        if self.is_error():
+        if self.is_error() and check_error:
             assert self.type.kind == TypeKind.POINTER
             pt = self.type.get_pointee()
             error_category = translate_error_category(pt)
@@ -98,7 +98,7 @@ class Parser(object):
         for child in cursor.get_children():
             if child.kind == CursorKind.ENUM_CONSTANT_DECL:
                 value1 = child.enum_value
-                enum_const = model.EnumConstant(name=child.spelling, value=value1)
+                enum_const = model.EnumConstant(name=child.spelling, value=value1, docstring=child.brief_comment)
                 enum.add_constant(enum_const)
             else:
                 self.report_unparsed(child)